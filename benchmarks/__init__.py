@@ -0,0 +1 @@
+"""Performance benchmarks that run the pipeline against local stand-ins."""
@@ -0,0 +1,210 @@
+"""Start-up import-time benchmark for the API, CLI worker and Streamlit UI.
+
+Each entry module is imported in a fresh interpreter under
+``python -X importtime``; the benchmark reports the cumulative import time of
+the entry module, the slowest imports underneath it, and whether any heavy
+ML/LLM SDK (torch, whisper, faster-whisper, LLM clients, ...) was loaded. Those
+SDKs must only be imported on first use, so their presence fails the run, as
+does exceeding a per-process time budget.
+
+Usage::
+
+    python -m benchmarks.import_bench --runs 5 --budget api=800 --budget ui=2500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    "api": "src.apps.api.main",
+    "cli": "src.apps.workers.cli",
+    "ui": "src.apps.ui.streamlit_app",
+}
+DEFAULT_BUDGETS_MS = {"api": 1500.0, "cli": 1500.0, "ui": 3000.0}
+HEAVY_MODULES = (
+    "torch",
+    "whisper",
+    "faster_whisper",
+    "ctranslate2",
+    "openai",
+    "google.generativeai",
+    "ollama",
+    "notion_client",
+    "yt_dlp",
+)
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """Parse the ``import time:`` lines written to stderr by ``-X importtime``."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # column header
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        # Nested imports are indented by two spaces per level after one leading space.
+        depth = (len(name) - len(stripped) - 1) // 2
+        records.append(
+            ImportRecord(stripped, int(parts[0].strip()), int(parts[1].strip()), depth)
+        )
+    return records
+
+
+def heavy_modules_in(records: list[ImportRecord]) -> list[str]:
+    found = set()
+    for record in records:
+        for heavy in HEAVY_MODULES:
+            if record.module == heavy or record.module.startswith(heavy + "."):
+                found.add(heavy)
+    return sorted(found)
+
+
+def measure_target(module: str, runs: int = 3, top: int = 10) -> dict:
+    """Import ``module`` ``runs`` times in fresh interpreters and summarise."""
+    cumulative_ms: list[float] = []
+    records: list[ImportRecord] = []
+    for _ in range(max(1, runs)):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+        records = parse_importtime(proc.stderr)
+        target = next((r for r in records if r.module == module and r.depth == 0), None)
+        cumulative_ms.append((target.cumulative_us if target else 0) / 1000.0)
+
+    slowest = sorted(records, key=lambda r: r.self_us, reverse=True)[:top]
+    return {
+        "module": module,
+        "import_ms": statistics.median(cumulative_ms),
+        "runs_ms": cumulative_ms,
+        "modules_loaded": len(records),
+        "heavy_modules": heavy_modules_in(records),
+        "slowest": [
+            {
+                "module": r.module,
+                "self_ms": r.self_us / 1000.0,
+                "cumulative_ms": r.cumulative_us / 1000.0,
+            }
+            for r in slowest
+        ],
+    }
+
+
+def check_budgets(results: dict[str, dict], budgets: dict[str, float]) -> list[str]:
+    """Return human-readable budget violations (empty when everything passes)."""
+    failures = []
+    for name, result in results.items():
+        budget = budgets.get(name)
+        if budget is not None and result["import_ms"] > budget:
+            failures.append(f"{name}: {result['import_ms']:.0f} ms exceeds budget {budget:.0f} ms")
+        if result["heavy_modules"]:
+            heavy = ", ".join(result["heavy_modules"])
+            failures.append(f"{name}: imports heavy modules at start-up: {heavy}")
+    return failures
+
+
+def _parse_budget(value: str) -> tuple[str, float]:
+    name, sep, amount = value.partition("=")
+    if not sep or name not in TARGETS:
+        raise argparse.ArgumentTypeError(f"expected <{'|'.join(TARGETS)}>=<ms>: {value}")
+    try:
+        return name, float(amount)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid budget: {value}") from exc
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Measure start-up import time per process.")
+    parser.add_argument(
+        "--targets",
+        default=",".join(TARGETS),
+        help=f"Comma-separated subset of: {', '.join(TARGETS)}.",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="Fresh interpreters per target (the median is reported).",
+    )
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list per target.")
+    parser.add_argument(
+        "--budget",
+        type=_parse_budget,
+        action="append",
+        default=[],
+        help="Override a budget, e.g. api=800 (milliseconds).",
+    )
+    parser.add_argument("--output", help="Optional JSON result path.")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    names = [name.strip() for name in args.targets.split(",") if name.strip()]
+    unknown = [name for name in names if name not in TARGETS]
+    if unknown:
+        print(f"Unknown targets: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    budgets = {**DEFAULT_BUDGETS_MS, **dict(args.budget)}
+
+    results = {}
+    for name in names:
+        result = measure_target(TARGETS[name], runs=args.runs, top=args.top)
+        results[name] = result
+        print(
+            f"{name:<4} {result['module']:<28} {result['import_ms']:>8.1f} ms "
+            f"(budget {budgets[name]:.0f} ms, {result['modules_loaded']} modules)"
+        )
+        for item in result["slowest"]:
+            print(f"       {item['self_ms']:>8.1f} ms  {item['module']}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(
+                {
+                    "benchmark": "imports",
+                    "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "python": sys.version.split()[0],
+                    "budgets_ms": budgets,
+                    "results": results,
+                },
+                handle,
+                indent=2,
+            )
+        print(f"Results written to {args.output}")
+
+    failures = check_budgets(results, budgets)
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,361 @@
+"""End-to-end benchmark for ``ProcessingWorker`` against local stand-ins.
+
+Every external dependency of the pipeline is replaced by something local:
+
+- ``yt-dlp`` -> ``benchmarks/stubs/fake_yt_dlp.py`` serving a generated WAV;
+- OpenAI -> an OpenAI-compatible HTTP stub (``OPENAI_BASE_URL``);
+- Notion / Discord -> a fake Notion API (``NOTION_API_BASE_URL``) and webhook.
+
+The real downloader, summarizer, Notion storage, file writer and notifier are
+exercised; only the transcriber can be swapped for a sleep-based stand-in
+(``--transcriber stub``) so runs stay fast on machines without a model cache.
+
+Each scenario (queue size x worker count) runs in a fresh process so peak RSS
+is attributable to that scenario. Results are printed as a table and written
+as JSON for regression tracking; ``--baseline`` compares against a previous
+result file.
+
+Usage::
+
+    python -m benchmarks.pipeline_bench --queue-sizes 5,20 --workers 1,2,4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.stubs.fixtures import wav_duration_seconds, write_tone_wav  # noqa: E402
+from benchmarks.stubs.servers import (  # noqa: E402
+    install_fake_yt_dlp,
+    start_llm_stub,
+    start_notion_stub,
+)
+
+DEFAULT_RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+STAGES = ("download", "transcription", "summarization", "file_save", "notion_save", "notify")
+VIDEO_ID_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+
+@dataclass
+class ScenarioSettings:
+    queue_size: int
+    workers: int
+    transcriber: str
+    transcribe_rtf: float
+    model_size: str
+    fixture_path: str
+    audio_seconds: float
+
+
+class StubTranscriber:
+    """Sleeps ``audio_duration * rtf`` and returns a deterministic transcript."""
+
+    def __init__(self, model_size: str, rtf: float):
+        self.model_size = model_size
+        self.rtf = rtf
+        self.last_audio_duration: Optional[float] = None
+
+    def transcribe(self, file_path: str) -> str:
+        duration = wav_duration_seconds(file_path)
+        self.last_audio_duration = duration
+        time.sleep(duration * self.rtf)
+        # Roughly 2.5 spoken words per second keeps prompt sizes realistic.
+        return " ".join("word" for _ in range(int(duration * 2.5)))
+
+
+def _video_id(index: int) -> str:
+    chars = []
+    value = index
+    for _ in range(11):
+        chars.append(VIDEO_ID_ALPHABET[value % len(VIDEO_ID_ALPHABET)])
+        value //= len(VIDEO_ID_ALPHABET)
+    return "".join(reversed(chars))
+
+
+def _build_transcriber_factory(settings: ScenarioSettings):
+    if settings.transcriber == "stub":
+        return lambda model_size, **_options: StubTranscriber(
+            model_size, settings.transcribe_rtf
+        )
+    from src.infrastructure.media.transcription.transcriber import Transcriber
+
+    return lambda model_size, **options: Transcriber(model_size=model_size, **options)
+
+
+def _run_scenario(settings: ScenarioSettings) -> dict[str, Any]:
+    """Execute one scenario; runs inside a dedicated child process."""
+    from src.infrastructure.persistence.sqlite.client import SQLiteDB
+    from src.services.pipeline.processing_runner import ProcessingWorker
+    from src.services.tasks.stage_stats import summarize_values
+
+    workdir = tempfile.mkdtemp(prefix="pipeline-bench-")
+    os.chdir(workdir)
+    db = SQLiteDB(db_path=os.path.join(workdir, "tasks.db"))
+    for index in range(settings.queue_size):
+        db.add_task(f"https://www.youtube.com/watch?v={_video_id(index)}")
+
+    config = SimpleNamespace(
+        transcription_model_size=settings.model_size,
+        transcription_cpu_threads="auto",
+        transcription_concurrency=settings.workers,
+        notion_url=None,
+        discord_webhook_url=os.environ.get("DISCORD_WEBHOOK_URL"),
+        data_dir=os.path.join(workdir, "data"),
+        # The fake yt-dlp binary on PATH stands in for YouTube.
+        ytdlp_backend="subprocess",
+    )
+    transcriber_factory = _build_transcriber_factory(settings)
+    results = {"processed": 0, "failed": 0}
+    results_lock = threading.Lock()
+
+    def drain(worker_index: int) -> None:
+        worker = ProcessingWorker(
+            db,
+            worker_id=f"bench-worker-{worker_index}",
+            transcriber_factory=transcriber_factory,
+            config_factory=lambda: config,
+        )
+        while True:
+            outcome = worker.process_next_task()
+            if outcome is None:
+                return
+            with results_lock:
+                results["processed" if outcome else "failed"] += 1
+
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(target=drain, args=(index,), name=f"bench-worker-{index}")
+        for index in range(settings.workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_seconds = time.perf_counter() - started
+
+    records = db.list_task_stage_timings()
+    stages: dict[str, dict[str, Any]] = {}
+    for stage in STAGES:
+        values = [r.stage_durations[stage] for r in records if stage in r.stage_durations]
+        stages[stage] = summarize_values(values, percentiles=(50, 95))
+    totals = [r.total_duration for r in records if r.total_duration is not None]
+
+    return {
+        "queue_size": settings.queue_size,
+        "workers": settings.workers,
+        "processed": results["processed"],
+        "failed": results["failed"],
+        "wall_seconds": wall_seconds,
+        "throughput_tasks_per_min": (results["processed"] / wall_seconds * 60.0)
+        if wall_seconds > 0
+        else 0.0,
+        "task_latency": summarize_values(totals, percentiles=(50, 95)),
+        "stages": stages,
+        # ru_maxrss is reported in KiB on Linux and bytes on macOS.
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        / (1024 * 1024 if sys.platform == "darwin" else 1024),
+    }
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _parse_int_list(value: str) -> list[int]:
+    try:
+        items = [int(item) for item in value.split(",") if item.strip()]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers: {value}") from exc
+    if not items or any(item <= 0 for item in items):
+        raise argparse.ArgumentTypeError(f"expected positive integers: {value}")
+    return items
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.3f}"
+
+
+def print_report(scenarios: list[dict[str, Any]]) -> None:
+    header = f"{'queue':>5} {'workers':>7} {'ok/fail':>8} {'tasks/min':>10} {'peak MB':>8}  stage p50/p95 (s)"
+    print(header)
+    print("-" * len(header))
+    for item in scenarios:
+        stage_text = "  ".join(
+            f"{stage}={_fmt(stats['p50'])}/{_fmt(stats['p95'])}"
+            for stage, stats in item["stages"].items()
+            if stats["count"]
+        )
+        print(
+            f"{item['queue_size']:>5} {item['workers']:>7} "
+            f"{item['processed']:>4}/{item['failed']:<3} "
+            f"{item['throughput_tasks_per_min']:>10.2f} {item['peak_rss_mb']:>8.1f}  {stage_text}"
+        )
+
+
+def compare_with_baseline(
+    scenarios: list[dict[str, Any]],
+    baseline: dict[str, Any],
+    threshold_pct: float,
+) -> list[str]:
+    """Return human-readable regressions beyond ``threshold_pct``."""
+    previous = {
+        (item["queue_size"], item["workers"]): item for item in baseline.get("scenarios", [])
+    }
+    regressions: list[str] = []
+    for item in scenarios:
+        key = (item["queue_size"], item["workers"])
+        old = previous.get(key)
+        if old is None:
+            continue
+        label = f"queue={key[0]} workers={key[1]}"
+        old_tp = old.get("throughput_tasks_per_min") or 0.0
+        new_tp = item["throughput_tasks_per_min"]
+        if old_tp and (old_tp - new_tp) / old_tp * 100 > threshold_pct:
+            regressions.append(f"{label}: throughput {old_tp:.2f} -> {new_tp:.2f} tasks/min")
+        for stage, stats in item["stages"].items():
+            old_p95 = (old.get("stages", {}).get(stage) or {}).get("p95")
+            new_p95 = stats.get("p95")
+            if old_p95 and new_p95 and (new_p95 - old_p95) / old_p95 * 100 > threshold_pct:
+                regressions.append(f"{label}: {stage} p95 {old_p95:.3f}s -> {new_p95:.3f}s")
+    return regressions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark the processing pipeline with local stand-ins.")
+    parser.add_argument("--queue-sizes", type=_parse_int_list, default=[5, 20])
+    parser.add_argument("--workers", type=_parse_int_list, default=[1, 2, 4])
+    parser.add_argument("--audio-seconds", type=float, default=30.0, help="Fixture audio length.")
+    parser.add_argument("--transcriber", choices=("stub", "faster-whisper"), default="stub")
+    parser.add_argument(
+        "--transcribe-rtf",
+        type=float,
+        default=0.05,
+        help="Real-time factor for the stub transcriber (seconds per audio second).",
+    )
+    parser.add_argument("--model-size", default="tiny", help="faster-whisper model size.")
+    parser.add_argument("--download-latency", type=float, default=0.05)
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--notion-latency", type=float, default=0.05)
+    parser.add_argument("--output", help="Result JSON path (default: benchmarks/results/pipeline-<ts>.json).")
+    parser.add_argument("--baseline", help="Previous result JSON to compare against.")
+    parser.add_argument(
+        "--regression-threshold",
+        type=float,
+        default=10.0,
+        help="Percent change treated as a regression when comparing with --baseline.",
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    scratch = tempfile.mkdtemp(prefix="pipeline-bench-assets-")
+    fixture = write_tone_wav(os.path.join(scratch, "fixture.wav"), args.audio_seconds)
+    bin_dir = os.path.join(scratch, "bin")
+    install_fake_yt_dlp(bin_dir)
+    llm = start_llm_stub(args.llm_latency)
+    notion = start_notion_stub(args.notion_latency)
+
+    # Child processes inherit this environment (spawn copies os.environ).
+    os.environ.update(
+        {
+            "PATH": bin_dir + os.pathsep + os.environ.get("PATH", ""),
+            "FAKE_YTDLP_FIXTURE": fixture,
+            "FAKE_YTDLP_LATENCY_SECONDS": str(args.download_latency),
+            "FAKE_YTDLP_DURATION_SECONDS": str(args.audio_seconds),
+            "OPENAI_API_KEY": "bench-key",
+            "OPENAI_BASE_URL": f"{llm.base_url}/v1",
+            "NOTION_API_KEY": "bench-key",
+            "NOTION_DATABASE_ID": "bench-database",
+            "NOTION_API_BASE_URL": notion.base_url,
+            "DISCORD_WEBHOOK_URL": f"{notion.base_url}/webhook",
+            "APP_ENV": "benchmark",
+            "FORCE_TEST_MODE": "0",
+        }
+    )
+    for name in ("GOOGLE_GEMINI_API_KEY", "OLLAMA_API_KEY"):
+        os.environ.pop(name, None)
+
+    context = multiprocessing.get_context("spawn")
+    scenarios: list[dict[str, Any]] = []
+    try:
+        with context.Pool(processes=1, maxtasksperchild=1) as pool:
+            for queue_size in args.queue_sizes:
+                for workers in args.workers:
+                    settings = ScenarioSettings(
+                        queue_size=queue_size,
+                        workers=workers,
+                        transcriber=args.transcriber,
+                        transcribe_rtf=args.transcribe_rtf,
+                        model_size=args.model_size,
+                        fixture_path=fixture,
+                        audio_seconds=args.audio_seconds,
+                    )
+                    print(f"Running queue={queue_size} workers={workers} ...", flush=True)
+                    scenarios.append(pool.apply(_run_scenario, (settings,)))
+    finally:
+        llm.stop()
+        notion.stop()
+
+    print_report(scenarios)
+
+    payload = {
+        "benchmark": "pipeline",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "parameters": {
+            key: value for key, value in vars(args).items() if key not in ("output", "baseline")
+        },
+        "stub_requests": {"llm": llm.request_counts, "notion": notion.request_counts},
+        "scenarios": scenarios,
+    }
+    output = args.output or os.path.join(
+        DEFAULT_RESULTS_DIR, f"pipeline-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, ensure_ascii=False)
+    print(f"Results written to {output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare_with_baseline(scenarios, baseline, args.regression_threshold)
+        if regressions:
+            print("Regressions against baseline:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
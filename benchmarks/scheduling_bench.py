@@ -0,0 +1,293 @@
+"""Queue-wait simulation for the task scheduling policies.
+
+Generates a seeded workload — mostly short videos, a few multi-hour ones,
+manual requests mixed with RSS channels and one large RSS backfill burst — and
+replays it against a temporary ``SQLiteDB`` once per policy. Workers claim
+tasks through the real ``acquire_next_task`` while a virtual clock advances by
+each task's simulated processing time, so the queue order is exactly what
+production would pick. Reports mean and p95 queue wait (claim time minus
+arrival), overall and per source class.
+
+Usage::
+
+    python -m benchmarks.scheduling_bench --tasks 400 --workers 1 --seed 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from src.domain.tasks.scheduling import SCHEDULING_POLICIES  # noqa: E402
+
+DEFAULT_RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+EPOCH = datetime(2024, 1, 1)
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@dataclass(frozen=True)
+class SimTask:
+    arrival: float
+    duration: float
+    source_type: str
+    channel: Optional[str]
+    priority: int = 0
+
+    @property
+    def kind(self) -> str:
+        return "manual" if self.source_type == "manual" else "rss"
+
+
+def generate_workload(
+    count: int,
+    *,
+    seed: int = 7,
+    channels: int = 4,
+    backfill: int = 0,
+    manual_share: float = 0.3,
+    long_share: float = 0.05,
+    manual_priority: int = 0,
+    mean_interarrival: float = 240.0,
+) -> list[SimTask]:
+    """Build a reproducible workload sorted by arrival time (seconds)."""
+    rng = random.Random(seed)
+
+    def duration() -> float:
+        if rng.random() < long_share:
+            return rng.uniform(2 * 3600, 3 * 3600)
+        return rng.uniform(180, 900)
+
+    tasks: list[SimTask] = []
+    now = 0.0
+    for _ in range(count):
+        now += rng.expovariate(1.0 / mean_interarrival)
+        if rng.random() < manual_share:
+            tasks.append(SimTask(now, duration(), "manual", None, manual_priority))
+        else:
+            channel = f"UC{rng.randrange(max(1, channels)):04d}"
+            tasks.append(SimTask(now, duration(), "rss", channel))
+    if backfill:
+        # A newly subscribed channel imports its back catalogue all at once.
+        burst_at = tasks[len(tasks) // 4].arrival if tasks else 0.0
+        tasks.extend(
+            SimTask(burst_at + index * 0.001, duration(), "rss", "UCbackfill")
+            for index in range(backfill)
+        )
+    return sorted(tasks, key=lambda task: task.arrival)
+
+
+def _stamp(seconds: float) -> str:
+    return (EPOCH + timedelta(seconds=seconds)).strftime(TIME_FORMAT)
+
+
+def simulate(
+    policy: str,
+    tasks: list[SimTask],
+    *,
+    workers: int = 1,
+    processing_ratio: float = 0.2,
+    overhead_seconds: float = 30.0,
+    db_path: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """Replay ``tasks`` with ``policy`` and return one record per claimed task.
+
+    Processing takes ``overhead_seconds + duration * processing_ratio`` of
+    virtual time. Timestamps written to the database are virtual, so
+    ``created_at`` (FIFO) and ``started_at`` (fair share) order correctly.
+    """
+    from src.infrastructure.persistence.sqlite.client import SQLiteDB
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = SQLiteDB(db_path or os.path.join(tmpdir, "scheduling.db"))
+        db.set_scheduling_policy(policy)
+        conn = db._get_connection()
+        by_id: dict[str, SimTask] = {}
+        free_at = [0.0] * max(1, workers)
+        heapq.heapify(free_at)
+        next_arrival = 0
+        records: list[dict[str, Any]] = []
+        try:
+            while len(records) < len(tasks):
+                clock = heapq.heappop(free_at)
+                if next_arrival < len(tasks) and not _has_pending(conn):
+                    clock = max(clock, tasks[next_arrival].arrival)
+                while next_arrival < len(tasks) and tasks[next_arrival].arrival <= clock:
+                    task = tasks[next_arrival]
+                    stored = db.add_task(
+                        f"https://www.youtube.com/watch?v=sim{next_arrival:05d}",
+                        source_type=task.source_type,
+                        source_channel_id=task.channel,
+                        priority=task.priority,
+                    )
+                    conn.execute(
+                        "UPDATE tasks SET created_at = ?, duration_seconds = ? WHERE id = ?",
+                        (_stamp(task.arrival), task.duration, stored.id),
+                    )
+                    conn.commit()
+                    by_id[str(stored.id)] = task
+                    next_arrival += 1
+
+                claimed = db.acquire_next_task("bench")
+                if claimed is None:  # pragma: no cover - arrivals always precede claims
+                    heapq.heappush(free_at, clock)
+                    continue
+                task = by_id[str(claimed.id)]
+                finished = clock + overhead_seconds + task.duration * processing_ratio
+                conn.execute(
+                    "UPDATE tasks SET status = 'Completed', started_at = ?, locked_at = NULL "
+                    "WHERE id = ?",
+                    (_stamp(clock), claimed.id),
+                )
+                conn.commit()
+                records.append(
+                    {
+                        "kind": task.kind,
+                        "channel": task.channel,
+                        "duration": task.duration,
+                        "wait": clock - task.arrival,
+                    }
+                )
+                heapq.heappush(free_at, finished)
+        finally:
+            conn.close()
+    return records
+
+
+def _has_pending(conn) -> bool:
+    return (
+        conn.execute("SELECT 1 FROM tasks WHERE status = 'Pending' LIMIT 1").fetchone()
+        is not None
+    )
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile (``fraction`` in 0..1)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(policy: str, records: list[dict[str, Any]]) -> dict[str, Any]:
+    def stats(waits: list[float]) -> dict[str, float]:
+        return {
+            "count": len(waits),
+            "mean_wait_s": statistics.fmean(waits) if waits else 0.0,
+            "p95_wait_s": percentile(waits, 0.95),
+        }
+
+    return {
+        "policy": policy,
+        "overall": stats([item["wait"] for item in records]),
+        "manual": stats([item["wait"] for item in records if item["kind"] == "manual"]),
+        "rss": stats([item["wait"] for item in records if item["kind"] == "rss"]),
+        "short": stats([item["wait"] for item in records if item["duration"] < 3600]),
+    }
+
+
+def format_table(results: list[dict[str, Any]]) -> str:
+    """Render mean / p95 wait in minutes per policy and class."""
+    classes = ("overall", "manual", "rss", "short")
+    header = f"{'policy':<14}" + "".join(f" {name + ' mean/p95 min':>24}" for name in classes)
+    lines = [header, "-" * len(header)]
+    for item in results:
+        cells = "".join(
+            f" {item[name]['mean_wait_s'] / 60:>11.1f} / {item[name]['p95_wait_s'] / 60:>10.1f}"
+            for name in classes
+        )
+        lines.append(f"{item['policy']:<14}{cells}")
+    return "\n".join(lines)
+
+
+def _split(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Simulate queue wait per scheduling policy.")
+    parser.add_argument(
+        "--policies",
+        type=_split,
+        default=list(SCHEDULING_POLICIES),
+        help=f"Comma-separated subset of: {', '.join(SCHEDULING_POLICIES)}.",
+    )
+    parser.add_argument("--tasks", type=int, default=400, help="Regular arrivals to simulate.")
+    parser.add_argument("--backfill", type=int, default=80, help="Size of the RSS backfill burst.")
+    parser.add_argument("--channels", type=int, default=4, help="Regular RSS channels.")
+    parser.add_argument("--workers", type=int, default=1, help="Concurrent processing workers.")
+    parser.add_argument(
+        "--manual-priority",
+        type=int,
+        default=10,
+        help="Priority given to manual requests (what API users would set).",
+    )
+    parser.add_argument(
+        "--processing-ratio",
+        type=float,
+        default=0.2,
+        help="Processing seconds per second of video.",
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Result JSON path (default: benchmarks/results/scheduling-<ts>.json).")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    unknown = [name for name in args.policies if name not in SCHEDULING_POLICIES]
+    if unknown:
+        print(f"Unknown policies: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    tasks = generate_workload(
+        args.tasks,
+        seed=args.seed,
+        channels=args.channels,
+        backfill=args.backfill,
+        manual_priority=args.manual_priority,
+    )
+    results = []
+    for policy in args.policies:
+        print(f"Simulating {policy} over {len(tasks)} task(s) ...", flush=True)
+        records = simulate(
+            policy, tasks, workers=args.workers, processing_ratio=args.processing_ratio
+        )
+        results.append(summarize(policy, records))
+
+    print(format_table(results))
+
+    payload = {
+        "benchmark": "scheduling",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "parameters": {
+            key: value for key, value in vars(args).items() if key not in {"output"}
+        },
+        "results": results,
+    }
+    output = args.output or os.path.join(
+        DEFAULT_RESULTS_DIR, f"scheduling-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, ensure_ascii=False)
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""Database size and query latency with and without text compression.
+
+Fills a temporary SQLite database per codec with the same seeded set of
+completed tasks (markdown summaries and, optionally, transcripts), then
+reports the file size after ``VACUUM``, the latency of listing every task
+(``get_all_tasks``, which no longer reads compressed text) and of opening
+task details (``get_task_by_id`` plus reading the summary, which decompresses
+it on access).
+
+Usage::
+
+    python -m benchmarks.storage_bench --tasks 2000 --summary-chars 4000 --transcript-chars 30000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from src.infrastructure.persistence.sqlite.task_blobs import (  # noqa: E402
+    OFF,
+    ZLIB,
+    ZSTD,
+    zstd_available,
+)
+
+DEFAULT_RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+_SENTENCES = (
+    "本影片討論台積電的先進製程與全球供應鏈。",
+    "講者認為 AI 晶片需求將持續成長，資料中心投資是主要動能。",
+    "接著比較了不同國家的半導體補貼政策與人才培育。",
+    "最後提醒投資人留意庫存循環與地緣政治風險。",
+    "The speaker walks through the quarterly results and guidance.",
+    "Margins improved thanks to a better product mix and higher utilization.",
+)
+
+
+def make_text(rng: random.Random, chars: int, heading: str = "## 摘要") -> str:
+    parts = [heading]
+    size = len(heading)
+    while size < chars:
+        sentence = rng.choice(_SENTENCES)
+        parts.append(f"- {sentence}" if rng.random() < 0.3 else sentence)
+        size += len(parts[-1])
+    return "\n".join(parts)
+
+
+def populate(db, tasks: int, summary_chars: int, transcript_chars: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    ids = []
+    for index in range(tasks):
+        task = db.add_task(f"https://www.youtube.com/watch?v=bench{index:06d}")
+        db.update_task_status(
+            task.id,
+            "Completed",
+            title=f"Benchmark video {index}",
+            summary=make_text(rng, summary_chars),
+            processing_duration=rng.uniform(30, 600),
+        )
+        if transcript_chars:
+            db.index_task_transcript(task.id, make_text(rng, transcript_chars, heading=""))
+        ids.append(str(task.id))
+    return ids
+
+
+def _median_ms(samples: list[float]) -> float:
+    return statistics.median(samples) * 1000.0
+
+
+def measure(
+    codec: str,
+    *,
+    tasks: int,
+    summary_chars: int,
+    transcript_chars: int,
+    runs: int = 5,
+    detail_samples: int = 200,
+    seed: int = 7,
+) -> dict[str, Any]:
+    from src.infrastructure.persistence.sqlite.client import SQLiteDB
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "tasks.db")
+        db = SQLiteDB(path, text_codec=codec)
+        ids = populate(db, tasks, summary_chars, transcript_chars, seed)
+        conn = sqlite3.connect(path)
+        conn.execute("VACUUM")
+        conn.close()
+        size = os.path.getsize(path)
+
+        list_samples = []
+        for _ in range(max(1, runs)):
+            started = time.perf_counter()
+            db.get_all_tasks()
+            list_samples.append(time.perf_counter() - started)
+
+        rng = random.Random(seed)
+        detail_samples_s = []
+        for task_id in (rng.choice(ids) for _ in range(max(1, detail_samples))):
+            started = time.perf_counter()
+            task = db.get_task_by_id(task_id)
+            len(task.summary)
+            detail_samples_s.append(time.perf_counter() - started)
+
+    return {
+        "codec": codec,
+        "db_bytes": size,
+        "list_ms": _median_ms(list_samples),
+        "detail_ms": _median_ms(detail_samples_s),
+    }
+
+
+def format_table(results: list[dict[str, Any]]) -> str:
+    header = f"{'codec':<6} {'DB MB':>9} {'vs off':>7} {'list ms':>9} {'detail ms':>10}"
+    lines = [header, "-" * len(header)]
+    baseline = next((item["db_bytes"] for item in results if item["codec"] == OFF), None)
+    for item in results:
+        ratio = f"{item['db_bytes'] / baseline:.2f}x" if baseline else "-"
+        lines.append(
+            f"{item['codec']:<6} {item['db_bytes'] / 1_048_576:>9.2f} {ratio:>7} "
+            f"{item['list_ms']:>9.2f} {item['detail_ms']:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compare SQLite size/latency per text codec.")
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--summary-chars", type=int, default=4000)
+    parser.add_argument(
+        "--transcript-chars",
+        type=int,
+        default=0,
+        help="Also store a transcript of this size per task (0 skips transcripts).",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="List queries per codec (median).")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Result JSON path (default: benchmarks/results/storage-<ts>.json).")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    codecs = [OFF, ZLIB] + ([ZSTD] if zstd_available() else [])
+    results = []
+    for codec in codecs:
+        print(f"Measuring {codec} with {args.tasks} task(s) ...", flush=True)
+        results.append(
+            measure(
+                codec,
+                tasks=args.tasks,
+                summary_chars=args.summary_chars,
+                transcript_chars=args.transcript_chars,
+                runs=args.runs,
+                seed=args.seed,
+            )
+        )
+
+    print(format_table(results))
+
+    payload = {
+        "benchmark": "storage",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "parameters": {key: value for key, value in vars(args).items() if key != "output"},
+        "results": results,
+    }
+    output = args.output or os.path.join(
+        DEFAULT_RESULTS_DIR, f"storage-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, ensure_ascii=False)
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
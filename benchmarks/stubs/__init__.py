@@ -0,0 +1 @@
+"""Local stand-ins for yt-dlp, the LLM API and the Notion API."""
@@ -0,0 +1,100 @@
+"""Minimal yt-dlp stand-in that serves fixture audio instead of hitting YouTube.
+
+Supports the flags used by ``YouTubeDownloader``: ``-o``, ``--print``
+(including the ``after_move:`` prefix), ``-O``, ``-J``/``--dump-single-json``
+and ``--no-overwrites``. Behaviour is configured through environment
+variables:
+
+- ``FAKE_YTDLP_FIXTURE``: audio file copied for every download (required).
+- ``FAKE_YTDLP_LATENCY_SECONDS``: artificial delay per invocation.
+- ``FAKE_YTDLP_DURATION_SECONDS``: duration reported in metadata.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import sys
+import time
+
+ID_PATTERN = re.compile(r"(?:v=|youtu\.be/|shorts/|embed/)([A-Za-z0-9_-]{11})")
+TEMPLATE_FIELD = re.compile(r"%\((\w+)\)s")
+
+
+def _render(template: str, info: dict[str, object]) -> str:
+    return TEMPLATE_FIELD.sub(lambda match: str(info.get(match.group(1), "NA")), template)
+
+
+def main(argv: list[str]) -> int:
+    fixture = os.environ.get("FAKE_YTDLP_FIXTURE")
+    if not fixture or not os.path.isfile(fixture):
+        print("ERROR: FAKE_YTDLP_FIXTURE is not set to an existing file", file=sys.stderr)
+        return 2
+
+    output_template = "%(id)s.%(ext)s"
+    prints: list[str] = []
+    dump_json = False
+    urls: list[str] = []
+    args = list(argv)
+    while args:
+        arg = args.pop(0)
+        if arg == "-o":
+            output_template = args.pop(0)
+        elif arg in ("--print", "-O"):
+            value = args.pop(0)
+            prints.append(value.split(":", 1)[1] if value.startswith("after_move:") else value)
+        elif arg in ("-J", "--dump-single-json", "--dump-json"):
+            dump_json = True
+        elif arg in ("-S", "-f"):
+            args.pop(0)
+        elif arg.startswith("-"):
+            continue
+        else:
+            urls.append(arg)
+
+    if not urls:
+        print("ERROR: missing URL", file=sys.stderr)
+        return 2
+
+    match = ID_PATTERN.search(urls[-1])
+    if not match:
+        print(f"ERROR: unsupported URL {urls[-1]}", file=sys.stderr)
+        return 1
+    video_id = match.group(1)
+
+    time.sleep(float(os.environ.get("FAKE_YTDLP_LATENCY_SECONDS", "0") or 0))
+
+    ext = os.path.splitext(fixture)[1].lstrip(".") or "wav"
+    info: dict[str, object] = {
+        "id": video_id,
+        "ext": ext,
+        "title": f"Benchmark video {video_id}",
+        "duration": float(os.environ.get("FAKE_YTDLP_DURATION_SECONDS", "0") or 0),
+        "live_status": "not_live",
+        "availability": "public",
+        "webpage_url": f"https://www.youtube.com/watch?v={video_id}",
+    }
+
+    if dump_json:
+        print(json.dumps(info))
+        return 0
+
+    target = os.path.abspath(_render(output_template, info))
+    info["filepath"] = target
+    if prints and all(value == "%(title)s" for value in prints) and len(prints) == 1:
+        # ``-O %(title)s`` metadata lookup without download.
+        print(_render(prints[0], info))
+        return 0
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    if not os.path.exists(target):
+        shutil.copyfile(fixture, target)
+    for value in prints:
+        print(_render(value, info))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,36 @@
+"""Generate deterministic fixture audio for benchmarks."""
+
+from __future__ import annotations
+
+import math
+import os
+import struct
+import wave
+
+SAMPLE_RATE = 16000
+
+
+def write_tone_wav(path: str, duration_seconds: float, frequency: float = 440.0) -> str:
+    """Write a mono 16 kHz sine tone WAV file and return its path."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    frame_count = int(duration_seconds * SAMPLE_RATE)
+    amplitude = 0.3 * 32767
+    with wave.open(path, "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(SAMPLE_RATE)
+        chunk = bytearray()
+        for index in range(frame_count):
+            sample = int(amplitude * math.sin(2 * math.pi * frequency * index / SAMPLE_RATE))
+            chunk += struct.pack("<h", sample)
+            if len(chunk) >= 64 * 1024:
+                handle.writeframes(bytes(chunk))
+                chunk.clear()
+        if chunk:
+            handle.writeframes(bytes(chunk))
+    return path
+
+
+def wav_duration_seconds(path: str) -> float:
+    with wave.open(path, "rb") as handle:
+        return handle.getnframes() / float(handle.getframerate())
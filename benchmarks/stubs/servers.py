@@ -0,0 +1,144 @@
+"""Local HTTP stand-ins for the OpenAI-compatible LLM API, Notion and Discord."""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+Route = Callable[[dict[str, Any]], tuple[int, dict[str, Any]]]
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: "StubServer"
+
+    def log_message(self, *_args) -> None:  # silence per-request logging
+        return None
+
+    def _dispatch(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            payload = json.loads(raw) if raw else {}
+        except ValueError:
+            payload = {}
+        route = self.server.routes.get((self.command, self.path.split("?", 1)[0]))
+        if route is None:
+            status, body = 404, {"error": f"no stub route for {self.command} {self.path}"}
+        else:
+            if self.server.latency_seconds:
+                time.sleep(self.server.latency_seconds)
+            status, body = route(payload)
+        self.server.record_request(self.command, self.path)
+        encoded = json.dumps(body).encode("utf-8") if status != 204 else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_PATCH = _dispatch
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded JSON server with a fixed artificial latency per request."""
+
+    daemon_threads = True
+
+    def __init__(self, routes: dict[tuple[str, str], Route], latency_seconds: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.routes = routes
+        self.latency_seconds = latency_seconds
+        self.request_counts: dict[str, int] = {}
+        self._counts_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record_request(self, method: str, path: str) -> None:
+        key = f"{method} {path.split('?', 1)[0]}"
+        with self._counts_lock:
+            self.request_counts[key] = self.request_counts.get(key, 0) + 1
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def _chat_completion(payload: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+    messages = payload.get("messages") or []
+    prompt_chars = sum(len(str(message.get("content", ""))) for message in messages)
+    content = f"# Benchmark summary\n\nPrompt length: {prompt_chars} characters."
+    return 200, {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": payload.get("model", "stub-model"),
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": prompt_chars // 4, "completion_tokens": 16, "total_tokens": prompt_chars // 4 + 16},
+    }
+
+
+def _notion_create_page(payload: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+    return 200, {
+        "object": "page",
+        "id": str(uuid.uuid4()),
+        "created_time": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime()),
+        "properties": payload.get("properties", {}),
+    }
+
+
+def _discord_webhook(_payload: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+    return 204, {}
+
+
+def start_llm_stub(latency_seconds: float = 0.0) -> StubServer:
+    """OpenAI-compatible ``/v1/chat/completions`` endpoint."""
+    return StubServer(
+        {("POST", "/v1/chat/completions"): _chat_completion},
+        latency_seconds=latency_seconds,
+    ).start()
+
+
+def start_notion_stub(latency_seconds: float = 0.0) -> StubServer:
+    """Fake Notion API (page creation) plus a Discord-style webhook."""
+    return StubServer(
+        {
+            ("POST", "/v1/pages"): _notion_create_page,
+            ("POST", "/webhook"): _discord_webhook,
+        },
+        latency_seconds=latency_seconds,
+    ).start()
+
+
+def install_fake_yt_dlp(bin_dir: str) -> str:
+    """Write an executable ``yt-dlp`` wrapper into ``bin_dir`` and return its path."""
+    os.makedirs(bin_dir, exist_ok=True)
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_yt_dlp.py")
+    wrapper = os.path.join(bin_dir, "yt-dlp")
+    with open(wrapper, "w", encoding="utf-8") as handle:
+        handle.write(f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n')
+    os.chmod(wrapper, os.stat(wrapper).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return wrapper
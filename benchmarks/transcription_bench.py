@@ -0,0 +1,214 @@
+"""Transcription micro-benchmark for ``Transcriber`` (faster-whisper).
+
+Runs every combination of model size, compute type, beam size and
+``cpu_threads`` over a directory of local audio files and reports:
+
+- model load time (seconds);
+- real-time factor (transcription seconds / audio seconds, lower is better);
+- words per second of transcription time;
+- peak RSS of the process running that configuration.
+
+Each configuration runs in a fresh process so load time and peak memory are
+not polluted by previously loaded models.
+
+Usage::
+
+    python -m benchmarks.transcription_bench --audio-dir data/videos \\
+        --model-sizes tiny,base --compute-types int8,float32 \\
+        --beam-sizes 1,5 --cpu-threads 0,4
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".webm", ".flac", ".ogg", ".opus", ".mp4")
+
+
+@dataclass(frozen=True)
+class TranscriptionConfig:
+    model_size: str
+    compute_type: str
+    beam_size: int
+    cpu_threads: int
+
+    @property
+    def label(self) -> str:
+        return (
+            f"{self.model_size}/{self.compute_type}/beam={self.beam_size}"
+            f"/threads={self.cpu_threads or 'auto'}"
+        )
+
+
+def expand_configs(
+    model_sizes: list[str],
+    compute_types: list[str],
+    beam_sizes: list[int],
+    cpu_threads: list[int],
+) -> list[TranscriptionConfig]:
+    return [
+        TranscriptionConfig(*combo)
+        for combo in itertools.product(model_sizes, compute_types, beam_sizes, cpu_threads)
+    ]
+
+
+def find_audio_files(audio_dir: str, limit: Optional[int] = None) -> list[str]:
+    files = sorted(
+        os.path.join(audio_dir, name)
+        for name in os.listdir(audio_dir)
+        if name.lower().endswith(AUDIO_EXTENSIONS)
+    )
+    return files[:limit] if limit else files
+
+
+def _run_config(config: TranscriptionConfig, files: list[str]) -> dict[str, Any]:
+    """Benchmark one configuration; runs inside a dedicated child process."""
+    from src.infrastructure.media.transcription.transcriber import Transcriber
+
+    transcriber = Transcriber(
+        model_size=config.model_size,
+        compute_type=config.compute_type,
+        cpu_threads=config.cpu_threads,
+        beam_size=config.beam_size,
+    )
+    transcriber.load_model()
+
+    per_file = []
+    for path in files:
+        started = time.perf_counter()
+        text = transcriber.transcribe_with_faster_whisper(path)
+        elapsed = time.perf_counter() - started
+        per_file.append(
+            {
+                "file": os.path.basename(path),
+                "audio_seconds": transcriber.last_audio_duration,
+                "transcribe_seconds": elapsed,
+                "words": len(text.split()),
+            }
+        )
+
+    audio_total = sum(item["audio_seconds"] or 0.0 for item in per_file)
+    transcribe_total = sum(item["transcribe_seconds"] for item in per_file)
+    words_total = sum(item["words"] for item in per_file)
+    return {
+        **asdict(config),
+        "label": config.label,
+        "load_seconds": transcriber.last_model_load_seconds,
+        "audio_seconds": audio_total,
+        "transcribe_seconds": transcribe_total,
+        "words": words_total,
+        "rtf": (transcribe_total / audio_total) if audio_total else None,
+        "words_per_second": (words_total / transcribe_total) if transcribe_total else None,
+        # ru_maxrss is reported in KiB on Linux and bytes on macOS.
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        / (1024 * 1024 if sys.platform == "darwin" else 1024),
+        "files": per_file,
+    }
+
+
+def format_table(results: list[dict[str, Any]]) -> str:
+    """Render results sorted by real-time factor (fastest first)."""
+    header = (
+        f"{'model':<10} {'compute':<14} {'beam':>4} {'threads':>7} "
+        f"{'load s':>7} {'RTF':>7} {'words/s':>8} {'peak MB':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    ordered = sorted(
+        results, key=lambda item: (item["rtf"] is None, item["rtf"] or 0.0)
+    )
+    for item in ordered:
+        rtf = "-" if item["rtf"] is None else f"{item['rtf']:.3f}"
+        wps = "-" if item["words_per_second"] is None else f"{item['words_per_second']:.1f}"
+        load = "-" if item["load_seconds"] is None else f"{item['load_seconds']:.2f}"
+        lines.append(
+            f"{item['model_size']:<10} {item['compute_type']:<14} {item['beam_size']:>4} "
+            f"{item['cpu_threads'] or 'auto':>7} {load:>7} {rtf:>7} {wps:>8} "
+            f"{item['peak_rss_mb']:>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def _split(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _split_ints(value: str) -> list[int]:
+    try:
+        return [int(item) for item in _split(value)]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers: {value}") from exc
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark faster-whisper transcription settings.")
+    parser.add_argument("--audio-dir", required=True, help="Directory containing audio files.")
+    parser.add_argument("--limit", type=int, help="Only use the first N audio files.")
+    parser.add_argument("--model-sizes", type=_split, default=["tiny", "base"])
+    parser.add_argument("--compute-types", type=_split, default=["int8"])
+    parser.add_argument("--beam-sizes", type=_split_ints, default=[5])
+    parser.add_argument(
+        "--cpu-threads",
+        type=_split_ints,
+        default=[0],
+        help="Comma-separated cpu_threads values; 0 uses the library default.",
+    )
+    parser.add_argument("--output", help="Result JSON path (default: benchmarks/results/transcription-<ts>.json).")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    files = find_audio_files(args.audio_dir, args.limit)
+    if not files:
+        print(f"No audio files found in {args.audio_dir}", file=sys.stderr)
+        return 2
+
+    configs = expand_configs(
+        args.model_sizes, args.compute_types, args.beam_sizes, args.cpu_threads
+    )
+    context = multiprocessing.get_context("spawn")
+    results: list[dict[str, Any]] = []
+    with context.Pool(processes=1, maxtasksperchild=1) as pool:
+        for config in configs:
+            print(f"Running {config.label} over {len(files)} file(s) ...", flush=True)
+            results.append(pool.apply(_run_config, (config, files)))
+
+    print(format_table(results))
+
+    payload = {
+        "benchmark": "transcription",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "audio_files": [os.path.basename(path) for path in files],
+        "results": results,
+    }
+    output = args.output or os.path.join(
+        DEFAULT_RESULTS_DIR, f"transcription-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, ensure_ascii=False)
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""Conditional GET support (``ETag`` / ``If-None-Match``) for read endpoints.
+
+ETags are built from the backend's per-table write counters
+(``BaseDB.get_change_version``, a single-row read in SQLite) plus the request
+parameters, never from the response body. A poll whose tag still matches is
+answered with 304 before the endpoint touches the data it would return.
+Backends without counters (Notion) get no ETag and always a full response.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Optional
+
+from fastapi import Response, status
+
+# Clients may keep the body but must revalidate it on every use.
+CACHE_CONTROL = "private, no-cache"
+
+
+def build_etag(scope: str, version: Optional[int], *parts: object) -> Optional[str]:
+    """Weak ETag for ``scope`` at ``version``; ``None`` when the backend has no counter."""
+    if not isinstance(version, int):
+        return None
+    key = "\x1f".join(str(part) for part in parts)
+    return f'W/"{scope}-{version}-{zlib.crc32(key.encode("utf-8")):08x}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` header value."""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == wanted for candidate in if_none_match.split(",")
+    )
+
+
+def set_cache_headers(response: Response, etag: Optional[str]) -> None:
+    """Attach the ETag and revalidation policy to a full response."""
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
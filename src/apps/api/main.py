@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import os
+from contextlib import asynccontextmanager
 from datetime import datetime
-from fastapi import FastAPI, Header, HTTPException, Response, status
+from functools import lru_cache
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from src.apps.api.http_cache import (
+    build_etag,
+    etag_matches,
+    not_modified,
+    set_cache_headers,
+)
 from src.core.logger import logger
+from src.core.metrics import PROMETHEUS_CONTENT_TYPE, QUEUE_DEPTH, REGISTRY
 from src.core.time_utils import as_utc, utc_now
 from src.core.utils.url import (
     build_youtube_channel_feed_url,
@@ -15,7 +24,16 @@ from src.core.utils.url import (
     is_valid_youtube_url,
     normalize_youtube_url,
 )
-from src.domain.interfaces.database import ProcessingLockInfo
+from src.domain.interfaces.database import ActiveTaskExistsError, BaseDB, ProcessingLockInfo
+from src.domain.rss.models import RSSChannelSubscription
+from src.domain.tasks.models import Task
+from src.domain.tasks.scheduling import (
+    MAX_PRIORITY,
+    MIN_PRIORITY,
+    SCHEDULING_POLICIES,
+    normalize_policy,
+)
+from src.infrastructure.media.transcription.options import validate_model_size
 from src.infrastructure.persistence.factory import DBFactory
 from src.infrastructure.persistence.sqlite.rss_subscription_repository import (
     SQLiteRSSSubscriptionRepository,
@@ -26,14 +44,35 @@ from src.services.tasks.processing_scheduler import (
     schedule_processing_job,
 )
 from src.services.rss.subscription_service import create_rss_subscription
+from src.services.tasks.dedup_cache import get_dedup_cache
+from src.services.tasks.related_tasks import find_related_tasks
+from src.services.tasks.stage_stats import MAX_BUCKETS, load_stage_timing_summary
 from src.services.tasks.task_creation import create_task_record
 
 SUPPORTED_DB_TYPES = {"sqlite", "notion"}
 REQUIRED_NOTION_ENV_VARS: tuple[str, ...] = ("NOTION_API_KEY", "NOTION_DATABASE_ID")
 FAILED_RETRY_CREATED_STATUS = "Failed Retry Created"
+SUPPORTED_COMPUTE_TYPES = {
+    "auto",
+    "default",
+    "int8",
+    "int8_float32",
+    "int8_float16",
+    "int8_bfloat16",
+    "int16",
+    "float16",
+    "bfloat16",
+    "float32",
+}
 TASK_CACHE_TTL_SECONDS: int = int(
     os.environ.get("TASK_CACHE_TTL_SECONDS", "3600")
 )
+# Backend read by the task_queue_depth gauge on /metrics (empty disables it).
+QUEUE_DEPTH_DB_TYPE: str = os.environ.get("QUEUE_DEPTH_DB_TYPE", "sqlite").strip().lower()
+# In-process URL dedup index for POST /tasks (see src/services/tasks/dedup_cache.py).
+TASK_DEDUP_CACHE_ENABLED: bool = os.environ.get(
+    "TASK_DEDUP_CACHE_ENABLED", "true"
+).lower() in {"1", "true", "yes", "on"}
 
 
 def _normalize_db_type(value: str) -> str:
@@ -43,6 +82,70 @@ def _normalize_db_type(value: str) -> str:
     return normalized
 
 
+class TranscriptionOverrides(BaseModel):
+    """Optional per-task faster-whisper settings (unset fields use the config)."""
+
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    model_size: str | None = Field(
+        default=None,
+        description="Whisper model size, e.g. tiny, base, small.",
+    )
+    compute_type: str | None = Field(
+        default=None,
+        description="CTranslate2 compute type (int8|float32|...).",
+    )
+    cpu_threads: int | str | None = Field(
+        default=None,
+        description="Threads per model worker, 0 for the library default, or 'auto'.",
+    )
+    num_workers: int | None = Field(default=None, ge=1, le=16)
+    beam_size: int | None = Field(default=None, ge=1, le=10)
+    vad_filter: bool | None = None
+    language: str | None = Field(
+        default=None,
+        description="Language code; omit to auto-detect.",
+    )
+    chunked: bool | None = Field(
+        default=None,
+        description="Split long audio on silence and transcribe chunks in parallel.",
+    )
+    chunk_workers: int | None = Field(default=None, ge=0, le=64)
+
+    @field_validator("model_size")
+    @classmethod
+    def validate_model_size(cls, value: str | None) -> str | None:
+        if value is None:
+            return value
+        return validate_model_size(value)
+
+    @field_validator("compute_type")
+    @classmethod
+    def validate_compute_type(cls, value: str | None) -> str | None:
+        if value is None:
+            return value
+        normalized = value.lower()
+        if normalized not in SUPPORTED_COMPUTE_TYPES:
+            raise ValueError(
+                f"compute_type must be one of: {', '.join(sorted(SUPPORTED_COMPUTE_TYPES))}."
+            )
+        return normalized
+
+    @field_validator("cpu_threads")
+    @classmethod
+    def validate_cpu_threads(cls, value: int | str | None) -> int | str | None:
+        if value is None or isinstance(value, int):
+            if isinstance(value, int) and value < 0:
+                raise ValueError("cpu_threads must be >= 0 or 'auto'.")
+            return value
+        normalized = value.lower()
+        if normalized == "auto":
+            return normalized
+        if normalized.isdigit():
+            return int(normalized)
+        raise ValueError("cpu_threads must be >= 0 or 'auto'.")
+
+
 class TaskCreateRequest(BaseModel):
     """Incoming payload for creating a new task."""
 
@@ -65,6 +168,16 @@ class TaskCreateRequest(BaseModel):
         default="cache_ttl",
         description="Completed-task dedup policy (cache_ttl|block_existing).",
     )
+    transcription: TranscriptionOverrides | None = Field(
+        default=None,
+        description="Optional faster-whisper overrides for this task (sqlite only).",
+    )
+    priority: int = Field(
+        default=0,
+        ge=MIN_PRIORITY,
+        le=MAX_PRIORITY,
+        description="Scheduling priority; higher runs first (sqlite only).",
+    )
 
     @field_validator("url")
     @classmethod
@@ -192,6 +305,25 @@ class RSSSubscriptionCreateResponse(BaseModel):
     message: str = Field(..., description="Human readable status message.")
 
 
+class RSSSubscriptionItem(BaseModel):
+    """A YouTube RSS channel subscription and its last poll state."""
+
+    subscription_id: str = Field(..., description="Identifier of the subscription.")
+    channel_id: str = Field(..., description="YouTube channel id.")
+    feed_url: str = Field(..., description="Canonical YouTube feed URL.")
+    title: str = Field(..., description="Display title for the subscription.")
+    enabled: bool = Field(..., description="Whether the subscription is enabled.")
+    last_checked_at: datetime | None = Field(default=None, description="Last poll time.")
+    last_status: str = Field(default="", description="Outcome of the last poll.")
+    last_error: str = Field(default="", description="Error from the last poll, if any.")
+
+
+class RSSSubscriptionListResponse(BaseModel):
+    """Response payload for GET /rss/subscriptions."""
+
+    subscriptions: list[RSSSubscriptionItem] = Field(default_factory=list)
+
+
 class ProcessingJobCreateRequest(BaseModel):
     """Incoming payload for triggering the processing worker."""
 
@@ -328,10 +460,191 @@ class ProcessingLockReleaseResponse(BaseModel):
     )
 
 
+class TaskPriorityUpdateRequest(BaseModel):
+    """Incoming payload for changing a pending task's priority."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    priority: int = Field(
+        ...,
+        ge=MIN_PRIORITY,
+        le=MAX_PRIORITY,
+        description="New scheduling priority; higher runs first.",
+    )
+
+
+class TaskPriorityResponse(BaseModel):
+    """Response after changing a task's priority."""
+
+    task_id: str = Field(..., description="Identifier of the updated task.")
+    priority: int = Field(..., description="Stored scheduling priority.")
+    status: str = Field(..., description="Current status of the task.")
+
+
+class SchedulingPolicyRequest(BaseModel):
+    """Incoming payload for switching the scheduling policy."""
+
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    policy: str = Field(..., description="Scheduling policy (fifo|priority_fifo|sjf|fair_share).")
+
+    @field_validator("policy")
+    @classmethod
+    def validate_policy(cls, value: str) -> str:
+        return normalize_policy(value)
+
+
+class SchedulingPolicyResponse(BaseModel):
+    """Current scheduling policy used when workers claim tasks."""
+
+    policy: str = Field(..., description="Active scheduling policy.")
+    available: list[str] = Field(
+        default_factory=lambda: list(SCHEDULING_POLICIES),
+        description="Supported scheduling policies.",
+    )
+
+
+class TaskSearchResult(BaseModel):
+    """A single search hit."""
+
+    task_id: str = Field(..., description="Identifier of the matching task.")
+    title: str = Field(..., description="Task title.")
+    url: str = Field(..., description="Video URL.")
+    status: str = Field(..., description="Current status of the task.")
+    created_at: datetime | None = Field(default=None, description="Task creation time.")
+    snippet: str = Field(..., description="Excerpt with matches wrapped in <mark>...</mark>.")
+    score: float = Field(..., description="bm25 rank; lower is more relevant.")
+
+
+class TaskSearchResponse(BaseModel):
+    """Paginated, ranked full-text search results."""
+
+    query: str = Field(..., description="Search query as received.")
+    total: int = Field(..., description="Number of matching tasks.")
+    limit: int = Field(..., description="Page size.")
+    offset: int = Field(..., description="Offset of the first result.")
+    results: list[TaskSearchResult] = Field(default_factory=list)
+
+
+class RelatedTaskResult(BaseModel):
+    """A task whose summary is similar to the requested one."""
+
+    task_id: str = Field(..., description="Identifier of the related task.")
+    title: str = Field(..., description="Task title.")
+    url: str = Field(..., description="Video URL.")
+    score: float = Field(..., description="BM25 similarity; higher is more similar.")
+
+
+class RelatedTasksResponse(BaseModel):
+    """Most similar completed tasks for a task."""
+
+    task_id: str = Field(..., description="Identifier of the requested task.")
+    results: list[RelatedTaskResult] = Field(default_factory=list)
+
+
+class TaskListItem(BaseModel):
+    """A task as shown in task lists (without its summary)."""
+
+    task_id: str = Field(..., description="Identifier of the task.")
+    url: str = Field(..., description="Video URL.")
+    video_id: str | None = Field(default=None, description="YouTube video id.")
+    title: str = Field(..., description="Task title.")
+    status: str = Field(..., description="Current status of the task.")
+    priority: int = Field(default=0, description="Scheduling priority.")
+    source_type: str = Field(default="manual", description="How the task was submitted.")
+    created_at: datetime | None = Field(default=None, description="Task creation time.")
+    processing_duration: float | None = Field(
+        default=None, description="Seconds spent processing the task."
+    )
+    error_message: str = Field(default="", description="Failure reason, if any.")
+
+
+class TaskListResponse(BaseModel):
+    """Paginated task list, newest first."""
+
+    db_type: str = Field(..., description="Database backend being inspected.")
+    total: int = Field(..., description="Number of tasks matching the filter.")
+    limit: int = Field(..., description="Page size.")
+    offset: int = Field(..., description="Offset of the first task.")
+    tasks: list[TaskListItem] = Field(default_factory=list)
+
+
+class TaskDetailResponse(TaskListItem):
+    """A single task including its summary."""
+
+    db_type: str = Field(..., description="Database backend being inspected.")
+    summary: str = Field(default="", description="Generated summary (Markdown).")
+    retry_of_task_id: str | None = Field(
+        default=None, description="Task this one retries, if any."
+    )
+    notion_url: str | None = Field(default=None, description="Notion page URL, if any.")
+    duration_seconds: float | None = Field(default=None, description="Video length.")
+
+
+class StageTimingStats(BaseModel):
+    """Distribution summary for a single timing series (seconds or ratio)."""
+
+    count: int = Field(..., description="Number of samples.")
+    mean: float | None = Field(default=None, description="Arithmetic mean.")
+    max: float | None = Field(default=None, description="Largest sample.")
+    p50: float | None = Field(default=None, description="Median.")
+    p90: float | None = Field(default=None, description="90th percentile.")
+    p95: float | None = Field(default=None, description="95th percentile.")
+    p99: float | None = Field(default=None, description="99th percentile.")
+
+
+class StageTimingBucket(BaseModel):
+    """Aggregated stage timings for one time bucket."""
+
+    start: datetime = Field(..., description="Bucket start (UTC).")
+    end: datetime = Field(..., description="Bucket end (UTC).")
+    task_count: int = Field(..., description="Processing attempts recorded in the bucket.")
+    outcomes: dict[str, int] = Field(
+        default_factory=dict,
+        description="Attempt count per outcome (completed|failed).",
+    )
+    total: StageTimingStats = Field(..., description="End-to-end duration per attempt.")
+    stages: dict[str, StageTimingStats] = Field(
+        default_factory=dict,
+        description="Duration summary per pipeline stage.",
+    )
+    transcription_realtime_factor: dict[str, StageTimingStats] = Field(
+        default_factory=dict,
+        description="Transcription seconds per audio second, per transcription model.",
+    )
+
+
+class StageTimingSummaryResponse(BaseModel):
+    """Response payload for GET /stats/stage-timings."""
+
+    db_type: str = Field(..., description="Database backend being inspected.")
+    window_hours: float = Field(..., description="Trailing window length in hours.")
+    bucket_hours: float | None = Field(
+        default=None,
+        description="Bucket size in hours; null means one bucket for the window.",
+    )
+    buckets: list[StageTimingBucket] = Field(
+        default_factory=list,
+        description="Aggregated timings ordered from oldest to newest bucket.",
+    )
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI):
+    if TASK_DEDUP_CACHE_ENABLED:
+        try:
+            db = _load_database("sqlite")
+            get_dedup_cache(db).sync(db)
+        except Exception as exc:  # pragma: no cover - warm-up is best effort
+            logger.warning(f"Could not warm the task dedup cache: {exc}")
+    yield
+
+
 app = FastAPI(
     title="Task API",
     version="1.0.0",
     description="HTTP endpoints for managing transcription tasks.",
+    lifespan=_lifespan,
 )
 
 
@@ -346,9 +659,19 @@ def _ensure_db_configuration(db_type: str) -> None:
             )
 
 
+@lru_cache(maxsize=None)
+def _load_database(db_type: str) -> BaseDB:
+    """Process-wide client per backend (as the UI's ``get_db``).
+
+    Schema setup runs once, so a conditional GET that matches its ETag costs a
+    single ``table_versions`` read.
+    """
+    return DBFactory.get_db(db_type)
+
+
 def _get_database(db_type: str):
     try:
-        return DBFactory.get_db(db_type)
+        return _load_database(db_type.lower())
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -362,7 +685,7 @@ def _get_database(db_type: str):
 
 
 def _get_rss_repository() -> SQLiteRSSSubscriptionRepository:
-    db = DBFactory.get_db("sqlite")
+    db = _load_database("sqlite")
     db_path = getattr(db, "db_path", "data/tasks.db")
     return SQLiteRSSSubscriptionRepository(db_path=db_path)
 
@@ -403,6 +726,56 @@ def _build_lock_snapshot(info: ProcessingLockInfo) -> ProcessingLockSnapshot:
         stale=stale,
     )
 
+
+def _task_list_fields(task: Task) -> dict:
+    return {
+        "task_id": str(task.id),
+        "url": task.url,
+        "video_id": task.video_id,
+        "title": task.title or "",
+        "status": task.status,
+        "priority": task.priority or 0,
+        "source_type": task.source_type or "manual",
+        "created_at": as_utc(task.created_at) if task.created_at else None,
+        "processing_duration": task.processing_duration,
+        "error_message": task.error_message or "",
+    }
+
+
+def _subscription_item(subscription: RSSChannelSubscription) -> RSSSubscriptionItem:
+    return RSSSubscriptionItem(
+        subscription_id=str(subscription.id),
+        channel_id=subscription.channel_id,
+        feed_url=subscription.feed_url,
+        title=subscription.title or "",
+        enabled=subscription.enabled,
+        last_checked_at=(
+            as_utc(subscription.last_checked_at) if subscription.last_checked_at else None
+        ),
+        last_status=subscription.last_status or "",
+        last_error=subscription.last_error or "",
+    )
+
+
+def _collect_queue_depth() -> None:
+    """Refresh the queue depth gauge from the configured backend's task table."""
+    if QUEUE_DEPTH_DB_TYPE not in SUPPORTED_DB_TYPES:
+        return
+    try:
+        counts = _load_database(QUEUE_DEPTH_DB_TYPE).count_tasks_by_status()
+    except Exception as exc:  # pragma: no cover - defensive guard
+        logger.warning(f"Failed to collect queue depth metrics: {exc}")
+        return
+    if counts is None:  # e.g. Notion: no per-status count without a full scan
+        return
+    QUEUE_DEPTH.reset()
+    for task_status, count in counts.items():
+        QUEUE_DEPTH.set(count, status=task_status)
+
+
+REGISTRY.register_collector(_collect_queue_depth)
+
+
 def _schedule_processing_job(
     *,
     db_type: str,
@@ -423,6 +796,71 @@ def _schedule_processing_job(
         ) from exc
 
 
+@app.get("/tasks", response_model=TaskListResponse, status_code=status.HTTP_200_OK)
+def list_tasks(
+    request: Request,
+    response: Response,
+    task_status: str | None = Query(default=None, alias="status"),
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    db_type: str = "sqlite",
+    if_none_match: str | None = Header(None),
+):
+    """List active tasks, newest first (conditional GET via ETag)."""
+
+    normalized_db_type = _normalize_db_type(db_type)
+    _ensure_db_configuration(normalized_db_type)
+    db = _get_database(normalized_db_type)
+    etag = build_etag("tasks", db.get_change_version("tasks"), request.url.query)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    page = db.list_tasks(
+        statuses=[task_status] if task_status else None, limit=limit, offset=offset
+    )
+    set_cache_headers(response, etag)
+    return TaskListResponse(
+        db_type=normalized_db_type,
+        total=page.total,
+        limit=limit,
+        offset=offset,
+        tasks=[TaskListItem(**_task_list_fields(task)) for task in page.tasks],
+    )
+
+
+@app.get("/tasks/{task_id}", response_model=TaskDetailResponse, status_code=status.HTTP_200_OK)
+def get_task(
+    task_id: str,
+    response: Response,
+    db_type: str = "sqlite",
+    if_none_match: str | None = Header(None),
+):
+    """Return a single task, including archived ones (conditional GET via ETag)."""
+
+    normalized_db_type = _normalize_db_type(db_type)
+    _ensure_db_configuration(normalized_db_type)
+    db = _get_database(normalized_db_type)
+    etag = build_etag("tasks", db.get_change_version("tasks"), task_id, normalized_db_type)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    task = db.get_task_by_id(task_id)
+    if task is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found.",
+        )
+    set_cache_headers(response, etag)
+    return TaskDetailResponse(
+        **_task_list_fields(task),
+        db_type=normalized_db_type,
+        summary=task.summary or "",
+        retry_of_task_id=str(task.retry_of_task_id) if task.retry_of_task_id else None,
+        notion_url=task.notion_url,
+        duration_seconds=task.duration_seconds,
+    )
+
+
 @app.post("/tasks", response_model=TaskCreateResponse, status_code=status.HTTP_201_CREATED)
 def create_task(payload: TaskCreateRequest, response: Response):
     """Create a new task and persist it in the selected backend.
@@ -451,6 +889,13 @@ def create_task(payload: TaskCreateRequest, response: Response):
             source_channel_id=payload.source_channel_id,
             cache_ttl_seconds=TASK_CACHE_TTL_SECONDS,
             completed_task_policy=payload.completed_task_policy,
+            transcription_options=(
+                payload.transcription.model_dump(exclude_none=True)
+                if payload.transcription
+                else None
+            ),
+            priority=payload.priority,
+            dedup_cache=get_dedup_cache(db) if TASK_DEDUP_CACHE_ENABLED else None,
         )
     except RuntimeError as exc:
         raise HTTPException(
@@ -532,6 +977,34 @@ def create_task(payload: TaskCreateRequest, response: Response):
     )
 
 
+@app.get(
+    "/rss/subscriptions",
+    response_model=RSSSubscriptionListResponse,
+    status_code=status.HTTP_200_OK,
+)
+def list_rss_subscriptions_endpoint(
+    response: Response,
+    enabled_only: bool = False,
+    if_none_match: str | None = Header(None),
+):
+    """List RSS channel subscriptions in SQLite (conditional GET via ETag)."""
+
+    db = _get_database("sqlite")
+    etag = build_etag(
+        "rss_channel_subscriptions",
+        db.get_change_version("rss_channel_subscriptions"),
+        enabled_only,
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    subscriptions = _get_rss_repository().list_subscriptions(enabled_only=enabled_only)
+    set_cache_headers(response, etag)
+    return RSSSubscriptionListResponse(
+        subscriptions=[_subscription_item(subscription) for subscription in subscriptions]
+    )
+
+
 @app.post(
     "/rss/subscriptions",
     response_model=RSSSubscriptionCreateResponse,
@@ -604,6 +1077,11 @@ def retry_task(task_id: str, payload: TaskRetryRequest) -> TaskRetryResponse:
     try:
         new_task = db.create_retry_task(source_task, payload.retry_reason)
         db.update_task_status(source_task.id, FAILED_RETRY_CREATED_STATUS)
+    except ActiveTaskExistsError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(exc),
+        ) from exc
     except RuntimeError as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -624,6 +1102,64 @@ def retry_task(task_id: str, payload: TaskRetryRequest) -> TaskRetryResponse:
     )
 
 
+@app.patch(
+    "/tasks/{task_id}/priority",
+    response_model=TaskPriorityResponse,
+    status_code=status.HTTP_200_OK,
+)
+def update_task_priority(task_id: str, payload: TaskPriorityUpdateRequest) -> TaskPriorityResponse:
+    """Change the scheduling priority of a pending task (sqlite only)."""
+
+    db = _get_database("sqlite")
+    task = db.get_task_by_id(task_id)
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found.",
+        )
+    if task.status != "Pending":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Only pending tasks can be reprioritized.",
+        )
+    db.set_task_priority(task_id, payload.priority)
+    return TaskPriorityResponse(
+        task_id=str(task.id),
+        priority=payload.priority,
+        status=task.status,
+    )
+
+
+@app.get(
+    "/scheduling/policy",
+    response_model=SchedulingPolicyResponse,
+    status_code=status.HTTP_200_OK,
+)
+def get_scheduling_policy() -> SchedulingPolicyResponse:
+    """Report the policy workers use to pick the next task."""
+
+    db = _get_database("sqlite")
+    return SchedulingPolicyResponse(policy=db.get_scheduling_policy())
+
+
+@app.put(
+    "/scheduling/policy",
+    response_model=SchedulingPolicyResponse,
+    status_code=status.HTTP_200_OK,
+)
+def put_scheduling_policy(
+    payload: SchedulingPolicyRequest,
+    maintainer_token: str | None = Header(None, alias="X-Maintainer-Token"),
+) -> SchedulingPolicyResponse:
+    """Switch the scheduling policy (maintainer only); applies to the next claim."""
+
+    _ensure_maintainer_token(maintainer_token)
+    db = _get_database("sqlite")
+    db.set_scheduling_policy(payload.policy)
+    logger.info(f"Maintainer switched the scheduling policy to {payload.policy}")
+    return SchedulingPolicyResponse(policy=db.get_scheduling_policy())
+
+
 @app.post(
     "/processing-jobs",
     response_model=ProcessingJobCreateResponse,
@@ -663,16 +1199,31 @@ def create_processing_job_endpoint(
     status_code=status.HTTP_200_OK,
 )
 def get_processing_lock_status(
+    response: Response,
     db_type: str = "sqlite",
     maintainer_token: str | None = Header(None, alias="X-Maintainer-Token"),
-) -> ProcessingLockStatusResponse:
-    """Inspect the current processing lock for the selected backend."""
+    if_none_match: str | None = Header(None),
+):
+    """Inspect the current processing lock for the selected backend.
+
+    The ETag changes when the lock row is written and when the lock turns
+    stale; ``age_seconds`` in a revalidated body is as of its first fetch.
+    """
 
     normalized_db_type = _normalize_db_type(db_type)
     _ensure_maintainer_token(maintainer_token)
     _ensure_db_configuration(normalized_db_type)
     db = _get_database(normalized_db_type)
     snapshot = _build_lock_snapshot(db.read_processing_lock())
+    etag = build_etag(
+        "processing_lock",
+        db.get_change_version("processing_lock"),
+        normalized_db_type,
+        snapshot.stale,
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
     logger.info(
         f"Maintainer inspected processing lock for {normalized_db_type} "
         f"(worker={snapshot.worker_id}, stale={snapshot.stale})"
@@ -772,3 +1323,114 @@ def delete_processing_lock(
         before=before_snapshot,
         after=after_snapshot,
     )
+
+
+@app.get(
+    "/stats/stage-timings",
+    response_model=StageTimingSummaryResponse,
+    status_code=status.HTTP_200_OK,
+)
+def get_stage_timing_summary(
+    db_type: str = "sqlite",
+    window_hours: float = Query(default=24, gt=0, le=24 * 90),
+    bucket_hours: float | None = Query(default=None, gt=0),
+) -> StageTimingSummaryResponse:
+    """Aggregate per-stage processing timings over a trailing time window."""
+
+    try:
+        normalized_db_type = _normalize_db_type(db_type)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc),
+        ) from exc
+    if bucket_hours and window_hours / bucket_hours > MAX_BUCKETS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"window_hours / bucket_hours must not exceed {MAX_BUCKETS}.",
+        )
+    _ensure_db_configuration(normalized_db_type)
+    db = _get_database(normalized_db_type)
+    buckets = load_stage_timing_summary(
+        db,
+        window_hours=window_hours,
+        bucket_hours=bucket_hours,
+    )
+    return StageTimingSummaryResponse(
+        db_type=normalized_db_type,
+        window_hours=window_hours,
+        bucket_hours=bucket_hours,
+        buckets=[StageTimingBucket(**bucket) for bucket in buckets],
+    )
+
+
+@app.get(
+    "/search",
+    response_model=TaskSearchResponse,
+    status_code=status.HTTP_200_OK,
+)
+def search_tasks(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+) -> TaskSearchResponse:
+    """Search task titles, summaries and indexed transcripts (sqlite only)."""
+
+    db = _get_database("sqlite")
+    found = db.search_tasks(q, limit=limit, offset=offset)
+    return TaskSearchResponse(
+        query=q,
+        total=found.total,
+        limit=limit,
+        offset=offset,
+        results=[
+            TaskSearchResult(
+                task_id=str(hit.task.id),
+                title=hit.task.title or "",
+                url=hit.task.url,
+                status=hit.task.status,
+                created_at=as_utc(hit.task.created_at) if hit.task.created_at else None,
+                snippet=hit.snippet,
+                score=hit.score,
+            )
+            for hit in found.hits
+        ],
+    )
+
+
+@app.get(
+    "/tasks/{task_id}/related",
+    response_model=RelatedTasksResponse,
+    status_code=status.HTTP_200_OK,
+)
+def get_related_tasks(
+    task_id: str,
+    limit: int = Query(default=5, ge=1, le=50),
+) -> RelatedTasksResponse:
+    """Completed tasks with the most similar summaries (local BM25 index, sqlite only)."""
+
+    db = _get_database("sqlite")
+    if db.get_task_by_id(task_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found.",
+        )
+    return RelatedTasksResponse(
+        task_id=task_id,
+        results=[
+            RelatedTaskResult(
+                task_id=item.task_id,
+                title=item.title,
+                url=item.url,
+                score=item.score,
+            )
+            for item in find_related_tasks(db, task_id, limit)
+        ],
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+def get_metrics() -> Response:
+    """Expose in-process pipeline metrics in Prometheus text format."""
+
+    return Response(content=REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
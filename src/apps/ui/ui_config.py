@@ -5,3 +5,6 @@ API_BASE_URL = os.environ.get("TASK_API_BASE_URL", "http://localhost:8080")
 NOTION_BASE_URL = os.environ.get("NOTION_URL")
 RECENT_TASK_HISTORY_KEY = "recent_task_history"
 RECENT_TASK_HISTORY_TTL_DAYS = 30
+# How long a cached task-list page may be reused when the backend cannot
+# report table changes (Notion); SQLite pages are re-read on every write.
+TASK_SNAPSHOT_TTL_SECONDS = int(os.environ.get("UI_TASK_SNAPSHOT_TTL_SECONDS", "30"))
@@ -0,0 +1,85 @@
+"""Data access for the Streamlit UI: shared DB clients and cached task pages.
+
+Streamlit re-runs the whole script on every widget interaction. Clients are
+created once per process (``st.cache_resource``), so SQLite schema setup and
+Notion client construction do not repeat on each rerun. Task-list pages are
+kept in ``st.cache_data``, keyed by the backend's ``tasks`` change counter,
+so SQLite pages are re-read only after a write from any process. Notion has
+no counter; its pages expire after ``TASK_SNAPSHOT_TTL_SECONDS`` or when the
+UI calls ``invalidate_task_snapshots`` after its own mutations.
+"""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from typing import Optional, Sequence
+
+from src.apps.ui.ui_config import TASK_SNAPSHOT_TTL_SECONDS
+from src.apps.ui.ui_runtime import st
+from src.domain.interfaces.database import BaseDB
+from src.domain.tasks.models import Task, TaskPage
+from src.infrastructure.persistence.factory import DBFactory
+
+# List rows never show the summary; leaving it out keeps snapshots small and
+# avoids loading compressed summaries just to cache a page.
+_SNAPSHOT_FIELDS = tuple(field.name for field in fields(Task) if field.name != "summary")
+
+
+def _cache_resource(func):
+    return st.cache_resource(show_spinner=False)(func) if st is not None else func
+
+
+def _cache_data(func):
+    if st is None:
+        return func
+    return st.cache_data(ttl=TASK_SNAPSHOT_TTL_SECONDS, show_spinner=False)(func)
+
+
+@_cache_resource
+def _load_db(db_type: str) -> BaseDB:
+    return DBFactory.get_db(db_type)
+
+
+def get_db(db_choice: str) -> BaseDB:
+    """Process-wide client for ``db_choice`` ("SQLite" / "Notion")."""
+    return _load_db(db_choice.lower())
+
+
+def _snapshot_task(task: Task) -> Task:
+    return Task(**{name: getattr(task, name) for name in _SNAPSHOT_FIELDS})
+
+
+@_cache_data
+def _load_task_page(
+    db_type: str,
+    version: Optional[int],
+    statuses: Optional[tuple[str, ...]],
+    limit: int,
+    offset: int,
+) -> TaskPage:
+    page = _load_db(db_type).list_tasks(statuses=statuses, limit=limit, offset=offset)
+    return TaskPage(total=page.total, tasks=[_snapshot_task(task) for task in page.tasks])
+
+
+def load_task_page(
+    db_choice: str,
+    statuses: Optional[Sequence[str]] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> TaskPage:
+    """One page of tasks (newest first, without summaries) for the task table."""
+    db_type = db_choice.lower()
+    return _load_task_page(
+        db_type,
+        _load_db(db_type).get_change_version("tasks"),
+        tuple(statuses) if statuses is not None else None,
+        limit,
+        offset,
+    )
+
+
+def invalidate_task_snapshots() -> None:
+    """Drop cached task pages after the UI creates or changes tasks."""
+    clear = getattr(_load_task_page, "clear", None)
+    if clear is not None:
+        clear()
@@ -5,13 +5,14 @@ from datetime import timedelta
 from typing import Any
 
 from src.apps.ui.ui_config import RECENT_TASK_HISTORY_KEY, RECENT_TASK_HISTORY_TTL_DAYS
+from src.apps.ui.ui_data import get_db
 from src.apps.ui.ui_runtime import require_streamlit, st
 from src.core.time_utils import utc_now_naive
 from src.infrastructure.persistence.sqlite.client import SQLiteDB
 
 
 def _get_history_db() -> SQLiteDB:
-    return SQLiteDB()
+    return get_db("SQLite")
 
 
 def prune_recent_history() -> None:
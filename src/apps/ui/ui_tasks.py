@@ -25,7 +25,7 @@ ALLOWED_STATUS_OPTIONS = [
 ]
 
 
-def collect_task_status_options(tasks: list[Any]) -> list[str]:
+def collect_task_status_options() -> list[str]:
     """Return fixed status filter options."""
     return list(ALLOWED_STATUS_OPTIONS)
 
@@ -38,3 +38,16 @@ def filter_tasks_by_status(tasks: list[Any], selected_statuses: list[str] | None
         return []
     selected_set = set(selected_statuses)
     return [task for task in tasks if getattr(task, "status", None) in selected_set]
+
+
+SEARCH_PAGE_SIZE = 10
+
+
+def format_search_snippet(snippet: str | None) -> str:
+    """Turn API/DB ``<mark>`` highlights into Markdown bold for ``st.markdown``."""
+    if not snippet:
+        return ""
+    text = " ".join(snippet.split())
+    for char in ("\\", "*", "_", "`", "#"):
+        text = text.replace(char, "\\" + char)
+    return text.replace("<mark>", "**").replace("</mark>", "**")
@@ -13,6 +13,7 @@ from src.apps.ui.ui_api import (
     get_processing_lock_admin_token,
 )
 from src.apps.ui.ui_config import NOTION_BASE_URL
+from src.apps.ui.ui_data import get_db, invalidate_task_snapshots, load_task_page
 from src.apps.ui.ui_history import (
     get_recent_task_history,
     get_viewed_task_ids,
@@ -28,16 +29,19 @@ from src.apps.ui.ui_rss import (
 from src.apps.ui.ui_notion import get_notion_display
 from src.apps.ui.ui_runtime import RequestException, require_streamlit, st
 from src.apps.ui.ui_tasks import (
+    SEARCH_PAGE_SIZE,
     collect_task_status_options,
-    filter_tasks_by_status,
-    sort_tasks_for_display,
+    format_search_snippet,
 )
 from src.core.utils.url import is_valid_youtube_url, normalize_youtube_url
-from src.infrastructure.persistence.factory import DBFactory
 from src.infrastructure.persistence.sqlite.client import SQLiteDB
 from src.infrastructure.persistence.sqlite.rss_subscription_repository import (
     SQLiteRSSSubscriptionRepository,
 )
+from src.services.tasks.related_tasks import find_related_tasks
+from src.services.tasks.stage_stats import load_stage_timing_summary
+
+STAGE_TIMING_WINDOWS = {"最近 24 小時": 24, "最近 7 天": 24 * 7, "最近 30 天": 24 * 30}
 
 
 def _normalize_optional_text(value: str | None) -> str | None:
@@ -93,6 +97,7 @@ def trigger_processing_via_api(db_choice: str) -> None:
         return
 
     if status == 202:
+        invalidate_task_snapshots()
         worker_id = body.get("worker_id")
         message = body.get("message", "已排程背景處理。")
         note = f"{message}（worker: {worker_id}）" if worker_id else message
@@ -118,6 +123,7 @@ def retry_task_via_api(task_id: str, db_choice: str) -> None:
         return
 
     if status == 201:
+        invalidate_task_snapshots()
         new_task_id = body.get("task_id")
         message = body.get("message") or "已建立重試任務。"
         note = f"{message}（task: {new_task_id}）" if new_task_id else message
@@ -248,6 +254,7 @@ def add_url_callback(db_choice: str) -> None:
             return
 
         if status == 201:
+            invalidate_task_snapshots()
             message = body.get(
                 "message",
                 f"Successfully added to queue: {normalized}",
@@ -287,6 +294,7 @@ def render_rss_management(db) -> None:
         try:
             with st.spinner("正在執行 RSS 輪詢..."):
                 results = trigger_rss_poll_once(db.db_path)
+            invalidate_task_snapshots()
             summary_lines = format_rss_poll_results(results)
             if summary_lines:
                 st.session_state.rss_poll_summary = summary_lines
@@ -378,6 +386,113 @@ def render_rss_management(db) -> None:
                 st.rerun()
 
 
+def _format_seconds(value: float | None) -> str:
+    return f"{value:.2f}" if value is not None else "-"
+
+
+def build_stage_timing_rows(bucket: dict[str, Any]) -> list[dict[str, Any]]:
+    """Flatten one aggregated bucket into table rows (one per stage)."""
+    rows: list[dict[str, Any]] = []
+    stages = dict(bucket.get("stages") or {})
+    total = bucket.get("total")
+    if total and total.get("count"):
+        stages["total"] = total
+    for stage, stats in stages.items():
+        rows.append(
+            {
+                "Stage": stage,
+                "Count": stats.get("count", 0),
+                "p50 (s)": _format_seconds(stats.get("p50")),
+                "p95 (s)": _format_seconds(stats.get("p95")),
+                "p99 (s)": _format_seconds(stats.get("p99")),
+                "Max (s)": _format_seconds(stats.get("max")),
+            }
+        )
+    return rows
+
+
+def render_stage_timing_summary(db) -> None:
+    require_streamlit()
+    with st.expander("處理階段耗時統計"):
+        window_label = st.selectbox(
+            "統計區間",
+            list(STAGE_TIMING_WINDOWS),
+            key="stage_timing_window",
+        )
+        buckets = load_stage_timing_summary(
+            db,
+            window_hours=STAGE_TIMING_WINDOWS[window_label],
+        )
+        bucket = buckets[0] if buckets else {}
+        if not bucket.get("task_count"):
+            st.caption("此區間尚無處理紀錄。")
+            return
+        st.caption(f"共 {bucket['task_count']} 次處理：{bucket.get('outcomes')}")
+        st.table(build_stage_timing_rows(bucket))
+        realtime_factors = bucket.get("transcription_realtime_factor") or {}
+        if realtime_factors:
+            st.markdown("**轉錄 real-time factor（轉錄秒數 / 音訊秒數）**")
+            st.table(
+                [
+                    {
+                        "Model": model,
+                        "Count": stats.get("count", 0),
+                        "p50": _format_seconds(stats.get("p50")),
+                        "p95": _format_seconds(stats.get("p95")),
+                    }
+                    for model, stats in realtime_factors.items()
+                ]
+            )
+
+
+def render_task_search(db, db_choice: str) -> None:
+    """Full-text search over summaries (SQLite FTS5), ranked with highlights."""
+    require_streamlit()
+    st.header("Search Summaries")
+    if not isinstance(db, SQLiteDB):
+        st.caption("全文搜尋目前僅支援 SQLite。")
+        return
+
+    query = st.text_input("搜尋標題、摘要或逐字稿", key="task_search_query").strip()
+    if not query:
+        return
+    if st.session_state.get("task_search_last_query") != query:
+        st.session_state.task_search_last_query = query
+        st.session_state.task_search_page = 1
+    page = st.session_state.get("task_search_page", 1)
+
+    found = db.search_tasks(
+        query, limit=SEARCH_PAGE_SIZE, offset=(page - 1) * SEARCH_PAGE_SIZE
+    )
+    if not found.total:
+        st.write("找不到符合的任務。")
+        return
+    total_pages = math.ceil(found.total / SEARCH_PAGE_SIZE)
+    st.caption(f"共 {found.total} 筆結果")
+    for hit in found.hits:
+        task = hit.task
+        title_col, action_col = st.columns([6, 1])
+        title_col.markdown(f"**{task.title or task.url}** · {task.status}")
+        title_col.markdown(format_search_snippet(hit.snippet))
+        if action_col.button("View", key=f"search_view_{task.id}"):
+            record_recent_task(task, NOTION_BASE_URL)
+            st.session_state.selected_task_id = task.id
+            st.session_state.selected_db_choice = db_choice
+            st.rerun()
+
+    prev_col, label_col, next_col = st.columns([1, 1, 1])
+    with prev_col:
+        if st.button("Previous", key="search_prev") and page > 1:
+            st.session_state.task_search_page = page - 1
+            st.rerun()
+    with label_col:
+        st.write(f"Page {page} of {total_pages}")
+    with next_col:
+        if st.button("Next", key="search_next") and page < total_pages:
+            st.session_state.task_search_page = page + 1
+            st.rerun()
+
+
 def main_view() -> None:
     require_streamlit()
     st.title("YouTube Transcript Summarizer")
@@ -480,150 +595,178 @@ def main_view() -> None:
                 )
                 release_processing_lock_with_payload(db_choice, payload)
 
-    db = DBFactory.get_db(db_choice)
+    db = get_db(db_choice)
 
     render_rss_management(db)
 
+    render_stage_timing_summary(db)
+
     get_recent_task_history()
 
-    st.header("Tasks in Database")
+    render_task_search(db, db_choice)
 
-    tasks = sort_tasks_for_display(db.get_all_tasks())
+    st.header("Tasks in Database")
 
-    if not tasks:
-        st.write("No tasks in the database.")
-    else:
-        status_options = collect_task_status_options(tasks)
-        if status_options:
-            default_statuses = [
+    status_options = collect_task_status_options()
+    if status_options:
+        default_statuses = [
+            status
+            for status in ["Pending", "Processing", "Completed", "Failed"]
+            if status in status_options
+        ]
+        if "task_status_filter" in st.session_state:
+            st.session_state.task_status_filter = [
                 status
-                for status in ["Pending", "Processing", "Completed", "Failed"]
+                for status in st.session_state.task_status_filter
                 if status in status_options
             ]
-            if "task_status_filter" in st.session_state:
-                st.session_state.task_status_filter = [
-                    status
-                    for status in st.session_state.task_status_filter
-                    if status in status_options
-                ]
-            st.markdown(
-                """
-                <style>
-                .stMultiSelect [data-baseweb="tag"] {
-                    background-color: #1f6feb;
-                    color: #ffffff;
-                }
-                .stMultiSelect [data-baseweb="tag"]:hover {
-                    background-color: #1158c7;
-                }
-                </style>
-                """,
-                unsafe_allow_html=True,
-            )
-            selected_statuses = st.multiselect(
-                "狀態篩選",
-                status_options,
-                default=default_statuses,
-                key="task_status_filter",
-            )
+        st.markdown(
+            """
+            <style>
+            .stMultiSelect [data-baseweb="tag"] {
+                background-color: #1f6feb;
+                color: #ffffff;
+            }
+            .stMultiSelect [data-baseweb="tag"]:hover {
+                background-color: #1158c7;
+            }
+            </style>
+            """,
+            unsafe_allow_html=True,
+        )
+        selected_statuses = st.multiselect(
+            "狀態篩選",
+            status_options,
+            default=default_statuses,
+            key="task_status_filter",
+        )
+    else:
+        selected_statuses = None
+
+    if "page_size" not in st.session_state:
+        st.session_state.page_size = 20
+    if "current_page" not in st.session_state:
+        st.session_state.current_page = 1
+
+    page_size = st.selectbox(
+        "Items per page",
+        [20, 50, 100],
+        index=[20, 50, 100].index(st.session_state.page_size),
+        key="page_size_selector",
+    )
+    st.session_state.page_size = page_size
+
+    # Only the visible page is read (and cached); see ui_data.py.
+    page = load_task_page(
+        db_choice,
+        statuses=selected_statuses,
+        limit=page_size,
+        offset=(st.session_state.current_page - 1) * page_size,
+    )
+    if not page.total:
+        if selected_statuses is None or set(status_options) <= set(selected_statuses):
+            st.write("No tasks in the database.")
         else:
-            selected_statuses = None
-        filtered_tasks = filter_tasks_by_status(tasks, selected_statuses)
-        if not filtered_tasks:
             st.write("沒有符合狀態篩選的任務。")
-            return
-
-        if "page_size" not in st.session_state:
-            st.session_state.page_size = 20
-        if "current_page" not in st.session_state:
-            st.session_state.current_page = 1
-
-        page_size = st.selectbox(
-            "Items per page",
-            [20, 50, 100],
-            index=[20, 50, 100].index(st.session_state.page_size),
-            key="page_size_selector",
+        return
+    total_pages = math.ceil(page.total / page_size)
+    if st.session_state.current_page > total_pages:
+        st.session_state.current_page = total_pages
+        page = load_task_page(
+            db_choice,
+            statuses=selected_statuses,
+            limit=page_size,
+            offset=(total_pages - 1) * page_size,
         )
-        st.session_state.page_size = page_size
-
-        total_pages = math.ceil(len(filtered_tasks) / st.session_state.page_size)
-        if st.session_state.current_page > total_pages:
-            st.session_state.current_page = total_pages
-        start_idx = (st.session_state.current_page - 1) * st.session_state.page_size
-        end_idx = start_idx + st.session_state.page_size
-        paginated_tasks = filtered_tasks[start_idx:end_idx]
-        viewed_ids = set(get_viewed_task_ids())
-
-        header_cols = st.columns(8)
-        header_cols[0].write("**URL**")
-        header_cols[1].write("**Title**")
-        header_cols[2].write("**Viewed**")
-        header_cols[3].write("**Status**")
-        header_cols[4].write("**Created At (Taipei)**")
-        header_cols[5].write("**Duration (s)**")
-        header_cols[6].write("**Notion**")
-        header_cols[7].write("**Action**")
-
-        for task in paginated_tasks:
-            col1, col2, col3, col4, col5, col6, col7, col8 = st.columns(8)
-            col1.write(task.url)
-            col2.write(task.title)
-            viewed_placeholder = col3.empty()
-            task_id_str = str(task.id)
-            viewed_label = "已看過" if task_id_str in viewed_ids else "-"
-            viewed_placeholder.write(viewed_label)
-            col4.write(task.status)
-            if task.created_at:
-                taipei_time = task.created_at.astimezone(timezone(timedelta(hours=8)))
-                col5.write(taipei_time.strftime("%Y-%m-%d %H:%M:%S"))
-            else:
-                col5.write("-")
-            if task.status == "Completed" and task.processing_duration is not None:
-                col6.write(f"{task.processing_duration:.2f}")
-            else:
-                col6.write("-")
-
-            notion_display = get_notion_display(task, NOTION_BASE_URL)
-            if notion_display["status"] == "link":
-                if col7.button("Notion", key=f"notion_{task.id}"):
-                    record_recent_task(task, NOTION_BASE_URL)
-                    open_notion_link(notion_display["url"])
-                    if task_id_str not in viewed_ids:
-                        viewed_ids.add(task_id_str)
-                        viewed_placeholder.write("已看過")
-            elif notion_display["status"] == "invalid":
-                col7.write(f"⚠️ {notion_display['message']}")
-            else:
-                col7.write(notion_display["message"])
+    paginated_tasks = page.tasks
+    viewed_ids = set(get_viewed_task_ids())
+
+    header_cols = st.columns(8)
+    header_cols[0].write("**URL**")
+    header_cols[1].write("**Title**")
+    header_cols[2].write("**Viewed**")
+    header_cols[3].write("**Status**")
+    header_cols[4].write("**Created At (Taipei)**")
+    header_cols[5].write("**Duration (s)**")
+    header_cols[6].write("**Notion**")
+    header_cols[7].write("**Action**")
+
+    for task in paginated_tasks:
+        col1, col2, col3, col4, col5, col6, col7, col8 = st.columns(8)
+        col1.write(task.url)
+        col2.write(task.title)
+        viewed_placeholder = col3.empty()
+        task_id_str = str(task.id)
+        viewed_label = "已看過" if task_id_str in viewed_ids else "-"
+        viewed_placeholder.write(viewed_label)
+        col4.write(task.status)
+        if task.created_at:
+            taipei_time = task.created_at.astimezone(timezone(timedelta(hours=8)))
+            col5.write(taipei_time.strftime("%Y-%m-%d %H:%M:%S"))
+        else:
+            col5.write("-")
+        if task.status == "Completed" and task.processing_duration is not None:
+            col6.write(f"{task.processing_duration:.2f}")
+        else:
+            col6.write("-")
 
-            if col8.button("View", key=f"view_{task.id}"):
+        notion_display = get_notion_display(task, NOTION_BASE_URL)
+        if notion_display["status"] == "link":
+            if col7.button("Notion", key=f"notion_{task.id}"):
                 record_recent_task(task, NOTION_BASE_URL)
-                st.session_state.selected_task_id = task.id
-                st.session_state.selected_db_choice = db_choice
+                open_notion_link(notion_display["url"])
+                if task_id_str not in viewed_ids:
+                    viewed_ids.add(task_id_str)
+                    viewed_placeholder.write("已看過")
+        elif notion_display["status"] == "invalid":
+            col7.write(f"⚠️ {notion_display['message']}")
+        else:
+            col7.write(notion_display["message"])
+
+        if col8.button("View", key=f"view_{task.id}"):
+            record_recent_task(task, NOTION_BASE_URL)
+            st.session_state.selected_task_id = task.id
+            st.session_state.selected_db_choice = db_choice
+            st.rerun()
+        if task.status == "Failed":
+            if col8.button("Retry", key=f"retry_{task.id}"):
+                retry_task_via_api(task.id, db_choice)
+
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        if st.button("Previous"):
+            if st.session_state.current_page > 1:
+                st.session_state.current_page -= 1
+                st.rerun()
+    with col2:
+        st.write(f"Page {st.session_state.current_page} of {total_pages}")
+    with col3:
+        if st.button("Next"):
+            if st.session_state.current_page < total_pages:
+                st.session_state.current_page += 1
                 st.rerun()
-            if task.status == "Failed":
-                if col8.button("Retry", key=f"retry_{task.id}"):
-                    retry_task_via_api(task.id, db_choice)
-
-        col1, col2, col3 = st.columns([1, 1, 1])
-        with col1:
-            if st.button("Previous"):
-                if st.session_state.current_page > 1:
-                    st.session_state.current_page -= 1
-                    st.rerun()
-        with col2:
-            st.write(f"Page {st.session_state.current_page} of {total_pages}")
-        with col3:
-            if st.button("Next"):
-                if st.session_state.current_page < total_pages:
-                    st.session_state.current_page += 1
-                    st.rerun()
+
+
+def render_related_tasks(db, task, db_choice: str) -> None:
+    if not isinstance(db, SQLiteDB) or task.status != "Completed":
+        return
+    related = find_related_tasks(db, str(task.id), limit=5)
+    if not related:
+        return
+    st.header("相關影片")
+    for item in related:
+        title_col, action_col = st.columns([6, 1])
+        title_col.write(item.title or item.url)
+        if action_col.button("View", key=f"related_{task.id}_{item.task_id}"):
+            st.session_state.selected_task_id = item.task_id
+            st.session_state.selected_db_choice = db_choice
+            st.rerun()
 
 
 def detail_view(task_id: str, db_choice: str) -> None:
     require_streamlit()
     st.title("Task Details")
-    db = DBFactory.get_db(db_choice)
+    db = get_db(db_choice)
     task = db.get_task_by_id(task_id)
 
     if task:
@@ -645,6 +788,7 @@ def detail_view(task_id: str, db_choice: str) -> None:
             st.write(f"**Notion:** {notion_display['message']}")
         st.header("Summary")
         st.markdown(task.summary)
+        render_related_tasks(db, task, db_choice)
     else:
         st.error("Task not found.")
 
@@ -0,0 +1,39 @@
+"""CLI entry for archiving old completed and failed tasks."""
+
+from __future__ import annotations
+
+import argparse
+
+from src.core.config import Config
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.services.pipeline.task_archive import DEFAULT_BATCH_SIZE, archive_old_tasks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Move completed/failed tasks older than the retention window to the archive."
+    )
+    parser.add_argument(
+        "--db-path",
+        default="data/tasks.db",
+        help="SQLite database holding the tasks table.",
+    )
+    parser.add_argument(
+        "--days",
+        type=float,
+        default=None,
+        help="Retention window in days (default: TASK_ARCHIVE_AFTER_DAYS).",
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    days = args.days if args.days is not None else Config().task_archive_after_days
+    if days <= 0:
+        print({"archived": 0, "message": "Archiving is disabled (retention <= 0 days)."})
+        return
+    archived = archive_old_tasks(SQLiteDB(args.db_path), days, batch_size=max(1, args.batch_size))
+    print({"archived": archived, "retention_days": days})
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,10 @@ from __future__ import annotations
 import argparse
 
 from src.infrastructure.persistence.factory import DBFactory
+from src.services.pipeline.async_runner import (
+    DEFAULT_ASYNC_CONCURRENCY,
+    process_pending_tasks_async,
+)
 from src.services.pipeline.processing_runner import process_pending_tasks
 
 
@@ -21,10 +25,27 @@ def main() -> None:
         default=None,
         help="Optional worker identifier for easier lock inspection.",
     )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Use the asyncio runner to overlap downloads, LLM and Notion calls across tasks.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_ASYNC_CONCURRENCY,
+        help="Tasks in flight with --async (transcription is still capped by TRANSCRIPTION_CONCURRENCY).",
+    )
     args = parser.parse_args()
 
     db = DBFactory.get_db(args.db_type)
-    summary = process_pending_tasks(db=db, worker_id=args.worker_id)
+    if args.use_async:
+        summary = process_pending_tasks_async(
+            db=db, worker_id=args.worker_id, concurrency=args.concurrency
+        )
+    else:
+        summary = process_pending_tasks(db=db, worker_id=args.worker_id)
     print(summary.to_dict())
 
 
@@ -0,0 +1,83 @@
+"""Dedicated transcription worker processes fed by the SQLite job table."""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+
+from src.core.logger import logger
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.infrastructure.persistence.sqlite.transcription_job_repository import (
+    SQLiteTranscriptionJobRepository,
+)
+from src.services.pipeline.transcription_queue import TranscriptionJobWorker
+
+
+def _run_worker(db_path: str, worker_id: str, args: argparse.Namespace) -> None:
+    worker = TranscriptionJobWorker(
+        SQLiteTranscriptionJobRepository(db_path),
+        worker_id=worker_id,
+        stale_after_seconds=args.stale_after,
+        poll_interval_seconds=args.poll_interval,
+    )
+    handled = worker.run(exit_when_idle=args.once)
+    logger.info(f"Transcription worker {worker_id} stopped after {handled} job(s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run transcription workers that drain the transcription_jobs queue."
+    )
+    parser.add_argument(
+        "--db-path",
+        default="data/tasks.db",
+        help="SQLite database holding the job table.",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Worker processes to start (each loads its own model).",
+    )
+    parser.add_argument("--worker-id", default="transcriber", help="Worker id prefix.")
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between polls when idle.",
+    )
+    parser.add_argument(
+        "--stale-after",
+        type=int,
+        default=900,
+        help="Reclaim running jobs whose worker has not reported for this many seconds.",
+    )
+    parser.add_argument("--once", action="store_true", help="Exit once the queue is empty.")
+    args = parser.parse_args()
+
+    SQLiteDB(args.db_path)  # ensure the schema exists
+    processes = max(1, args.processes)
+    if processes == 1:
+        _run_worker(args.db_path, args.worker_id, args)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    children = [
+        context.Process(
+            target=_run_worker,
+            args=(args.db_path, f"{args.worker_id}-{index}", args),
+        )
+        for index in range(processes)
+    ]
+    for child in children:
+        child.start()
+    try:
+        for child in children:
+            child.join()
+    except KeyboardInterrupt:  # pragma: no cover - interactive shutdown
+        for child in children:
+            child.terminate()
+
+
+if __name__ == "__main__":
+    main()
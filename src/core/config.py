@@ -56,8 +56,138 @@ class Config:
         # Ensure directories exist
         self._ensure_directories_exist()
 
-        # Transcription settings
-        self.transcription_model_size = "tiny"
+        # Transcription settings (faster-whisper)
+        self.transcription_model_size = os.getenv("TRANSCRIPTION_MODEL_SIZE", "tiny")
+        self.transcription_compute_type = os.getenv(
+            "TRANSCRIPTION_COMPUTE_TYPE", "int8"
+        )
+        # 0 keeps the CTranslate2 default; "auto" splits available cores
+        # across concurrent transcriptions.
+        self.transcription_cpu_threads = (
+            os.getenv("TRANSCRIPTION_CPU_THREADS", "0").strip().lower() or "0"
+        )
+        self.transcription_num_workers = max(
+            int(os.getenv("TRANSCRIPTION_NUM_WORKERS", "1")),
+            1,
+        )
+        self.transcription_concurrency = max(
+            int(os.getenv("TRANSCRIPTION_CONCURRENCY", "1")),
+            1,
+        )
+        self.transcription_beam_size = max(
+            int(os.getenv("TRANSCRIPTION_BEAM_SIZE", "5")),
+            1,
+        )
+        self.transcription_vad_filter = (
+            os.getenv("TRANSCRIPTION_VAD_FILTER", "false").lower()
+            in {"1", "true", "yes", "on"}
+        )
+        self.transcription_language = os.getenv("TRANSCRIPTION_LANGUAGE") or None
+        # Chunked parallel transcription for long audio (VAD split + process pool).
+        self.transcription_chunked = (
+            os.getenv("TRANSCRIPTION_CHUNKED", "false").lower()
+            in {"1", "true", "yes", "on"}
+        )
+        self.transcription_chunk_workers = max(
+            int(os.getenv("TRANSCRIPTION_CHUNK_WORKERS", "0")),
+            0,
+        )
+        self.transcription_chunk_max_seconds = float(
+            os.getenv("TRANSCRIPTION_CHUNK_MAX_SECONDS", "600")
+        )
+        self.transcription_chunk_overlap_seconds = float(
+            os.getenv("TRANSCRIPTION_CHUNK_OVERLAP_SECONDS", "2")
+        )
+        self.transcription_chunk_min_audio_seconds = float(
+            os.getenv("TRANSCRIPTION_CHUNK_MIN_AUDIO_SECONDS", "1200")
+        )
+        # Batched mode for short clips: pull several queued tasks and run them
+        # through one shared BatchedInferencePipeline (1 task disables it).
+        self.transcription_batch_tasks = max(
+            int(os.getenv("TRANSCRIPTION_BATCH_TASKS", "1")),
+            1,
+        )
+        self.transcription_batch_size = max(
+            int(os.getenv("TRANSCRIPTION_BATCH_SIZE", "8")),
+            1,
+        )
+        self.transcription_batch_max_audio_seconds = float(
+            os.getenv("TRANSCRIPTION_BATCH_MAX_AUDIO_SECONDS", "180")
+        )
+        # Resumable transcription checkpoints (opt in with TRANSCRIPTION_CHECKPOINTS=true).
+        checkpoints_enabled = (
+            os.getenv("TRANSCRIPTION_CHECKPOINTS", "false").lower()
+            in {"1", "true", "yes", "on"}
+        )
+        self.transcription_checkpoint_dir = (
+            os.getenv(
+                "TRANSCRIPTION_CHECKPOINT_DIR",
+                os.path.join(self.data_dir, "transcription_checkpoints"),
+            )
+            if checkpoints_enabled
+            else None
+        )
+        self.transcription_checkpoint_interval_seconds = float(
+            os.getenv("TRANSCRIPTION_CHECKPOINT_INTERVAL_SECONDS", "30")
+        )
+        self.transcription_word_timestamps = (
+            os.getenv("TRANSCRIPTION_WORD_TIMESTAMPS", "false").lower()
+            in {"1", "true", "yes", "on"}
+        )
+        # "inline" transcribes in the processing worker; "queue" hands jobs to
+        # `python -m src.apps.workers.transcription_worker` processes.
+        self.transcription_executor = os.getenv("TRANSCRIPTION_EXECUTOR", "inline").lower()
+        self.transcription_queue_db_path = os.getenv(
+            "TRANSCRIPTION_QUEUE_DB_PATH", os.path.join(self.data_dir, "tasks.db")
+        )
+        self.transcription_queue_poll_seconds = float(
+            os.getenv("TRANSCRIPTION_QUEUE_POLL_SECONDS", "0.5")
+        )
+        self.transcription_queue_timeout_seconds = float(
+            os.getenv("TRANSCRIPTION_QUEUE_TIMEOUT_SECONDS", "7200")
+        )
+        # Segment-level JSONL transcripts (set a directory to enable the streamed output).
+        self.transcription_output_dir = os.getenv("TRANSCRIPTION_OUTPUT_DIR", "") or None
+
+        # Metadata probe before download (title/duration/live status/availability).
+        # Tasks longer than the max duration or restricted are rejected, live
+        # streams are deferred, long videos can be routed to chunked transcription
+        # (0 disables a rule). Opt-in: the probe is an extra yt-dlp call per task.
+        self.probe_enabled = (
+            os.getenv("PROBE_ENABLED", "false").lower()
+            in {"1", "true", "yes", "on"}
+        )
+        self.probe_max_duration_seconds = float(os.getenv("PROBE_MAX_DURATION_SECONDS", "0"))
+        self.probe_defer_live_seconds = float(os.getenv("PROBE_DEFER_LIVE_SECONDS", "1800"))
+        self.probe_chunked_min_seconds = float(os.getenv("PROBE_CHUNKED_MIN_SECONDS", "0"))
+
+        # Titles and summaries are always searchable (SQLite FTS5); transcripts
+        # are only added to the index when enabled, since they dominate its size.
+        self.search_index_transcripts = (
+            os.getenv("SEARCH_INDEX_TRANSCRIPTS", "false").lower()
+            in {"1", "true", "yes", "on"}
+        )
+
+        # Completed/failed tasks not updated for this many days move to the
+        # archive table after each worker run (0 keeps everything active).
+        self.task_archive_after_days = float(os.getenv("TASK_ARCHIVE_AFTER_DAYS", "0"))
+
+        # yt-dlp backend: "library" (in-process yt_dlp package), "subprocess"
+        # (yt-dlp binary) or "auto" (library when installed, binary as fallback).
+        self.ytdlp_backend = os.getenv("YTDLP_BACKEND", "auto").strip().lower() or "auto"
+
+        # Bounded media cache in data/videos: LRU eviction above the budget and
+        # of files unused for longer than the max age (0 disables a limit). Opt-in.
+        self.media_cache_enabled = (
+            os.getenv("MEDIA_CACHE_ENABLED", "false").lower()
+            in {"1", "true", "yes", "on"}
+        )
+        self.media_cache_max_mb = float(os.getenv("MEDIA_CACHE_MAX_MB", "5120"))
+        self.media_cache_max_age_days = float(os.getenv("MEDIA_CACHE_MAX_AGE_DAYS", "30"))
+
+        # Download media for the next N pending tasks ahead of the worker (0 disables).
+        self.prefetch_tasks = max(int(os.getenv("PREFETCH_TASKS", "0")), 0)
+        self.prefetch_disk_budget_mb = float(os.getenv("PREFETCH_DISK_BUDGET_MB", "2048"))
 
         # File patterns to process
         self.file_patterns = [
@@ -0,0 +1,376 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+The registry is intentionally dependency-free: counters, gauges and
+histograms keep their samples in memory (guarded by a lock) and are rendered
+on demand by the API's ``GET /metrics`` endpoint.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Sequence
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    600.0,
+    1800.0,
+    3600.0,
+)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    metric_type = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames: tuple[str, ...] = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: dict[str, object]) -> LabelValues:
+        unknown = set(labels) - set(self.labelnames)
+        if unknown:
+            raise ValueError(f"Unknown labels for {self.name}: {sorted(unknown)}")
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> list[str]:  # pragma: no cover - abstract hook
+        raise NotImplementedError
+
+    def reset(self) -> None:  # pragma: no cover - abstract hook
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts.")
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        key = self._label_values(labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, e.g. queue depth."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: object) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: object) -> float:
+        key = self._label_values(labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class _HistogramState:
+    __slots__ = ("bucket_counts", "total", "count")
+
+    def __init__(self, bucket_count: int):
+        self.bucket_counts = [0] * bucket_count
+        self.total = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    """Cumulative bucketed distribution of observed values."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        sorted_buckets = sorted(float(b) for b in buckets if not math.isinf(b))
+        self.buckets: tuple[float, ...] = tuple(sorted_buckets) + (math.inf,)
+        self._states: dict[LabelValues, _HistogramState] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = _HistogramState(len(self.buckets))
+                self._states[key] = state
+            for index, upper in enumerate(self.buckets):
+                if value <= upper:
+                    state.bucket_counts[index] += 1
+                    break
+            state.total += value
+            state.count += 1
+
+    @contextmanager
+    def time(self, **labels: object) -> Iterator[None]:
+        """Observe the wall-clock duration of the wrapped block, even on error."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: object) -> int:
+        key = self._label_values(labels)
+        with self._lock:
+            state = self._states.get(key)
+            return state.count if state else 0
+
+    def sum(self, **labels: object) -> float:
+        key = self._label_values(labels)
+        with self._lock:
+            state = self._states.get(key)
+            return state.total if state else 0.0
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(
+                (key, list(state.bucket_counts), state.total, state.count)
+                for key, state in self._states.items()
+            )
+        lines: list[str] = []
+        bucket_labelnames = self.labelnames + ("le",)
+        for key, bucket_counts, total, count in items:
+            cumulative = 0
+            for upper, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                labels = _format_labels(bucket_labelnames, key + (_format_value(upper),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            plain_labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{plain_labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{plain_labels} {count}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+
+Collector = Callable[[], None]
+
+
+class MetricsRegistry:
+    """Holds metric instances and renders them in Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Collector] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered with a different shape.")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))  # type: ignore[return-value]
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(  # type: ignore[return-value]
+            Histogram(name, help_text, labelnames, buckets)
+        )
+
+    def register_collector(self, collector: Collector) -> None:
+        """Register a callback that refreshes gauges right before rendering."""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def render(self) -> str:
+        with self._lock:
+            collectors = list(self._collectors)
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        for collector in collectors:
+            collector()
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Clear all recorded samples (used by tests)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+REGISTRY = MetricsRegistry()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+PIPELINE_STAGE_SECONDS = REGISTRY.histogram(
+    "pipeline_stage_duration_seconds",
+    "Duration of each processing pipeline stage per task.",
+    ("stage",),
+)
+PIPELINE_TASK_SECONDS = REGISTRY.histogram(
+    "pipeline_task_duration_seconds",
+    "End-to-end processing duration per task.",
+    ("outcome",),
+)
+PIPELINE_TASKS_TOTAL = REGISTRY.counter(
+    "pipeline_tasks_total",
+    "Tasks finished by the processing worker.",
+    ("outcome",),
+)
+QUEUE_DEPTH = REGISTRY.gauge(
+    "task_queue_depth",
+    "Number of tasks per status.",
+    ("status",),
+)
+LOCK_WAIT_SECONDS = REGISTRY.histogram(
+    "lock_wait_seconds",
+    "Time spent acquiring the global processing lock or the next task lock.",
+    ("lock",),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+LLM_REQUEST_SECONDS = REGISTRY.histogram(
+    "llm_request_duration_seconds",
+    "Latency of summarization requests per backend and model.",
+    ("backend", "model"),
+)
+LLM_REQUESTS_TOTAL = REGISTRY.counter(
+    "llm_requests_total",
+    "Summarization requests per backend, model and outcome.",
+    ("backend", "model", "outcome"),
+)
+CACHE_REQUESTS_TOTAL = REGISTRY.counter(
+    "cache_requests_total",
+    "Cache lookups per cache and result (hit|miss); hit ratio = hit / (hit + miss).",
+    ("cache", "result"),
+)
+DOWNLOADED_BYTES_TOTAL = REGISTRY.counter(
+    "downloaded_bytes_total",
+    "Bytes fetched from the network per source.",
+    ("source",),
+)
+RSS_POLL_SECONDS = REGISTRY.histogram(
+    "rss_poll_duration_seconds",
+    "Duration of polling a single RSS subscription.",
+    ("outcome",),
+)
+RSS_ENQUEUED_TOTAL = REGISTRY.counter(
+    "rss_enqueued_tasks_total",
+    "RSS entries submitted to the task API per result.",
+    ("result",),
+)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS_TOTAL.inc(cache=cache, result="hit" if hit else "miss")
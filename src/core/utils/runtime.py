@@ -0,0 +1,15 @@
+"""Helpers for code shared between the Streamlit UI and headless processes."""
+
+from __future__ import annotations
+
+import sys
+
+
+def loaded_streamlit():
+    """Return the ``streamlit`` module only if this process already imported it.
+
+    Services consult Streamlit's session state (e.g. the UI test-mode toggle),
+    but importing Streamlit just to find out is slow; a process that has not
+    loaded it cannot have a session.
+    """
+    return sys.modules.get("streamlit")
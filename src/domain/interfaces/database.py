@@ -3,9 +3,10 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
-from src.domain.tasks.models import Task
+from src.domain.tasks.models import Task, TaskPage, TaskSearchResults, TaskStageTimings
+from src.domain.tasks.scheduling import FIFO
 
 
 @dataclass
@@ -16,6 +17,15 @@ class ProcessingLockInfo:
     locked_at: datetime | None
 
 
+class ActiveTaskExistsError(RuntimeError):
+    """Raised when a video already has a Pending or Processing task."""
+
+    def __init__(self, video_id: str, task: Optional[Task] = None):
+        super().__init__(f"An active task already exists for video {video_id}.")
+        self.video_id = video_id
+        self.task = task
+
+
 class BaseDB(ABC):
     """Abstract base class for a database interface."""
 
@@ -26,6 +36,8 @@ class BaseDB(ABC):
         status: str = "Pending",
         source_type: str = "manual",
         source_channel_id: str | None = None,
+        transcription_options: dict | None = None,
+        priority: int = 0,
     ) -> Task:
         """Adds a new task to the database and returns its representation.
 
@@ -34,9 +46,15 @@ class BaseDB(ABC):
             status: The initial status of the task.
             source_type: Origin of the task creation request.
             source_channel_id: Optional source channel identifier for RSS-created tasks.
+            transcription_options: Optional per-task faster-whisper overrides.
+            priority: Scheduling priority; higher is claimed first.
 
         Returns:
             The persisted task instance, including the generated identifier.
+
+        Raises:
+            ActiveTaskExistsError: The backend enforces one Pending/Processing
+                task per video and the video already has one.
         """
         raise NotImplementedError
 
@@ -87,6 +105,26 @@ class BaseDB(ABC):
         """
         raise NotImplementedError
 
+    def get_scheduling_policy(self) -> str:
+        """Returns the policy ``acquire_next_task`` orders candidates by."""
+        return FIFO
+
+    def set_scheduling_policy(self, policy: str) -> bool:
+        """Stores the scheduling policy; returns False if the backend has a fixed order."""
+        return False
+
+    def set_task_priority(self, task_id: str, priority: int) -> bool:
+        """Changes a task's priority; returns False if unsupported or the task is missing."""
+        return False
+
+    def peek_pending_tasks(self, limit: int) -> List[Task]:
+        """Returns up to ``limit`` pending tasks in claim order without locking them.
+
+        Used to prefetch media ahead of the worker; backends may override this
+        with a cheaper query.
+        """
+        return self.get_pending_tasks()[: max(0, limit)]
+
     @abstractmethod
     def acquire_processing_lock(
         self,
@@ -101,6 +139,14 @@ class BaseDB(ABC):
         """Extends the lease of the global processing lock."""
         raise NotImplementedError
 
+    def refresh_task_locks(self, worker_id: str, task_ids: Sequence[str]) -> None:
+        """Extends ``locked_at`` of tasks the worker still holds in Processing.
+
+        Keeps claimed-but-waiting tasks from being reclaimed as stale; backends
+        without per-task leases ignore it.
+        """
+        return None
+
     @abstractmethod
     def release_processing_lock(self, worker_id: str) -> None:
         """Releases the global processing lock if held by the worker."""
@@ -140,6 +186,95 @@ class BaseDB(ABC):
         """
         raise NotImplementedError
 
+    def record_task_metadata(
+        self,
+        task_id: str,
+        title: Optional[str] = None,
+        duration_seconds: Optional[float] = None,
+    ) -> None:
+        """Stores probed video metadata while the task is processing.
+
+        Backends without a duration field only persist the title.
+        """
+        if title:
+            self.update_task_status(task_id, "Processing", title=title)
+
+    def index_task_transcript(self, task_id: str, transcript: str) -> None:
+        """Adds a finished transcript to the full-text search index.
+
+        Backends without a search index silently ignore the call.
+        """
+        return None
+
+    def get_task_transcript(self, task_id: str) -> Optional[str]:
+        """Returns the transcript stored by ``index_task_transcript``, if any."""
+        return None
+
+    def search_tasks(self, query: str, limit: int = 20, offset: int = 0) -> TaskSearchResults:
+        """Full-text search over titles, summaries and indexed transcripts.
+
+        Backends without a search index return no results.
+        """
+        return TaskSearchResults(query=query)
+
+    def list_tasks(
+        self, statuses: Optional[Sequence[str]] = None, limit: int = 50, offset: int = 0
+    ) -> TaskPage:
+        """One page of active tasks, newest first, optionally limited to ``statuses``.
+
+        The default pages through ``get_all_tasks``; backends override it with
+        a query that only reads the requested page.
+        """
+        tasks = [
+            task for task in self.get_all_tasks() if statuses is None or task.status in statuses
+        ]
+        tasks.sort(key=lambda task: task.created_at or datetime.min, reverse=True)
+        return TaskPage(total=len(tasks), tasks=tasks[offset : offset + limit])
+
+    def count_tasks_by_status(self) -> Optional[dict[str, int]]:
+        """Number of tasks per status; ``None`` when the backend cannot count cheaply."""
+        return None
+
+    def list_tasks_changed_since(self, since: Optional[str]) -> List[tuple[str, Task]]:
+        """Returns ``(updated_at, task)`` pairs updated at or after ``since``.
+
+        ``since`` is an ``updated_at`` value from a previous call (``None`` for
+        everything). Backends without change tracking return nothing.
+        """
+        return []
+
+    def list_task_deletions_since(self, since: Optional[str]) -> List[tuple[str, str]]:
+        """Returns ``(deleted_at, task_id)`` for tasks deleted or archived at or
+        after ``since``, so change-feed consumers can drop them.
+
+        Backends without change tracking return nothing.
+        """
+        return []
+
+    def get_change_version(self, table: str) -> Optional[int]:
+        """Counter bumped on every write to ``table`` by any process.
+
+        Lets in-process caches detect foreign writes cheaply; ``None`` means
+        the backend does not track changes.
+        """
+        return None
+
+    def archive_tasks(self, before: datetime, limit: int = 500) -> int:
+        """Moves up to ``limit`` finished tasks last updated before ``before`` out
+        of the active task list; they stay readable through ``get_task_by_id``.
+
+        Returns how many tasks were archived (backends without an archive: 0).
+        """
+        return 0
+
+    def defer_task(self, task_id: str, worker_id: str, until: datetime) -> bool:
+        """Returns a task claimed by ``worker_id`` to ``Pending`` until ``until``.
+
+        Returns False when the backend cannot defer tasks or the worker no
+        longer holds the claim.
+        """
+        return False
+
     @abstractmethod
     def find_recent_task_by_url(self, url: str) -> Optional[Task]:
         """Find the most recent non-failed task for the given URL.
@@ -164,3 +299,17 @@ class BaseDB(ABC):
     ) -> Task:
         """Creates a new pending task cloned from a failed task."""
         raise NotImplementedError
+
+    def record_task_stage_timings(self, timings: TaskStageTimings) -> None:
+        """Persists the per-stage timing breakdown of a processing attempt.
+
+        Backends without a place to store timings silently ignore the call.
+        """
+        return None
+
+    def list_task_stage_timings(
+        self,
+        since: Optional[datetime] = None,
+    ) -> List[TaskStageTimings]:
+        """Returns recorded stage timings, optionally limited to ``since`` onwards."""
+        return []
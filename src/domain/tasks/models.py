@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 
 @dataclass
@@ -21,3 +21,56 @@ class Task:
     notion_url: Optional[str] = None
     source_type: str = "manual"
     source_channel_id: Optional[str] = None
+    # Per-task faster-whisper overrides (see TranscriptionOptions).
+    transcription_options: Optional[dict[str, Any]] = None
+    # Filled in by the metadata probe before download.
+    duration_seconds: Optional[float] = None
+    # Pending tasks are not claimed before this time (e.g. live streams).
+    deferred_until: Optional[datetime] = None
+    # Higher runs first under every scheduling policy except fifo.
+    priority: int = 0
+    started_at: Optional[datetime] = None
+    # YouTube video id derived from ``url`` when the task is stored.
+    video_id: Optional[str] = None
+
+
+@dataclass
+class TaskStageTimings:
+    """Per-stage timing breakdown recorded for a single processing attempt."""
+
+    task_id: str
+    outcome: str
+    stage_durations: dict[str, float] = field(default_factory=dict)
+    total_duration: Optional[float] = None
+    audio_duration: Optional[float] = None
+    transcript_chars: Optional[int] = None
+    summary_chars: Optional[int] = None
+    transcription_model: Optional[str] = None
+    summarizer_model: Optional[str] = None
+    recorded_at: Optional[datetime] = None
+
+
+@dataclass
+class TaskSearchHit:
+    """A task matching a full-text search, with a highlighted excerpt."""
+
+    task: Task
+    # Matched terms are wrapped in <mark>...</mark>.
+    snippet: str = ""
+    # Lower is better (SQLite bm25); 0.0 when the match was not ranked.
+    score: float = 0.0
+
+
+@dataclass
+class TaskSearchResults:
+    query: str
+    total: int = 0
+    hits: list[TaskSearchHit] = field(default_factory=list)
+
+
+@dataclass
+class TaskPage:
+    """One page of the task list, newest first."""
+
+    total: int = 0
+    tasks: list[Task] = field(default_factory=list)
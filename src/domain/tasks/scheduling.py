@@ -0,0 +1,45 @@
+"""Scheduling policies deciding which pending task a worker claims next.
+
+- ``fifo``: oldest task first.
+- ``priority_fifo``: highest ``priority`` first, then oldest.
+- ``sjf``: highest ``priority`` first, then shortest estimated job (probed
+  ``duration_seconds``; tasks not probed yet count as
+  ``UNKNOWN_DURATION_SECONDS``), then oldest.
+- ``fair_share``: highest ``priority`` first, then the source (manual
+  requests, or one RSS channel) that was served least recently, then oldest;
+  a large RSS backfill no longer starves manual requests or other channels.
+"""
+
+from __future__ import annotations
+
+import os
+
+FIFO = "fifo"
+PRIORITY_FIFO = "priority_fifo"
+SHORTEST_JOB_FIRST = "sjf"
+FAIR_SHARE = "fair_share"
+
+SCHEDULING_POLICIES = (FIFO, PRIORITY_FIFO, SHORTEST_JOB_FIRST, FAIR_SHARE)
+DEFAULT_SCHEDULING_POLICY = PRIORITY_FIFO
+# Estimated length of tasks the metadata probe has not seen yet.
+UNKNOWN_DURATION_SECONDS = 900.0
+
+MIN_PRIORITY = -100
+MAX_PRIORITY = 100
+
+
+def normalize_policy(value: str) -> str:
+    normalized = (value or "").strip().lower()
+    if normalized not in SCHEDULING_POLICIES:
+        raise ValueError(
+            f"Unknown scheduling policy '{value}' (expected one of: {', '.join(SCHEDULING_POLICIES)})."
+        )
+    return normalized
+
+
+def default_policy() -> str:
+    """Policy used until one is stored through the API (``SCHEDULING_POLICY``)."""
+    try:
+        return normalize_policy(os.environ.get("SCHEDULING_POLICY", DEFAULT_SCHEDULING_POLICY))
+    except ValueError:
+        return DEFAULT_SCHEDULING_POLICY
@@ -0,0 +1,4 @@
+from src.domain.transcripts.jobs import TranscriptionJob
+from src.domain.transcripts.models import Transcript, TranscriptSegment, TranscriptWord
+
+__all__ = ["Transcript", "TranscriptSegment", "TranscriptWord", "TranscriptionJob"]
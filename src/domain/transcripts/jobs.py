@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+@dataclass
+class TranscriptionJob:
+    """A transcription request handed to an out-of-process transcription worker."""
+
+    id: str
+    file_path: str
+    status: str = JOB_QUEUED
+    options: dict[str, Any] = field(default_factory=dict)
+    transcript: Optional[str] = None
+    audio_duration: Optional[float] = None
+    error_message: Optional[str] = None
+    worker_id: Optional[str] = None
+    created_at: Optional[datetime] = None
+    claimed_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in (JOB_COMPLETED, JOB_FAILED)
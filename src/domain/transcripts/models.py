@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class TranscriptWord:
+    start: float
+    end: float
+    word: str
+    probability: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class TranscriptSegment:
+    start: float
+    end: float
+    text: str
+    words: Optional[tuple[TranscriptWord, ...]] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {"start": self.start, "end": self.end, "text": self.text}
+        if self.words is not None:
+            data["words"] = [
+                {
+                    "start": word.start,
+                    "end": word.end,
+                    "word": word.word,
+                    "probability": word.probability,
+                }
+                for word in self.words
+            ]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TranscriptSegment":
+        raw_words = data.get("words")
+        words = (
+            tuple(
+                TranscriptWord(
+                    float(word["start"]),
+                    float(word["end"]),
+                    word["word"],
+                    word.get("probability"),
+                )
+                for word in raw_words
+            )
+            if raw_words is not None
+            else None
+        )
+        return cls(float(data["start"]), float(data["end"]), data["text"], words)
+
+
+@dataclass
+class Transcript:
+    """Ordered transcript segments plus audio-level metadata.
+
+    Segments are accumulated in a list and joined once, so building the
+    transcript of a long file stays linear.
+    """
+
+    segments: list[TranscriptSegment] = field(default_factory=list)
+    language: Optional[str] = None
+    duration: Optional[float] = None
+
+    def append(self, segment: TranscriptSegment) -> None:
+        self.segments.append(segment)
+
+    def extend(self, segments: list[TranscriptSegment]) -> None:
+        self.segments.extend(segments)
+
+    @property
+    def text(self) -> str:
+        return "".join(segment.text for segment in self.segments)
+
+    @property
+    def end(self) -> float:
+        return self.segments[-1].end if self.segments else 0.0
+
+    def metadata(self) -> dict[str, Any]:
+        return {"language": self.language, "duration": self.duration}
@@ -0,0 +1,59 @@
+"""Registry of lazily imported summarization backends.
+
+The vendor SDKs (``google.generativeai``, ``openai``, ``ollama``) are slow to
+import, and most processes (API, UI, CLI start-up) never call an LLM. Each
+backend lives in its own module that imports its SDK at the top; the registry
+only records ``(module, class)`` paths and imports a backend the first time it
+is requested.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import Any
+
+_REGISTRY: dict[str, tuple[str, str]] = {
+    "gemini": ("src.infrastructure.llm.backends.gemini_backend", "GeminiBackend"),
+    "openai": ("src.infrastructure.llm.backends.openai_backend", "OpenAIBackend"),
+    "ollama": ("src.infrastructure.llm.backends.ollama_backend", "OllamaBackend"),
+}
+_LOADED: dict[str, type] = {}
+_LOCK = threading.Lock()
+
+
+def register_backend(name: str, module_path: str, class_name: str) -> None:
+    """Register (or replace) a backend without importing it."""
+    with _LOCK:
+        _REGISTRY[name] = (module_path, class_name)
+        _LOADED.pop(name, None)
+
+
+def backend_names() -> list[str]:
+    return list(_REGISTRY)
+
+
+def load_backend(name: str) -> type:
+    """Import and return the backend class registered under ``name``."""
+    with _LOCK:
+        backend = _LOADED.get(name)
+        if backend is not None:
+            return backend
+        try:
+            module_path, class_name = _REGISTRY[name]
+        except KeyError:
+            raise ValueError(f"Unknown summarization backend: {name}") from None
+        try:
+            module = importlib.import_module(module_path)
+        except ModuleNotFoundError as exc:
+            raise ImportError(
+                f"{exc.name} package is not installed (required by the {name} backend). "
+                "Please install project dependencies."
+            ) from exc
+        backend = getattr(module, class_name)
+        _LOADED[name] = backend
+        return backend
+
+
+def create_backend(name: str, **options: Any):
+    return load_backend(name)(**options)
@@ -0,0 +1,16 @@
+import google.generativeai as genai
+
+
+class GeminiBackend:
+    def __init__(self, api_key: str):
+        genai.configure(api_key=api_key)
+
+    def generate(self, prompt_text: str, model: str) -> str:
+        gemini = genai.GenerativeModel(model)
+        response = gemini.generate_content(prompt_text)
+        return response.text
+
+    async def agenerate(self, prompt_text: str, model: str) -> str:
+        gemini = genai.GenerativeModel(model)
+        response = await gemini.generate_content_async(prompt_text)
+        return response.text
@@ -0,0 +1,25 @@
+from ollama import Client as OllamaClient
+
+
+class OllamaBackend:
+    def __init__(self, api_key: str, host: str):
+        self.host = host
+        self.headers = {"Authorization": f"Bearer {api_key}"}
+        self.client = OllamaClient(host=host, headers=self.headers)
+
+    def generate(self, prompt_text: str, model: str) -> str:
+        response = self.client.chat(
+            model=model,
+            messages=[{"role": "user", "content": prompt_text}],
+        )
+        return response.message.content.strip()
+
+    async def agenerate(self, prompt_text: str, model: str) -> str:
+        from ollama import AsyncClient as AsyncOllamaClient
+
+        client = AsyncOllamaClient(host=self.host, headers=self.headers)
+        response = await client.chat(
+            model=model,
+            messages=[{"role": "user", "content": prompt_text}],
+        )
+        return response.message.content.strip()
@@ -0,0 +1,28 @@
+from openai import OpenAI
+
+
+class OpenAIBackend:
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+        self.client = OpenAI(api_key=api_key)
+
+    def _request(self, prompt_text: str, model: str) -> dict:
+        return {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": prompt_text},
+            ],
+            "temperature": 0.5,
+        }
+
+    def generate(self, prompt_text: str, model: str) -> str:
+        resp = self.client.chat.completions.create(**self._request(prompt_text, model))
+        return resp.choices[0].message.content.strip()
+
+    async def agenerate(self, prompt_text: str, model: str) -> str:
+        from openai import AsyncOpenAI
+
+        async with AsyncOpenAI(api_key=self.api_key) as client:
+            resp = await client.chat.completions.create(**self._request(prompt_text, model))
+        return resp.choices[0].message.content.strip()
@@ -1,9 +1,12 @@
+import asyncio
 import os
+from contextlib import contextmanager
 from dotenv import load_dotenv
-import google.generativeai as genai
-from openai import OpenAI
 from src.core import prompt
 from src.core.logger import logger
+from src.core.metrics import LLM_REQUEST_SECONDS, LLM_REQUESTS_TOTAL
+from src.core.utils.runtime import loaded_streamlit
+from src.infrastructure.llm.backends import create_backend
 from src.infrastructure.llm.model_options import (
     AUTO_SUMMARIZER_MODELS,
     GEMINI_MODEL,
@@ -20,16 +23,6 @@ from src.infrastructure.llm.weighted_selection import (
     choose_weighted_model,
 )
 
-try:
-    from ollama import Client as OllamaClient
-except ImportError:  # pragma: no cover - optional dependency in minimal envs
-    OllamaClient = None
-
-try:
-    import streamlit as st
-except ImportError:
-    st = None
-
 try:
     from test_sample_manager import TestSampleManager
 except ImportError:
@@ -71,16 +64,83 @@ class Summarizer:
         )
 
         if backend == "gemini":
-            return self.summarize_with_google_gemini(title, text, model=model)
+            call = self.summarize_with_google_gemini
+        elif backend == "openai":
+            call = self.summarize_with_openai
+        elif backend == "ollama":
+            call = self.summarize_with_ollama
+        else:
+            raise ValueError(
+                "No available summarization backend "
+                "(set API keys or enable test mode)"
+            )
+        return self._call_backend_with_metrics(backend, model, call, title, text)
+
+    async def asummarize(self, title, text):
+        """Async variant of ``summarize`` that awaits the backend's async client."""
+        selection_mode = self._determine_backend(text)
+
+        if selection_mode == "mock":
+            self.last_backend = "mock"
+            self.last_model_label = self._format_model_label("mock", "mock")
+            return await asyncio.to_thread(self._mock_summarize, title, text)
+        if selection_mode == "unknown":
+            raise ValueError(
+                "No available summarization backend "
+                "(set API keys or enable test mode)"
+            )
+
+        backend, model = self._choose_backend_and_model(selection_mode)
+        self.last_backend = backend
+        self.last_model_label = self._format_model_label(backend, model)
+        logger.info(
+            f"[Summarizer] async selection_mode={selection_mode} "
+            f"backend={backend} model={model}"
+        )
+        self._require_api_key(backend)
+        client = create_backend(backend, **self._backend_options(backend))
+        with self._backend_metrics(backend, model):
+            return await client.agenerate(self.get_prompt(title=title, text=text), model)
+
+    def _backend_options(self, backend: str) -> dict:
+        if backend == "gemini":
+            return {"api_key": self.google_gemini_api_key}
         if backend == "openai":
-            return self.summarize_with_openai(title, text, model=model)
+            return {"api_key": self.openai_api_key}
         if backend == "ollama":
-            return self.summarize_with_ollama(title, text, model=model)
+            return {"api_key": self.ollama_api_key, "host": self.ollama_host}
+        raise ValueError(f"Unsupported backend: {backend}")
+
+    def _require_api_key(self, backend: str) -> None:
+        if self._backend_options(backend)["api_key"]:
+            return
+        if backend == "ollama":
+            raise ValueError(
+                "OLLAMA_API_KEY is not set. Please add it to the .env file."
+            )
         raise ValueError(
-            "No available summarization backend "
-            "(set API keys or enable test mode)"
+            "API key is not set. Please add it to the .env file."
         )
 
+    @contextmanager
+    def _backend_metrics(self, backend, model):
+        """Record latency and outcome per backend:model around a backend call."""
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            yield
+            outcome = "success"
+        finally:
+            LLM_REQUEST_SECONDS.observe(
+                time.perf_counter() - started, backend=backend, model=model
+            )
+            LLM_REQUESTS_TOTAL.inc(backend=backend, model=model, outcome=outcome)
+
+    def _call_backend_with_metrics(self, backend, model, call, title, text):
+        """Invoke a backend call while recording latency per backend:model."""
+        with self._backend_metrics(backend, model):
+            return call(title, text, model=model)
+
     def _determine_backend(self, text):
         if self._is_test_mode(text):
             return "mock"
@@ -164,6 +224,7 @@ class Summarizer:
     def _is_test_mode(self, text):
         """檢測是否為測試模式"""
         # 只接受顯式旗標（Streamlit 開關或環境變數），避免因關鍵字誤觸
+        st = loaded_streamlit()
         if (
             st
             and hasattr(st, "session_state")
@@ -212,24 +273,12 @@ class Summarizer:
         return prompt.PROMPT_VIDEO_SUMMARY.format(title=title, text=text)
 
     def summarize_with_openai(self, title, text, model: str = OPENAI_MODEL):
-        if not self.openai_api_key:
-            raise ValueError(
-                "API key is not set. Please add it to the .env file."
-            )
+        self._require_api_key("openai")
 
         self.last_backend = "openai"
         self.last_model_label = self._format_model_label("openai", model)
-        client = OpenAI(api_key=self.openai_api_key)
-        prompt_text = self.get_prompt(title=title, text=text)
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant."},
-                {"role": "user", "content": prompt_text},
-            ],
-            temperature=0.5,
-        )
-        return resp.choices[0].message.content.strip()
+        backend = create_backend("openai", **self._backend_options("openai"))
+        return backend.generate(self.get_prompt(title=title, text=text), model)
 
     def summarize_with_google_gemini(
         self,
@@ -237,12 +286,9 @@ class Summarizer:
         text,
         model: str | None = None,
     ):
-        if not self.google_gemini_api_key:
-            raise ValueError(
-                "API key is not set. Please add it to the .env file."
-            )
+        self._require_api_key("gemini")
 
-        genai.configure(api_key=self.google_gemini_api_key)
+        backend = create_backend("gemini", **self._backend_options("gemini"))
 
         selected_model = model or self._choose_gemini_model()
         self.last_backend = "gemini"
@@ -250,23 +296,13 @@ class Summarizer:
             "gemini",
             selected_model,
         )
-        gemini = genai.GenerativeModel(selected_model)
-        response = gemini.generate_content(
-            self.get_prompt(title=title, text=text)
+        return backend.generate(
+            self.get_prompt(title=title, text=text),
+            selected_model,
         )
 
-        return response.text
-
     def summarize_with_ollama(self, title, text, model: str = OLLAMA_MODEL):
-        if not self.ollama_api_key:
-            raise ValueError(
-                "OLLAMA_API_KEY is not set. Please add it to the .env file."
-            )
-        if OllamaClient is None:
-            raise ImportError(
-                "ollama package is not installed. "
-                "Please install project dependencies."
-            )
+        self._require_api_key("ollama")
 
         self.last_backend = "ollama"
         self.last_model_label = self._format_model_label("ollama", model)
@@ -274,17 +310,5 @@ class Summarizer:
             f"[Ollama] Summarize with host={self.ollama_host} "
             f"model={model}"
         )
-        client = OllamaClient(
-            host=self.ollama_host,
-            headers={"Authorization": f"Bearer {self.ollama_api_key}"},
-        )
-        response = client.chat(
-            model=model,
-            messages=[
-                {
-                    "role": "user",
-                    "content": self.get_prompt(title=title, text=text),
-                }
-            ],
-        )
-        return response.message.content.strip()
+        backend = create_backend("ollama", **self._backend_options("ollama"))
+        return backend.generate(self.get_prompt(title=title, text=text), model)
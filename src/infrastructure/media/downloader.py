@@ -1,26 +1,198 @@
+import asyncio
 import glob
+import json
 import os
 import subprocess
 from typing import Optional
 
 from src.core.logger import logger
+from src.core.metrics import DOWNLOADED_BYTES_TOTAL, record_cache_lookup
 from src.core.utils.url import extract_video_id
+from src.infrastructure.media.media_cache import MediaCache
+from src.infrastructure.media import yt_dlp_library
+from src.infrastructure.media.yt_dlp_library import MediaInfo, ProgressHook
+
+# "library" runs yt_dlp.YoutubeDL in-process, "subprocess" runs the yt-dlp
+# binary; "auto" prefers the library and falls back to the binary.
+BACKENDS = ("auto", "library", "subprocess")
+
+
+def _checked(result: subprocess.CompletedProcess) -> subprocess.CompletedProcess:
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(
+            result.returncode, result.args, result.stdout, result.stderr
+        )
+    return result
 
 
 class YouTubeDownloader:
-    def __init__(self, url, output_path="data"):
+    def __init__(
+        self,
+        url,
+        output_path="data",
+        media_cache: Optional[MediaCache] = None,
+        backend: str = "auto",
+        progress_hook: Optional[ProgressHook] = None,
+    ):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown yt-dlp backend: {backend}")
         self.url = url
         self.output_path = output_path
+        self.media_cache = media_cache
+        self.backend = backend
+        self.progress_hook = progress_hook
+        # Structured metadata of the last library download (None for the subprocess backend).
+        self.last_info: Optional[MediaInfo] = None
 
     def download(self):
         # Always use yt-dlp for download（移除測試模式與模擬下載邏輯）
         logger.info("Download YouTube video using yt-dlp...")
+        cached = self._cached_result()
+        if cached is not None:
+            return cached
+        if self._use_library():
+            try:
+                return self._download_with_library()
+            except Exception as exc:
+                if self.backend == "library":
+                    raise
+                logger.warning(f"In-process yt-dlp failed, falling back to subprocess: {exc}")
         return self._download_with_yt_dlp()
 
-    def _download_with_yt_dlp(self):
+    async def adownload(self):
+        """Async variant of ``download``.
+
+        The library backend runs in a worker thread; the subprocess backend
+        runs yt-dlp via asyncio subprocesses.
+        """
+        logger.info("Download YouTube video using yt-dlp (async)...")
+        cached = self._cached_result()
+        if cached is not None:
+            return cached
+        if self._use_library():
+            try:
+                return await asyncio.to_thread(self._download_with_library)
+            except Exception as exc:
+                if self.backend == "library":
+                    raise
+                logger.warning(f"In-process yt-dlp failed, falling back to subprocess: {exc}")
+        steps = self._yt_dlp_steps()
+        try:
+            cmd = next(steps)
+            while True:
+                try:
+                    proc = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                    )
+                    stdout, stderr = await proc.communicate()
+                    result = subprocess.CompletedProcess(
+                        cmd,
+                        proc.returncode,
+                        stdout.decode("utf-8", errors="replace"),
+                        stderr.decode("utf-8", errors="replace"),
+                    )
+                except Exception as exc:
+                    cmd = steps.throw(exc)
+                    continue
+                cmd = steps.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+    def probe(self) -> MediaInfo:
+        """Fetch metadata (duration, live status, availability, captions) without downloading."""
+        if self._use_library():
+            try:
+                self.last_info = yt_dlp_library.extract(
+                    self.url, self._output_dir(), download=False
+                )
+                return self.last_info
+            except Exception as exc:
+                if self.backend == "library":
+                    raise
+                logger.warning(f"In-process yt-dlp probe failed, falling back to subprocess: {exc}")
+        proc = _checked(
+            subprocess.run(
+                ["yt-dlp", "--skip-download", "--dump-single-json", "--no-warnings", self.url],
+                capture_output=True,
+                text=True,
+            )
+        )
+        self.last_info = yt_dlp_library.media_info_from_dict(json.loads(proc.stdout))
+        return self.last_info
+
+    def _use_library(self) -> bool:
+        if self.backend == "subprocess":
+            return False
+        if yt_dlp_library.library_available():
+            return True
+        if self.backend == "library":
+            raise RuntimeError("yt_dlp package is not installed (required by the library backend)")
+        return False
+
+    def _output_dir(self) -> str:
         output_dir = os.path.join(self.output_path, "videos")
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+        return output_dir
+
+    def _cached_result(self) -> Optional[dict]:
+        if self.media_cache is None:
+            return None
+        video_id = extract_video_id(self.url)
+        cached = self.media_cache.lookup(video_id)
+        record_cache_lookup("media", hit=cached is not None)
+        if cached is None:
+            return None
+        # Cache hit: the file and its title are known, yt-dlp is not needed.
+        logger.info(f"Using cached media for id={video_id}: {cached.path}")
+        return {"path": cached.path, "title": cached.title}
+
+    def _download_with_library(self):
+        output_dir = self._output_dir()
+        video_id = extract_video_id(self.url)
+        existing_files = (
+            glob.glob(os.path.join(output_dir, f"{video_id}.*")) if video_id else []
+        )
+        if self.media_cache is None:
+            record_cache_lookup("media", hit=bool(existing_files))
+        logger.info(f"Running in-process yt-dlp. url={self.url}, id={video_id}")
+        info = yt_dlp_library.extract(
+            self.url,
+            output_dir,
+            download=True,
+            progress_hook=self.progress_hook,
+            probed=self.last_info,
+        )
+        self.last_info = info
+        if not existing_files:
+            DOWNLOADED_BYTES_TOTAL.inc(os.path.getsize(info.path), source="media")
+        if self.media_cache is not None:
+            self.media_cache.add(info.video_id or video_id, info.path, info.title)
+        logger.info(f"Download result: path={info.path}, title={info.title}")
+        return {"path": info.path, "title": info.title, "duration": info.duration}
+
+    def _download_with_yt_dlp(self):
+        steps = self._yt_dlp_steps()
+        try:
+            cmd = next(steps)
+            while True:
+                try:
+                    result = subprocess.run(cmd, capture_output=True, text=True)
+                except Exception as exc:
+                    cmd = steps.throw(exc)
+                    continue
+                cmd = steps.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+    def _yt_dlp_steps(self):
+        """Download logic as a generator that yields yt-dlp commands to run.
+
+        The caller runs each command (blocking or asyncio) and sends back the
+        ``CompletedProcess``; the generator returns ``{"path", "title"}``.
+        """
+        output_dir = self._output_dir()
         # Prefer deterministic filename by video id and read back via --print
         video_id = extract_video_id(self.url)
         template = os.path.join(output_dir, "%(id)s.%(ext)s")
@@ -58,6 +230,12 @@ class YouTubeDownloader:
                 return True
             return os.path.isfile(value)
 
+        existing_files = (
+            glob.glob(os.path.join(output_dir, f"{video_id}.*")) if video_id else []
+        )
+        if self.media_cache is None:
+            record_cache_lookup("media", hit=bool(existing_files))
+
         cmd = [
             "yt-dlp",
             "--no-overwrites",
@@ -78,9 +256,7 @@ class YouTubeDownloader:
         path = None
         title: Optional[str] = None
         try:
-            proc = subprocess.run(
-                cmd, check=True, capture_output=True, text=True
-            )
+            proc = _checked((yield cmd))
             if (proc.stderr or "").strip():
                 logger.warning(f"yt-dlp stderr: {_truncate(proc.stderr.strip())}")
 
@@ -128,6 +304,9 @@ class YouTubeDownloader:
             # As a last resort, error out clearly
             raise Exception("yt-dlp did not produce an output file for this URL")
 
+        if not existing_files:
+            DOWNLOADED_BYTES_TOTAL.inc(os.path.getsize(path), source="media")
+
         if title and _looks_like_filepath(title, path):
             logger.warning(
                 f"yt-dlp title looked like a filepath, ignoring it. title={title}"
@@ -137,12 +316,7 @@ class YouTubeDownloader:
         if not title:
             # Fallback: query the title independently (may require network access).
             try:
-                tproc = subprocess.run(
-                    ["yt-dlp", "-O", "%(title)s", self.url],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
+                tproc = _checked((yield ["yt-dlp", "-O", "%(title)s", self.url]))
                 if (tproc.stderr or "").strip():
                     logger.warning(f"yt-dlp -O stderr: {_truncate(tproc.stderr.strip())}")
                 title = (tproc.stdout or "").strip()
@@ -159,5 +333,8 @@ class YouTubeDownloader:
                 logger.error(f"yt-dlp -O title lookup errored: {e}")
                 title = "(unknown title)"
 
+        if self.media_cache is not None:
+            # Don't remember a placeholder title; the next hit returns None instead.
+            self.media_cache.add(video_id, path, None if title == "(unknown title)" else title)
         logger.info(f"Download result: path={path}, title={title}")
         return {"path": path, "title": title}
@@ -0,0 +1,320 @@
+"""Bounded cache of downloaded media in ``data/videos``.
+
+Media files are stored as ``<video_id>.<ext>`` by the downloader. ``MediaCache``
+keeps an index of video id → path (persisted next to the files together with
+the title, so a cache hit needs no yt-dlp call at all), tracks last access via
+the file mtime and evicts least recently used files once the directory exceeds
+its byte budget or a file has not been used for ``max_age_seconds``. Files of
+in-flight tasks are pinned and never evicted.
+
+Several worker processes may share one directory. Every change re-reads the
+index and writes it back while holding an exclusive ``flock`` on
+``.media_index.lock``, so one process never overwrites another's entries.
+Pins are files in ``.pins/`` named ``<video_id>.<pid>``; pins left behind by
+processes that are no longer running are ignored and removed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Iterator, Optional
+
+from src.core.logger import logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock; fall back to the thread lock
+    fcntl = None
+
+INDEX_FILENAME = ".media_index.json"
+LOCK_FILENAME = ".media_index.lock"
+PINS_DIRNAME = ".pins"
+# yt-dlp leftovers that are not finished media files.
+_PARTIAL_SUFFIXES = (".part", ".ytdl", ".temp", ".tmp")
+
+
+@dataclass
+class MediaEntry:
+    video_id: str
+    path: str
+    size: int
+    last_access: float
+    title: Optional[str] = None
+
+
+class MediaCache:
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 0,
+        max_age_seconds: float = 0.0,
+        *,
+        clock=time.time,
+    ):
+        self.directory = directory
+        # 0 disables the respective limit.
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_age_seconds = max(0.0, float(max_age_seconds))
+        self._clock = clock
+        # Pins held by this process; each pinned id also has a pin file on disk.
+        self._pins: Counter[str] = Counter()
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.directory, INDEX_FILENAME)
+
+    @property
+    def pins_directory(self) -> str:
+        return os.path.join(self.directory, PINS_DIRNAME)
+
+    def lookup(self, video_id: Optional[str]) -> Optional[MediaEntry]:
+        """Return the cached entry for ``video_id`` and mark it as recently used."""
+        if not video_id:
+            return None
+        with self._locked():
+            entries = self._load()
+            entry = entries.get(video_id)
+            if entry is None:
+                return None
+            if not os.path.isfile(entry.path):
+                del entries[video_id]
+                self._save(entries)
+                return None
+            entry.last_access = self._clock()
+            self._touch(entry.path, entry.last_access)
+            self._save(entries)
+            return entry
+
+    def add(self, video_id: Optional[str], path: str, title: Optional[str] = None) -> None:
+        """Register a freshly downloaded file and enforce the cache limits."""
+        if not video_id or not os.path.isfile(path):
+            return
+        with self._locked():
+            entries = self._load()
+            previous = entries.get(video_id)
+            now = self._clock()
+            entries[video_id] = MediaEntry(
+                video_id=video_id,
+                path=path,
+                size=os.path.getsize(path),
+                last_access=now,
+                title=title or (previous.title if previous else None),
+            )
+            self._touch(path, now)
+            # The new file is about to be used; never evict it on the way in.
+            self._evict(entries, keep=video_id)
+
+    def pin(self, video_id: Optional[str]) -> None:
+        if not video_id:
+            return
+        # Under the index lock so a concurrent eviction sees the pin or finishes first.
+        with self._locked():
+            self._pins[video_id] += 1
+            if self._pins[video_id] == 1:
+                os.makedirs(self.pins_directory, exist_ok=True)
+                with open(self._pin_path(video_id), "w", encoding="utf-8"):
+                    pass
+
+    def unpin(self, video_id: Optional[str]) -> None:
+        if not video_id:
+            return
+        with self._locked():
+            self._pins[video_id] -= 1
+            if self._pins[video_id] <= 0:
+                del self._pins[video_id]
+                self._remove_quietly(self._pin_path(video_id))
+
+    @contextmanager
+    def pinned(self, video_id: Optional[str]) -> Iterator[None]:
+        self.pin(video_id)
+        try:
+            yield
+        finally:
+            self.unpin(video_id)
+
+    def total_bytes(self) -> int:
+        with self._locked():
+            return sum(entry.size for entry in self._load().values())
+
+    def evict(self) -> list[str]:
+        """Delete expired files, then least recently used ones above the budget."""
+        with self._locked():
+            return self._evict(self._load())
+
+    def _evict(self, entries: dict[str, MediaEntry], keep: Optional[str] = None) -> list[str]:
+        """Evict from ``entries`` and save the index; the caller holds ``_locked``."""
+        removed: list[str] = []
+        pinned = self._pinned_ids()
+        now = self._clock()
+        candidates = sorted(
+            (
+                entry
+                for entry in entries.values()
+                if entry.video_id != keep and entry.video_id not in pinned
+            ),
+            key=lambda entry: entry.last_access,
+        )
+        total = sum(entry.size for entry in entries.values())
+        for entry in candidates:
+            expired = (
+                self.max_age_seconds > 0
+                and now - entry.last_access > self.max_age_seconds
+            )
+            over_budget = self.max_bytes > 0 and total > self.max_bytes
+            if not (expired or over_budget):
+                continue
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.warning(f"[MediaCache] Could not delete {entry.path}: {exc}")
+                continue
+            del entries[entry.video_id]
+            total -= entry.size
+            removed.append(entry.path)
+        if removed:
+            logger.info(
+                f"[MediaCache] Evicted {len(removed)} file(s); {total} bytes cached"
+            )
+        self._save(entries)
+        return removed
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Serialize index access across threads and (via ``flock``) processes."""
+        with self._lock:
+            self._lock_depth += 1
+            try:
+                if self._lock_depth > 1 or fcntl is None:
+                    yield
+                    return
+                os.makedirs(self.directory, exist_ok=True)
+                with open(os.path.join(self.directory, LOCK_FILENAME), "a") as handle:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                    try:
+                        yield
+                    finally:
+                        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            finally:
+                self._lock_depth -= 1
+
+    def _load(self) -> dict[str, MediaEntry]:
+        """Read the index from disk; other processes may have changed it."""
+        entries: dict[str, MediaEntry] = {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as handle:
+                for record in json.load(handle).get("entries", []):
+                    entry = MediaEntry(**record)
+                    if os.path.isfile(entry.path):
+                        entries[entry.video_id] = entry
+        except FileNotFoundError:
+            pass
+        except (ValueError, TypeError, AttributeError) as exc:
+            logger.warning(f"[MediaCache] Ignoring unreadable index {self.index_path}: {exc}")
+
+        # Pick up files downloaded before the index existed (or by other tools).
+        known = {os.path.normpath(entry.path) for entry in entries.values()}
+        if os.path.isdir(self.directory):
+            for item in os.scandir(self.directory):
+                if (
+                    not item.is_file()
+                    or item.name.startswith(".")
+                    or item.name.endswith(_PARTIAL_SUFFIXES)
+                    or os.path.normpath(item.path) in known
+                ):
+                    continue
+                video_id = os.path.splitext(item.name)[0]
+                stat = item.stat()
+                current = entries.get(video_id)
+                if current is None or stat.st_mtime > current.last_access:
+                    entries[video_id] = MediaEntry(
+                        video_id=video_id,
+                        path=item.path,
+                        size=stat.st_size,
+                        last_access=stat.st_mtime,
+                    )
+        return entries
+
+    def _save(self, entries: dict[str, MediaEntry]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(
+                {"entries": [asdict(entry) for entry in entries.values()]},
+                handle,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.index_path)
+
+    def _pin_path(self, video_id: str) -> str:
+        return os.path.join(self.pins_directory, f"{video_id}.{os.getpid()}")
+
+    def _pinned_ids(self) -> set[str]:
+        """Video ids pinned by this or any other live process."""
+        pinned = set(self._pins)
+        if not os.path.isdir(self.pins_directory):
+            return pinned
+        for item in os.scandir(self.pins_directory):
+            video_id, _, pid = item.name.rpartition(".")
+            if not video_id or not pid.isdigit():
+                continue
+            if _process_alive(int(pid)):
+                pinned.add(video_id)
+            else:
+                self._remove_quietly(item.path)
+        return pinned
+
+    @staticmethod
+    def _remove_quietly(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _touch(path: str, timestamp: float) -> None:
+        try:
+            os.utime(path, (timestamp, timestamp))
+        except OSError:
+            pass
+
+
+def _process_alive(pid: int) -> bool:
+    if os.name == "nt":  # pragma: no cover - os.kill(pid, 0) would terminate it
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+_CACHES: dict[str, MediaCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_media_cache(
+    directory: str, max_bytes: int = 0, max_age_seconds: float = 0.0
+) -> MediaCache:
+    """Return the process-wide cache for ``directory`` (shared by all workers)."""
+    key = os.path.abspath(directory)
+    with _CACHES_LOCK:
+        cache = _CACHES.get(key)
+        if cache is None:
+            cache = MediaCache(directory, max_bytes, max_age_seconds)
+            _CACHES[key] = cache
+        else:
+            cache.max_bytes = max(0, int(max_bytes))
+            cache.max_age_seconds = max(0.0, float(max_age_seconds))
+        return cache
@@ -0,0 +1,101 @@
+"""Shared-model batched transcription for short clips.
+
+Short queued tasks (e.g. Shorts) each pay for loading a ``WhisperModel`` and
+for a mostly idle decoder. ``BatchTranscriber`` keeps one model per
+configuration for the whole process, runs every clip through faster-whisper's
+``BatchedInferencePipeline`` (VAD chunks decoded ``batch_size`` at a time) and
+transcribes several clips concurrently on that model, bounded by its
+``num_workers``.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Sequence
+
+from src.core.logger import logger
+from src.infrastructure.media.transcription.options import TranscriptionOptions
+
+_MODEL_CACHE: dict[tuple[Any, ...], Any] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def get_shared_model(
+    model_size: str,
+    compute_type: str = "int8",
+    cpu_threads: int = 0,
+    num_workers: int = 1,
+):
+    """Return a process-wide ``WhisperModel`` for the given configuration."""
+    key = (model_size, compute_type, cpu_threads, num_workers)
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            from faster_whisper import WhisperModel
+
+            logger.info(
+                f"Loading shared faster-whisper model={model_size} "
+                f"compute_type={compute_type} cpu_threads={cpu_threads} num_workers={num_workers}"
+            )
+            model = WhisperModel(
+                model_size,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=num_workers,
+            )
+            _MODEL_CACHE[key] = model
+        return model
+
+
+def probe_audio_duration(file_path: str) -> Optional[float]:
+    """Read the container duration (seconds) without decoding the audio."""
+    try:
+        import av
+
+        with av.open(file_path) as container:
+            if container.duration:
+                return float(container.duration / av.time_base)
+    except Exception as exc:
+        logger.warning(f"Could not probe audio duration for {file_path}: {exc}")
+    return None
+
+
+class BatchTranscriber:
+    """Transcribe several short files on one shared, batched model."""
+
+    def __init__(self, options: TranscriptionOptions, batch_size: int = 8):
+        self.options = options
+        self.batch_size = max(1, batch_size)
+        self.last_audio_durations: list[Optional[float]] = []
+
+    def transcribe_many(self, file_paths: Sequence[str]) -> list[str]:
+        from faster_whisper import BatchedInferencePipeline
+
+        model = get_shared_model(
+            self.options.model_size,
+            self.options.compute_type,
+            self.options.cpu_threads,
+            self.options.num_workers,
+        )
+        pipeline = BatchedInferencePipeline(model=model)
+
+        def _transcribe(path: str) -> tuple[str, Optional[float]]:
+            segments, info = pipeline.transcribe(
+                path,
+                batch_size=self.batch_size,
+                beam_size=self.options.beam_size,
+                language=self.options.language,
+            )
+            text = "".join(segment.text for segment in segments)
+            return text, getattr(info, "duration", None)
+
+        logger.info(
+            f"[Batch] Transcribing {len(file_paths)} clip(s) "
+            f"(batch_size={self.batch_size}, model={self.options.model_size})"
+        )
+        # CTranslate2 runs up to num_workers transcriptions on one model in parallel.
+        with ThreadPoolExecutor(max_workers=max(1, self.options.num_workers)) as pool:
+            results = list(pool.map(_transcribe, file_paths))
+        self.last_audio_durations = [duration for _text, duration in results]
+        return [text for text, _duration in results]
@@ -0,0 +1,117 @@
+"""Append-only checkpoints of completed transcription segments.
+
+A checkpoint is a JSONL file per video id: a header line describing the audio
+it belongs to, followed by one line per completed segment. A reclaimed task
+loads the segments, resumes faster-whisper from the last segment end, and the
+file is removed once the transcript is complete. A torn final line (worker
+killed mid-write) is truncated away on load, so later appends start on a
+line boundary.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Any, Optional
+
+from src.core.logger import logger
+from src.domain.transcripts import TranscriptSegment
+from src.infrastructure.media.transcription.transcript_io import encode_segment
+
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_key_for(file_path: str) -> str:
+    """Media files are stored as ``<video_id>.<ext>``; the stem is the key."""
+    return os.path.splitext(os.path.basename(file_path))[0]
+
+
+class TranscriptionCheckpoint:
+    """Buffered, periodically flushed segment log for one audio file."""
+
+    def __init__(
+        self,
+        directory: str,
+        key: str,
+        fingerprint: dict[str, Any],
+        flush_interval_seconds: float = 30.0,
+    ):
+        self.path = os.path.join(directory, f"{key}.jsonl")
+        self.fingerprint = fingerprint
+        self.flush_interval_seconds = flush_interval_seconds
+        self._pending: list[TranscriptSegment] = []
+        self._last_flush = time.monotonic()
+
+    def load(self) -> list[TranscriptSegment]:
+        """Return checkpointed segments, discarding checkpoints for other audio."""
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, "rb") as handle:
+            data = handle.read()
+        lines = data.splitlines(keepends=True)
+        try:
+            header = json.loads(lines[0]) if lines and lines[0].endswith(b"\n") else {}
+        except ValueError:
+            header = {}
+        if (
+            header.get("version") != CHECKPOINT_VERSION
+            or header.get("fingerprint") != self.fingerprint
+        ):
+            logger.info(f"Discarding stale transcription checkpoint {self.path}")
+            self.clear()
+            return []
+        segments: list[TranscriptSegment] = []
+        valid_bytes = len(lines[0])
+        for line in lines[1:]:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                segments.append(TranscriptSegment.from_dict(json.loads(line)))
+            except (ValueError, KeyError, TypeError):
+                break
+            valid_bytes += len(line)
+        if valid_bytes < len(data):
+            # Torn write: keep the valid prefix so the next flush appends after it.
+            with open(self.path, "r+b") as handle:
+                handle.truncate(valid_bytes)
+                os.fsync(handle.fileno())
+        return segments
+
+    def add(self, segment: TranscriptSegment) -> None:
+        self._pending.append(segment)
+        if time.monotonic() - self._last_flush >= self.flush_interval_seconds:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        new_file = not os.path.exists(self.path)
+        with open(self.path, "a", encoding="utf-8") as handle:
+            if new_file:
+                handle.write(
+                    json.dumps({"version": CHECKPOINT_VERSION, "fingerprint": self.fingerprint})
+                    + "\n"
+                )
+            handle.writelines(encode_segment(segment) for segment in self._pending)
+            handle.flush()
+            os.fsync(handle.fileno())
+        self._pending.clear()
+        self._last_flush = time.monotonic()
+
+    def clear(self) -> None:
+        self._pending.clear()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def audio_fingerprint(file_path: str, model_size: str, language: Optional[str]) -> dict[str, Any]:
+    """Identify the audio/model combination a checkpoint was produced for."""
+    return {
+        "size": os.path.getsize(file_path),
+        "model_size": model_size,
+        "language": language,
+    }
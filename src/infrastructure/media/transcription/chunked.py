@@ -0,0 +1,186 @@
+"""VAD-based chunked transcription across a process pool of model instances.
+
+Long audio is split on silence into chunks of bounded length, each chunk is
+transcribed by its own ``WhisperModel`` in a worker process, and the segments
+are stitched back in order. Chunks are padded by a small overlap so words at a
+hard split are not cut in half; every chunk owns the half-open range
+``[keep_from, keep_until)`` and only segments whose midpoint falls inside that
+range survive stitching, which removes the duplicated overlap.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+
+from src.core.logger import logger
+from src.domain.transcripts import TranscriptSegment
+
+SAMPLING_RATE = 16000
+
+
+@dataclass(frozen=True)
+class ChunkPlan:
+    index: int
+    start: float
+    end: float
+    keep_from: float
+    keep_until: float
+
+
+def plan_chunks(
+    speech_spans: Sequence[tuple[float, float]],
+    total_duration: float,
+    max_chunk_seconds: float,
+    overlap_seconds: float = 0.0,
+) -> list[ChunkPlan]:
+    """Group VAD speech spans into chunks of at most ``max_chunk_seconds``.
+
+    Cuts are placed in the middle of the silence between spans; a single span
+    longer than the limit is hard-split. Each chunk is trimmed to the speech it
+    contains and padded by ``overlap_seconds`` on both sides, so a chunk is at
+    most ``max_chunk_seconds + 2 * overlap_seconds`` long. Chunks without
+    speech are dropped.
+    """
+    if max_chunk_seconds <= 0:
+        raise ValueError("max_chunk_seconds must be positive")
+    spans = sorted((max(0.0, s), min(total_duration, e)) for s, e in speech_spans if e > s)
+    if not spans:
+        return []
+
+    cuts: list[float] = []
+    window_start = spans[0][0]
+    speech_end: Optional[float] = None
+    for span_start, span_end in spans:
+        if span_end - window_start > max_chunk_seconds and speech_end is not None:
+            window_start = (speech_end + span_start) / 2.0
+            cuts.append(window_start)
+        while span_end - window_start > max_chunk_seconds:
+            window_start += max_chunk_seconds
+            cuts.append(window_start)
+        speech_end = span_end
+
+    boundaries = [-math.inf, *cuts, math.inf]
+    plans: list[ChunkPlan] = []
+    for keep_from, keep_until in zip(boundaries, boundaries[1:]):
+        inside = [
+            (max(s, keep_from), min(e, keep_until))
+            for s, e in spans
+            if e > keep_from and s < keep_until
+        ]
+        if not inside:
+            continue
+        plans.append(
+            ChunkPlan(
+                index=len(plans),
+                start=max(0.0, inside[0][0] - overlap_seconds),
+                end=min(total_duration, inside[-1][1] + overlap_seconds),
+                keep_from=keep_from,
+                keep_until=keep_until,
+            )
+        )
+    return plans
+
+
+def stitch_segments(
+    plans: Sequence[ChunkPlan],
+    results: dict[int, Sequence[TranscriptSegment]],
+) -> list[TranscriptSegment]:
+    """Merge per-chunk segments (absolute timestamps) in order, dropping overlaps."""
+    stitched: list[TranscriptSegment] = []
+    for plan in sorted(plans, key=lambda item: item.index):
+        for segment in sorted(results.get(plan.index, ()), key=lambda item: item.start):
+            midpoint = (segment.start + segment.end) / 2.0
+            if plan.keep_from <= midpoint < plan.keep_until:
+                stitched.append(segment)
+    return stitched
+
+
+def detect_speech_spans(audio: Any, min_silence_ms: int = 500) -> list[tuple[float, float]]:
+    """Return speech ``(start, end)`` seconds using faster-whisper's Silero VAD."""
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    timestamps = get_speech_timestamps(
+        audio, VadOptions(min_silence_duration_ms=min_silence_ms)
+    )
+    return [
+        (item["start"] / SAMPLING_RATE, item["end"] / SAMPLING_RATE) for item in timestamps
+    ]
+
+
+_WORKER_MODEL = None
+
+
+def _init_worker(model_size: str, model_kwargs: dict[str, Any]) -> None:
+    global _WORKER_MODEL
+    from faster_whisper import WhisperModel
+
+    _WORKER_MODEL = WhisperModel(model_size, **model_kwargs)
+
+
+def _transcribe_chunk(
+    index: int,
+    audio: Any,
+    offset: float,
+    transcribe_kwargs: dict[str, Any],
+) -> tuple[int, list[TranscriptSegment]]:
+    segments, _info = _WORKER_MODEL.transcribe(audio, **transcribe_kwargs)
+    from src.infrastructure.media.transcription.transcript_io import segment_from_whisper
+
+    return index, [segment_from_whisper(segment, offset) for segment in segments]
+
+
+def transcribe_chunked(
+    audio: Any,
+    *,
+    model_size: str,
+    model_kwargs: dict[str, Any],
+    transcribe_kwargs: dict[str, Any],
+    workers: int,
+    max_chunk_seconds: float,
+    overlap_seconds: float,
+    on_progress: Optional[Callable[[float], None]] = None,
+) -> list[TranscriptSegment]:
+    """Transcribe decoded 16 kHz mono ``audio`` in parallel chunks."""
+    total_duration = len(audio) / SAMPLING_RATE
+    plans = plan_chunks(
+        detect_speech_spans(audio), total_duration, max_chunk_seconds, overlap_seconds
+    )
+    if not plans:
+        return []
+    workers = max(1, min(workers, len(plans)))
+    logger.info(
+        f"[Chunked] {len(plans)} chunk(s) over {total_duration:.0f}s audio "
+        f"using {workers} process(es)"
+    )
+
+    results: dict[int, list[TranscriptSegment]] = {}
+    covered = 0.0
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(model_size, model_kwargs),
+    ) as pool:
+        futures = {
+            pool.submit(
+                _transcribe_chunk,
+                plan.index,
+                audio[int(plan.start * SAMPLING_RATE) : int(plan.end * SAMPLING_RATE)],
+                plan.start,
+                transcribe_kwargs,
+            ): plan
+            for plan in plans
+        }
+        for future in as_completed(futures):
+            index, segments = future.result()
+            results[index] = segments
+            plan = futures[future]
+            covered += plan.end - plan.start
+            if on_progress is not None:
+                on_progress(min(1.0, covered / max(total_duration, 1e-9)))
+
+    return stitch_segments(plans, results)
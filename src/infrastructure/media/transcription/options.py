@@ -0,0 +1,223 @@
+"""Resolve faster-whisper inference settings from config and per-task overrides."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Any, Mapping, Optional
+
+from src.core.logger import logger
+
+AUTO = "auto"
+# Model names faster-whisper can download by name; anything else must be a
+# local CTranslate2 model directory.
+KNOWN_MODEL_SIZES = frozenset(
+    {
+        "tiny.en",
+        "tiny",
+        "base.en",
+        "base",
+        "small.en",
+        "small",
+        "medium.en",
+        "medium",
+        "large-v1",
+        "large-v2",
+        "large-v3",
+        "large",
+        "distil-large-v2",
+        "distil-medium.en",
+        "distil-small.en",
+        "distil-large-v3",
+        "large-v3-turbo",
+        "turbo",
+    }
+)
+# Threads given to each chunk process when the pool size is auto-tuned.
+CHUNK_THREADS_PER_WORKER = 2
+
+
+@dataclass(frozen=True)
+class TranscriptionOptions:
+    """Inference parameters passed to ``Transcriber`` / ``WhisperModel``."""
+
+    model_size: str = "tiny"
+    compute_type: str = "int8"
+    # 0 lets CTranslate2 pick its default thread count.
+    cpu_threads: int = 0
+    num_workers: int = 1
+    beam_size: int = 5
+    vad_filter: bool = False
+    language: Optional[str] = None
+    # Chunked mode: split long audio on silence and transcribe chunks in a
+    # process pool (one model per process). 0 workers means auto.
+    chunked: bool = False
+    chunk_workers: int = 0
+    chunk_max_seconds: float = 600.0
+    chunk_overlap_seconds: float = 2.0
+    chunk_min_audio_seconds: float = 1200.0
+    # Directory for resumable segment checkpoints (None disables them).
+    checkpoint_dir: Optional[str] = None
+    checkpoint_interval_seconds: float = 30.0
+    word_timestamps: bool = False
+    # Directory for streamed JSONL segment output (None disables it).
+    transcript_dir: Optional[str] = None
+
+    def transcriber_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for ``Transcriber`` (everything but the model size)."""
+        values = asdict(self)
+        values.pop("model_size")
+        return values
+
+
+OVERRIDABLE_FIELDS = frozenset(field.name for field in fields(TranscriptionOptions))
+
+
+def available_cpu_count() -> int:
+    """CPUs usable by this process (respects affinity masks where supported)."""
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            return max(1, len(os.sched_getaffinity(0)))
+        except OSError:  # pragma: no cover - platform specific
+            pass
+    return max(1, os.cpu_count() or 1)
+
+
+def auto_cpu_threads(
+    concurrent_transcriptions: int,
+    num_workers: int = 1,
+    cpu_count: Optional[int] = None,
+) -> int:
+    """Split available cores so parallel transcriptions don't oversubscribe the CPU.
+
+    Every running ``WhisperModel`` uses ``num_workers`` parallel workers, each
+    with ``cpu_threads`` threads, so the per-worker share is
+    ``cores // (concurrent_transcriptions * num_workers)`` (at least 1).
+    """
+    cores = cpu_count if cpu_count is not None else available_cpu_count()
+    consumers = max(1, concurrent_transcriptions) * max(1, num_workers)
+    return max(1, cores // consumers)
+
+
+def validate_model_size(value: str) -> str:
+    """Return ``value`` if it names a known model or an existing model directory.
+
+    Raises ``ValueError`` otherwise, so bad overrides fail when they are parsed
+    rather than inside faster-whisper.
+    """
+    normalized = (value or "").strip()
+    if normalized in KNOWN_MODEL_SIZES or (normalized and os.path.isdir(normalized)):
+        return normalized
+    raise ValueError(
+        f"model_size must be one of: {', '.join(sorted(KNOWN_MODEL_SIZES))} "
+        "or an existing model directory."
+    )
+
+
+def _parse_cpu_threads(value: Any) -> Optional[int]:
+    """Return an explicit thread count, or ``None`` for auto-tune."""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        normalized = value.strip().lower()
+        if normalized == AUTO:
+            return None
+        value = normalized or 0
+    return max(0, int(value))
+
+
+def resolve_transcription_options(
+    config: Any,
+    overrides: Optional[Mapping[str, Any]] = None,
+    *,
+    cpu_count: Optional[int] = None,
+) -> TranscriptionOptions:
+    """Combine ``Config`` transcription settings with per-task overrides.
+
+    ``cpu_threads`` may be ``"auto"`` (in config or overrides); it is then
+    derived from the available cores, ``transcription_concurrency``,
+    ``num_workers`` and (in chunked mode) the number of chunk processes.
+    """
+    defaults = TranscriptionOptions()
+    raw: dict[str, Any] = {
+        "model_size": getattr(config, "transcription_model_size", defaults.model_size),
+        "compute_type": getattr(config, "transcription_compute_type", defaults.compute_type),
+        "cpu_threads": getattr(config, "transcription_cpu_threads", defaults.cpu_threads),
+        "num_workers": getattr(config, "transcription_num_workers", defaults.num_workers),
+        "beam_size": getattr(config, "transcription_beam_size", defaults.beam_size),
+        "vad_filter": getattr(config, "transcription_vad_filter", defaults.vad_filter),
+        "language": getattr(config, "transcription_language", defaults.language),
+        "chunked": getattr(config, "transcription_chunked", defaults.chunked),
+        "chunk_workers": getattr(config, "transcription_chunk_workers", defaults.chunk_workers),
+        "chunk_max_seconds": getattr(
+            config, "transcription_chunk_max_seconds", defaults.chunk_max_seconds
+        ),
+        "chunk_overlap_seconds": getattr(
+            config, "transcription_chunk_overlap_seconds", defaults.chunk_overlap_seconds
+        ),
+        "chunk_min_audio_seconds": getattr(
+            config, "transcription_chunk_min_audio_seconds", defaults.chunk_min_audio_seconds
+        ),
+        "checkpoint_dir": getattr(
+            config, "transcription_checkpoint_dir", defaults.checkpoint_dir
+        ),
+        "checkpoint_interval_seconds": getattr(
+            config,
+            "transcription_checkpoint_interval_seconds",
+            defaults.checkpoint_interval_seconds,
+        ),
+        "word_timestamps": getattr(
+            config, "transcription_word_timestamps", defaults.word_timestamps
+        ),
+        "transcript_dir": getattr(config, "transcription_output_dir", defaults.transcript_dir),
+    }
+    for key, value in (overrides or {}).items():
+        if key not in OVERRIDABLE_FIELDS:
+            logger.warning(f"Ignoring unknown transcription override: {key}")
+            continue
+        if value is None:
+            continue
+        if key == "model_size":
+            try:
+                value = validate_model_size(value)
+            except ValueError as exc:
+                logger.warning(f"Ignoring transcription override: {exc}")
+                continue
+        raw[key] = value
+
+    num_workers = max(1, int(raw["num_workers"]))
+    concurrency = int(getattr(config, "transcription_concurrency", 1) or 1)
+    chunked = bool(raw["chunked"])
+    chunk_workers = max(0, int(raw["chunk_workers"]))
+    if chunked and chunk_workers == 0:
+        chunk_workers = auto_cpu_threads(
+            concurrency * CHUNK_THREADS_PER_WORKER, 1, cpu_count
+        )
+    cpu_threads = _parse_cpu_threads(raw["cpu_threads"])
+    if cpu_threads is None:
+        # Every chunk process hosts its own model, so it counts as a consumer.
+        cpu_threads = auto_cpu_threads(
+            concurrency * (chunk_workers if chunked else 1),
+            num_workers,
+            cpu_count,
+        )
+
+    return replace(
+        defaults,
+        model_size=str(raw["model_size"]),
+        compute_type=str(raw["compute_type"]),
+        cpu_threads=cpu_threads,
+        num_workers=num_workers,
+        beam_size=max(1, int(raw["beam_size"])),
+        vad_filter=bool(raw["vad_filter"]),
+        language=raw["language"] or None,
+        chunked=chunked,
+        chunk_workers=chunk_workers,
+        chunk_max_seconds=float(raw["chunk_max_seconds"]),
+        chunk_overlap_seconds=max(0.0, float(raw["chunk_overlap_seconds"])),
+        chunk_min_audio_seconds=max(0.0, float(raw["chunk_min_audio_seconds"])),
+        checkpoint_dir=raw["checkpoint_dir"] or None,
+        checkpoint_interval_seconds=max(0.0, float(raw["checkpoint_interval_seconds"])),
+        word_timestamps=bool(raw["word_timestamps"]),
+        transcript_dir=raw["transcript_dir"] or None,
+    )
@@ -3,8 +3,20 @@ from src.core.logger import logger
 import time
 from typing import Optional
 
-import whisper
-from faster_whisper import WhisperModel
+from src.core.utils.runtime import loaded_streamlit
+from src.domain.transcripts import Transcript
+from src.infrastructure.media.transcription.checkpoint import (
+    TranscriptionCheckpoint,
+    audio_fingerprint,
+    checkpoint_key_for,
+)
+from src.infrastructure.media.transcription.transcript_io import (
+    TranscriptJsonlWriter,
+    segment_from_whisper,
+)
+
+# Tail of the checkpointed transcript fed back as context when resuming.
+CHECKPOINT_PROMPT_CHARS = 200
 
 # 導入測試樣本管理器
 try:
@@ -12,16 +24,77 @@ try:
 except ImportError:
     TestSampleManager = None
 
-# 導入 Streamlit（如果可用）用於檢測測試模式
-try:
-    import streamlit as st
-except ImportError:
-    st = None
+
+def is_test_mode() -> bool:
+    """檢測是否為測試模式"""
+    # 只接受顯式旗標（Streamlit 開關或環境變數），避免因檔名含關鍵字誤觸
+    st = loaded_streamlit()
+    if st and hasattr(st, "session_state"):
+        try:
+            if st.session_state.get("test_mode", False):
+                return True
+        except Exception:
+            pass
+
+    env_flag = os.getenv("APP_ENV", "").lower() == "test"
+    force_flag = os.getenv("FORCE_TEST_MODE", "").lower() in [
+        "1",
+        "true",
+        "yes",
+        "on",
+    ]
+    return env_flag or force_flag
 
 
 class Transcriber:
-    def __init__(self, model_size="base"):
+    def __init__(
+        self,
+        model_size="base",
+        *,
+        compute_type: str = "int8",
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        beam_size: int = 5,
+        vad_filter: bool = False,
+        language: Optional[str] = None,
+        chunked: bool = False,
+        chunk_workers: int = 0,
+        chunk_max_seconds: float = 600.0,
+        chunk_overlap_seconds: float = 2.0,
+        chunk_min_audio_seconds: float = 1200.0,
+        checkpoint_dir: Optional[str] = None,
+        checkpoint_interval_seconds: float = 30.0,
+        word_timestamps: bool = False,
+        transcript_dir: Optional[str] = None,
+    ):
         self.model_size = model_size
+        self.compute_type = compute_type
+        # 0 lets CTranslate2 pick its default thread count.
+        self.cpu_threads = cpu_threads
+        self.num_workers = num_workers
+        self.beam_size = beam_size
+        self.vad_filter = vad_filter
+        # None lets faster-whisper detect the language.
+        self.language = language
+        self.chunked = chunked
+        self.chunk_workers = max(1, chunk_workers)
+        self.chunk_max_seconds = chunk_max_seconds
+        self.chunk_overlap_seconds = chunk_overlap_seconds
+        self.chunk_min_audio_seconds = chunk_min_audio_seconds
+        # Completed segments are checkpointed here (keyed by video id) so a
+        # reclaimed task resumes instead of starting from second zero.
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_interval_seconds = checkpoint_interval_seconds
+        self.word_timestamps = word_timestamps
+        # Segments are streamed to <transcript_dir>/<video_id>.jsonl while decoding.
+        self.transcript_dir = transcript_dir
+        self._model = None
+        # Seconds spent constructing the faster-whisper model, once loaded.
+        self.last_model_load_seconds: Optional[float] = None
+        # Duration of the most recently transcribed audio (seconds), if known.
+        self.last_audio_duration: Optional[float] = None
+        # Structured result of the most recent faster-whisper transcription.
+        self.last_transcript: Optional[Transcript] = None
 
     def transcribe(self, file_path):
         # 檢測測試模式
@@ -32,40 +105,222 @@ class Transcriber:
             return self.transcribe_with_faster_whisper(file_path)
 
     def transcribe_with_whisper(self, file_path):
+        # openai-whisper pulls in torch; only import it on this path.
+        import whisper
+
         logger.info(f"Transcribing audio with Whisper...")
         whisper_model = whisper.load_model(self.model_size)
         result = whisper_model.transcribe(file_path, verbose=True, fp16=False)
         return result["text"]
 
     def transcribe_with_faster_whisper(self, file_path):
+        return self.transcribe_detailed(file_path).text
+
+    def transcribe_detailed(self, file_path) -> Transcript:
+        """Transcribe ``file_path`` into timestamped segments.
+
+        Segments are accumulated in a list (joined once via ``Transcript.text``)
+        and, when ``transcript_dir`` is set, streamed to a JSONL file as they
+        are decoded.
+        """
+        if self.chunked:
+            chunked_transcript = self._transcribe_chunked(file_path)
+            if chunked_transcript is not None:
+                self._write_transcript_file(file_path, chunked_transcript)
+                self.last_transcript = chunked_transcript
+                return chunked_transcript
+
+        checkpoint = self._open_checkpoint(file_path)
+        resumed = checkpoint.load() if checkpoint else []
+        resume_offset = resumed[-1].end if resumed else 0.0
+        transcribe_kwargs = {
+            "beam_size": self.beam_size,
+            "vad_filter": self.vad_filter,
+            "language": self.language,
+            "word_timestamps": self.word_timestamps,
+        }
+        if resume_offset > 0:
+            logger.info(
+                f"Resuming transcription from checkpoint at {resume_offset:.1f}s "
+                f"({len(resumed)} segments)"
+            )
+            transcribe_kwargs["clip_timestamps"] = [resume_offset]
+            # VAD would re-plan clips over the whole file and ignore the offset.
+            transcribe_kwargs["vad_filter"] = False
+            transcribe_kwargs["initial_prompt"] = "".join(
+                segment.text for segment in resumed
+            )[-CHECKPOINT_PROMPT_CHARS:]
+
         logger.info(f"Transcribing audio with Faster Whisper...")
-        whisper_model = WhisperModel(
-            self.model_size,
-            compute_type="int8",
-        )
-        segments, info = whisper_model.transcribe(file_path)
+        whisper_model = self.load_model()
+        segments, info = whisper_model.transcribe(file_path, **transcribe_kwargs)
 
         total_duration = self._get_total_duration_seconds(info)
+        self.last_audio_duration = total_duration
         next_progress = 10
-        last_segment_end = 0.0
+        if total_duration and resume_offset:
+            _, next_progress = self._get_progress_updates(
+                resume_offset, total_duration, next_progress
+            )
+        last_segment_end = resume_offset
 
-        transcript_text = ""
-        for segment in segments:
-            # print(f"[{segment.start:.2f}s -> {segment.end:.2f}s] {segment.text}")
-            transcript_text += segment.text
+        transcript = Transcript(
+            language=getattr(info, "language", None) or self.language,
+            duration=total_duration,
+        )
+        writer = self._open_transcript_writer(file_path, transcript)
+        try:
+            for segment in resumed:
+                transcript.append(segment)
+                if writer:
+                    writer.write(segment)
+            for raw_segment in segments:
+                segment = segment_from_whisper(raw_segment)
+                transcript.append(segment)
+                if writer:
+                    writer.write(segment)
+                if checkpoint:
+                    checkpoint.add(segment)
 
-            if total_duration:
-                updates, next_progress = self._get_progress_updates(
-                    segment.end, total_duration, next_progress
-                )
-                for progress in updates:
-                    logger.info(f"[進度] 轉錄 {progress}%")
-            last_segment_end = segment.end
+                if total_duration:
+                    updates, next_progress = self._get_progress_updates(
+                        segment.end, total_duration, next_progress
+                    )
+                    for progress in updates:
+                        logger.info(f"[進度] 轉錄 {progress}%")
+                last_segment_end = segment.end
+        except BaseException:
+            if writer:
+                writer.abort()
+            if checkpoint:
+                checkpoint.flush()
+            raise
 
+        if writer:
+            writer.close()
+        if checkpoint:
+            checkpoint.clear()
         if total_duration and last_segment_end >= total_duration:
             logger.info("[進度] 轉錄 100%")
 
-        return transcript_text
+        self.last_transcript = transcript
+        return transcript
+
+    def _transcript_path(self, file_path) -> Optional[str]:
+        if not self.transcript_dir:
+            return None
+        return os.path.join(self.transcript_dir, f"{checkpoint_key_for(file_path)}.jsonl")
+
+    def _open_transcript_writer(
+        self, file_path, transcript: Transcript
+    ) -> Optional[TranscriptJsonlWriter]:
+        path = self._transcript_path(file_path)
+        if path is None:
+            return None
+        try:
+            return TranscriptJsonlWriter(path, transcript.metadata())
+        except OSError as exc:
+            logger.warning(f"Could not open transcript output {path}: {exc}")
+            return None
+
+    def _write_transcript_file(self, file_path, transcript: Transcript) -> None:
+        writer = self._open_transcript_writer(file_path, transcript)
+        if writer is None:
+            return
+        for segment in transcript.segments:
+            writer.write(segment)
+        writer.close()
+
+    def _open_checkpoint(self, file_path) -> Optional[TranscriptionCheckpoint]:
+        if not self.checkpoint_dir:
+            return None
+        try:
+            fingerprint = audio_fingerprint(file_path, self.model_size, self.language)
+        except OSError:
+            return None
+        return TranscriptionCheckpoint(
+            self.checkpoint_dir,
+            checkpoint_key_for(file_path),
+            fingerprint,
+            flush_interval_seconds=self.checkpoint_interval_seconds,
+        )
+
+    def _transcribe_chunked(self, file_path) -> Optional[Transcript]:
+        """Split long audio on silence and transcribe chunks in parallel.
+
+        Returns ``None`` when the audio is shorter than
+        ``chunk_min_audio_seconds`` so the caller falls back to a single call.
+        """
+        from faster_whisper import decode_audio
+
+        from src.infrastructure.media.transcription.chunked import (
+            SAMPLING_RATE,
+            transcribe_chunked,
+        )
+
+        audio = decode_audio(file_path, sampling_rate=SAMPLING_RATE)
+        total_duration = len(audio) / SAMPLING_RATE
+        if total_duration < self.chunk_min_audio_seconds:
+            return None
+
+        logger.info(
+            f"Transcribing {total_duration:.0f}s audio in chunks "
+            f"(max={self.chunk_max_seconds:.0f}s, workers={self.chunk_workers})..."
+        )
+        self.last_audio_duration = total_duration
+        next_progress = 10
+
+        def _log_progress(fraction: float) -> None:
+            nonlocal next_progress
+            updates, next_progress = self._get_progress_updates(
+                fraction * total_duration, total_duration, next_progress
+            )
+            for progress in updates:
+                logger.info(f"[進度] 轉錄 {progress}%")
+
+        segments = transcribe_chunked(
+            audio,
+            model_size=self.model_size,
+            model_kwargs={
+                "compute_type": self.compute_type,
+                "cpu_threads": self.cpu_threads,
+                "num_workers": self.num_workers,
+            },
+            transcribe_kwargs={
+                "beam_size": self.beam_size,
+                # Chunks are already cut on silence; the per-chunk VAD flag
+                # still trims leading/trailing noise when enabled.
+                "vad_filter": self.vad_filter,
+                "language": self.language,
+                "word_timestamps": self.word_timestamps,
+            },
+            workers=self.chunk_workers,
+            max_chunk_seconds=self.chunk_max_seconds,
+            overlap_seconds=self.chunk_overlap_seconds,
+            on_progress=_log_progress,
+        )
+        return Transcript(segments=segments, language=self.language, duration=total_duration)
+
+    def load_model(self):
+        """Load (once) and return the faster-whisper model for this configuration."""
+        if self._model is None:
+            from faster_whisper import WhisperModel
+
+            started = time.perf_counter()
+            self._model = WhisperModel(
+                self.model_size,
+                compute_type=self.compute_type,
+                cpu_threads=self.cpu_threads,
+                num_workers=self.num_workers,
+            )
+            self.last_model_load_seconds = time.perf_counter() - started
+            logger.info(
+                f"Loaded faster-whisper model={self.model_size} "
+                f"compute_type={self.compute_type} cpu_threads={self.cpu_threads} "
+                f"num_workers={self.num_workers} "
+                f"in {self.last_model_load_seconds:.2f}s"
+            )
+        return self._model
 
     def _get_total_duration_seconds(self, info: Optional[object]) -> Optional[float]:
         if not info:
@@ -96,22 +351,7 @@ class Transcriber:
 
     def _is_test_mode(self, file_path: str = None) -> bool:
         """檢測是否為測試模式"""
-        # 只接受顯式旗標（Streamlit 開關或環境變數），避免因檔名含關鍵字誤觸
-        if st and hasattr(st, "session_state"):
-            try:
-                if st.session_state.get("test_mode", False):
-                    return True
-            except Exception:
-                pass
-
-        env_flag = os.getenv("APP_ENV", "").lower() == "test"
-        force_flag = os.getenv("FORCE_TEST_MODE", "").lower() in [
-            "1",
-            "true",
-            "yes",
-            "on",
-        ]
-        return env_flag or force_flag
+        return is_test_mode()
 
     def _mock_transcribe(self, file_path: str) -> str:
         """模擬轉錄過程，返回測試樣本文字"""
@@ -0,0 +1,85 @@
+"""JSONL serialization of structured transcripts.
+
+Layout: one header line (``{"type": "header", "language": ..., "duration":
+...}``) followed by one JSON object per segment. ``TranscriptJsonlWriter``
+streams segments while decoding into ``<path>.partial`` and renames it into
+place on ``close()``, so readers never mistake a partial file for a complete
+transcript.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Optional
+
+from src.domain.transcripts import Transcript, TranscriptSegment, TranscriptWord
+
+PARTIAL_SUFFIX = ".partial"
+
+
+def segment_from_whisper(segment: Any, offset: float = 0.0) -> TranscriptSegment:
+    """Convert a faster-whisper ``Segment`` into a ``TranscriptSegment``."""
+    raw_words = getattr(segment, "words", None)
+    words = (
+        tuple(
+            TranscriptWord(
+                offset + word.start,
+                offset + word.end,
+                word.word,
+                getattr(word, "probability", None),
+            )
+            for word in raw_words
+        )
+        if raw_words
+        else None
+    )
+    return TranscriptSegment(offset + segment.start, offset + segment.end, segment.text, words)
+
+
+def encode_segment(segment: TranscriptSegment) -> str:
+    return json.dumps(segment.to_dict(), ensure_ascii=False) + "\n"
+
+
+class TranscriptJsonlWriter:
+    """Append segments to a JSONL transcript as they are decoded."""
+
+    def __init__(self, path: str, metadata: Optional[dict[str, Any]] = None):
+        self.path = path
+        self.partial_path = path + PARTIAL_SUFFIX
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._handle = open(self.partial_path, "w", encoding="utf-8")
+        self._handle.write(json.dumps({"type": "header", **(metadata or {})}) + "\n")
+        self._handle.flush()
+
+    def write(self, segment: TranscriptSegment) -> None:
+        self._handle.write(encode_segment(segment))
+        self._handle.flush()
+
+    def close(self) -> str:
+        """Finish the transcript and atomically move it to ``path``."""
+        self._handle.close()
+        os.replace(self.partial_path, self.path)
+        return self.path
+
+    def abort(self) -> None:
+        self._handle.close()
+        try:
+            os.remove(self.partial_path)
+        except FileNotFoundError:
+            pass
+
+
+def read_transcript_jsonl(path: str) -> Transcript:
+    transcript = Transcript()
+    with open(path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get("type") == "header":
+                transcript.language = record.get("language")
+                transcript.duration = record.get("duration")
+                continue
+            transcript.append(TranscriptSegment.from_dict(record))
+    return transcript
@@ -0,0 +1,184 @@
+"""In-process yt-dlp backend built on ``yt_dlp.YoutubeDL``.
+
+One ``extract_info`` call both resolves the metadata and downloads the media,
+so the title, duration, formats, captions and chapters all come from a single
+extraction (the subprocess backend needs a second ``yt-dlp -O`` run when the
+printed title is unusable). ``YoutubeDL`` instances are pooled per output
+directory and reused across tasks; each instance serves one call at a time, so
+concurrent downloads check out separate instances. ``yt_dlp`` is imported
+lazily and is optional: ``library_available()`` reports whether it is
+installed.
+"""
+
+from __future__ import annotations
+
+import glob
+import importlib.util
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional
+
+from src.core.logger import logger
+
+ProgressHook = Callable[[dict[str, Any]], None]
+
+# Same selection as the subprocess backend (``-S res:360``).
+_BASE_PARAMS: dict[str, Any] = {
+    "format_sort": ["res:360"],
+    "overwrites": False,
+    "quiet": True,
+    "no_warnings": False,
+    "noprogress": True,
+}
+
+
+@dataclass
+class MediaInfo:
+    """Structured metadata from one yt-dlp extraction."""
+
+    video_id: Optional[str]
+    title: Optional[str]
+    duration: Optional[float] = None
+    live_status: Optional[str] = None
+    availability: Optional[str] = None
+    formats: list[dict[str, Any]] = field(default_factory=list)
+    # language -> available caption extensions
+    captions: dict[str, list[str]] = field(default_factory=dict)
+    automatic_captions: dict[str, list[str]] = field(default_factory=dict)
+    chapters: list[dict[str, Any]] = field(default_factory=list)
+    path: Optional[str] = None
+    # Sanitized info dict; lets a later download skip the metadata extraction.
+    raw: Optional[dict[str, Any]] = field(default=None, repr=False, compare=False)
+
+
+def _caption_tracks(tracks: Optional[dict[str, Any]]) -> dict[str, list[str]]:
+    return {
+        language: [item.get("ext") for item in items or [] if item.get("ext")]
+        for language, items in (tracks or {}).items()
+    }
+
+
+def media_info_from_dict(info: dict[str, Any], path: Optional[str] = None) -> MediaInfo:
+    """Reduce a yt-dlp info dict to the fields the pipeline uses."""
+    duration = info.get("duration")
+    return MediaInfo(
+        video_id=info.get("id"),
+        title=info.get("title"),
+        duration=float(duration) if duration is not None else None,
+        live_status=info.get("live_status"),
+        availability=info.get("availability"),
+        formats=[
+            {
+                "format_id": item.get("format_id"),
+                "ext": item.get("ext"),
+                "height": item.get("height"),
+                "vcodec": item.get("vcodec"),
+                "acodec": item.get("acodec"),
+                "filesize": item.get("filesize") or item.get("filesize_approx"),
+            }
+            for item in info.get("formats") or []
+        ],
+        captions=_caption_tracks(info.get("subtitles")),
+        automatic_captions=_caption_tracks(info.get("automatic_captions")),
+        chapters=[
+            {
+                "start_time": item.get("start_time"),
+                "end_time": item.get("end_time"),
+                "title": item.get("title"),
+            }
+            for item in info.get("chapters") or []
+        ],
+        path=path,
+        raw=info,
+    )
+
+
+def library_available() -> bool:
+    return importlib.util.find_spec("yt_dlp") is not None
+
+
+class _PooledYoutubeDL:
+    """A ``YoutubeDL`` whose progress hook can be swapped per checkout."""
+
+    def __init__(self, output_dir: str):
+        import yt_dlp
+
+        self.progress_hook: Optional[ProgressHook] = None
+        self.ydl = yt_dlp.YoutubeDL(
+            {
+                **_BASE_PARAMS,
+                "outtmpl": os.path.join(output_dir, "%(id)s.%(ext)s"),
+                "progress_hooks": [self._on_progress],
+            }
+        )
+
+    def _on_progress(self, status: dict[str, Any]) -> None:
+        if self.progress_hook is not None:
+            try:
+                self.progress_hook(status)
+            except Exception as exc:  # pragma: no cover - never break a download
+                logger.warning(f"yt-dlp progress hook failed: {exc}")
+
+
+_IDLE: dict[str, list[_PooledYoutubeDL]] = {}
+_IDLE_LOCK = threading.Lock()
+
+
+@contextmanager
+def _checkout(output_dir: str, progress_hook: Optional[ProgressHook]) -> Iterator[_PooledYoutubeDL]:
+    key = os.path.abspath(output_dir)
+    with _IDLE_LOCK:
+        idle = _IDLE.setdefault(key, [])
+        instance = idle.pop() if idle else None
+    if instance is None:
+        instance = _PooledYoutubeDL(output_dir)
+    instance.progress_hook = progress_hook
+    try:
+        yield instance
+    finally:
+        instance.progress_hook = None
+        with _IDLE_LOCK:
+            _IDLE.setdefault(key, []).append(instance)
+
+
+def _downloaded_path(ydl: Any, info: dict[str, Any], output_dir: str) -> Optional[str]:
+    for item in info.get("requested_downloads") or []:
+        path = item.get("filepath")
+        if path and os.path.isfile(path):
+            return path
+    path = ydl.prepare_filename(info)
+    if path and os.path.isfile(path):
+        return path
+    if info.get("id"):
+        candidates = glob.glob(os.path.join(output_dir, f"{info['id']}.*"))
+        if candidates:
+            return max(candidates, key=os.path.getctime)
+    return None
+
+
+def extract(
+    url: str,
+    output_dir: str,
+    *,
+    download: bool = True,
+    progress_hook: Optional[ProgressHook] = None,
+    probed: Optional[MediaInfo] = None,
+) -> MediaInfo:
+    """Extract metadata for ``url`` and (optionally) download it into ``output_dir``.
+
+    Passing the ``probed`` result of an earlier ``download=False`` call
+    downloads from that info (like ``--load-info-json``) without a second
+    extraction.
+    """
+    with _checkout(output_dir, progress_hook) as instance:
+        if probed is not None and probed.raw is not None and download:
+            info = instance.ydl.process_ie_result(dict(probed.raw), download=True)
+        else:
+            info = instance.ydl.extract_info(url, download=download)
+        info = instance.ydl.sanitize_info(info)
+        path = _downloaded_path(instance.ydl, info, output_dir) if download else None
+    if download and not path:
+        raise Exception("yt-dlp did not produce an output file for this URL")
+    return media_info_from_dict(info, path)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 try:  # pragma: no cover - optional dependency
     import requests
@@ -15,6 +15,43 @@ from src.core.logger import logger
 
 DEFAULT_TIMEOUT_SECONDS = 10
 PostFunc = Callable[..., Any]
+AsyncPostFunc = Callable[..., Awaitable[Any]]
+
+
+def _build_payload(
+    title: str,
+    youtube_url: str,
+    notion_url: Optional[str],
+    notion_task_id: Optional[str],
+) -> dict[str, str]:
+    message_lines = [f"✅ 任務完成：{title}", youtube_url]
+
+    notion_url_value = (notion_url or "").strip()
+    notion_task_id_value = (notion_task_id or "").strip()
+    if notion_url_value and notion_task_id_value:
+        normalized_base = notion_url_value.rstrip("/")
+        sanitized_id = notion_task_id_value.replace("-", "")
+        notion_link = f"{normalized_base}/{sanitized_id or notion_task_id_value}"
+        message_lines.append(f"Notion：{notion_link}")
+    elif notion_url_value or notion_task_id_value:
+        logger.info(
+            "Notion link information incomplete; sending Discord notification without Notion URL."
+        )
+
+    return {
+        "content": "\n".join(message_lines),
+    }
+
+
+def _delivered(response: Any) -> bool:
+    status_code = getattr(response, "status_code", None)
+    if status_code is not None and status_code >= 400:
+        body = getattr(response, "text", "")
+        logger.warning(f"Discord webhook returned {status_code}: {body}")
+        return False
+
+    logger.info("Discord notification delivered.")
+    return True
 
 
 def send_task_completion_notification(
@@ -43,23 +80,7 @@ def send_task_completion_notification(
             return False
         sender = requests.post
 
-    message_lines = [f"✅ 任務完成：{title}", youtube_url]
-
-    notion_url_value = (notion_url or "").strip()
-    notion_task_id_value = (notion_task_id or "").strip()
-    if notion_url_value and notion_task_id_value:
-        normalized_base = notion_url_value.rstrip("/")
-        sanitized_id = notion_task_id_value.replace("-", "")
-        notion_link = f"{normalized_base}/{sanitized_id or notion_task_id_value}"
-        message_lines.append(f"Notion：{notion_link}")
-    elif notion_url_value or notion_task_id_value:
-        logger.info(
-            "Notion link information incomplete; sending Discord notification without Notion URL."
-        )
-
-    payload = {
-        "content": "\n".join(message_lines),
-    }
+    payload = _build_payload(title, youtube_url, notion_url, notion_task_id)
 
     try:
         response = sender(webhook_url, json=payload, timeout=timeout_seconds)
@@ -67,11 +88,37 @@ def send_task_completion_notification(
         logger.warning(f"Failed to send Discord notification: {exc}")
         return False
 
-    status_code = getattr(response, "status_code", None)
-    if status_code is not None and status_code >= 400:
-        body = getattr(response, "text", "")
-        logger.warning(f"Discord webhook returned {status_code}: {body}")
+    return _delivered(response)
+
+
+async def async_send_task_completion_notification(
+    title: str,
+    youtube_url: str,
+    webhook_url: Optional[str],
+    *,
+    notion_url: Optional[str] = None,
+    notion_task_id: Optional[str] = None,
+    post: Optional[AsyncPostFunc] = None,
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+) -> bool:
+    """Async variant of ``send_task_completion_notification`` (httpx ``AsyncClient``)."""
+    if not webhook_url:
+        logger.info("Discord webhook not configured; skipping notification.")
         return False
 
-    logger.info("Discord notification delivered.")
-    return True
+    payload = _build_payload(title, youtube_url, notion_url, notion_task_id)
+    try:
+        if post is not None:
+            response = await post(webhook_url, json=payload, timeout=timeout_seconds)
+        else:
+            import httpx
+
+            async with httpx.AsyncClient() as client:
+                response = await client.post(
+                    webhook_url, json=payload, timeout=timeout_seconds
+                )
+    except Exception as exc:  # pragma: no cover - network failure path
+        logger.warning(f"Failed to send Discord notification: {exc}")
+        return False
+
+    return _delivered(response)
@@ -31,8 +31,15 @@ class NotionDB(BaseDB):
         status: str = "Pending",
         source_type: str = "manual",
         source_channel_id: str | None = None,
+        transcription_options: dict | None = None,
+        priority: int = 0,
     ) -> Task:
-        """Adds a new task to the Notion database."""
+        """Adds a new task to the Notion database.
+
+        ``transcription_options`` and ``priority`` are not persisted: the
+        Notion schema has no columns for them, so Notion-backed tasks use the
+        global configuration and are claimed in FIFO order.
+        """
         self._ensure_configuration()
         name_text = build_rich_text_array(url or "") or [
             {"type": "text", "text": {"content": url or ""}}
@@ -1,20 +1,114 @@
+import json
 import sqlite3
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Sequence
 
+from src.core.logger import logger
 from src.core.time_utils import utc_now_naive
-from src.domain.interfaces.database import BaseDB, ProcessingLockInfo
-from src.domain.tasks.models import Task
+from src.core.utils.url import extract_video_id
+from src.domain.interfaces.database import ActiveTaskExistsError, BaseDB, ProcessingLockInfo
+from src.domain.tasks.models import (
+    Task,
+    TaskPage,
+    TaskSearchHit,
+    TaskSearchResults,
+    TaskStageTimings,
+)
+from src.domain.tasks.scheduling import (
+    FAIR_SHARE,
+    FIFO,
+    PRIORITY_FIFO,
+    SHORTEST_JOB_FIRST,
+    UNKNOWN_DURATION_SECONDS,
+    default_policy,
+    normalize_policy,
+)
+from src.infrastructure.persistence.sqlite.search import (
+    BM25_WEIGHTS,
+    FALLBACK_SUMMARY,
+    HIGHLIGHT_CLOSE,
+    HIGHLIGHT_OPEN,
+    MIN_MATCH_CHARS,
+    SEARCH_TABLE,
+    SNIPPET_TOKENS,
+    create_search_index,
+    highlight,
+    like_pattern,
+    match_expression,
+    register_blob_text,
+    search_index_exists,
+    split_terms,
+)
 from src.infrastructure.persistence.sqlite.task_adapter import SQLiteTaskAdapter
+from src.infrastructure.persistence.sqlite.task_archive import (
+    ARCHIVABLE_STATUSES,
+    DEFAULT_BATCH_SIZE,
+    archive_rows,
+    create_archive_tables,
+    latest_archived_id,
+    load_archived_row,
+)
+from src.infrastructure.persistence.sqlite.task_blobs import (
+    NONE,
+    OFF,
+    compress_text,
+    decompress_text,
+    resolve_codec,
+    resolve_min_bytes,
+)
+
+# Tables whose writes bump a counter in ``table_versions``.
+VERSIONED_TABLES = ("tasks", "processing_lock", "rss_channel_subscriptions")
+
+# Stored in ``PRAGMA user_version`` once _create_table has run; bump it
+# whenever _create_table gains a table, index, trigger or migration.
+SCHEMA_VERSION = 1
+
+
+# ORDER BY clause (and its parameters) for each scheduling policy; see
+# src/domain/tasks/scheduling.py. Every policy ends with FIFO as tie-breaker.
+_ORDER_BY: dict[str, tuple[str, tuple[object, ...]]] = {
+    FIFO: ("created_at ASC, id ASC", ()),
+    PRIORITY_FIFO: ("priority DESC, created_at ASC, id ASC", ()),
+    SHORTEST_JOB_FIRST: (
+        "priority DESC, COALESCE(duration_seconds, ?) ASC, created_at ASC, id ASC",
+        (UNKNOWN_DURATION_SECONDS,),
+    ),
+    FAIR_SHARE: (
+        """
+        priority DESC,
+        (
+            SELECT MAX(served.started_at)
+            FROM tasks AS served
+            WHERE served.source_type IS tasks.source_type
+              AND served.source_channel_id IS tasks.source_channel_id
+        ) ASC,
+        created_at ASC,
+        id ASC
+        """,
+        (),
+    ),
+}
 
 
 class SQLiteDB(BaseDB):
     """SQLite database connector."""
 
-    def __init__(self, db_path: str = "data/tasks.db"):
-        """Initializes the SQLite database."""
+    def __init__(
+        self,
+        db_path: str = "data/tasks.db",
+        text_codec: Optional[str] = None,
+        compress_min_bytes: Optional[int] = None,
+    ):
+        """Initializes the SQLite database.
+
+        Summaries of at least ``compress_min_bytes`` are stored compressed with
+        ``text_codec`` (defaults: ``TEXT_COMPRESSION`` / ``TEXT_COMPRESSION_MIN_BYTES``).
+        """
         self.db_path = db_path
-        self.adapter = SQLiteTaskAdapter()
+        self.text_codec = resolve_codec(text_codec)
+        self.compress_min_bytes = resolve_min_bytes(compress_min_bytes)
+        self.adapter = SQLiteTaskAdapter(text_loader=self.load_task_text)
         self._create_table()
 
     def _get_connection(self) -> sqlite3.Connection:
@@ -25,6 +119,14 @@ class SQLiteDB(BaseDB):
         """Creates the application tables if they don't exist and ensures required columns."""
         conn = self._get_connection()
         cursor = conn.cursor()
+        # A current schema needs no DDL, so opening a client never waits for
+        # the write lock held by another writer.
+        if cursor.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+            self.search_enabled = search_index_exists(cursor)
+            conn.close()
+            return
+        # Serialize schema setup between processes starting at the same time.
+        cursor.execute("BEGIN IMMEDIATE")
         cursor.execute(
             """
             CREATE TABLE IF NOT EXISTS tasks (
@@ -43,7 +145,42 @@ class SQLiteDB(BaseDB):
                 worker_id TEXT,
                 notion_page_id TEXT,
                 source_type TEXT DEFAULT 'manual',
-                source_channel_id TEXT
+                source_channel_id TEXT,
+                transcription_options TEXT,
+                duration_seconds REAL,
+                deferred_until TIMESTAMP,
+                priority INTEGER NOT NULL DEFAULT 0,
+                started_at TIMESTAMP,
+                summary_size INTEGER,
+                video_id TEXT
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS task_blobs (
+                task_id INTEGER NOT NULL,
+                field TEXT NOT NULL,
+                codec TEXT NOT NULL,
+                data BLOB NOT NULL,
+                raw_size INTEGER NOT NULL,
+                PRIMARY KEY (task_id, field)
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS tasks_blobs_delete AFTER DELETE ON tasks BEGIN
+                DELETE FROM task_blobs WHERE task_id = old.id;
+            END
+            """
+        )
+        create_archive_tables(cursor)
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scheduler_settings (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
             )
             """
         )
@@ -87,6 +224,75 @@ class SQLiteDB(BaseDB):
             ON rss_channel_subscriptions (enabled, channel_id)
             """
         )
+        # Per-table write counters read by in-process caches and API ETags
+        # (get_change_version).
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS table_versions (
+                name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL
+            )
+            """
+        )
+        for table in VERSIONED_TABLES:
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                cursor.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_version_{event.lower()}
+                    AFTER {event} ON {table} BEGIN
+                        INSERT INTO table_versions (name, version) VALUES ('{table}', 1)
+                        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+                    END
+                    """
+                )
+
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS task_stage_timings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                task_id INTEGER NOT NULL,
+                outcome TEXT NOT NULL,
+                stage_durations TEXT NOT NULL,
+                total_duration REAL,
+                audio_duration REAL,
+                transcript_chars INTEGER,
+                summary_chars INTEGER,
+                transcription_model TEXT,
+                summarizer_model TEXT,
+                recorded_at TIMESTAMP NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_task_stage_timings_recorded_at
+            ON task_stage_timings (recorded_at)
+            """
+        )
+
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS transcription_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                file_path TEXT NOT NULL,
+                options TEXT,
+                status TEXT NOT NULL DEFAULT 'queued',
+                transcript TEXT,
+                audio_duration REAL,
+                error_message TEXT,
+                worker_id TEXT,
+                created_at TIMESTAMP NOT NULL,
+                claimed_at TIMESTAMP,
+                finished_at TIMESTAMP
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_transcription_jobs_status
+            ON transcription_jobs (status, id)
+            """
+        )
 
         # Ensure legacy databases get the new columns.
         cursor.execute("PRAGMA table_info(tasks)")
@@ -105,9 +311,132 @@ class SQLiteDB(BaseDB):
             cursor.execute("ALTER TABLE tasks ADD COLUMN source_type TEXT DEFAULT 'manual'")
         if "source_channel_id" not in existing_columns:
             cursor.execute("ALTER TABLE tasks ADD COLUMN source_channel_id TEXT")
+        if "transcription_options" not in existing_columns:
+            cursor.execute("ALTER TABLE tasks ADD COLUMN transcription_options TEXT")
+        if "duration_seconds" not in existing_columns:
+            cursor.execute("ALTER TABLE tasks ADD COLUMN duration_seconds REAL")
+        if "deferred_until" not in existing_columns:
+            cursor.execute("ALTER TABLE tasks ADD COLUMN deferred_until TIMESTAMP")
+        if "priority" not in existing_columns:
+            cursor.execute("ALTER TABLE tasks ADD COLUMN priority INTEGER NOT NULL DEFAULT 0")
+        if "started_at" not in existing_columns:
+            cursor.execute("ALTER TABLE tasks ADD COLUMN started_at TIMESTAMP")
+        # Set (uncompressed bytes) when the summary lives in task_blobs.
+        migrate_texts = "summary_size" not in existing_columns
+        if migrate_texts:
+            cursor.execute("ALTER TABLE tasks ADD COLUMN summary_size INTEGER")
+        if "video_id" not in existing_columns:
+            cursor.execute("ALTER TABLE tasks ADD COLUMN video_id TEXT")
+            rows = cursor.execute("SELECT id, url FROM tasks").fetchall()
+            cursor.executemany(
+                "UPDATE tasks SET video_id = ? WHERE id = ?",
+                [(extract_video_id(url), task_id) for task_id, url in rows],
+            )
+        # URL dedup (find_recent_task_by_url) and at most one active task per video.
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_video_id ON tasks (video_id, created_at)"
+        )
+        has_active_index = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_tasks_active_video_id'"
+        ).fetchone()
+        if not has_active_index:
+            self._fail_duplicate_active_tasks(cursor)
+        cursor.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_tasks_active_video_id
+            ON tasks (video_id) WHERE status IN ('Pending', 'Processing')
+            """
+        )
+        # Task list pages filtered by status (list_tasks).
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, id)")
+        # fair_share looks up when each source was last served.
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_tasks_source_started_at
+            ON tasks (source_type, source_channel_id, started_at)
+            """
+        )
+        # Change feed for in-process indexes (list_tasks_changed_since).
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_updated_at ON tasks (updated_at)"
+        )
+        # Tombstones of deleted or archived tasks (list_task_deletions_since).
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS task_deletions (
+                task_id INTEGER PRIMARY KEY,
+                deleted_at TIMESTAMP NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_task_deletions_deleted_at ON task_deletions (deleted_at)"
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS tasks_record_deletion AFTER DELETE ON tasks BEGIN
+                INSERT OR REPLACE INTO task_deletions (task_id, deleted_at)
+                VALUES (old.id, strftime('%Y-%m-%d %H:%M:%S', 'now'));
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS tasks_clear_deletion AFTER INSERT ON tasks BEGIN
+                DELETE FROM task_deletions WHERE task_id = new.id;
+            END
+            """
+        )
+        self.search_enabled = create_search_index(cursor)
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
         conn.commit()
         conn.close()
+        if migrate_texts:
+            self.compress_existing_texts()
+
+    @staticmethod
+    def _fail_duplicate_active_tasks(cursor: sqlite3.Cursor) -> None:
+        """Keep one Pending/Processing task per video before the unique index exists.
+
+        The one kept is in flight if any is, otherwise the oldest; the others
+        are marked Failed with a pointer to it.
+        """
+        rows = cursor.execute(
+            """
+            SELECT id, video_id FROM tasks
+            WHERE status IN ('Pending', 'Processing')
+              AND video_id IN (
+                  SELECT video_id FROM tasks
+                  WHERE status IN ('Pending', 'Processing') AND video_id IS NOT NULL
+                  GROUP BY video_id HAVING COUNT(*) > 1
+              )
+            ORDER BY video_id, status = 'Processing' DESC, created_at, id
+            """
+        ).fetchall()
+        kept: dict[str, int] = {}
+        duplicates: list[tuple[str, str, int]] = []
+        now_str = utc_now_naive().strftime("%Y-%m-%d %H:%M:%S")
+        for task_id, video_id in rows:
+            if video_id not in kept:
+                kept[video_id] = task_id
+                continue
+            duplicates.append((f"Duplicate of active task {kept[video_id]}", now_str, task_id))
+        if not duplicates:
+            return
+        cursor.executemany(
+            """
+            UPDATE tasks
+            SET status = 'Failed', error_message = ?, updated_at = ?,
+                locked_at = NULL, worker_id = NULL
+            WHERE id = ?
+            """,
+            duplicates,
+        )
+        logger.warning(
+            f"Marked {len(duplicates)} duplicate Pending/Processing task(s) as Failed "
+            "so each video has one active task."
+        )
 
     def record_recent_task_view(
         self,
@@ -169,20 +498,44 @@ class SQLiteDB(BaseDB):
         status: str = "Pending",
         source_type: str = "manual",
         source_channel_id: str | None = None,
+        transcription_options: dict | None = None,
+        priority: int = 0,
     ) -> Task:
-        """Adds a new task to the database and returns the stored record."""
+        """Adds a new task to the database and returns the stored record.
+
+        Raises ``ActiveTaskExistsError`` when the video already has a Pending
+        or Processing task (enforced by ``idx_tasks_active_video_id``).
+        """
+        video_id = extract_video_id(url)
+        options_json = json.dumps(transcription_options) if transcription_options else None
         conn = self._get_connection()
         try:
             cursor = conn.cursor()
             cursor.execute(
                 """
-                INSERT INTO tasks (url, status, title, source_type, source_channel_id)
-                VALUES (?, ?, ?, ?, ?)
+                INSERT INTO tasks (
+                    url, status, title, source_type, source_channel_id,
+                    transcription_options, priority, video_id
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (url, status, url, source_type, source_channel_id),
+                (
+                    url,
+                    status,
+                    url,
+                    source_type,
+                    source_channel_id,
+                    options_json,
+                    int(priority),
+                    video_id,
+                ),
             )
             new_id = cursor.lastrowid
             conn.commit()
+        except sqlite3.IntegrityError as exc:
+            if video_id is None:
+                raise
+            raise ActiveTaskExistsError(video_id, self.find_recent_task_by_url(url)) from exc
         finally:
             conn.close()
 
@@ -201,6 +554,27 @@ class SQLiteDB(BaseDB):
         conn.close()
         return tasks
 
+    def peek_pending_tasks(self, limit: int) -> list[Task]:
+        """Gets the next ``limit`` pending tasks in the order workers claim them."""
+        now_str = utc_now_naive().strftime("%Y-%m-%d %H:%M:%S")
+        conn = self._get_connection()
+        conn.row_factory = sqlite3.Row
+        try:
+            order_by, order_params = _ORDER_BY[self._read_scheduling_policy(conn.cursor())]
+            rows = conn.execute(
+                f"""
+                SELECT * FROM tasks
+                WHERE status = 'Pending'
+                  AND (deferred_until IS NULL OR deferred_until <= ?)
+                ORDER BY {order_by}
+                LIMIT ?
+                """,
+                (now_str, *order_params, max(0, limit)),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [self.adapter.to_task(dict(row)) for row in rows]
+
     def get_all_tasks(self) -> list[Task]:
         """Gets all tasks from the database."""
         conn = self._get_connection()
@@ -212,14 +586,322 @@ class SQLiteDB(BaseDB):
         return tasks
 
     def get_task_by_id(self, task_id: str) -> Optional[Task]:
-        """Gets a single task by its ID from the SQLite database."""
+        """Gets a single task by its ID, including archived tasks."""
         conn = self._get_connection()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
         row = cursor.fetchone()
+        archived = None if row else load_archived_row(cursor, task_id)
         conn.close()
-        return self.adapter.to_task(dict(row)) if row else None
+        if row:
+            return self.adapter.to_task(dict(row))
+        return self.adapter.to_task(archived) if archived else None
+
+    def get_change_version(self, table: str) -> Optional[int]:
+        """Write counter maintained by triggers (0 before the first write)."""
+        conn = self._get_connection()
+        try:
+            row = conn.execute(
+                "SELECT version FROM table_versions WHERE name = ?", (table,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return int(row[0]) if row else 0
+
+    def archive_tasks(self, before: datetime, limit: int = DEFAULT_BATCH_SIZE) -> int:
+        """Moves up to ``limit`` finished tasks last updated before ``before`` to the archive.
+
+        Returns how many tasks were archived; call again until it returns 0.
+        """
+        cutoff = before.strftime("%Y-%m-%d %H:%M:%S")
+        placeholders = ", ".join("?" for _ in ARCHIVABLE_STATUSES)
+        conn = self._get_connection()
+        conn.isolation_level = None  # Explicit transaction control.
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout = 3000")
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            rows = [
+                dict(row)
+                for row in cursor.execute(
+                    f"""
+                    SELECT * FROM tasks
+                    WHERE updated_at < ? AND status IN ({placeholders})
+                    ORDER BY updated_at, id
+                    LIMIT ?
+                    """,
+                    (cutoff, *ARCHIVABLE_STATUSES, max(0, limit)),
+                ).fetchall()
+            ]
+            for row in rows:
+                for field, codec, data in cursor.execute(
+                    "SELECT field, codec, data FROM task_blobs WHERE task_id = ?",
+                    (row["id"],),
+                ).fetchall():
+                    row[field] = decompress_text(data, codec)
+                row["summary_size"] = None
+            archive_rows(
+                cursor,
+                rows,
+                self.text_codec,
+                utc_now_naive().strftime("%Y-%m-%d %H:%M:%S"),
+            )
+            # The delete triggers drop the search entries and blobs.
+            cursor.executemany("DELETE FROM tasks WHERE id = ?", [(row["id"],) for row in rows])
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return len(rows)
+
+    def list_tasks(
+        self, statuses: Optional[Sequence[str]] = None, limit: int = 50, offset: int = 0
+    ) -> TaskPage:
+        """One page of active tasks, newest first; summaries stay unread until accessed."""
+        where, params = "", ()
+        if statuses is not None:
+            params = tuple(statuses)
+            where = f"WHERE status IN ({', '.join('?' * len(params)) or 'NULL'})"
+        conn = self._get_connection()
+        conn.row_factory = sqlite3.Row
+        try:
+            total = conn.execute(f"SELECT COUNT(*) FROM tasks {where}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT * FROM tasks {where} ORDER BY id DESC LIMIT ? OFFSET ?",
+                (*params, limit, offset),
+            ).fetchall()
+        finally:
+            conn.close()
+        return TaskPage(total=int(total), tasks=[self.adapter.to_task(dict(row)) for row in rows])
+
+    def list_tasks_changed_since(self, since: Optional[str]) -> list[tuple[str, Task]]:
+        """Returns ``(updated_at, task)`` pairs updated at or after ``since``."""
+        conn = self._get_connection()
+        conn.row_factory = sqlite3.Row
+        try:
+            if since is None:
+                rows = conn.execute("SELECT * FROM tasks ORDER BY updated_at").fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM tasks WHERE updated_at >= ? ORDER BY updated_at",
+                    (since,),
+                ).fetchall()
+        finally:
+            conn.close()
+        return [(str(row["updated_at"]), self.adapter.to_task(dict(row))) for row in rows]
+
+    def list_task_deletions_since(self, since: Optional[str]) -> list[tuple[str, str]]:
+        """Returns ``(deleted_at, task_id)`` for tasks deleted at or after ``since``."""
+        conn = self._get_connection()
+        try:
+            if since is None:
+                rows = conn.execute(
+                    "SELECT deleted_at, task_id FROM task_deletions ORDER BY deleted_at"
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT deleted_at, task_id FROM task_deletions "
+                    "WHERE deleted_at >= ? ORDER BY deleted_at",
+                    (since,),
+                ).fetchall()
+        finally:
+            conn.close()
+        return [(str(deleted_at), str(task_id)) for deleted_at, task_id in rows]
+
+    def index_task_transcript(self, task_id: str, transcript: str) -> None:
+        """Stores a finished transcript (compressed) and adds it to the search index."""
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            self._write_blob(
+                cursor,
+                task_id,
+                "transcript",
+                transcript or "",
+                codec=NONE if self.text_codec == OFF else self.text_codec,
+                index=False,
+            )
+            if self.search_enabled:
+                cursor.execute(
+                    f"UPDATE {SEARCH_TABLE} SET transcript = ? WHERE rowid = ?",
+                    (transcript or "", task_id),
+                )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_task_transcript(self, task_id: str) -> Optional[str]:
+        transcript = self.load_task_text(task_id, "transcript")
+        if transcript is not None:
+            return transcript
+        conn = self._get_connection()
+        try:
+            archived = load_archived_row(conn.cursor(), task_id)
+        finally:
+            conn.close()
+        return archived.get("transcript") if archived else None
+
+    def load_task_text(self, task_id: str, field: str) -> Optional[str]:
+        """Fetches and decompresses one text field from ``task_blobs``."""
+        conn = self._get_connection()
+        try:
+            row = conn.execute(
+                "SELECT codec, data FROM task_blobs WHERE task_id = ? AND field = ?",
+                (task_id, field),
+            ).fetchone()
+        finally:
+            conn.close()
+        return decompress_text(row[1], row[0]) if row else None
+
+    def compress_existing_texts(self) -> int:
+        """Moves large inline summaries into ``task_blobs``; returns how many moved."""
+        if self.text_codec == OFF:
+            return 0
+        conn = self._get_connection()
+        moved = 0
+        try:
+            cursor = conn.cursor()
+            rows = cursor.execute(
+                """
+                SELECT id, summary FROM tasks
+                WHERE summary IS NOT NULL AND length(CAST(summary AS BLOB)) >= ?
+                """,
+                (max(1, self.compress_min_bytes),),
+            ).fetchall()
+            for task_id, summary in rows:
+                cursor.execute(
+                    "UPDATE tasks SET summary = NULL, summary_size = ? WHERE id = ?",
+                    (len(summary.encode("utf-8")), task_id),
+                )
+                self._write_blob(cursor, task_id, "summary", summary)
+                moved += 1
+            conn.commit()
+        finally:
+            conn.close()
+        return moved
+
+    def _compressible(self, text: str) -> Optional[bytes]:
+        """UTF-8 bytes of ``text`` when it should be stored compressed."""
+        if self.text_codec == OFF or not text:
+            return None
+        raw = text.encode("utf-8")
+        return raw if len(raw) >= self.compress_min_bytes else None
+
+    def _write_blob(
+        self,
+        cursor: sqlite3.Cursor,
+        task_id: str,
+        field: str,
+        text: str,
+        codec: Optional[str] = None,
+        index: bool = True,
+    ) -> None:
+        codec = codec or self.text_codec
+        cursor.execute(
+            """
+            INSERT INTO task_blobs (task_id, field, codec, data, raw_size)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(task_id, field) DO UPDATE SET
+                codec = excluded.codec,
+                data = excluded.data,
+                raw_size = excluded.raw_size
+            """,
+            (
+                task_id,
+                field,
+                codec,
+                compress_text(text, codec),
+                len(text.encode("utf-8")),
+            ),
+        )
+        # The tasks triggers only see NULL for compressed fields.
+        if index and self.search_enabled:
+            cursor.execute(
+                f"UPDATE {SEARCH_TABLE} SET {field} = ? WHERE rowid = ?",
+                (text, task_id),
+            )
+
+    def search_tasks(self, query: str, limit: int = 20, offset: int = 0) -> TaskSearchResults:
+        """Ranked full-text search over titles, summaries and indexed transcripts."""
+        results = TaskSearchResults(query=query)
+        terms = split_terms(query)
+        if not terms:
+            return results
+
+        clauses: list[str] = []
+        params: list[object] = []
+        if self.search_enabled:
+            source = f"{SEARCH_TABLE} JOIN tasks ON tasks.id = {SEARCH_TABLE}.rowid"
+            columns = [f"{SEARCH_TABLE}.{name}" for name in ("title", "summary", "transcript")]
+            match_terms = [term for term in terms if len(term) >= MIN_MATCH_CHARS]
+        else:
+            source = "tasks"
+            columns = ["tasks.title", FALLBACK_SUMMARY]
+            match_terms = []
+        if match_terms:
+            clauses.append(f"{SEARCH_TABLE} MATCH ?")
+            params.append(match_expression(match_terms))
+        for term in terms:
+            if term in match_terms:
+                continue
+            clauses.append(
+                "(" + " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for column in columns) + ")"
+            )
+            params.extend([like_pattern(term)] * len(columns))
+        where = " AND ".join(clauses)
+
+        if match_terms:
+            score = f"bm25({SEARCH_TABLE}, {', '.join(str(w) for w in BM25_WEIGHTS)})"
+            snippet = (
+                f"snippet({SEARCH_TABLE}, -1, '{HIGHLIGHT_OPEN}', '{HIGHLIGHT_CLOSE}', "
+                f"'…', {SNIPPET_TOKENS})"
+            )
+        else:
+            score, snippet = "0.0", "NULL"
+        transcript = f"{SEARCH_TABLE}.transcript" if self.search_enabled else "NULL"
+
+        conn = self._get_connection()
+        conn.row_factory = sqlite3.Row
+        register_blob_text(conn)
+        try:
+            results.total = conn.execute(
+                f"SELECT COUNT(*) FROM {source} WHERE {where}", params
+            ).fetchone()[0]
+            rows = conn.execute(
+                f"""
+                SELECT tasks.*,
+                       {score} AS search_score,
+                       {snippet} AS search_snippet,
+                       {transcript} AS search_transcript
+                FROM {source}
+                WHERE {where}
+                ORDER BY search_score ASC, tasks.created_at DESC, tasks.id DESC
+                LIMIT ? OFFSET ?
+                """,
+                (*params, max(0, limit), max(0, offset)),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        for row in rows:
+            record = dict(row)
+            score_value = record.pop("search_score")
+            snippet_text = record.pop("search_snippet")
+            transcript_text = record.pop("search_transcript")
+            task = self.adapter.to_task(record)
+            if not snippet_text:
+                snippet_text = highlight(
+                    [task.summary, task.title if task.title != task.url else "", transcript_text],
+                    terms,
+                )
+            results.hits.append(
+                TaskSearchHit(task=task, snippet=snippet_text, score=float(score_value or 0.0))
+            )
+        return results
 
     def acquire_next_task(
         self,
@@ -240,11 +922,15 @@ class SQLiteDB(BaseDB):
 
         try:
             cursor.execute("BEGIN IMMEDIATE")
+            order_by, order_params = _ORDER_BY[self._read_scheduling_policy(cursor)]
             candidate = cursor.execute(
-                """
+                f"""
                 SELECT id
                 FROM tasks
-                WHERE status = 'Pending'
+                WHERE (
+                        status = 'Pending'
+                        AND (deferred_until IS NULL OR deferred_until <= ?)
+                   )
                    OR (
                         status = 'Processing'
                         AND (
@@ -252,10 +938,10 @@ class SQLiteDB(BaseDB):
                             OR locked_at <= ?
                         )
                    )
-                ORDER BY created_at ASC, id ASC
+                ORDER BY {order_by}
                 LIMIT 1
                 """,
-                (stale_cutoff,),
+                (now_str, stale_cutoff, *order_params),
             ).fetchone()
 
             if candidate is None:
@@ -269,10 +955,11 @@ class SQLiteDB(BaseDB):
                 SET status = 'Processing',
                     worker_id = ?,
                     locked_at = ?,
+                    started_at = ?,
                     updated_at = ?
                 WHERE id = ?
                 """,
-                (worker_id, now_str, now_str, task_id),
+                (worker_id, now_str, now_str, now_str, task_id),
             )
 
             if cursor.rowcount != 1:
@@ -289,6 +976,53 @@ class SQLiteDB(BaseDB):
         finally:
             conn.close()
 
+    @staticmethod
+    def _read_scheduling_policy(cursor: sqlite3.Cursor) -> str:
+        row = cursor.execute(
+            "SELECT value FROM scheduler_settings WHERE key = 'policy'"
+        ).fetchone()
+        if row is None:
+            return default_policy()
+        try:
+            return normalize_policy(row[0])
+        except ValueError:
+            return default_policy()
+
+    def get_scheduling_policy(self) -> str:
+        conn = self._get_connection()
+        try:
+            return self._read_scheduling_policy(conn.cursor())
+        finally:
+            conn.close()
+
+    def set_scheduling_policy(self, policy: str) -> bool:
+        normalized = normalize_policy(policy)
+        conn = self._get_connection()
+        try:
+            conn.execute(
+                """
+                INSERT INTO scheduler_settings (key, value) VALUES ('policy', ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                """,
+                (normalized,),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return True
+
+    def set_task_priority(self, task_id: str, priority: int) -> bool:
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute(
+                "UPDATE tasks SET priority = ?, updated_at = ? WHERE id = ?",
+                (int(priority), utc_now_naive(), task_id),
+            )
+            conn.commit()
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
     def acquire_processing_lock(
         self,
         worker_id: str,
@@ -361,6 +1095,27 @@ class SQLiteDB(BaseDB):
         conn.commit()
         conn.close()
 
+    def refresh_task_locks(self, worker_id: str, task_ids: Sequence[str]) -> None:
+        """Refresh ``locked_at`` of the worker's Processing tasks among ``task_ids``."""
+        if not task_ids:
+            return
+        now_str = utc_now_naive().strftime("%Y-%m-%d %H:%M:%S")
+        placeholders = ", ".join("?" * len(task_ids))
+        conn = self._get_connection()
+        try:
+            conn.execute("PRAGMA busy_timeout = 3000")
+            conn.execute(
+                f"""
+                UPDATE tasks
+                SET locked_at = ?
+                WHERE worker_id = ? AND status = 'Processing' AND id IN ({placeholders})
+                """,
+                (now_str, worker_id, *task_ids),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
     def release_processing_lock(self, worker_id: str) -> None:
         """Release the processing lock if held by the worker."""
         conn = self._get_connection()
@@ -443,9 +1198,13 @@ class SQLiteDB(BaseDB):
         if title is not None:
             set_clauses.append("title = ?")
             params.append(title)
+        compressed_summary = None
         if summary is not None:
+            compressed_summary = self._compressible(summary)
             set_clauses.append("summary = ?")
-            params.append(summary)
+            params.append(None if compressed_summary else summary)
+            set_clauses.append("summary_size = ?")
+            params.append(len(compressed_summary) if compressed_summary else None)
         if error_message is not None:
             set_clauses.append("error_message = ?")
             params.append(error_message)
@@ -470,26 +1229,173 @@ class SQLiteDB(BaseDB):
             """,
             tuple(params),
         )
+        if summary is not None:
+            if compressed_summary:
+                self._write_blob(cursor, task_id, "summary", summary)
+            else:
+                cursor.execute(
+                    "DELETE FROM task_blobs WHERE task_id = ? AND field = 'summary'",
+                    (task_id,),
+                )
         conn.commit()
         conn.close()
 
+    def record_task_metadata(
+        self,
+        task_id: str,
+        title: Optional[str] = None,
+        duration_seconds: Optional[float] = None,
+    ) -> None:
+        """Stores the probed title and duration of a task."""
+        conn = self._get_connection()
+        try:
+            conn.execute(
+                """
+                UPDATE tasks
+                SET title = COALESCE(?, title),
+                    duration_seconds = COALESCE(?, duration_seconds),
+                    updated_at = ?
+                WHERE id = ?
+                """,
+                (title or None, duration_seconds, utc_now_naive(), task_id),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def defer_task(self, task_id: str, worker_id: str, until: datetime) -> bool:
+        """Releases a task ``worker_id`` still holds back to Pending until ``until`` (naive UTC)."""
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute(
+                """
+                UPDATE tasks
+                SET status = 'Pending',
+                    deferred_until = ?,
+                    locked_at = NULL,
+                    worker_id = NULL,
+                    updated_at = ?
+                WHERE id = ? AND worker_id = ? AND status = 'Processing'
+                """,
+                (until.strftime("%Y-%m-%d %H:%M:%S"), utc_now_naive(), task_id, worker_id),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return cursor.rowcount > 0
+
+    def count_tasks_by_status(self) -> dict[str, int]:
+        """Return the number of tasks per status."""
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+            ).fetchall()
+        finally:
+            conn.close()
+        return {status: count for status, count in rows}
+
+    def record_task_stage_timings(self, timings: TaskStageTimings) -> None:
+        """Persist the per-stage timing breakdown of a processing attempt."""
+        recorded_at = timings.recorded_at or utc_now_naive()
+        conn = self._get_connection()
+        try:
+            conn.execute(
+                """
+                INSERT INTO task_stage_timings (
+                    task_id, outcome, stage_durations, total_duration,
+                    audio_duration, transcript_chars, summary_chars,
+                    transcription_model, summarizer_model, recorded_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    timings.task_id,
+                    timings.outcome,
+                    json.dumps(timings.stage_durations),
+                    timings.total_duration,
+                    timings.audio_duration,
+                    timings.transcript_chars,
+                    timings.summary_chars,
+                    timings.transcription_model,
+                    timings.summarizer_model,
+                    recorded_at.strftime("%Y-%m-%d %H:%M:%S"),
+                ),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def list_task_stage_timings(
+        self,
+        since: Optional[datetime] = None,
+    ) -> list[TaskStageTimings]:
+        """Return recorded stage timings ordered by record time."""
+        conn = self._get_connection()
+        conn.row_factory = sqlite3.Row
+        try:
+            if since is not None:
+                rows = conn.execute(
+                    """
+                    SELECT * FROM task_stage_timings
+                    WHERE recorded_at >= ?
+                    ORDER BY recorded_at ASC, id ASC
+                    """,
+                    (since.strftime("%Y-%m-%d %H:%M:%S"),),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM task_stage_timings ORDER BY recorded_at ASC, id ASC"
+                ).fetchall()
+        finally:
+            conn.close()
+        return [
+            TaskStageTimings(
+                task_id=str(row["task_id"]),
+                outcome=row["outcome"],
+                stage_durations=json.loads(row["stage_durations"] or "{}"),
+                total_duration=row["total_duration"],
+                audio_duration=row["audio_duration"],
+                transcript_chars=row["transcript_chars"],
+                summary_chars=row["summary_chars"],
+                transcription_model=row["transcription_model"],
+                summarizer_model=row["summarizer_model"],
+                recorded_at=datetime.fromisoformat(row["recorded_at"]),
+            )
+            for row in rows
+        ]
+
     def find_recent_task_by_url(self, url: str) -> Optional[Task]:
-        """Find the most recent non-failed task for the given URL."""
+        """Find the most recent non-failed task for the given URL's video.
+
+        YouTube URLs match on ``video_id`` (any URL form of the same video);
+        other URLs match exactly. Falls back to the newest archived task
+        through ``task_video_index`` (keyed the same way).
+        """
+        video_id = extract_video_id(url)
         conn = self._get_connection()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute(
-            """
+            f"""
             SELECT * FROM tasks
-            WHERE url = ? AND status NOT IN ('Failed', 'Failed Retry Created')
+            WHERE {"video_id" if video_id else "url"} = ?
+              AND status NOT IN ('Failed', 'Failed Retry Created')
             ORDER BY created_at DESC
             LIMIT 1
             """,
-            (url,),
+            (video_id or url,),
         )
         row = cursor.fetchone()
+        archived = None
+        if row is None:
+            archived_id = latest_archived_id(cursor, url)
+            if archived_id is not None:
+                archived = load_archived_row(cursor, archived_id)
         conn.close()
-        return self.adapter.to_task(dict(row)) if row else None
+        if row:
+            return self.adapter.to_task(dict(row))
+        return self.adapter.to_task(archived) if archived else None
 
     def create_retry_task(
         self, source_task: Task, retry_reason: Optional[str] = None
@@ -501,18 +1407,41 @@ class SQLiteDB(BaseDB):
         except (TypeError, ValueError):
             parent_id = None
 
+        video_id = extract_video_id(source_task.url)
         conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO tasks (url, status, title, retry_of_task_id, retry_reason)
-            VALUES (?, 'Pending', ?, ?, ?)
-            """,
-            (source_task.url, source_task.title or source_task.url, parent_id, reason),
-        )
-        new_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO tasks (
+                    url, status, title, retry_of_task_id, retry_reason, transcription_options,
+                    priority, duration_seconds, video_id
+                )
+                VALUES (?, 'Pending', ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    source_task.url,
+                    source_task.title or source_task.url,
+                    parent_id,
+                    reason,
+                    json.dumps(source_task.transcription_options)
+                    if source_task.transcription_options
+                    else None,
+                    source_task.priority,
+                    source_task.duration_seconds,
+                    video_id,
+                ),
+            )
+            new_id = cursor.lastrowid
+            conn.commit()
+        except sqlite3.IntegrityError as exc:
+            if video_id is None:
+                raise
+            raise ActiveTaskExistsError(
+                video_id, self.find_recent_task_by_url(source_task.url)
+            ) from exc
+        finally:
+            conn.close()
         # Fresh read to return the full task representation.
         task = self.get_task_by_id(str(new_id))
         if task is None:  # pragma: no cover - defensive guard
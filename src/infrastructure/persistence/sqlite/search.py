@@ -0,0 +1,174 @@
+"""FTS5 full-text index over task titles, summaries and (optionally) transcripts.
+
+``task_search`` is an FTS5 table keyed by task id and kept in sync with
+``tasks`` by triggers; transcripts are not stored in ``tasks`` and are added
+by the worker through ``SQLiteDB.index_task_transcript``. The ``trigram``
+tokenizer (SQLite >= 3.34) indexes every three-character window, so Chinese
+text without word boundaries is searchable. Terms shorter than three
+characters cannot use the trigram index and fall back to ``LIKE`` filters on
+the same table.
+
+Without FTS5 every term is a ``LIKE`` filter on ``tasks``; compressed
+summaries are decompressed from ``task_blobs`` by a SQL function registered
+on the search connection (``register_blob_text``), so they still match.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from typing import Iterable, Optional
+
+from src.core.logger import logger
+from src.infrastructure.persistence.sqlite.task_blobs import decompress_text
+
+SEARCH_TABLE = "task_search"
+HIGHLIGHT_OPEN = "<mark>"
+HIGHLIGHT_CLOSE = "</mark>"
+ELLIPSIS = "…"
+# Shortest term the trigram tokenizer can match.
+MIN_MATCH_CHARS = 3
+MAX_TERMS = 8
+SNIPPET_TOKENS = 48
+# bm25 column weights: title, summary, transcript.
+BM25_WEIGHTS = (10.0, 5.0, 1.0)
+
+BLOB_TEXT_FUNCTION = "task_blob_text"
+# Summary text for LIKE filters on ``tasks`` (no FTS5): compressed summaries are
+# NULL inline and read back from ``task_blobs``.
+FALLBACK_SUMMARY = (
+    "CASE WHEN tasks.summary_size IS NULL THEN tasks.summary ELSE ("
+    f"SELECT {BLOB_TEXT_FUNCTION}(codec, data) FROM task_blobs "
+    "WHERE task_id = tasks.id AND field = 'summary') END"
+)
+
+_INDEXED_TITLE = "CASE WHEN {row}.title IS {row}.url THEN '' ELSE COALESCE({row}.title, '') END"
+
+
+def search_index_exists(cursor: sqlite3.Cursor) -> bool:
+    """Whether the FTS table was created (False on builds without FTS5 trigram)."""
+    return cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (SEARCH_TABLE,),
+    ).fetchone() is not None
+
+
+def create_search_index(cursor: sqlite3.Cursor) -> bool:
+    """Create the FTS table and triggers; backfill existing tasks on first run.
+
+    Returns False when this SQLite build lacks FTS5 or the trigram tokenizer.
+    """
+    exists = search_index_exists(cursor)
+    try:
+        cursor.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE}
+            USING fts5(title, summary, transcript, tokenize = 'trigram')
+            """
+        )
+    except sqlite3.OperationalError as exc:
+        logger.warning(f"Full-text search disabled (FTS5 trigram unavailable): {exc}")
+        return False
+
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS tasks_search_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO {SEARCH_TABLE} (rowid, title, summary, transcript)
+            VALUES (new.id, {_INDEXED_TITLE.format(row="new")}, COALESCE(new.summary, ''), '');
+        END
+        """
+    )
+    # Compressed summaries are NULL in tasks (summary_size is set) and are
+    # written to the index by SQLiteDB itself; keep the indexed text for them.
+    # Triggers created before compressed storage are replaced once.
+    update_trigger = cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'tasks_search_update'"
+    ).fetchone()
+    if update_trigger and "summary_size" not in update_trigger[0]:
+        cursor.execute("DROP TRIGGER tasks_search_update")
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS tasks_search_update
+        AFTER UPDATE OF title, summary ON tasks BEGIN
+            UPDATE {SEARCH_TABLE}
+            SET title = {_INDEXED_TITLE.format(row="new")},
+                summary = CASE
+                    WHEN new.summary IS NULL AND new.summary_size IS NOT NULL THEN summary
+                    ELSE COALESCE(new.summary, '')
+                END
+            WHERE rowid = new.id;
+        END
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS tasks_search_delete AFTER DELETE ON tasks BEGIN
+            DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id;
+        END
+        """
+    )
+    if not exists:
+        cursor.execute(
+            f"""
+            INSERT INTO {SEARCH_TABLE} (rowid, title, summary, transcript)
+            SELECT id, {_INDEXED_TITLE.format(row="tasks")}, COALESCE(summary, ''), ''
+            FROM tasks
+            """
+        )
+    return True
+
+
+def register_blob_text(conn: sqlite3.Connection) -> None:
+    """Make ``FALLBACK_SUMMARY`` usable on ``conn``."""
+    conn.create_function(
+        BLOB_TEXT_FUNCTION,
+        2,
+        lambda codec, data: decompress_text(data, codec) if data is not None else None,
+        deterministic=True,
+    )
+
+
+def split_terms(query: Optional[str]) -> list[str]:
+    """Whitespace-separated search terms (quotes stripped, duplicates removed)."""
+    terms: list[str] = []
+    for raw in (query or "").split():
+        term = raw.strip("\"'")
+        if term and term.lower() not in (item.lower() for item in terms):
+            terms.append(term)
+    return terms[:MAX_TERMS]
+
+
+def match_expression(terms: Iterable[str]) -> str:
+    """FTS5 query requiring every term, each matched as a literal phrase."""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def highlight(texts: Iterable[Optional[str]], terms: list[str], width: int = 96) -> str:
+    """Excerpt of the first text containing a term, with terms marked.
+
+    Used when SQLite's ``snippet()`` is unavailable (LIKE-only queries).
+    """
+    pattern = re.compile(
+        "|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)),
+        re.IGNORECASE,
+    )
+    fallback = ""
+    for text in texts:
+        if not text:
+            continue
+        fallback = fallback or text
+        found = pattern.search(text) if terms else None
+        if found is None:
+            continue
+        start = max(0, found.start() - width // 4)
+        end = min(len(text), start + width)
+        excerpt = pattern.sub(
+            lambda item: f"{HIGHLIGHT_OPEN}{item.group(0)}{HIGHLIGHT_CLOSE}", text[start:end]
+        )
+        return f"{ELLIPSIS if start else ''}{excerpt}{ELLIPSIS if end < len(text) else ''}"
+    return fallback[:width] + (ELLIPSIS if len(fallback) > width else "")
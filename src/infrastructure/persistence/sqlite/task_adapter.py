@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
+import json
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from src.domain.tasks.models import Task
+from src.infrastructure.persistence.sqlite.task_blobs import lazy_task
 
 
 def _extract_rich_text_content(items: Optional[List[Dict[str, Any]]]) -> str:
@@ -26,6 +28,16 @@ def _build_notion_url(page_id: Optional[str]) -> Optional[str]:
     return f"{normalized_base}/{cleaned_id}"
 
 
+def _load_json_object(value: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not value:
+        return None
+    try:
+        loaded = json.loads(value)
+    except ValueError:
+        return None
+    return loaded if isinstance(loaded, dict) else None
+
+
 class TaskAdapter(ABC):
     @abstractmethod
     def to_task(self, data: Dict[str, Any]) -> Task:
@@ -72,6 +84,10 @@ class NotionTaskAdapter(TaskAdapter):
 
 
 class SQLiteTaskAdapter(TaskAdapter):
+    def __init__(self, text_loader: Optional[Callable[[str, str], Optional[str]]] = None):
+        # Loads compressed text fields from task_blobs: (task_id, field) -> text.
+        self.text_loader = text_loader
+
     def to_task(self, data: Dict[str, Any]) -> Task:
         created_at_value = data.get("created_at")
         created_at = (
@@ -94,7 +110,13 @@ class SQLiteTaskAdapter(TaskAdapter):
         notion_page = data.get("notion_page_id")
         notion_page_id = str(notion_page) if notion_page is not None else None
         notion_url = _build_notion_url(notion_page_id)
-        return Task(
+        deferred_until_value = data.get("deferred_until")
+        deferred_until = (
+            datetime.fromisoformat(deferred_until_value)
+            if deferred_until_value is not None
+            else None
+        )
+        task = Task(
             id=task_id,
             url=data.get("url", ""),
             status=data.get("status", ""),
@@ -111,4 +133,18 @@ class SQLiteTaskAdapter(TaskAdapter):
             notion_url=notion_url,
             source_type=(data.get("source_type") or "manual"),
             source_channel_id=data.get("source_channel_id"),
+            transcription_options=_load_json_object(data.get("transcription_options")),
+            duration_seconds=data.get("duration_seconds"),
+            deferred_until=deferred_until,
+            priority=int(data.get("priority") or 0),
+            started_at=(
+                datetime.fromisoformat(data["started_at"])
+                if data.get("started_at") is not None
+                else None
+            ),
+            video_id=data.get("video_id"),
         )
+        loader = self.text_loader
+        if loader is not None and data.get("summary") is None and data.get("summary_size"):
+            return lazy_task(task, lambda: loader(task_id, "summary"))
+        return task
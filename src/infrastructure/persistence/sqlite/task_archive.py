@@ -0,0 +1,157 @@
+"""Archive of finished tasks moved out of the hot ``tasks`` table.
+
+Completed and failed tasks whose last update is older than the retention
+window are copied into ``tasks_archive`` as one compressed JSON record each
+(the full row plus its summary and transcript) and deleted from ``tasks``, so
+listings, queue scans and the search index only carry recent history. Ids
+come from ``AUTOINCREMENT`` and are never reused, so archived tasks still
+resolve by id.
+
+``task_video_index`` keeps, per video (the YouTube video id, or the URL for
+other links), the newest non-failed archived task; URL dedup
+(``find_recent_task_by_url``) falls back to it when ``tasks`` has no match,
+without scanning archived records. It replaces the URL-keyed
+``task_url_index``, whose rows are migrated on first start.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import Any, Optional
+
+from src.core.utils.url import extract_video_id
+from src.infrastructure.persistence.sqlite.task_blobs import (
+    NONE,
+    OFF,
+    compress_text,
+    decompress_text,
+)
+
+ARCHIVE_TABLE = "tasks_archive"
+VIDEO_INDEX_TABLE = "task_video_index"
+# Pre-video-id index keyed by normalised URL; migrated into VIDEO_INDEX_TABLE.
+LEGACY_URL_INDEX_TABLE = "task_url_index"
+ARCHIVABLE_STATUSES = ("Completed", "Failed", "Failed Retry Created")
+# Statuses ignored by URL dedup (see find_recent_task_by_url).
+FAILED_STATUSES = ("Failed", "Failed Retry Created")
+DEFAULT_BATCH_SIZE = 500
+
+
+def create_archive_tables(cursor: sqlite3.Cursor) -> None:
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {ARCHIVE_TABLE} (
+            id INTEGER PRIMARY KEY,
+            url TEXT NOT NULL,
+            status TEXT NOT NULL,
+            created_at TIMESTAMP,
+            updated_at TIMESTAMP,
+            archived_at TIMESTAMP NOT NULL,
+            codec TEXT NOT NULL,
+            data BLOB NOT NULL
+        )
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {VIDEO_INDEX_TABLE} (
+            video_key TEXT PRIMARY KEY,
+            task_id INTEGER NOT NULL,
+            created_at TIMESTAMP
+        ) WITHOUT ROWID
+        """
+    )
+    legacy = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (LEGACY_URL_INDEX_TABLE,),
+    ).fetchone()
+    if legacy:
+        rows = cursor.execute(
+            f"SELECT url, task_id, created_at FROM {LEGACY_URL_INDEX_TABLE}"
+        ).fetchall()
+        for url, task_id, created_at in rows:
+            _index_archived(cursor, archive_key(url), task_id, created_at)
+        cursor.execute(f"DROP TABLE {LEGACY_URL_INDEX_TABLE}")
+
+
+def archive_key(url: str, video_id: Optional[str] = None) -> str:
+    """Dedup key of an archived task: its video id, or the URL for other links."""
+    return video_id or extract_video_id(url) or url
+
+
+def encode_record(row: dict[str, Any], codec: str) -> tuple[str, bytes]:
+    """Compress an archived row; returns ``(codec, data)``."""
+    codec = NONE if codec == OFF else codec
+    payload = json.dumps(row, ensure_ascii=False, default=str)
+    return codec, compress_text(payload, codec)
+
+
+def decode_record(codec: str, data: bytes) -> dict[str, Any]:
+    return json.loads(decompress_text(data, codec))
+
+
+def archive_rows(
+    cursor: sqlite3.Cursor,
+    rows: list[dict[str, Any]],
+    codec: str,
+    archived_at: str,
+) -> None:
+    """Insert ``rows`` (with text fields resolved) and update the video index."""
+    for row in rows:
+        record_codec, data = encode_record(row, codec)
+        cursor.execute(
+            f"""
+            INSERT OR REPLACE INTO {ARCHIVE_TABLE}
+                (id, url, status, created_at, updated_at, archived_at, codec, data)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                row["id"],
+                row["url"],
+                row["status"],
+                row.get("created_at"),
+                row.get("updated_at"),
+                archived_at,
+                record_codec,
+                data,
+            ),
+        )
+        if row["status"] in FAILED_STATUSES:
+            continue
+        _index_archived(
+            cursor, archive_key(row["url"], row.get("video_id")), row["id"], row.get("created_at")
+        )
+
+
+def _index_archived(
+    cursor: sqlite3.Cursor, video_key: str, task_id: Any, created_at: Optional[str]
+) -> None:
+    """Point ``video_key`` at ``task_id`` unless a newer archived task holds it."""
+    cursor.execute(
+        f"""
+        INSERT INTO {VIDEO_INDEX_TABLE} (video_key, task_id, created_at)
+        VALUES (?, ?, ?)
+        ON CONFLICT(video_key) DO UPDATE SET
+            task_id = excluded.task_id,
+            created_at = excluded.created_at
+        WHERE excluded.created_at >= {VIDEO_INDEX_TABLE}.created_at
+           OR {VIDEO_INDEX_TABLE}.created_at IS NULL
+        """,
+        (video_key, task_id, created_at),
+    )
+
+
+def load_archived_row(cursor: sqlite3.Cursor, task_id: Any) -> Optional[dict[str, Any]]:
+    found = cursor.execute(
+        f"SELECT codec, data FROM {ARCHIVE_TABLE} WHERE id = ?", (task_id,)
+    ).fetchone()
+    return decode_record(found[0], found[1]) if found else None
+
+
+def latest_archived_id(cursor: sqlite3.Cursor, url: str) -> Optional[int]:
+    """Newest non-failed archived task for ``url``'s video (any URL form)."""
+    found = cursor.execute(
+        f"SELECT task_id FROM {VIDEO_INDEX_TABLE} WHERE video_key = ?", (archive_key(url),)
+    ).fetchone()
+    return found[0] if found else None
@@ -0,0 +1,116 @@
+"""Compressed side storage for large task text fields.
+
+Summaries (and transcripts kept for search) above a size threshold are
+stored compressed in ``task_blobs`` instead of inline in ``tasks``; the
+``tasks`` row keeps ``NULL`` plus the uncompressed size, so listing queries
+scan small rows. Tasks read from SQLite carry a loader instead of the text and
+only fetch and decompress it when the field is first accessed.
+
+zstd is used when the optional ``zstandard`` package is installed, zlib
+otherwise; every blob records its codec, so both can be read back regardless
+of the current setting.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import zlib
+from dataclasses import fields
+from typing import Any, Callable, Optional
+
+from src.domain.tasks.models import Task
+
+ZLIB = "zlib"
+ZSTD = "zstd"
+# Stored uncompressed (fields without an inline column while compression is off).
+NONE = "none"
+OFF = "off"
+AUTO = "auto"
+DEFAULT_MIN_BYTES = 1024
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 9
+
+
+def zstd_available() -> bool:
+    return importlib.util.find_spec("zstandard") is not None
+
+
+def resolve_codec(value: Optional[str] = None) -> str:
+    """Codec for new blobs from ``value`` or ``TEXT_COMPRESSION`` (auto|zstd|zlib|off)."""
+    codec = (value or os.environ.get("TEXT_COMPRESSION") or AUTO).strip().lower()
+    if codec == AUTO:
+        return ZSTD if zstd_available() else ZLIB
+    if codec == ZSTD and not zstd_available():
+        return ZLIB
+    return codec if codec in (ZLIB, ZSTD, OFF) else ZLIB
+
+
+def resolve_min_bytes(value: Optional[int] = None) -> int:
+    if value is not None:
+        return max(0, int(value))
+    try:
+        return max(0, int(os.environ.get("TEXT_COMPRESSION_MIN_BYTES", DEFAULT_MIN_BYTES)))
+    except ValueError:
+        return DEFAULT_MIN_BYTES
+
+
+def compress_text(text: str, codec: str) -> bytes:
+    raw = text.encode("utf-8")
+    if codec in (NONE, OFF):
+        return raw
+    if codec == ZSTD:
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+    return zlib.compress(raw, ZLIB_LEVEL)
+
+
+def decompress_text(data: bytes, codec: str) -> str:
+    if codec == NONE:
+        return bytes(data).decode("utf-8")
+    if codec == ZSTD:
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+    return zlib.decompress(data).decode("utf-8")
+
+
+class _LazyText:
+    """Data descriptor holding either a string or a zero-argument loader."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = f"_lazy_{name}"
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        value = obj.__dict__.get(self.slot, "")
+        if callable(value):
+            value = value() or ""
+            obj.__dict__[self.slot] = value
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self.slot] = value
+
+
+class LazyTextTask(Task):
+    """``Task`` whose ``summary`` is decompressed on first access."""
+
+    summary = _LazyText()
+
+    def summary_loaded(self) -> bool:
+        return not callable(self.__dict__.get("_lazy_summary"))
+
+    def __reduce__(self):
+        # The loader is bound to a client; pickles and copies get a plain Task
+        # with the text materialized.
+        return Task, tuple(getattr(self, field.name) for field in fields(Task))
+
+
+def lazy_task(task: Task, loader: Callable[[], Optional[str]]) -> LazyTextTask:
+    """Copy ``task`` into a ``LazyTextTask`` whose summary comes from ``loader``."""
+    values = dict(task.__dict__)
+    values["summary"] = loader
+    return LazyTextTask(**values)
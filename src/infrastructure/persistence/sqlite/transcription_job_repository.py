@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from src.core.time_utils import utc_now_naive
+from src.domain.transcripts.jobs import (
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    TranscriptionJob,
+)
+
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+class SQLiteTranscriptionJobRepository:
+    """Job table shared by processing workers and out-of-process transcription workers.
+
+    The ``transcription_jobs`` table is created by ``SQLiteDB``.
+    """
+
+    def __init__(self, db_path: str = "data/tasks.db"):
+        self.db_path = db_path
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout = 3000")
+        return conn
+
+    def _to_model(self, row: sqlite3.Row) -> TranscriptionJob:
+        try:
+            options = json.loads(row["options"]) if row["options"] else {}
+        except ValueError:
+            options = {}
+        return TranscriptionJob(
+            id=str(row["id"]),
+            file_path=row["file_path"],
+            status=row["status"],
+            options=options if isinstance(options, dict) else {},
+            transcript=row["transcript"],
+            audio_duration=row["audio_duration"],
+            error_message=row["error_message"],
+            worker_id=row["worker_id"],
+            created_at=_parse_datetime(row["created_at"]),
+            claimed_at=_parse_datetime(row["claimed_at"]),
+            finished_at=_parse_datetime(row["finished_at"]),
+        )
+
+    def enqueue(self, file_path: str, options: Optional[dict[str, Any]] = None) -> str:
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute(
+                """
+                INSERT INTO transcription_jobs (file_path, options, status, created_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    file_path,
+                    json.dumps(options or {}),
+                    JOB_QUEUED,
+                    utc_now_naive().strftime(_TIMESTAMP_FORMAT),
+                ),
+            )
+            job_id = str(cursor.lastrowid)
+            conn.commit()
+        finally:
+            conn.close()
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[TranscriptionJob]:
+        conn = self._get_connection()
+        try:
+            row = conn.execute(
+                "SELECT * FROM transcription_jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+        return self._to_model(row) if row else None
+
+    def claim_next(
+        self,
+        worker_id: str,
+        stale_after_seconds: int = 900,
+    ) -> Optional[TranscriptionJob]:
+        """Atomically claim the oldest queued job (or one whose worker went silent)."""
+        conn = self._get_connection()
+        conn.isolation_level = None  # Explicit transaction control.
+        now = utc_now_naive()
+        now_str = now.strftime(_TIMESTAMP_FORMAT)
+        stale_cutoff = (now - timedelta(seconds=stale_after_seconds)).strftime(
+            _TIMESTAMP_FORMAT
+        )
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            candidate = conn.execute(
+                """
+                SELECT id
+                FROM transcription_jobs
+                WHERE status = ?
+                   OR (status = ? AND (claimed_at IS NULL OR claimed_at <= ?))
+                ORDER BY id ASC
+                LIMIT 1
+                """,
+                (JOB_QUEUED, JOB_RUNNING, stale_cutoff),
+            ).fetchone()
+            if candidate is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                """
+                UPDATE transcription_jobs
+                SET status = ?, worker_id = ?, claimed_at = ?
+                WHERE id = ?
+                """,
+                (JOB_RUNNING, worker_id, now_str, candidate["id"]),
+            )
+            row = conn.execute(
+                "SELECT * FROM transcription_jobs WHERE id = ?",
+                (candidate["id"],),
+            ).fetchone()
+            conn.execute("COMMIT")
+            return self._to_model(row) if row else None
+        except sqlite3.OperationalError:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def heartbeat(self, job_id: str, worker_id: str) -> None:
+        """Keep a running job from being reclaimed as stale."""
+        conn = self._get_connection()
+        try:
+            conn.execute(
+                """
+                UPDATE transcription_jobs
+                SET claimed_at = ?
+                WHERE id = ? AND worker_id = ? AND status = ?
+                """,
+                (utc_now_naive().strftime(_TIMESTAMP_FORMAT), job_id, worker_id, JOB_RUNNING),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def complete(
+        self,
+        job_id: str,
+        worker_id: str,
+        transcript: str,
+        audio_duration: Optional[float] = None,
+    ) -> bool:
+        return self._finish(
+            job_id,
+            worker_id,
+            JOB_COMPLETED,
+            transcript=transcript,
+            audio_duration=audio_duration,
+        )
+
+    def fail(self, job_id: str, worker_id: str, error_message: str) -> bool:
+        return self._finish(job_id, worker_id, JOB_FAILED, error_message=error_message)
+
+    def _finish(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: str,
+        *,
+        transcript: Optional[str] = None,
+        audio_duration: Optional[float] = None,
+        error_message: Optional[str] = None,
+    ) -> bool:
+        """Record the outcome; False when the job was reclaimed by another worker."""
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute(
+                """
+                UPDATE transcription_jobs
+                SET status = ?,
+                    transcript = ?,
+                    audio_duration = ?,
+                    error_message = ?,
+                    finished_at = ?
+                WHERE id = ? AND worker_id = ? AND status = ?
+                """,
+                (
+                    status,
+                    transcript,
+                    audio_duration,
+                    error_message,
+                    utc_now_naive().strftime(_TIMESTAMP_FORMAT),
+                    job_id,
+                    worker_id,
+                    JOB_RUNNING,
+                ),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return cursor.rowcount > 0
+
+    def delete_job(self, job_id: str) -> None:
+        conn = self._get_connection()
+        try:
+            conn.execute("DELETE FROM transcription_jobs WHERE id = ?", (job_id,))
+            conn.commit()
+        finally:
+            conn.close()
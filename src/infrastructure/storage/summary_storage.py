@@ -1,7 +1,8 @@
+import asyncio
 import os
-from notion_client import Client
 from dotenv import load_dotenv
 from src.core.logger import logger
+from src.core.utils.runtime import loaded_streamlit
 import time
 import random
 
@@ -11,11 +12,6 @@ from src.infrastructure.persistence.notion.utils import (
     chunk_text,
 )
 
-try:
-    import streamlit as st
-except ImportError:
-    st = None
-
 try:
     from test_sample_manager import TestSampleManager
 except ImportError:
@@ -36,6 +32,7 @@ class SummaryStorage:
     def _is_test_mode(self, title, text, url):
         """檢測是否為測試模式"""
         # 只接受顯式旗標（Streamlit 開關或環境變數），避免因關鍵字誤觸
+        st = loaded_streamlit()
         if (
             st
             and hasattr(st, "session_state")
@@ -98,66 +95,102 @@ class SummaryStorage:
     def split_text(self, text, limit=NOTION_RICH_TEXT_LIMIT):
         return chunk_text(text, limit=limit)
 
+    def _notion_client_options(self):
+        client_options = {"auth": os.getenv("NOTION_API_KEY")}
+        base_url = os.getenv("NOTION_API_BASE_URL")
+        if base_url:
+            # Allows pointing at a local Notion stand-in (benchmarks).
+            client_options["base_url"] = base_url
+        return client_options
+
     def get_notion_env(self):
+        from notion_client import Client
+
         load_dotenv()
 
         return {
-            "notion_client": Client(auth=os.getenv("NOTION_API_KEY")),
+            "notion_client": Client(**self._notion_client_options()),
             "database_id": os.getenv("NOTION_DATABASE_ID"),
         }
 
+    def _build_page(self, title, text, model, url, database_id):
+        """Return the ``pages.create`` payload and the number of text chunks."""
+        text_chunks = chunk_text(text, NOTION_RICH_TEXT_LIMIT)
+        children = [
+            {
+                "object": "block",
+                "paragraph": {
+                    "rich_text": build_rich_text_array(chunk),
+                    "color": "default",
+                },
+            }
+            for chunk in text_chunks
+        ]
+        page = {
+            "parent": {"database_id": database_id},
+            "properties": {
+                "Title": {
+                    "title": build_rich_text_array(title)
+                    or [{"type": "text", "text": {"content": ""}}],
+                },
+                "URL": {
+                    "url": url,
+                },
+                "Model": {
+                    "rich_text": build_rich_text_array(model)
+                    or [{"type": "text", "text": {"content": ""}}],
+                },
+                "Public": {
+                    "checkbox": False,
+                },
+            },
+            "children": children,
+        }
+        return page, len(text_chunks)
+
+    def _page_result(self, response, title, text, model, url, chunk_count):
+        logger.info(f"新增成功！頁面ID: {response['id']}")
+
+        # 返回結果以保持一致性
+        return {
+            "page_id": response["id"],
+            "success": True,
+            "title": title,
+            "model": model,
+            "url": url,
+            "text_length": len(text),
+            "text_chunks": chunk_count,
+        }
+
     def save_with_notion(self, title, text, model, url):
         notion_env = self.get_notion_env()
         notion = notion_env["notion_client"]
         database_id = notion_env["database_id"]
 
         try:
-            text_chunks = chunk_text(text, NOTION_RICH_TEXT_LIMIT)
-
-            children = [
-                {
-                    "object": "block",
-                    "paragraph": {
-                        "rich_text": build_rich_text_array(chunk),
-                        "color": "default",
-                    },
-                }
-                for chunk in text_chunks
-            ]
-
-            response = notion.pages.create(
-                parent={"database_id": database_id},
-                properties={
-                    "Title": {
-                        "title": build_rich_text_array(title)
-                        or [{"type": "text", "text": {"content": ""}}],
-                    },
-                    "URL": {
-                        "url": url,
-                    },
-                    "Model": {
-                        "rich_text": build_rich_text_array(model)
-                        or [{"type": "text", "text": {"content": ""}}],
-                    },
-                    "Public": {
-                        "checkbox": False,
-                    },
-                },
-                children=children,
-            )
-            logger.info(f"新增成功！頁面ID: {response['id']}")
-
-            # 返回結果以保持一致性
-            return {
-                "page_id": response["id"],
-                "success": True,
-                "title": title,
-                "model": model,
-                "url": url,
-                "text_length": len(text),
-                "text_chunks": len(text_chunks),
-            }
+            page, chunk_count = self._build_page(title, text, model, url, database_id)
+            response = notion.pages.create(**page)
+            return self._page_result(response, title, text, model, url, chunk_count)
+        except Exception as e:
+            logger.error(f"發生錯誤: {e}")
+            raise e
+
+    async def asave(self, title, text, model, url):
+        """Async variant of ``save`` using notion-client's ``AsyncClient``."""
+        if self._is_test_mode(title, text, url):
+            return await asyncio.to_thread(self._mock_save, title, text, model, url)
+
+        from notion_client import AsyncClient
 
+        load_dotenv()
+        database_id = os.getenv("NOTION_DATABASE_ID")
+        page, chunk_count = self._build_page(title, text, model, url, database_id)
+        notion = AsyncClient(**self._notion_client_options())
+        try:
+            response = await notion.pages.create(**page)
+            return self._page_result(response, title, text, model, url, chunk_count)
         except Exception as e:
             logger.error(f"發生錯誤: {e}")
             raise e
+        finally:
+            await notion.aclose()
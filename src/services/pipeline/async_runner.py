@@ -0,0 +1,310 @@
+"""Asyncio implementation of the processing runner.
+
+``AsyncProcessingWorker`` drives up to ``concurrency`` tasks at once from a
+single event loop: yt-dlp runs as an asyncio subprocess, summarization,
+Notion and Discord go through async clients (``Summarizer.asummarize``,
+``SummaryStorage.asave``, httpx), the processing-lock heartbeat is an asyncio
+task, and CPU-bound transcription runs in a thread pool bounded by
+``TRANSCRIPTION_CONCURRENCY``. Blocking SQLite calls are pushed to threads.
+
+Factories are shared with ``ProcessingWorker``; injected collaborators that
+only expose the blocking API (``download``/``summarize``/``save``) are run in
+a thread instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from src.core.logger import logger
+from src.core.metrics import LOCK_WAIT_SECONDS, PIPELINE_TASK_SECONDS, PIPELINE_TASKS_TOTAL
+from src.domain.interfaces.database import BaseDB
+from src.domain.tasks.models import Task, TaskStageTimings
+from src.infrastructure.media.transcription.options import (
+    TranscriptionOptions,
+    resolve_transcription_options,
+)
+from src.infrastructure.notifications.discord import (
+    async_send_task_completion_notification,
+)
+from src.services.outputs.path_builder import build_summary_output_path
+from src.services.pipeline.processing_runner import (
+    PROCESSING_LOCK_REFRESH_INTERVAL,
+    PROCESSING_LOCK_TIMEOUT_SECONDS,
+    TASK_LOCK_TIMEOUT_SECONDS,
+    ProcessingSummary,
+    ProcessingWorker,
+    _numeric_attribute,
+    get_db_client,
+)
+
+AsyncNotifierFunc = Callable[..., Awaitable[bool]]
+DEFAULT_ASYNC_CONCURRENCY = 8
+
+
+async def _call(obj: Any, async_name: str, sync_name: str, *args: Any, **kwargs: Any) -> Any:
+    """Await ``obj.<async_name>`` when available, else run the blocking method in a thread."""
+    method = getattr(obj, async_name, None)
+    if method is not None and asyncio.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await asyncio.to_thread(getattr(obj, sync_name), *args, **kwargs)
+
+
+class AsyncProcessingWorker(ProcessingWorker):
+    """Event-loop based worker that overlaps the I/O-bound stages of many tasks."""
+
+    def __init__(
+        self,
+        db: BaseDB,
+        worker_id: Optional[str] = None,
+        task_lock_timeout_seconds: int = TASK_LOCK_TIMEOUT_SECONDS,
+        processing_lock_timeout_seconds: int = PROCESSING_LOCK_TIMEOUT_SECONDS,
+        lock_refresh_interval: int = PROCESSING_LOCK_REFRESH_INTERVAL,
+        *,
+        concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+        async_notifier: Optional[AsyncNotifierFunc] = None,
+        **factories: Any,
+    ):
+        super().__init__(
+            db,
+            worker_id=worker_id,
+            task_lock_timeout_seconds=task_lock_timeout_seconds,
+            processing_lock_timeout_seconds=processing_lock_timeout_seconds,
+            lock_refresh_interval=lock_refresh_interval,
+            **factories,
+        )
+        self.concurrency = max(1, concurrency)
+        self.transcription_concurrency = max(
+            1, int(getattr(self.config, "transcription_concurrency", 1) or 1)
+        )
+        # A custom blocking notifier is honoured (in a thread) unless an async one is given.
+        if async_notifier is None and factories.get("notifier") is None:
+            async_notifier = async_send_task_completion_notification
+        self.async_notifier = async_notifier
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def run(self) -> ProcessingSummary:
+        return asyncio.run(self.arun())
+
+    async def arun(self) -> ProcessingSummary:
+        """Drain the queue with ``concurrency`` tasks in flight."""
+        summary = ProcessingSummary(worker_id=self.worker_id)
+        logger.info(f"Async worker {self.worker_id} requesting processing lock")
+        with LOCK_WAIT_SECONDS.time(lock="processing"):
+            acquired = await asyncio.to_thread(
+                self.db.acquire_processing_lock,
+                self.worker_id,
+                self.processing_lock_timeout_seconds,
+            )
+        if not acquired:
+            logger.info(
+                f"Async worker {self.worker_id} could not acquire processing lock; another worker is active."
+            )
+            return summary
+
+        summary.acquired_lock = True
+        heartbeat = asyncio.create_task(self._heartbeat())
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.transcription_concurrency,
+            thread_name_prefix=f"{self.worker_id}-transcribe",
+        )
+        try:
+            results = await asyncio.gather(
+                *(self._drain() for _ in range(self.concurrency))
+            )
+            for processed, failed in results:
+                summary.processed_tasks += processed
+                summary.failed_tasks += failed
+            await asyncio.to_thread(self._archive_old_tasks)
+            return summary
+        finally:
+            heartbeat.cancel()
+            with suppress(asyncio.CancelledError):
+                await heartbeat
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            await asyncio.to_thread(self.db.release_processing_lock, self.worker_id)
+            logger.info(
+                f"Async worker {self.worker_id} released processing lock "
+                f"(processed={summary.processed_tasks}, failed={summary.failed_tasks})"
+            )
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.lock_refresh_interval)
+            try:
+                await asyncio.to_thread(self.db.refresh_processing_lock, self.worker_id)
+            except Exception as exc:
+                logger.warning(
+                    f"Failed to refresh processing lock for worker {self.worker_id}: {exc}"
+                )
+            try:
+                await asyncio.to_thread(self._refresh_task_locks)
+            except Exception as exc:
+                logger.warning(f"Failed to refresh task locks for worker {self.worker_id}: {exc}")
+
+    async def _drain(self) -> tuple[int, int]:
+        processed = failed = 0
+        while True:
+            try:
+                success = await self.aprocess_next_task()
+            except Exception as exc:  # pragma: no cover - defensive guard
+                logger.error(
+                    f"Async worker {self.worker_id} encountered an error while acquiring tasks: {exc}"
+                )
+                break
+            if success is None:
+                break
+            if success:
+                processed += 1
+            else:
+                failed += 1
+        return processed, failed
+
+    async def aprocess_next_task(self) -> Optional[bool]:
+        """Acquire and process one task; ``None`` when the queue is empty."""
+        with LOCK_WAIT_SECONDS.time(lock="task"):
+            task = await asyncio.to_thread(
+                self.db.acquire_next_task, self.worker_id, self.task_lock_timeout_seconds
+            )
+        if task is None:
+            return None
+        with self._claimed([task]):
+            async with self._amedia_pinned([task]):
+                return await self._aprocess_task(task)
+
+    @asynccontextmanager
+    async def _amedia_pinned(self, tasks: list[Task]) -> AsyncIterator[None]:
+        """``_media_pinned`` with the cache's file I/O (pins, eviction) off the loop."""
+        if self.media_cache is None:
+            yield
+            return
+        video_ids = await asyncio.to_thread(self._pin_media, tasks)
+        try:
+            yield
+        finally:
+            await asyncio.to_thread(self._release_media, video_ids)
+
+    async def _aprocess_task(self, task: Task) -> bool:
+        start_time = time.time()
+        timings = TaskStageTimings(task_id=task.id, outcome="processing")
+        try:
+            file_path = await self._adownload(task, timings)
+            options = resolve_transcription_options(self.config, task.transcription_options)
+            text = await self._atranscribe(file_path, options, timings)
+            return await self._afinish_task(task, timings, options, text, start_time)
+        except Exception as exc:
+            return await asyncio.to_thread(self._fail_task, task, timings, exc, start_time)
+
+    async def _adownload(self, task: Task, timings: TaskStageTimings) -> str:
+        logger.info(f"Worker {self.worker_id} processing task {task.id} ({task.url})")
+        downloader = await asyncio.to_thread(self._probe, task, timings)
+        with self._stage(timings, "download"):
+            downloader = downloader or self.downloader_factory(task.url, self.config.data_dir)
+            download_result = await _call(downloader, "adownload", "download")
+        task.title = download_result.get("title") or task.title or task.url
+        await asyncio.to_thread(
+            self.db.update_task_status, task.id, "Processing", title=task.title
+        )
+        return download_result["path"]
+
+    async def _atranscribe(
+        self, file_path: str, options: TranscriptionOptions, timings: TaskStageTimings
+    ) -> str:
+        timings.transcription_model = f"faster-whisper-{options.model_size}"
+        loop = asyncio.get_running_loop()
+        with self._stage(timings, "transcription"):
+            transcriber = self.transcriber_factory(
+                options.model_size, **options.transcriber_kwargs()
+            )
+            text = await loop.run_in_executor(self._executor, transcriber.transcribe, file_path)
+        timings.audio_duration = _numeric_attribute(transcriber, "last_audio_duration")
+        return text
+
+    async def _afinish_task(
+        self,
+        task: Task,
+        timings: TaskStageTimings,
+        options: TranscriptionOptions,
+        transcription_text: str,
+        start_time: float,
+    ) -> bool:
+        cfg = self.config
+        timings.transcript_chars = len(transcription_text or "")
+
+        with self._stage(timings, "summarization"):
+            summarizer = self.summarizer_factory()
+            summarized_text = await _call(
+                summarizer, "asummarize", "summarize", task.title, transcription_text
+            )
+        timings.summary_chars = len(summarized_text or "")
+        summarizer_label = getattr(summarizer, "last_model_label", "unknown")
+        timings.summarizer_model = str(summarizer_label)
+        model_label = f"faster-whisper-{options.model_size}+{summarizer_label}"
+
+        with self._stage(timings, "file_save"):
+            output_file = build_summary_output_path(task.title, task.url)
+            file_manager = self.file_manager_factory()
+            await asyncio.to_thread(file_manager.save_text, summarized_text, output_file)
+
+        notion_page_id: Optional[str] = task.notion_page_id
+        with self._stage(timings, "notion_save"):
+            summary_storage = self.summary_storage_factory()
+            storage_result = await _call(
+                summary_storage,
+                "asave",
+                "save",
+                title=task.title,
+                text=summarized_text,
+                model=model_label,
+                url=task.url,
+            )
+        if isinstance(storage_result, dict) and storage_result.get("page_id"):
+            notion_page_id = str(storage_result["page_id"])
+            task.notion_page_id = notion_page_id
+
+        duration = time.time() - start_time
+        await asyncio.to_thread(
+            self.db.update_task_status,
+            task.id,
+            "Completed",
+            title=task.title,
+            summary=summarized_text,
+            processing_duration=duration,
+            notion_page_id=notion_page_id,
+        )
+        await asyncio.to_thread(self._index_transcript, task, transcription_text)
+        notify_args = (task.title or "untitled", task.url, cfg.discord_webhook_url)
+        notify_kwargs = {"notion_url": cfg.notion_url, "notion_task_id": notion_page_id}
+        with self._stage(timings, "notify"):
+            if self.async_notifier is not None:
+                await self.async_notifier(*notify_args, **notify_kwargs)
+            else:
+                await asyncio.to_thread(self.notifier, *notify_args, **notify_kwargs)
+
+        PIPELINE_TASK_SECONDS.observe(duration, outcome="completed")
+        PIPELINE_TASKS_TOTAL.inc(outcome="completed")
+        timings.outcome = "completed"
+        timings.total_duration = time.time() - start_time
+        await asyncio.to_thread(self._record_stage_timings, timings)
+        logger.info(
+            f"Worker {self.worker_id} completed task {task.id} in {duration:.2f} seconds"
+        )
+        return True
+
+
+def process_pending_tasks_async(
+    *,
+    db: Optional[BaseDB] = None,
+    worker_id: Optional[str] = None,
+    concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+) -> ProcessingSummary:
+    """Drain pending tasks with the asyncio runner."""
+    worker = AsyncProcessingWorker(
+        db or get_db_client(), worker_id=worker_id, concurrency=concurrency
+    )
+    return worker.run()
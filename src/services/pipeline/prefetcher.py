@@ -0,0 +1,222 @@
+"""Background media prefetch for the next pending tasks.
+
+``DownloadPrefetcher`` peeks at the next ``lookahead`` pending tasks (without
+claiming them) and downloads their media into ``data/videos`` on a background
+thread, so ``ProcessingWorker._download`` usually finds the file already local
+and skips yt-dlp. Prefetching pauses while the files fetched but not yet
+consumed exceed ``disk_budget_bytes``.
+
+With a ``probe_policy`` the metadata probe runs first, so media of tasks the
+worker would reject or defer is never downloaded; the probed ``MediaInfo`` is
+handed to the worker through ``probed_info`` so it does not probe again.
+
+A result is kept until the worker calls ``take`` or ``discard``, even after
+the task leaves the pending window (the worker itself claims it there). Only
+tasks that finished, disappeared or were claimed by another worker are
+purged on the next lookahead.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Callable, Optional
+
+from src.core.logger import logger
+from src.core.utils.url import extract_video_id
+from src.domain.interfaces.database import BaseDB
+from src.infrastructure.media.media_cache import MediaCache
+from src.infrastructure.media.yt_dlp_library import MediaInfo
+from src.services.pipeline.probe_policy import ACCEPT, ProbePolicy
+
+DownloaderFactory = Callable[[str, str], Any]
+
+FINISHED_STATUSES = frozenset({"Completed", "Failed"})
+
+
+class DownloadPrefetcher:
+    def __init__(
+        self,
+        db: BaseDB,
+        downloader_factory: DownloaderFactory,
+        output_path: str,
+        *,
+        lookahead: int = 2,
+        disk_budget_bytes: int = 2 * 1024**3,
+        poll_interval_seconds: float = 5.0,
+        media_cache: Optional[MediaCache] = None,
+        worker_id: Optional[str] = None,
+        probe_policy: Optional[ProbePolicy] = None,
+    ):
+        self.db = db
+        # Tasks in Processing under this worker id are ours; results are kept.
+        self.worker_id = worker_id
+        self.downloader_factory = downloader_factory
+        self.output_path = output_path
+        self.lookahead = max(1, lookahead)
+        self.disk_budget_bytes = max(0, disk_budget_bytes)
+        self.poll_interval_seconds = poll_interval_seconds
+        # Prefetched media stays pinned until the worker takes it.
+        self.media_cache = media_cache
+        self.probe_policy = probe_policy
+        self._results: dict[str, dict[str, Any]] = {}
+        self._probed: dict[str, MediaInfo] = {}
+        self._video_ids: dict[str, Optional[str]] = {}
+        self._in_progress: dict[str, threading.Event] = {}
+        # Tasks whose prefetch failed; the worker's own download reports the error.
+        self._failed: set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="download-prefetcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def poke(self) -> None:
+        """Ask the prefetcher to look ahead again (e.g. after a task was claimed)."""
+        self._wake.set()
+
+    def prefetched_bytes(self) -> int:
+        with self._lock:
+            paths = [result.get("path") for result in self._results.values()]
+        return sum(os.path.getsize(path) for path in paths if path and os.path.isfile(path))
+
+    def take(self, task_id: str, wait_seconds: Optional[float] = None) -> Optional[dict[str, Any]]:
+        """Return the prefetched download result for ``task_id`` (if any).
+
+        When the task's media is still being prefetched, waits for that
+        download instead of letting the caller start a duplicate one.
+        """
+        self._wait_for(task_id, wait_seconds)
+        with self._lock:
+            result = self._results.pop(task_id, None)
+            self._probed.pop(task_id, None)
+            self._failed.discard(task_id)
+        self._release(task_id)
+        if result and result.get("path") and os.path.isfile(result["path"]):
+            return result
+        return None
+
+    def probed_info(
+        self, task_id: str, wait_seconds: Optional[float] = None
+    ) -> Optional[MediaInfo]:
+        """Metadata probed for ``task_id`` ahead of the worker (if any)."""
+        self._wait_for(task_id, wait_seconds)
+        with self._lock:
+            return self._probed.get(task_id)
+
+    def discard(self, task_id: str) -> None:
+        """Forget the prefetched media for ``task_id`` without using it."""
+        with self._lock:
+            self._results.pop(task_id, None)
+            self._probed.pop(task_id, None)
+            self._failed.discard(task_id)
+        self._release(task_id)
+
+    def run_once(self) -> int:
+        """Prefetch what fits in the budget among the next pending tasks."""
+        tasks = self.db.peek_pending_tasks(self.lookahead)
+        upcoming = {task.id for task in tasks}
+        with self._lock:
+            outside = (set(self._results) | self._failed) - upcoming
+        for task_id in outside:
+            if self._is_stale(task_id):
+                self.discard(task_id)
+
+        started = 0
+        for task in tasks:
+            if self._stop.is_set():
+                break
+            with self._lock:
+                known = (
+                    task.id in self._results
+                    or task.id in self._in_progress
+                    or task.id in self._failed
+                )
+            if known:
+                continue
+            if self.prefetched_bytes() >= self.disk_budget_bytes:
+                logger.info("[Prefetch] Disk budget reached; waiting for tasks to consume media")
+                break
+            self._prefetch(task.id, task.url, task.video_id)
+            started += 1
+        return started
+
+    def _prefetch(self, task_id: str, url: str, video_id: Optional[str] = None) -> None:
+        done = threading.Event()
+        video_id = video_id or extract_video_id(url)
+        with self._lock:
+            self._in_progress[task_id] = done
+            self._video_ids[task_id] = video_id
+        if self.media_cache is not None:
+            self.media_cache.pin(video_id)
+        try:
+            downloader = self.downloader_factory(url, self.output_path)
+            if self.probe_policy is not None and hasattr(downloader, "probe"):
+                info = downloader.probe()
+                with self._lock:
+                    self._probed[task_id] = info
+                decision = self.probe_policy.decide(info)
+                if decision.action != ACCEPT:
+                    # The worker reports the rejection or deferral when it claims the task.
+                    logger.info(f"[Prefetch] Skipping task {task_id}: {decision.reason}")
+                    with self._lock:
+                        self._failed.add(task_id)
+                    self._release(task_id)
+                    return
+            logger.info(f"[Prefetch] Downloading media for task {task_id} ({url})")
+            result = downloader.download()
+            with self._lock:
+                self._results[task_id] = result
+        except Exception as exc:
+            logger.warning(f"[Prefetch] Download for task {task_id} failed: {exc}")
+            with self._lock:
+                self._failed.add(task_id)
+            self._release(task_id)
+        finally:
+            with self._lock:
+                self._in_progress.pop(task_id, None)
+            done.set()
+
+    def _is_stale(self, task_id: str) -> bool:
+        """True when nobody will ``take`` the result for ``task_id`` any more."""
+        task = self.db.get_task_by_id(task_id)
+        if task is None or task.status in FINISHED_STATUSES:
+            return True
+        return task.status == "Processing" and task.worker_id != self.worker_id
+
+    def _wait_for(self, task_id: str, wait_seconds: Optional[float]) -> None:
+        """Block while ``task_id`` is still being prefetched."""
+        with self._lock:
+            pending = self._in_progress.get(task_id)
+        if pending is not None:
+            pending.wait(wait_seconds)
+
+    def _release(self, task_id: str) -> None:
+        with self._lock:
+            if task_id not in self._video_ids:
+                return
+            video_id = self._video_ids.pop(task_id)
+        if self.media_cache is not None:
+            self.media_cache.unpin(video_id)
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as exc:  # pragma: no cover - defensive guard
+                logger.warning(f"[Prefetch] Lookahead failed: {exc}")
+            self._wake.wait(self.poll_interval_seconds)
+            self._wake.clear()
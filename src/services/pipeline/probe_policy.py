@@ -0,0 +1,105 @@
+"""Decide what to do with a task from its probed metadata, before downloading.
+
+``ProbePolicy.decide`` turns a ``MediaInfo`` into a ``ProbeDecision``:
+
+- ``reject``: restricted videos (members-only, premium, login required) and
+  videos longer than ``max_duration_seconds`` fail right away instead of after
+  a long download;
+- ``defer``: live, upcoming or just-ended streams go back to the queue for
+  ``defer_live_seconds`` (their media is not final yet);
+- ``accept``: anything else, optionally routed to chunked transcription when
+  it is at least ``chunked_min_seconds`` long.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from src.infrastructure.media.yt_dlp_library import MediaInfo
+
+ACCEPT = "accept"
+REJECT = "reject"
+DEFER = "defer"
+
+LIVE_STATUSES = frozenset({"is_live", "is_upcoming", "post_live"})
+RESTRICTED_AVAILABILITY = frozenset({"premium_only", "subscriber_only", "needs_auth"})
+
+
+class TaskRejected(Exception):
+    """The probe showed the task is not worth (or not possible) processing."""
+
+
+class TaskDeferred(Exception):
+    """The task should be retried later; ``delay_seconds`` from now."""
+
+    def __init__(self, reason: str, delay_seconds: float):
+        super().__init__(reason)
+        self.delay_seconds = delay_seconds
+
+
+@dataclass(frozen=True)
+class ProbeDecision:
+    action: str
+    reason: str = ""
+    delay_seconds: float = 0.0
+    # Transcription overrides applied to the task (explicit task options win).
+    transcription_overrides: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ProbePolicy:
+    # 0 disables the respective rule.
+    max_duration_seconds: float = 0.0
+    defer_live_seconds: float = 1800.0
+    chunked_min_seconds: float = 0.0
+
+    @classmethod
+    def from_config(cls, config: Any) -> "ProbePolicy":
+        return cls(
+            max_duration_seconds=float(getattr(config, "probe_max_duration_seconds", 0) or 0),
+            defer_live_seconds=float(getattr(config, "probe_defer_live_seconds", 1800) or 0),
+            chunked_min_seconds=float(getattr(config, "probe_chunked_min_seconds", 0) or 0),
+        )
+
+    def decide(self, info: MediaInfo) -> ProbeDecision:
+        if info.availability in RESTRICTED_AVAILABILITY:
+            return ProbeDecision(REJECT, f"Video is not publicly available ({info.availability})")
+        if info.live_status in LIVE_STATUSES:
+            if self.defer_live_seconds > 0:
+                return ProbeDecision(
+                    DEFER,
+                    f"Live stream not finished ({info.live_status})",
+                    delay_seconds=self.defer_live_seconds,
+                )
+            return ProbeDecision(REJECT, f"Live streams are not processed ({info.live_status})")
+        duration = info.duration
+        if duration is not None and self.max_duration_seconds > 0:
+            if duration > self.max_duration_seconds:
+                return ProbeDecision(
+                    REJECT,
+                    f"Video is {_format_duration(duration)} long; the limit is "
+                    f"{_format_duration(self.max_duration_seconds)}",
+                )
+        if (
+            duration is not None
+            and self.chunked_min_seconds > 0
+            and duration >= self.chunked_min_seconds
+        ):
+            return ProbeDecision(ACCEPT, transcription_overrides={"chunked": True})
+        return ProbeDecision(ACCEPT)
+
+
+def apply_overrides(
+    task_options: Optional[dict[str, Any]], overrides: dict[str, Any]
+) -> Optional[dict[str, Any]]:
+    """Merge routing overrides under the task's explicit transcription options."""
+    if not overrides:
+        return task_options
+    return {**overrides, **(task_options or {})}
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
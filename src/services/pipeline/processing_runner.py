@@ -4,39 +4,60 @@ import os
 import threading
 import time
 import uuid
-from dataclasses import dataclass
-from typing import Callable, Optional
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Callable, Iterator, Optional
 
 from src.core.config import Config
 from src.core.logger import logger
+from src.core.time_utils import utc_now_naive
+from src.core.utils.url import extract_video_id
+from src.core.metrics import (
+    LOCK_WAIT_SECONDS,
+    PIPELINE_STAGE_SECONDS,
+    PIPELINE_TASK_SECONDS,
+    PIPELINE_TASKS_TOTAL,
+    record_cache_lookup,
+)
 from src.domain.interfaces.database import BaseDB
-from src.domain.tasks.models import Task
-try:  # pragma: no cover - optional heavy dependencies
-    from src.infrastructure.llm.summarizer_service import Summarizer
-except ModuleNotFoundError:  # pragma: no cover - testing scaffold
-    Summarizer = None  # type: ignore
-
-try:  # pragma: no cover - optional heavy dependencies
-    from src.infrastructure.media.downloader import YouTubeDownloader
-except ModuleNotFoundError:  # pragma: no cover - testing scaffold
-    YouTubeDownloader = None  # type: ignore
-
-try:  # pragma: no cover - optional heavy dependencies
-    from src.infrastructure.media.transcription.transcriber import Transcriber
-except ModuleNotFoundError:  # pragma: no cover - testing scaffold
-    Transcriber = None  # type: ignore
-
+from src.domain.tasks.models import Task, TaskStageTimings
+# SDKs (LLM clients, faster-whisper, notion-client) are imported lazily by
+# these modules, so importing the runner stays cheap for the API and CLI.
+from src.infrastructure.llm.summarizer_service import Summarizer
+from src.infrastructure.media.downloader import YouTubeDownloader
+from src.infrastructure.media.media_cache import MediaCache, get_media_cache
+from src.infrastructure.media.transcription.transcriber import Transcriber, is_test_mode
+from src.infrastructure.media.transcription.batched import (
+    BatchTranscriber,
+    probe_audio_duration,
+)
+from src.infrastructure.media.transcription.options import (
+    TranscriptionOptions,
+    resolve_transcription_options,
+)
 from src.infrastructure.notifications.discord import (
     send_task_completion_notification,
 )
 from src.infrastructure.persistence.factory import DBFactory
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.infrastructure.persistence.sqlite.transcription_job_repository import (
+    SQLiteTranscriptionJobRepository,
+)
 from src.infrastructure.storage.file_storage import FileManager
-
-try:  # pragma: no cover - optional heavy dependencies
-    from src.infrastructure.storage.summary_storage import SummaryStorage
-except ModuleNotFoundError:  # pragma: no cover - testing scaffold
-    SummaryStorage = None  # type: ignore
+from src.infrastructure.storage.summary_storage import SummaryStorage
 from src.services.outputs.path_builder import build_summary_output_path
+from src.services.pipeline.prefetcher import DownloadPrefetcher
+from src.services.pipeline.probe_policy import (
+    DEFER,
+    REJECT,
+    ProbePolicy,
+    TaskDeferred,
+    TaskRejected,
+    apply_overrides,
+)
+from src.services.pipeline.transcription_queue import QueuedTranscriber
+from src.services.pipeline.task_archive import archive_old_tasks
 
 
 TASK_LOCK_TIMEOUT_SECONDS = int(os.environ.get("TASK_LOCK_TIMEOUT_SECONDS", "900"))
@@ -67,13 +88,20 @@ class ProcessingSummary:
 
 
 class _ProcessingLockRefresher(threading.Thread):
-    """Background thread that keeps the global lock alive."""
+    """Background thread that keeps the global lock and claimed task locks alive."""
 
-    def __init__(self, db: BaseDB, worker_id: str, interval_seconds: int):
+    def __init__(
+        self,
+        db: BaseDB,
+        worker_id: str,
+        interval_seconds: int,
+        refresh_task_locks: Optional[Callable[[], None]] = None,
+    ):
         super().__init__(daemon=True)
         self._db = db
         self._worker_id = worker_id
         self._interval = max(1, interval_seconds)
+        self._refresh_task_locks = refresh_task_locks
         self._stop_event = threading.Event()
 
     def run(self) -> None:
@@ -84,6 +112,14 @@ class _ProcessingLockRefresher(threading.Thread):
                 logger.warning(
                     f"Failed to refresh processing lock for worker {self._worker_id}: {exc}"
                 )
+            if self._refresh_task_locks is None:
+                continue
+            try:
+                self._refresh_task_locks()
+            except Exception as exc:
+                logger.warning(
+                    f"Failed to refresh task locks for worker {self._worker_id}: {exc}"
+                )
 
     def ping(self) -> None:
         try:
@@ -104,12 +140,15 @@ class _ProcessingLockRefresher(threading.Thread):
 
 
 DownloaderFactory = Callable[[str, str], YouTubeDownloader]
-TranscriberFactory = Callable[[str], Transcriber]
+# Called as factory(model_size, **TranscriptionOptions.transcriber_kwargs()).
+TranscriberFactory = Callable[..., Transcriber]
 SummarizerFactory = Callable[[], Summarizer]
 SummaryStorageFactory = Callable[[], SummaryStorage]
 FileManagerFactory = Callable[[], FileManager]
 NotifierFunc = Callable[..., bool]
 ConfigFactory = Callable[[], Config]
+BatchTranscriberFactory = Callable[[TranscriptionOptions, int], BatchTranscriber]
+DurationProbe = Callable[[str], Optional[float]]
 
 
 class ProcessingWorker:
@@ -130,60 +169,91 @@ class ProcessingWorker:
         file_manager_factory: Optional[FileManagerFactory] = None,
         notifier: Optional[NotifierFunc] = None,
         config_factory: Optional[ConfigFactory] = None,
+        batch_transcriber_factory: Optional[BatchTranscriberFactory] = None,
+        audio_duration_probe: Optional[DurationProbe] = None,
     ):
         self.db = db
         self.worker_id = worker_id or f"worker-{uuid.uuid4().hex}"
         self.task_lock_timeout_seconds = task_lock_timeout_seconds
         self.processing_lock_timeout_seconds = processing_lock_timeout_seconds
         self.lock_refresh_interval = lock_refresh_interval
+        # Tasks acquired but not finished yet; their locks are refreshed with
+        # the processing lock so long batches are not reclaimed as stale.
+        self._claimed_task_ids: set[str] = set()
+        self._claimed_lock = threading.Lock()
         self.config = (config_factory or Config)()
+        self.media_cache: Optional[MediaCache] = None
+        if getattr(self.config, "media_cache_enabled", False):
+            self.media_cache = get_media_cache(
+                os.path.join(self.config.data_dir, "videos"),
+                max_bytes=int(
+                    float(getattr(self.config, "media_cache_max_mb", 0) or 0) * 1024 * 1024
+                ),
+                max_age_seconds=float(getattr(self.config, "media_cache_max_age_days", 0) or 0)
+                * 86400,
+            )
         if downloader_factory is not None:
             self.downloader_factory = downloader_factory
         else:
-            if YouTubeDownloader is None:
-                raise RuntimeError(
-                    "YouTube downloader dependency missing. Install yt-dlp-related extras."
-                )
-            self.downloader_factory = lambda url, output_path: YouTubeDownloader(  # type: ignore[misc]
-                url, output_path=output_path
+            self.downloader_factory = lambda url, output_path: YouTubeDownloader(
+                url,
+                output_path=output_path,
+                media_cache=self.media_cache,
+                backend=getattr(self.config, "ytdlp_backend", "auto"),
             )
         if transcriber_factory is not None:
             self.transcriber_factory = transcriber_factory
+        elif self._transcription_queued():
+            self.transcriber_factory = self._queued_transcriber_factory()
         else:
-            if Transcriber is None:
-                raise RuntimeError(
-                    "Transcriber dependency missing. Install faster-whisper or provide a custom factory."
-                )
-            self.transcriber_factory = lambda model_size: Transcriber(  # type: ignore[misc]
-                model_size=model_size
+            self.transcriber_factory = lambda model_size, **options: Transcriber(
+                model_size=model_size, **options
             )
-        if summarizer_factory is not None:
-            self.summarizer_factory = summarizer_factory
-        else:
-            if Summarizer is None:
-                raise RuntimeError(
-                    "Summarizer dependency missing. Install LLM dependencies or provide a custom factory."
-                )
-            self.summarizer_factory = Summarizer  # type: ignore[assignment]
-        if summary_storage_factory is not None:
-            self.summary_storage_factory = summary_storage_factory
-        else:
-            if SummaryStorage is None:
-                raise RuntimeError(
-                    "Summary storage dependency missing. Install Notion client or provide a custom factory."
-                )
-            self.summary_storage_factory = SummaryStorage  # type: ignore[assignment]
+        self.summarizer_factory = summarizer_factory or Summarizer
+        self.summary_storage_factory = summary_storage_factory or SummaryStorage
         self.file_manager_factory = file_manager_factory or FileManager
         self.notifier = notifier or send_task_completion_notification
+        self.batch_transcriber_factory = batch_transcriber_factory or (
+            lambda options, batch_size: BatchTranscriber(options, batch_size=batch_size)
+        )
+        self.audio_duration_probe = audio_duration_probe or probe_audio_duration
+        # Batched mode pulls several short tasks at once (1 disables it). Batches
+        # load Whisper in this process, so the queue executor turns them off.
+        self.batch_task_limit = max(
+            1, int(getattr(self.config, "transcription_batch_tasks", 1) or 1)
+        )
+        if self.batch_task_limit > 1 and self._transcription_queued():
+            logger.info("Batched transcription is disabled with TRANSCRIPTION_EXECUTOR=queue.")
+            self.batch_task_limit = 1
+        self.batch_size = max(1, int(getattr(self.config, "transcription_batch_size", 8) or 8))
+        self.batch_max_audio_seconds = float(
+            getattr(self.config, "transcription_batch_max_audio_seconds", 180.0) or 0.0
+        )
+        # Media for the next N pending tasks is downloaded in the background (0 disables).
+        self.prefetch_tasks = max(0, int(getattr(self.config, "prefetch_tasks", 0) or 0))
+        self.prefetch_disk_budget_bytes = int(
+            float(getattr(self.config, "prefetch_disk_budget_mb", 2048) or 0) * 1024 * 1024
+        )
+        self.prefetcher: Optional[DownloadPrefetcher] = None
+        # Metadata probe before download: reject, defer or route tasks by cost.
+        self.probe_enabled = bool(getattr(self.config, "probe_enabled", False))
+        self.probe_policy = ProbePolicy.from_config(self.config)
+        self.search_index_transcripts = bool(
+            getattr(self.config, "search_index_transcripts", False)
+        )
+        # Finished tasks older than this move to the archive once the queue drains (0 disables).
+        self.archive_after_days = float(getattr(self.config, "task_archive_after_days", 0) or 0)
 
     def run(self) -> ProcessingSummary:
         """Run the worker loop until no executable tasks remain."""
         summary = ProcessingSummary(worker_id=self.worker_id)
         logger.info(f"Worker {self.worker_id} requesting processing lock")
 
-        if not self.db.acquire_processing_lock(
-            self.worker_id, self.processing_lock_timeout_seconds
-        ):
+        with LOCK_WAIT_SECONDS.time(lock="processing"):
+            acquired = self.db.acquire_processing_lock(
+                self.worker_id, self.processing_lock_timeout_seconds
+            )
+        if not acquired:
             logger.info(
                 f"Worker {self.worker_id} could not acquire processing lock; another worker is active."
             )
@@ -191,77 +261,392 @@ class ProcessingWorker:
 
         summary.acquired_lock = True
         refresher = _ProcessingLockRefresher(
-            self.db, self.worker_id, self.lock_refresh_interval
+            self.db,
+            self.worker_id,
+            self.lock_refresh_interval,
+            refresh_task_locks=self._refresh_task_locks,
         )
         refresher.start()
+        if self.prefetch_tasks:
+            self.prefetcher = DownloadPrefetcher(
+                self.db,
+                self.downloader_factory,
+                self.config.data_dir,
+                lookahead=self.prefetch_tasks,
+                disk_budget_bytes=self.prefetch_disk_budget_bytes,
+                media_cache=self.media_cache,
+                worker_id=self.worker_id,
+                probe_policy=self.probe_policy if self.probe_enabled else None,
+            )
+            self.prefetcher.start()
 
         try:
             while True:
+                refresher.ping()
                 try:
-                    task = self.db.acquire_next_task(
-                        self.worker_id, self.task_lock_timeout_seconds
-                    )
+                    if self.batch_task_limit > 1:
+                        outcomes = self.process_next_batch()
+                    else:
+                        success = self.process_next_task()
+                        outcomes = None if success is None else [success]
                 except Exception as exc:  # pragma: no cover - defensive guard
                     logger.error(
                         f"Worker {self.worker_id} encountered an error while acquiring tasks: {exc}"
                     )
                     break
 
-                if task is None:
+                if outcomes is None:
                     logger.info(f"Worker {self.worker_id} found no pending tasks; exiting.")
                     break
 
-                refresher.ping()
-                success = self._process_task(task)
-                if success:
-                    summary.processed_tasks += 1
-                else:
-                    summary.failed_tasks += 1
+                for success in outcomes:
+                    if success:
+                        summary.processed_tasks += 1
+                    else:
+                        summary.failed_tasks += 1
                 refresher.ping()
 
+            self._archive_old_tasks()
             return summary
         finally:
+            if self.prefetcher is not None:
+                self.prefetcher.stop()
+                self.prefetcher = None
             refresher.stop()
             self.db.release_processing_lock(self.worker_id)
             logger.info(
                 f"Worker {self.worker_id} released processing lock (processed={summary.processed_tasks}, failed={summary.failed_tasks})"
             )
 
+    def process_next_task(self) -> Optional[bool]:
+        """Acquire and process a single task without taking the processing lock.
+
+        Returns ``None`` when no executable task is available, otherwise whether
+        the task completed successfully. ``run()`` wraps this with the global
+        processing lock; benchmarks call it directly to drive several workers.
+        """
+        with LOCK_WAIT_SECONDS.time(lock="task"):
+            task = self.db.acquire_next_task(
+                self.worker_id, self.task_lock_timeout_seconds
+            )
+        if task is None:
+            return None
+        with self._claimed([task]), self._media_pinned([task]):
+            return self._process_task(task)
+
+    def process_next_batch(self) -> Optional[list[bool]]:
+        """Acquire up to ``batch_task_limit`` tasks and transcribe short ones together.
+
+        Every task is downloaded first; clips no longer than
+        ``batch_max_audio_seconds`` that share the same transcription options
+        go through one ``BatchTranscriber`` call, everything else falls back to
+        the regular per-task transcriber. Returns ``None`` when the queue is
+        empty, otherwise one success flag per acquired task.
+        """
+        tasks: list[Task] = []
+        while len(tasks) < self.batch_task_limit:
+            with LOCK_WAIT_SECONDS.time(lock="task"):
+                task = self.db.acquire_next_task(
+                    self.worker_id, self.task_lock_timeout_seconds
+                )
+            if task is None:
+                break
+            tasks.append(task)
+        if not tasks:
+            return None
+        with self._claimed(tasks), self._media_pinned(tasks):
+            return self._process_batch(tasks)
+
+    def _process_batch(self, tasks: list[Task]) -> list[bool]:
+        outcomes: list[bool] = []
+        prepared: list[_PreparedTask] = []
+        for task in tasks:
+            item = _PreparedTask(
+                task=task,
+                timings=TaskStageTimings(task_id=task.id, outcome="processing"),
+            )
+            try:
+                item.file_path = self._download(task, item.timings)
+                item.options = resolve_transcription_options(
+                    self.config, task.transcription_options
+                )
+                item.audio_duration = self.audio_duration_probe(item.file_path)
+            except Exception as exc:
+                outcomes.append(self._fail_task(task, item.timings, exc, item.start_time))
+                continue
+            prepared.append(item)
+
+        # Test mode mocks transcription per task in Transcriber; never load the batch model.
+        batchable = [] if is_test_mode() else prepared
+        groups: dict[TranscriptionOptions, list[_PreparedTask]] = {}
+        for item in batchable:
+            if (
+                item.audio_duration is not None
+                and item.audio_duration <= self.batch_max_audio_seconds
+            ):
+                groups.setdefault(item.options, []).append(item)
+        for options, members in groups.items():
+            if len(members) > 1:
+                self._transcribe_batch(options, members)
+
+        for item in prepared:
+            try:
+                if item.transcript is None:
+                    item.transcript = self._transcribe(
+                        item.file_path, item.options, item.timings
+                    )
+                outcomes.append(
+                    self._finish_task(
+                        item.task, item.timings, item.options, item.transcript, item.start_time
+                    )
+                )
+            except Exception as exc:
+                outcomes.append(
+                    self._fail_task(item.task, item.timings, exc, item.start_time)
+                )
+        return outcomes
+
+    def _transcribe_batch(
+        self, options: TranscriptionOptions, members: list["_PreparedTask"]
+    ) -> None:
+        """Transcribe ``members`` in one batch; on error they fall back to single calls."""
+        started = time.perf_counter()
+        try:
+            batch_transcriber = self.batch_transcriber_factory(options, self.batch_size)
+            texts = batch_transcriber.transcribe_many([item.file_path for item in members])
+        except Exception as exc:
+            logger.warning(
+                f"Worker {self.worker_id} batched transcription failed; falling back to per-task: {exc}"
+            )
+            return
+        elapsed = time.perf_counter() - started
+
+        # Attribute the shared wall time to tasks in proportion to their audio.
+        total_audio = sum(item.audio_duration or 0.0 for item in members) or float(len(members))
+        for item, text in zip(members, texts):
+            share = (item.audio_duration or 1.0) / total_audio
+            item.transcript = text
+            item.timings.transcription_model = f"faster-whisper-{options.model_size}"
+            item.timings.audio_duration = item.audio_duration
+            self._record_stage(item.timings, "transcription", elapsed * share)
+
+    @contextmanager
+    def _claimed(self, tasks: list[Task]) -> Iterator[None]:
+        """Track ``tasks`` as held by this worker until they are finished."""
+        task_ids = [str(task.id) for task in tasks]
+        with self._claimed_lock:
+            self._claimed_task_ids.update(task_ids)
+        try:
+            yield
+        finally:
+            with self._claimed_lock:
+                self._claimed_task_ids.difference_update(task_ids)
+
+    def _refresh_task_locks(self) -> None:
+        with self._claimed_lock:
+            task_ids = sorted(self._claimed_task_ids)
+        if task_ids:
+            self.db.refresh_task_locks(self.worker_id, task_ids)
+
+    @contextmanager
+    def _media_pinned(self, tasks: list[Task]) -> Iterator[None]:
+        """Keep the media of in-flight ``tasks`` out of cache eviction."""
+        if self.media_cache is None:
+            yield
+            return
+        video_ids = self._pin_media(tasks)
+        try:
+            yield
+        finally:
+            self._release_media(video_ids)
+
+    def _pin_media(self, tasks: list[Task]) -> list[str]:
+        video_ids = [task.video_id or extract_video_id(task.url) for task in tasks]
+        for video_id in video_ids:
+            self.media_cache.pin(video_id)
+        return video_ids
+
+    def _release_media(self, video_ids: list[str]) -> None:
+        """Unpin ``video_ids`` and trim the cache back under its limits."""
+        for video_id in video_ids:
+            self.media_cache.unpin(video_id)
+        try:
+            self.media_cache.evict()
+        except Exception as exc:  # pragma: no cover - defensive guard
+            logger.warning(f"Media cache eviction failed: {exc}")
+
+    @contextmanager
+    def _stage(self, timings: TaskStageTimings, stage: str) -> Iterator[None]:
+        """Time a pipeline stage for both the metrics registry and the task record."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record_stage(timings, stage, time.perf_counter() - started)
+
+    @staticmethod
+    def _record_stage(timings: TaskStageTimings, stage: str, elapsed: float) -> None:
+        timings.stage_durations[stage] = elapsed
+        PIPELINE_STAGE_SECONDS.observe(elapsed, stage=stage)
+
+    def _record_stage_timings(self, timings: TaskStageTimings) -> None:
+        try:
+            self.db.record_task_stage_timings(timings)
+        except Exception as exc:  # pragma: no cover - defensive guard
+            logger.warning(
+                f"Failed to record stage timings for task {timings.task_id}: {exc}"
+            )
+
     def _process_task(self, task: Task) -> bool:
         """Execute the full processing pipeline for a task."""
+        start_time = time.time()
+        timings = TaskStageTimings(task_id=task.id, outcome="processing")
+
+        try:
+            file_path = self._download(task, timings)
+            options = resolve_transcription_options(self.config, task.transcription_options)
+            transcription_text = self._transcribe(file_path, options, timings)
+            return self._finish_task(task, timings, options, transcription_text, start_time)
+        except Exception as exc:  # pragma: no cover - the heavy pipeline is mocked in tests
+            return self._fail_task(task, timings, exc, start_time)
+
+    def _download(self, task: Task, timings: TaskStageTimings) -> str:
+        """Download the media for ``task`` and persist its resolved title."""
         logger.info(
             f"Worker {self.worker_id} processing task {task.id} ({task.url})"
         )
-        start_time = time.time()
+        downloader = self._probe(task, timings)
+        with self._stage(timings, "download"):
+            download_result = self._take_prefetched(task)
+            if download_result is None:
+                downloader = downloader or self.downloader_factory(
+                    task.url, self.config.data_dir
+                )
+                download_result = downloader.download()
+        previous_title = task.title
+        task.title = download_result.get("title") or task.title or task.url
+        logger.info(
+            f"Resolved task title={task.title} (download_title={download_result.get('title')}, previous_title={previous_title})"
+        )
 
-        try:
+        # Persist the resolved title while keeping status in Processing.
+        self.db.update_task_status(task.id, "Processing", title=task.title)
+        return download_result["path"]
+
+    def _probe(self, task: Task, timings: TaskStageTimings) -> Optional[object]:
+        """Probe metadata before downloading; returns the downloader for reuse.
+
+        Stores the title and duration right away, raises ``TaskRejected`` or
+        ``TaskDeferred`` per ``probe_policy`` and applies routing overrides to
+        ``task.transcription_options``. Metadata the prefetcher already probed
+        is reused. A failing probe only logs a warning; the download reports
+        real errors.
+        """
+        if not self.probe_enabled:
+            return None
+        downloader = None
+        info = self.prefetcher.probed_info(task.id) if self.prefetcher is not None else None
+        if info is None:
             downloader = self.downloader_factory(task.url, self.config.data_dir)
-            download_result = downloader.download()
-            file_path = download_result["path"]
-            previous_title = task.title
-            task.title = download_result.get("title") or task.title or task.url
+            if not hasattr(downloader, "probe"):
+                return downloader
+            try:
+                with self._stage(timings, "probe"):
+                    info = downloader.probe()
+            except Exception as exc:
+                logger.warning(f"Worker {self.worker_id} could not probe task {task.id}: {exc}")
+                return downloader
+
+        if info.title:
+            task.title = info.title
+        task.duration_seconds = info.duration
+        self.db.record_task_metadata(task.id, title=info.title, duration_seconds=info.duration)
+
+        decision = self.probe_policy.decide(info)
+        if decision.action == REJECT:
+            raise TaskRejected(f"Rejected before download: {decision.reason}")
+        if decision.action == DEFER:
+            raise TaskDeferred(decision.reason, decision.delay_seconds)
+        if decision.transcription_overrides:
             logger.info(
-                f"Resolved task title={task.title} (download_title={download_result.get('title')}, previous_title={previous_title})"
+                f"Routing task {task.id} with {decision.transcription_overrides} "
+                f"(duration={info.duration})"
             )
+            task.transcription_options = apply_overrides(
+                task.transcription_options, decision.transcription_overrides
+            )
+        return downloader
+
+    def _take_prefetched(self, task: Task) -> Optional[dict]:
+        if self.prefetcher is None:
+            return None
+        result = self.prefetcher.take(task.id)
+        # The claimed task left the lookahead window; let the prefetcher move on.
+        self.prefetcher.poke()
+        record_cache_lookup("prefetch", hit=result is not None)
+        if result is not None:
+            logger.info(f"Worker {self.worker_id} using prefetched media for task {task.id}")
+        return result
+
+    def _transcription_queued(self) -> bool:
+        return getattr(self.config, "transcription_executor", "inline") == "queue"
+
+    def _queued_transcriber_factory(self) -> TranscriberFactory:
+        """Transcribe in dedicated worker processes via the SQLite job table."""
+        db_path = getattr(self.config, "transcription_queue_db_path", "data/tasks.db")
+        SQLiteDB(db_path)  # ensure the job table exists
+        repository = SQLiteTranscriptionJobRepository(db_path)
+        poll_seconds = getattr(self.config, "transcription_queue_poll_seconds", 0.5)
+        timeout_seconds = getattr(self.config, "transcription_queue_timeout_seconds", 7200.0)
+        logger.info(f"Transcription runs out of process via job queue at {db_path}")
+        return lambda model_size, **options: QueuedTranscriber(
+            repository,
+            model_size,
+            poll_interval_seconds=poll_seconds,
+            timeout_seconds=timeout_seconds,
+            **options,
+        )
 
-            # Persist the resolved title while keeping status in Processing.
-            self.db.update_task_status(task.id, "Processing", title=task.title)
-
-            cfg = self.config
-            transcriber = self.transcriber_factory(cfg.transcription_model_size)
+    def _transcribe(
+        self, file_path: str, options: TranscriptionOptions, timings: TaskStageTimings
+    ) -> str:
+        timings.transcription_model = f"faster-whisper-{options.model_size}"
+        with self._stage(timings, "transcription"):
+            transcriber = self.transcriber_factory(
+                options.model_size, **options.transcriber_kwargs()
+            )
             transcription_text = transcriber.transcribe(file_path)
+        timings.audio_duration = _numeric_attribute(transcriber, "last_audio_duration")
+        return transcription_text
 
+    def _finish_task(
+        self,
+        task: Task,
+        timings: TaskStageTimings,
+        options: TranscriptionOptions,
+        transcription_text: str,
+        start_time: float,
+    ) -> bool:
+        """Summarize, store and notify for a transcribed task."""
+        cfg = self.config
+        timings.transcript_chars = len(transcription_text or "")
+
+        with self._stage(timings, "summarization"):
             summarizer = self.summarizer_factory()
             summarized_text = summarizer.summarize(task.title, transcription_text)
+        timings.summary_chars = len(summarized_text or "")
 
-            summarizer_label = getattr(summarizer, "last_model_label", "unknown")
-            model_label = f"faster-whisper-{cfg.transcription_model_size}+{summarizer_label}"
+        summarizer_label = getattr(summarizer, "last_model_label", "unknown")
+        timings.summarizer_model = str(summarizer_label)
+        model_label = f"faster-whisper-{options.model_size}+{summarizer_label}"
 
+        with self._stage(timings, "file_save"):
             output_file = build_summary_output_path(task.title, task.url)
             file_manager = self.file_manager_factory()
             file_manager.save_text(summarized_text, output_file)
 
-            notion_page_id: Optional[str] = task.notion_page_id
+        notion_page_id: Optional[str] = task.notion_page_id
+        with self._stage(timings, "notion_save"):
             summary_storage = self.summary_storage_factory()
             storage_result = summary_storage.save(
                 title=task.title,
@@ -270,21 +655,23 @@ class ProcessingWorker:
                 url=task.url,
             )
 
-            if isinstance(storage_result, dict):
-                raw_page_id = storage_result.get("page_id")
-                if raw_page_id:
-                    notion_page_id = str(raw_page_id)
-                    task.notion_page_id = notion_page_id
-
-            duration = time.time() - start_time
-            self.db.update_task_status(
-                task.id,
-                "Completed",
-                title=task.title,
-                summary=summarized_text,
-                processing_duration=duration,
-                notion_page_id=notion_page_id,
-            )
+        if isinstance(storage_result, dict):
+            raw_page_id = storage_result.get("page_id")
+            if raw_page_id:
+                notion_page_id = str(raw_page_id)
+                task.notion_page_id = notion_page_id
+
+        duration = time.time() - start_time
+        self.db.update_task_status(
+            task.id,
+            "Completed",
+            title=task.title,
+            summary=summarized_text,
+            processing_duration=duration,
+            notion_page_id=notion_page_id,
+        )
+        self._index_transcript(task, transcription_text)
+        with self._stage(timings, "notify"):
             self.notifier(
                 task.title or "untitled",
                 task.url,
@@ -292,23 +679,104 @@ class ProcessingWorker:
                 notion_url=cfg.notion_url,
                 notion_task_id=notion_page_id,
             )
-            logger.info(
-                f"Worker {self.worker_id} completed task {task.id} in {duration:.2f} seconds"
-            )
-            return True
+        PIPELINE_TASK_SECONDS.observe(duration, outcome="completed")
+        PIPELINE_TASKS_TOTAL.inc(outcome="completed")
+        timings.outcome = "completed"
+        timings.total_duration = time.time() - start_time
+        self._record_stage_timings(timings)
+        logger.info(
+            f"Worker {self.worker_id} completed task {task.id} in {duration:.2f} seconds"
+        )
+        return True
 
-        except Exception as exc:  # pragma: no cover - the heavy pipeline is mocked in tests
-            duration = time.time() - start_time
-            logger.error(
-                f"Worker {self.worker_id} failed to process task {task.id}: {exc}"
-            )
-            self.db.update_task_status(
-                task.id,
-                "Failed",
-                error_message=str(exc),
-                processing_duration=duration,
+    def _archive_old_tasks(self) -> None:
+        if self.archive_after_days <= 0:
+            return
+        try:
+            archive_old_tasks(self.db, self.archive_after_days)
+        except Exception as exc:  # pragma: no cover - defensive guard
+            logger.warning(f"Task archival failed: {exc}")
+
+    def _index_transcript(self, task: Task, transcription_text: str) -> None:
+        """Add the transcript to the search index; never fails the task."""
+        if not self.search_index_transcripts or not transcription_text:
+            return
+        try:
+            self.db.index_task_transcript(task.id, transcription_text)
+        except Exception as exc:
+            logger.warning(f"Could not index transcript of task {task.id}: {exc}")
+
+    def _fail_task(
+        self,
+        task: Task,
+        timings: TaskStageTimings,
+        exc: Exception,
+        start_time: float,
+    ) -> bool:
+        if self.prefetcher is not None:
+            # Media prefetched for a task that failed before using it.
+            self.prefetcher.discard(task.id)
+        if isinstance(exc, TaskDeferred) and self._defer_task(task, timings, exc, start_time):
+            return True
+        duration = time.time() - start_time
+        logger.error(
+            f"Worker {self.worker_id} failed to process task {task.id}: {exc}"
+        )
+        self.db.update_task_status(
+            task.id,
+            "Failed",
+            error_message=str(exc),
+            processing_duration=duration,
+        )
+        PIPELINE_TASK_SECONDS.observe(duration, outcome="failed")
+        PIPELINE_TASKS_TOTAL.inc(outcome="failed")
+        timings.outcome = "failed"
+        timings.total_duration = duration
+        self._record_stage_timings(timings)
+        return False
+
+    def _defer_task(
+        self,
+        task: Task,
+        timings: TaskStageTimings,
+        exc: TaskDeferred,
+        start_time: float,
+    ) -> bool:
+        until = utc_now_naive() + timedelta(seconds=exc.delay_seconds)
+        if not self.db.defer_task(task.id, self.worker_id, until):
+            logger.warning(
+                f"Worker {self.worker_id} could not defer task {task.id} "
+                "(unsupported backend or claim lost); marking it failed."
             )
             return False
+        logger.info(
+            f"Worker {self.worker_id} deferred task {task.id} until {until:%Y-%m-%d %H:%M:%S} UTC: {exc}"
+        )
+        PIPELINE_TASKS_TOTAL.inc(outcome="deferred")
+        timings.outcome = "deferred"
+        timings.total_duration = time.time() - start_time
+        self._record_stage_timings(timings)
+        return True
+
+
+@dataclass
+class _PreparedTask:
+    """A downloaded task waiting for (batched) transcription."""
+
+    task: Task
+    timings: TaskStageTimings
+    start_time: float = field(default_factory=time.time)
+    file_path: str = ""
+    options: TranscriptionOptions = field(default_factory=TranscriptionOptions)
+    audio_duration: Optional[float] = None
+    transcript: Optional[str] = None
+
+
+def _numeric_attribute(obj: object, name: str) -> Optional[float]:
+    value = getattr(obj, name, None)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
 
 
 def get_db_client(db_type: Optional[str] = None) -> BaseDB:
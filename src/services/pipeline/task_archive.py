@@ -0,0 +1,38 @@
+"""Move finished tasks older than the retention window out of the active table."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.core.logger import logger
+from src.core.time_utils import utc_now_naive
+from src.domain.interfaces.database import BaseDB
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def archive_old_tasks(
+    db: BaseDB,
+    retention_days: float,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    now: Optional[datetime] = None,
+) -> int:
+    """Archive completed/failed tasks not updated for ``retention_days``.
+
+    Works in batches of ``batch_size`` so each transaction stays short.
+    Returns how many tasks were archived (0 when retention is disabled).
+    """
+    if retention_days <= 0:
+        return 0
+    before = (now or utc_now_naive()) - timedelta(days=retention_days)
+    total = 0
+    while True:
+        moved = db.archive_tasks(before, limit=batch_size)
+        total += moved
+        if moved < batch_size:
+            break
+    if total:
+        logger.info(f"Archived {total} task(s) last updated before {before:%Y-%m-%d %H:%M:%S}")
+    return total
@@ -0,0 +1,192 @@
+"""Out-of-process transcription over the SQLite ``transcription_jobs`` table.
+
+Whisper is CPU-bound; running it in the API process (via
+``schedule_processing_job``) makes request handling compete with it for the
+GIL. With ``TRANSCRIPTION_EXECUTOR=queue`` the processing worker hands each
+transcription to a ``QueuedTranscriber``, which enqueues a job and sleeps while
+polling for the result. Dedicated ``python -m src.apps.workers.transcription_worker``
+processes claim jobs, keep their model loaded between jobs and write the
+transcript back.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import fields
+from typing import Any, Callable, Iterator, Optional
+
+from src.core.logger import logger
+from src.domain.transcripts.jobs import JOB_COMPLETED, JOB_FAILED, TranscriptionJob
+from src.infrastructure.media.transcription.options import TranscriptionOptions
+from src.infrastructure.media.transcription.transcriber import Transcriber
+from src.infrastructure.persistence.sqlite.transcription_job_repository import (
+    SQLiteTranscriptionJobRepository,
+)
+
+
+class TranscriptionQueueError(RuntimeError):
+    """Raised when a queued transcription fails or never completes."""
+
+
+class QueuedTranscriber:
+    """Drop-in for ``Transcriber`` that waits on a transcription worker process."""
+
+    def __init__(
+        self,
+        repository: SQLiteTranscriptionJobRepository,
+        model_size: str = "base",
+        *,
+        poll_interval_seconds: float = 0.5,
+        timeout_seconds: float = 7200.0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        **options: Any,
+    ):
+        self.repository = repository
+        self.options = {"model_size": model_size, **options}
+        self.poll_interval_seconds = poll_interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self._sleep = sleep
+        self._clock = clock
+        self.last_audio_duration: Optional[float] = None
+
+    def transcribe(self, file_path: str) -> str:
+        job_id = self.repository.enqueue(os.path.abspath(file_path), self.options)
+        logger.info(f"Queued transcription job {job_id} for {file_path}")
+        deadline = self._clock() + self.timeout_seconds
+        while True:
+            job = self.repository.get_job(job_id)
+            if job is None:
+                raise TranscriptionQueueError(f"Transcription job {job_id} disappeared")
+            if job.status == JOB_COMPLETED:
+                self.last_audio_duration = job.audio_duration
+                self.repository.delete_job(job_id)
+                return job.transcript or ""
+            if job.status == JOB_FAILED:
+                self.repository.delete_job(job_id)
+                raise TranscriptionQueueError(
+                    f"Transcription job {job_id} failed: {job.error_message}"
+                )
+            if self._clock() >= deadline:
+                self.repository.delete_job(job_id)
+                raise TranscriptionQueueError(
+                    f"Timed out after {self.timeout_seconds:.0f}s waiting for "
+                    f"transcription job {job_id}; is a transcription worker running?"
+                )
+            self._sleep(self.poll_interval_seconds)
+
+
+_OPTION_FIELDS = frozenset(field.name for field in fields(TranscriptionOptions))
+
+
+def options_for_job(job: TranscriptionJob) -> TranscriptionOptions:
+    known = {key: value for key, value in job.options.items() if key in _OPTION_FIELDS}
+    return TranscriptionOptions(**known)
+
+
+class TranscriptionJobWorker:
+    """Claims transcription jobs and runs them with a model kept warm between jobs."""
+
+    def __init__(
+        self,
+        repository: SQLiteTranscriptionJobRepository,
+        worker_id: Optional[str] = None,
+        *,
+        transcriber_factory: Optional[Callable[..., Any]] = None,
+        stale_after_seconds: int = 900,
+        heartbeat_interval_seconds: float = 30.0,
+        poll_interval_seconds: float = 1.0,
+    ):
+        self.repository = repository
+        self.worker_id = worker_id or f"transcriber-{uuid.uuid4().hex}"
+        self.transcriber_factory = transcriber_factory or (
+            lambda model_size, **options: Transcriber(model_size=model_size, **options)
+        )
+        self.stale_after_seconds = stale_after_seconds
+        self.heartbeat_interval_seconds = heartbeat_interval_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        # Only the most recent configuration is kept so memory holds one model.
+        self._cached_options: Optional[TranscriptionOptions] = None
+        self._cached_transcriber: Any = None
+
+    def _transcriber_for(self, options: TranscriptionOptions):
+        if self._cached_transcriber is None or options != self._cached_options:
+            self._cached_transcriber = self.transcriber_factory(
+                options.model_size, **options.transcriber_kwargs()
+            )
+            self._cached_options = options
+        return self._cached_transcriber
+
+    @contextmanager
+    def _heartbeat(self, job_id: str) -> Iterator[None]:
+        stop = threading.Event()
+
+        def _beat() -> None:
+            while not stop.wait(self.heartbeat_interval_seconds):
+                try:
+                    self.repository.heartbeat(job_id, self.worker_id)
+                except Exception as exc:
+                    logger.warning(f"Failed to refresh transcription job {job_id}: {exc}")
+
+        thread = threading.Thread(target=_beat, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join(timeout=1.0)
+
+    def run_once(self) -> Optional[bool]:
+        """Process one job. Returns None when the queue is empty."""
+        job = self.repository.claim_next(self.worker_id, self.stale_after_seconds)
+        if job is None:
+            return None
+        logger.info(f"[{self.worker_id}] Transcribing job {job.id}: {job.file_path}")
+        try:
+            transcriber = self._transcriber_for(options_for_job(job))
+            with self._heartbeat(job.id):
+                text = transcriber.transcribe(job.file_path)
+        except Exception as exc:
+            logger.error(f"[{self.worker_id}] Transcription job {job.id} failed: {exc}")
+            self._record(self.repository.fail(job.id, self.worker_id, str(exc)), job.id)
+            return False
+        return self._record(
+            self.repository.complete(
+                job.id,
+                self.worker_id,
+                text,
+                getattr(transcriber, "last_audio_duration", None),
+            ),
+            job.id,
+        )
+
+    def _record(self, recorded: bool, job_id: str) -> bool:
+        if not recorded:
+            logger.warning(
+                f"[{self.worker_id}] Transcription job {job_id} was reclaimed by another "
+                "worker; discarding this result."
+            )
+        return recorded
+
+    def run(
+        self,
+        *,
+        stop_event: Optional[threading.Event] = None,
+        exit_when_idle: bool = False,
+    ) -> int:
+        """Process jobs until stopped; returns the number of jobs handled."""
+        stop_event = stop_event or threading.Event()
+        handled = 0
+        while not stop_event.is_set():
+            result = self.run_once()
+            if result is None:
+                if exit_when_idle:
+                    break
+                stop_event.wait(self.poll_interval_seconds)
+                continue
+            handled += 1
+        return handled
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import threading
+import time
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from datetime import datetime
 
 from src.core.config import Config
 from src.core.logger import logger
+from src.core.metrics import DOWNLOADED_BYTES_TOTAL, RSS_ENQUEUED_TOTAL, RSS_POLL_SECONDS
 from src.core.time_utils import as_utc, utc_now
 from src.core.utils.url import extract_video_id, normalize_youtube_url
 from src.domain.rss.models import RSSChannelSubscription, RSSPollResult
@@ -45,6 +47,7 @@ class YouTubeRSSFeedClient:
             raise RuntimeError("requests is required for RSS monitoring.")
         response = requests.get(feed_url, timeout=15)
         response.raise_for_status()
+        DOWNLOADED_BYTES_TOTAL.inc(len(response.content or b""), source="rss_feed")
         return self.parse_entries(response.text)
 
     def parse_entries(self, xml_text: str) -> list[YouTubeFeedEntry]:
@@ -162,6 +165,12 @@ class RSSChannelMonitor:
             stopper.wait(poll_interval)
 
     def _poll_subscription(self, subscription: RSSChannelSubscription) -> RSSPollResult:
+        started = time.perf_counter()
+        result = self._poll_subscription_once(subscription)
+        RSS_POLL_SECONDS.observe(time.perf_counter() - started, outcome=result.status)
+        return result
+
+    def _poll_subscription_once(self, subscription: RSSChannelSubscription) -> RSSPollResult:
         checked_at = utc_now()
         result = RSSPollResult(
             subscription_id=subscription.id,
@@ -193,8 +202,10 @@ class RSSChannelMonitor:
                 enqueue_result = self.task_client.enqueue_task(entry.url, subscription.channel_id)
                 if enqueue_result.created:
                     result.new_tasks += 1
+                    RSS_ENQUEUED_TOTAL.inc(result="created")
                 else:
                     result.duplicates += 1
+                    RSS_ENQUEUED_TOTAL.inc(result="duplicate")
 
             updated_watermark = subscription.last_processed_published_at
             if new_entries:
@@ -0,0 +1,59 @@
+"""Incremental reader over a backend's task change feed.
+
+``TaskChangeFeed.poll`` returns the tasks updated since the previous poll
+(``list_tasks_changed_since``) and the ids of tasks deleted or archived in
+the meantime (``list_task_deletions_since``). Timestamps have one-second
+resolution and a transaction may stamp a time before another one that
+commits first, so every poll re-reads from ``FEED_OVERLAP`` before the newest
+timestamp seen; consumers must apply changes idempotently. Shared by the
+in-process dedup cache and related-tasks index.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.domain.interfaces.database import BaseDB
+from src.domain.tasks.models import Task
+
+FEED_OVERLAP = timedelta(seconds=10)
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@dataclass
+class TaskChanges:
+    updated: list[Task] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.updated) + len(self.deleted)
+
+
+class TaskChangeFeed:
+    """Watermark over one backend's feed; callers serialize ``poll``."""
+
+    def __init__(self) -> None:
+        self._watermark: Optional[str] = None
+
+    def poll(self, db: BaseDB) -> TaskChanges:
+        since = self._since()
+        changes = db.list_tasks_changed_since(since)
+        # A full read has nothing to delete.
+        deletions = db.list_task_deletions_since(since) if since is not None else []
+        for stamp in [updated_at for updated_at, _ in changes] + [
+            deleted_at for deleted_at, _ in deletions
+        ]:
+            if self._watermark is None or stamp > self._watermark:
+                self._watermark = stamp
+        return TaskChanges(
+            updated=[task for _, task in changes],
+            deleted=[str(task_id) for _, task_id in deletions],
+        )
+
+    def _since(self) -> Optional[str]:
+        if self._watermark is None:
+            return None
+        newest = datetime.strptime(self._watermark[:19], _TIMESTAMP_FORMAT)
+        return (newest - FEED_OVERLAP).strftime(_TIMESTAMP_FORMAT)
@@ -0,0 +1,121 @@
+"""In-process video index answering ``find_recent_task_by_url`` for task creation.
+
+It holds the id, status and creation time of every non-failed task per video.
+Before a lookup it compares the backend's ``tasks`` change counter with the one
+it last synced to and, if it moved, re-reads changed and deleted rows through
+``TaskChangeFeed``. Triggers bump the counter on writes from any process, so
+API processes and workers can share the database. Notion has no counter and
+always uses the backend lookup.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from src.core.metrics import record_cache_lookup
+from src.core.utils.url import extract_video_id
+from src.domain.interfaces.database import BaseDB
+from src.domain.tasks.models import Task
+from src.services.tasks.change_feed import TaskChangeFeed
+
+FAILED_STATUSES = frozenset({"Failed", "Failed Retry Created"})
+
+
+@dataclass(frozen=True)
+class DedupEntry:
+    task_id: str
+    url: str
+    status: str
+    created_at: Optional[datetime]
+
+    def to_task(self) -> Task:
+        return Task(id=self.task_id, url=self.url, status=self.status, created_at=self.created_at)
+
+
+class TaskDedupCache:
+    """Video id -> non-failed tasks, synced to the backend's change counter."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._by_key: dict[str, dict[str, DedupEntry]] = {}
+        self._key_by_task: dict[str, str] = {}
+        self._version: Optional[int] = None
+        self._feed = TaskChangeFeed()
+
+    def __len__(self) -> int:
+        return len(self._key_by_task)
+
+    def find_recent_task(self, db: BaseDB, url: str) -> Optional[Task]:
+        """Newest non-failed active task for ``url``, like ``find_recent_task_by_url``.
+
+        Archived tasks only come from the backend fallback; callers that must
+        see them on a miss use ``db.find_recent_task_by_url`` directly.
+        """
+        if not self.sync(db):
+            return db.find_recent_task_by_url(url)
+        with self._lock:
+            candidates = self._by_key.get(extract_video_id(url) or url)
+            entry = max(candidates.values(), key=_newest_first) if candidates else None
+        record_cache_lookup("dedup", hit=entry is not None)
+        return entry.to_task() if entry else None
+
+    def sync(self, db: BaseDB) -> bool:
+        """Apply changes made since the last sync; False if ``db`` has no change counter."""
+        version = db.get_change_version("tasks")
+        if not isinstance(version, int):
+            return False
+        with self._lock:
+            if version == self._version:
+                return True
+            changes = self._feed.poll(db)
+            for task in changes.updated:
+                self._apply(task)
+            for task_id in changes.deleted:
+                self._discard(task_id)
+            self._version = version
+        return True
+
+    def record(self, task: Task) -> None:
+        """Track a task this process just created or changed."""
+        with self._lock:
+            self._apply(task)
+
+    def _apply(self, task: Task) -> None:
+        task_id = str(task.id)
+        self._discard(task_id)
+        if task.status in FAILED_STATUSES or not task.url:
+            return
+        key = task.video_id or extract_video_id(task.url) or task.url
+        self._by_key.setdefault(key, {})[task_id] = DedupEntry(
+            task_id=task_id, url=task.url, status=task.status, created_at=task.created_at
+        )
+        self._key_by_task[task_id] = key
+
+    def _discard(self, task_id: str) -> None:
+        previous_key = self._key_by_task.pop(task_id, None)
+        if previous_key is not None:
+            entries = self._by_key.get(previous_key, {})
+            entries.pop(task_id, None)
+            if not entries:
+                self._by_key.pop(previous_key, None)
+
+
+def _newest_first(entry: DedupEntry) -> tuple[datetime, int]:
+    return entry.created_at or datetime.min, int(entry.task_id)
+
+
+_CACHES: dict[str, TaskDedupCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_dedup_cache(db: BaseDB) -> TaskDedupCache:
+    """Process-wide cache for one database (keyed by its SQLite path)."""
+    key = str(getattr(db, "db_path", type(db).__name__))
+    with _CACHES_LOCK:
+        cache = _CACHES.get(key)
+        if cache is None:
+            cache = _CACHES[key] = TaskDedupCache()
+        return cache
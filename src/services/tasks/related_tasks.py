@@ -0,0 +1,251 @@
+"""Local "related videos" index over completed task summaries.
+
+Summaries are tokenized (lower-cased words for Latin text, character bigrams
+for CJK text, which has no word boundaries) into sparse term-frequency
+vectors. Vectors and postings are stored in compact ``array`` buffers keyed by
+integer term ids, and similar tasks are ranked with BM25 using the source
+summary's highest-weighted terms as the query, so a lookup touches only a few
+postings lists. The index follows the database through its change feed
+(``TaskChangeFeed``): tasks that become ``Completed`` are added, edited
+summaries are re-indexed and tasks that leave ``Completed`` or are deleted or
+archived are dropped, which also picks up tasks finished by workers in other
+processes.
+Everything runs in-process; nothing is sent to external services.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from src.domain.interfaces.database import BaseDB
+from src.domain.tasks.models import Task
+from src.services.tasks.change_feed import TaskChangeFeed
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Terms of the source summary used as the "more like this" query.
+QUERY_TERMS = 32
+# Compact the postings once this many removed documents linger in them.
+COMPACT_AFTER_REMOVALS = 256
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_CJK_RE = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+_STOPWORDS = frozenset(
+    """a an and are as at be but by for from has have how in is it its of on or
+    that the this to was were what when which who will with you your""".split()
+)
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    """Word tokens for Latin text and character bigrams for CJK runs."""
+    if not text:
+        return []
+    lowered = text.lower()
+    tokens = [
+        word
+        for word in _WORD_RE.findall(_CJK_RE.sub(" ", lowered))
+        if len(word) > 1 and word not in _STOPWORDS
+    ]
+    for run in _CJK_RE.findall(lowered):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[index : index + 2] for index in range(len(run) - 1))
+    return tokens
+
+
+@dataclass(frozen=True)
+class RelatedTask:
+    task_id: str
+    title: str
+    url: str
+    score: float
+
+
+class RelatedTasksIndex:
+    """Incremental BM25 index; one per database, shared by request threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._vocabulary: dict[str, int] = {}
+        self._df = array("I")
+        # Per document slot: term ids / frequencies, length and liveness.
+        self._doc_terms: list[array] = []
+        self._doc_freqs: list[array] = []
+        self._doc_len = array("I")
+        self._alive = bytearray()
+        self._doc_meta: list[tuple[str, str, str]] = []
+        self._slot_by_task: dict[str, int] = {}
+        self._digest_by_task: dict[str, int] = {}
+        # term id -> (document slots, term frequencies)
+        self._postings: dict[int, tuple[array, array]] = {}
+        self._total_len = 0
+        self._removed = 0
+        self._feed = TaskChangeFeed()
+
+    def __len__(self) -> int:
+        return len(self._slot_by_task)
+
+    def refresh(self, db: BaseDB) -> int:
+        """Apply tasks changed since the last refresh; returns how many changed."""
+        with self._lock:
+            changes = self._feed.poll(db)
+            for task in changes.updated:
+                self.update(task)
+            for task_id in changes.deleted:
+                self._remove(task_id)
+            return len(changes)
+
+    def update(self, task: Task) -> None:
+        """Index ``task`` if it is completed with a summary, otherwise drop it."""
+        task_id = str(task.id)
+        text = task.summary if task.status == "Completed" else ""
+        with self._lock:
+            if not text:
+                self._remove(task_id)
+                return
+            digest = hash((task.title, text))
+            if self._digest_by_task.get(task_id) == digest:
+                return
+            self._remove(task_id)
+            counts = Counter(tokenize(f"{task.title}\n{text}"))
+            if not counts:
+                return
+            self._add(task_id, task, digest, counts)
+
+    def related(self, task_id: str, limit: int = 5) -> list[RelatedTask]:
+        """Top ``limit`` tasks most similar to ``task_id`` (empty if not indexed)."""
+        with self._lock:
+            slot = self._slot_by_task.get(str(task_id))
+            if slot is None or limit <= 0:
+                return []
+            alive_docs = len(self._slot_by_task)
+            average_len = self._total_len / max(1, alive_docs)
+            query = sorted(
+                zip(self._doc_terms[slot], self._doc_freqs[slot]),
+                key=lambda item: item[1] * self._idf(item[0], alive_docs),
+                reverse=True,
+            )[:QUERY_TERMS]
+
+            scores: dict[int, float] = {}
+            for term_id, _ in query:
+                idf = self._idf(term_id, alive_docs)
+                slots, freqs = self._postings[term_id]
+                for other, freq in zip(slots, freqs):
+                    if other == slot or not self._alive[other]:
+                        continue
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_len[other] / average_len)
+                    scores[other] = scores.get(other, 0.0) + idf * freq * (BM25_K1 + 1) / (
+                        freq + norm
+                    )
+            best = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+            return [
+                RelatedTask(*self._doc_meta[other], score=round(score, 4))
+                for other, score in best
+            ]
+
+    def _idf(self, term_id: int, docs: int) -> float:
+        df = self._df[term_id]
+        return math.log(1.0 + (docs - df + 0.5) / (df + 0.5))
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._vocabulary.get(term)
+        if term_id is None:
+            term_id = len(self._vocabulary)
+            self._vocabulary[term] = term_id
+            self._df.append(0)
+        return term_id
+
+    def _add(self, task_id: str, task: Task, digest: int, counts: Counter) -> None:
+        slot = len(self._doc_meta)
+        items = sorted((self._term_id(term), count) for term, count in counts.items())
+        terms = array("I", (term_id for term_id, _ in items))
+        freqs = array("H", (min(count, 0xFFFF) for _, count in items))
+        length = sum(counts.values())
+        self._doc_terms.append(terms)
+        self._doc_freqs.append(freqs)
+        self._doc_len.append(length)
+        self._alive.append(1)
+        self._doc_meta.append((task_id, task.title or "", task.url))
+        self._slot_by_task[task_id] = slot
+        self._digest_by_task[task_id] = digest
+        self._total_len += length
+        for term_id, freq in zip(terms, freqs):
+            self._df[term_id] += 1
+            postings = self._postings.get(term_id)
+            if postings is None:
+                postings = self._postings[term_id] = (array("I"), array("H"))
+            postings[0].append(slot)
+            postings[1].append(freq)
+
+    def _remove(self, task_id: str) -> None:
+        slot = self._slot_by_task.pop(task_id, None)
+        self._digest_by_task.pop(task_id, None)
+        if slot is None:
+            return
+        self._alive[slot] = 0
+        self._total_len -= self._doc_len[slot]
+        for term_id in self._doc_terms[slot]:
+            self._df[term_id] -= 1
+        self._removed += 1
+        if self._removed >= COMPACT_AFTER_REMOVALS:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rebuild postings without removed documents."""
+        live = [slot for slot in range(len(self._doc_meta)) if self._alive[slot]]
+        documents = [
+            (self._doc_meta[slot], self._doc_terms[slot], self._doc_freqs[slot], self._doc_len[slot])
+            for slot in live
+        ]
+        self._doc_terms, self._doc_freqs, self._doc_meta = [], [], []
+        self._doc_len, self._alive = array("I"), bytearray()
+        self._postings = {}
+        for new_slot, (meta, terms, freqs, length) in enumerate(documents):
+            self._doc_terms.append(terms)
+            self._doc_freqs.append(freqs)
+            self._doc_len.append(length)
+            self._alive.append(1)
+            self._doc_meta.append(meta)
+            self._slot_by_task[meta[0]] = new_slot
+            for term_id, freq in zip(terms, freqs):
+                postings = self._postings.get(term_id)
+                if postings is None:
+                    postings = self._postings[term_id] = (array("I"), array("H"))
+                postings[0].append(new_slot)
+                postings[1].append(freq)
+        self._removed = 0
+
+
+_INDEXES: dict[str, RelatedTasksIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_related_index(key: str) -> RelatedTasksIndex:
+    """Process-wide index for one database (e.g. its SQLite path)."""
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = _INDEXES[key] = RelatedTasksIndex()
+        return index
+
+
+def find_related_tasks(db: BaseDB, task_id: str, limit: int = 5) -> list[RelatedTask]:
+    """Bring the shared index for ``db`` up to date and return related tasks."""
+    index = get_related_index(str(getattr(db, "db_path", id(db))))
+    index.refresh(db)
+    return index.related(task_id, limit)
+
+
+def build_index(tasks: Iterable[Task]) -> RelatedTasksIndex:
+    """Index a fixed set of tasks (benchmarks, tests)."""
+    index = RelatedTasksIndex()
+    for task in tasks:
+        index.update(task)
+    return index
@@ -0,0 +1,146 @@
+"""Aggregate persisted per-stage timings into percentile summaries."""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Iterable, Sequence
+
+from src.core.time_utils import utc_now_naive
+from src.domain.interfaces.database import BaseDB
+from src.domain.tasks.models import TaskStageTimings
+
+DEFAULT_PERCENTILES: tuple[int, ...] = (50, 90, 95, 99)
+# Upper bound on buckets per summary; each bucket is summarized separately.
+MAX_BUCKETS = 500
+
+
+def percentile(values: Sequence[float], pct: float) -> float | None:
+    """Linear-interpolated percentile of ``values`` (0 <= pct <= 100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return float(ordered[0])
+    rank = (pct / 100.0) * (len(ordered) - 1)
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return float(ordered[lower])
+    weight = rank - lower
+    return float(ordered[lower] * (1 - weight) + ordered[upper] * weight)
+
+
+def summarize_values(
+    values: Sequence[float],
+    percentiles: Sequence[int] = DEFAULT_PERCENTILES,
+) -> dict[str, float | int | None]:
+    summary: dict[str, float | int | None] = {
+        "count": len(values),
+        "mean": (sum(values) / len(values)) if values else None,
+        "max": max(values) if values else None,
+    }
+    for pct in percentiles:
+        summary[f"p{pct}"] = percentile(values, pct)
+    return summary
+
+
+def _summarize_records(
+    records: Iterable[TaskStageTimings],
+    percentiles: Sequence[int],
+) -> dict[str, object]:
+    stage_values: dict[str, list[float]] = defaultdict(list)
+    totals: list[float] = []
+    realtime_factors: dict[str, list[float]] = defaultdict(list)
+    outcomes: dict[str, int] = defaultdict(int)
+    task_count = 0
+
+    for record in records:
+        task_count += 1
+        outcomes[record.outcome] += 1
+        for stage, seconds in record.stage_durations.items():
+            stage_values[stage].append(float(seconds))
+        if record.total_duration is not None:
+            totals.append(float(record.total_duration))
+        transcription_seconds = record.stage_durations.get("transcription")
+        if transcription_seconds is not None and record.audio_duration:
+            model = record.transcription_model or "unknown"
+            realtime_factors[model].append(
+                float(transcription_seconds) / float(record.audio_duration)
+            )
+
+    return {
+        "task_count": task_count,
+        "outcomes": dict(outcomes),
+        "total": summarize_values(totals, percentiles),
+        "stages": {
+            stage: summarize_values(values, percentiles)
+            for stage, values in sorted(stage_values.items())
+        },
+        "transcription_realtime_factor": {
+            model: summarize_values(values, percentiles)
+            for model, values in sorted(realtime_factors.items())
+        },
+    }
+
+
+def aggregate_stage_timings(
+    records: Sequence[TaskStageTimings],
+    *,
+    window_start: datetime,
+    window_end: datetime,
+    bucket_seconds: int | None = None,
+    percentiles: Sequence[int] = DEFAULT_PERCENTILES,
+) -> list[dict[str, object]]:
+    """Group records into time buckets and summarize each bucket.
+
+    Without ``bucket_seconds`` the whole window is summarized as a single bucket.
+    Raises ``ValueError`` when the window would split into more than
+    ``MAX_BUCKETS`` buckets.
+    """
+    span_seconds = max((window_end - window_start).total_seconds(), 0.0)
+    step = bucket_seconds if bucket_seconds and bucket_seconds > 0 else span_seconds
+    bucket_count = max(1, math.ceil(span_seconds / step)) if step else 1
+    if bucket_count > MAX_BUCKETS:
+        raise ValueError(f"window would produce {bucket_count} buckets (max {MAX_BUCKETS}).")
+
+    buckets: list[list[TaskStageTimings]] = [[] for _ in range(bucket_count)]
+    for record in records:
+        if record.recorded_at is None:
+            continue
+        if record.recorded_at < window_start or record.recorded_at > window_end:
+            continue
+        offset = (record.recorded_at - window_start).total_seconds()
+        index = min(int(offset // step), bucket_count - 1) if step else 0
+        buckets[index].append(record)
+
+    results: list[dict[str, object]] = []
+    for index, bucket_records in enumerate(buckets):
+        start = window_start + timedelta(seconds=step * index)
+        end = min(window_start + timedelta(seconds=step * (index + 1)), window_end)
+        summary = _summarize_records(bucket_records, percentiles)
+        summary["start"] = start
+        summary["end"] = end
+        results.append(summary)
+    return results
+
+
+def load_stage_timing_summary(
+    db: BaseDB,
+    *,
+    window_hours: float = 24,
+    bucket_hours: float | None = None,
+    now: datetime | None = None,
+) -> list[dict[str, object]]:
+    """Read stage timings for the trailing window and aggregate them."""
+    window_end = now or utc_now_naive()
+    window_start = window_end - timedelta(hours=window_hours)
+    records = db.list_task_stage_timings(since=window_start)
+    bucket_seconds = max(1, int(bucket_hours * 3600)) if bucket_hours else None
+    return aggregate_stage_timings(
+        records,
+        window_start=window_start,
+        window_end=window_end,
+        bucket_seconds=bucket_seconds,
+    )
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from src.core.metrics import record_cache_lookup
 from src.core.time_utils import as_utc, utc_now
-from src.domain.interfaces.database import BaseDB
+from src.domain.interfaces.database import ActiveTaskExistsError, BaseDB
 from src.domain.tasks.models import Task
+from src.services.tasks.dedup_cache import TaskDedupCache
 
 
 @dataclass
@@ -27,8 +29,17 @@ def create_task_record(
     source_channel_id: str | None = None,
     cache_ttl_seconds: int = 3600,
     completed_task_policy: str = "cache_ttl",
+    transcription_options: dict | None = None,
+    priority: int = 0,
+    dedup_cache: TaskDedupCache | None = None,
 ) -> TaskCreationResult:
-    existing_task = db.find_recent_task_by_url(url)
+    if dedup_cache is None:
+        existing_task = db.find_recent_task_by_url(url)
+    else:
+        existing_task = dedup_cache.find_recent_task(db, url)
+        if existing_task is None and completed_task_policy == "block_existing":
+            # The cache only covers active tasks; archived ones still block.
+            existing_task = db.find_recent_task_by_url(url)
     if existing_task is not None:
         if existing_task.status in ("Pending", "Processing"):
             return TaskCreationResult(
@@ -50,6 +61,7 @@ def create_task_record(
             if existing_task.created_at:
                 age_seconds = (utc_now() - as_utc(existing_task.created_at)).total_seconds()
                 if age_seconds < cache_ttl_seconds:
+                    record_cache_lookup("task_result", hit=True)
                     return TaskCreationResult(
                         outcome="cached_completed",
                         task=existing_task,
@@ -60,11 +72,28 @@ def create_task_record(
                         cached=True,
                     )
 
-    task = db.add_task(
-        url,
-        source_type=source_type,
-        source_channel_id=source_channel_id,
-    )
+    record_cache_lookup("task_result", hit=False)
+    extra: dict[str, object] = {}
+    if transcription_options:
+        extra["transcription_options"] = transcription_options
+    if priority:
+        extra["priority"] = priority
+    try:
+        task = db.add_task(
+            url,
+            source_type=source_type,
+            source_channel_id=source_channel_id,
+            **extra,
+        )
+    except ActiveTaskExistsError as exc:
+        # Another request queued the same video since the lookup above.
+        return TaskCreationResult(
+            outcome="duplicate_active",
+            task=exc.task,
+            message=f"A task for this video is already queued ({exc.video_id}).",
+        )
+    if dedup_cache is not None:
+        dedup_cache.record(task)
     return TaskCreationResult(
         outcome="created",
         task=task,
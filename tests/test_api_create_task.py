@@ -34,10 +34,11 @@ if "notion_client" not in sys.modules:  # pragma: no cover - testing scaffold
 try:  # pragma: no cover - avoid hard dependency in minimal envs
     from fastapi import HTTPException, status
     from fastapi.testclient import TestClient
-    from src.apps.api.main import app
+    from src.apps.api.main import _load_database, app
 except ModuleNotFoundError:  # pragma: no cover - testing scaffold
     TestClient = None
     app = None
+    _load_database = None
     HTTPException = RuntimeError  # type: ignore
     status = types.SimpleNamespace(HTTP_500_INTERNAL_SERVER_ERROR=500)  # type: ignore
 
@@ -52,6 +53,7 @@ class TestCreateTaskEndpoint(unittest.TestCase):
     """Tests for the POST /tasks endpoint."""
 
     def setUp(self) -> None:
+        _load_database.cache_clear()  # the API keeps one client per backend
         self.client = TestClient(app)
         self.valid_url = "https://youtu.be/dQw4w9WgXcQ"
         self.normalized_url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
@@ -223,6 +225,65 @@ class TestCreateTaskEndpoint(unittest.TestCase):
         )
         mock_schedule.assert_called_once_with(db_type="notion", db=mock_db, worker_id=None)
 
+    def test_create_task_passes_transcription_overrides(self) -> None:
+        mock_db = MagicMock()
+        mock_db.find_recent_task_by_url.return_value = None
+        mock_db.add_task.return_value = Task(
+            id="43",
+            url=self.normalized_url,
+            status="Pending",
+        )
+
+        with patch("src.apps.api.main.DBFactory.get_db", return_value=mock_db):
+            with patch(
+                "src.apps.api.main.schedule_processing_job",
+                return_value=SchedulingResult(
+                    accepted=False,
+                    worker_id=None,
+                    message="Processing worker already running.",
+                ),
+            ):
+                response = self.client.post(
+                    "/tasks",
+                    json={
+                        "url": self.valid_url,
+                        "transcription": {
+                            "model_size": "base",
+                            "compute_type": "FLOAT32",
+                            "cpu_threads": "auto",
+                            "beam_size": 1,
+                        },
+                    },
+                )
+
+        self.assertEqual(response.status_code, 201)
+        mock_db.add_task.assert_called_once_with(
+            self.normalized_url,
+            source_type="manual",
+            source_channel_id=None,
+            transcription_options={
+                "model_size": "base",
+                "compute_type": "float32",
+                "cpu_threads": "auto",
+                "beam_size": 1,
+            },
+        )
+
+    def test_create_task_rejects_invalid_transcription_overrides(self) -> None:
+        with patch("src.apps.api.main.DBFactory.get_db") as mock_get_db:
+            response = self.client.post(
+                "/tasks",
+                json={"url": self.valid_url, "transcription": {"compute_type": "int3"}},
+            )
+            unknown_model = self.client.post(
+                "/tasks",
+                json={"url": self.valid_url, "transcription": {"model_size": "gigantic"}},
+            )
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(unknown_model.status_code, 422)
+        mock_get_db.assert_not_called()
+
     def test_create_task_db_factory_error(self) -> None:
         with patch(
             "src.apps.api.main.DBFactory.get_db",
@@ -449,6 +510,7 @@ class TestCreateTaskEndpoint(unittest.TestCase):
 @unittest.skipIf(TestClient is None, "fastapi is not installed")
 class TestRSSSubscriptionEndpoint(unittest.TestCase):
     def setUp(self) -> None:
+        _load_database.cache_clear()  # the API keeps one client per backend
         self.client = TestClient(app)
 
     def test_create_rss_subscription_success(self) -> None:
@@ -507,6 +569,7 @@ class TestRetryTaskEndpoint(unittest.TestCase):
     """Tests for the POST /tasks/{task_id}/retry endpoint."""
 
     def setUp(self) -> None:
+        _load_database.cache_clear()  # the API keeps one client per backend
         self.client = TestClient(app)
 
     def test_retry_task_success_for_failed(self) -> None:
@@ -594,6 +657,7 @@ class TestProcessingLockEndpoints(unittest.TestCase):
     """Tests for the GET/DELETE /processing-lock endpoints."""
 
     def setUp(self) -> None:
+        _load_database.cache_clear()  # the API keeps one client per backend
         self.client = TestClient(app)
         self.admin_token = "lock-secret"
 
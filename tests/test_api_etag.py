@@ -0,0 +1,159 @@
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest.mock import patch
+
+if "notion_client" not in sys.modules:  # pragma: no cover - testing scaffold
+    notion_stub = types.ModuleType("notion_client")
+
+    class _Client:  # minimal stub
+        def __init__(self, *_, **__):
+            pass
+
+    notion_stub.Client = _Client
+    sys.modules["notion_client"] = notion_stub
+
+try:  # pragma: no cover - avoid hard dependency in minimal envs
+    from fastapi.testclient import TestClient
+    from src.apps.api.main import _load_database, app
+except ModuleNotFoundError:  # pragma: no cover - testing scaffold
+    TestClient = None
+    app = None
+    _load_database = None
+
+from src.apps.api.http_cache import build_etag, etag_matches
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.infrastructure.persistence.sqlite.rss_subscription_repository import (
+    SQLiteRSSSubscriptionRepository,
+)
+
+URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+
+class TestHttpCache(unittest.TestCase):
+    def test_etag_depends_on_version_and_parameters(self):
+        etag = build_etag("tasks", 3, "limit=10")
+
+        self.assertTrue(etag.startswith('W/"tasks-3-'))
+        self.assertNotEqual(etag, build_etag("tasks", 4, "limit=10"))
+        self.assertNotEqual(etag, build_etag("tasks", 3, "limit=20"))
+        self.assertIsNone(build_etag("tasks", None))
+        self.assertTrue(etag_matches(f'"other", {etag.removeprefix("W/")}', etag))
+        self.assertTrue(etag_matches("*", etag))
+        self.assertFalse(etag_matches(None, etag))
+
+
+@unittest.skipIf(TestClient is None, "fastapi is not installed")
+class TestReadEndpointETags(unittest.TestCase):
+    def setUp(self):
+        _load_database.cache_clear()  # the API keeps one client per backend
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = SQLiteDB(db_path=os.path.join(self.tmpdir.name, "tasks.db"))
+        self.client = TestClient(app)
+        self.patcher = patch("src.apps.api.main.DBFactory.get_db", return_value=self.db)
+        self.get_db = self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.tmpdir.cleanup()
+
+    def test_task_list_revalidates_until_tasks_change(self):
+        task = self.db.add_task(URL)
+
+        first = self.client.get("/tasks", params={"limit": 10})
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers["Cache-Control"], "private, no-cache")
+        self.assertEqual([item["task_id"] for item in first.json()["tasks"]], [task.id])
+        etag = first.headers["ETag"]
+
+        with patch.object(self.db, "list_tasks") as list_tasks:
+            unchanged = self.client.get(
+                "/tasks", params={"limit": 10}, headers={"If-None-Match": etag}
+            )
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(unchanged.headers["ETag"], etag)
+        list_tasks.assert_not_called()
+        self.get_db.assert_called_once_with("sqlite")  # one client per process
+
+        other_page = self.client.get(
+            "/tasks", params={"limit": 5}, headers={"If-None-Match": etag}
+        )
+        self.assertEqual(other_page.status_code, 200)
+
+        self.db.update_task_status(task.id, "Completed", title="Done", summary="總結")
+        changed = self.client.get("/tasks", params={"limit": 10}, headers={"If-None-Match": etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["ETag"], etag)
+        self.assertEqual(changed.json()["tasks"][0]["status"], "Completed")
+
+    def test_task_list_pages_and_filters(self):
+        ids = [self.db.add_task(f"https://www.youtube.com/watch?v=video{n:06d}").id for n in range(3)]
+        self.db.update_task_status(ids[0], "Completed")
+
+        page = self.client.get("/tasks", params={"limit": 1, "offset": 1}).json()
+        completed = self.client.get("/tasks", params={"status": "Completed"}).json()
+
+        self.assertEqual((page["total"], [t["task_id"] for t in page["tasks"]]), (3, [ids[1]]))
+        self.assertEqual([t["task_id"] for t in completed["tasks"]], [ids[0]])
+
+    def test_task_detail(self):
+        task = self.db.add_task(URL)
+        self.db.update_task_status(task.id, "Completed", title="Done", summary="總結")
+
+        detail = self.client.get(f"/tasks/{task.id}")
+        self.assertEqual(detail.status_code, 200)
+        self.assertEqual(detail.json()["summary"], "總結")
+
+        with patch.object(self.db, "get_task_by_id") as lookup:
+            unchanged = self.client.get(
+                f"/tasks/{task.id}", headers={"If-None-Match": detail.headers["ETag"]}
+            )
+        self.assertEqual(unchanged.status_code, 304)
+        lookup.assert_not_called()
+        self.assertEqual(self.client.get("/tasks/999").status_code, 404)
+
+    def test_rss_subscriptions(self):
+        repository = SQLiteRSSSubscriptionRepository(db_path=self.db.db_path)
+        channel_id = "UC" + "a" * 22
+        repository.add_subscription(
+            channel_id=channel_id,
+            feed_url=f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}",
+            title="Channel",
+        )
+
+        first = self.client.get("/rss/subscriptions")
+        self.assertEqual([item["channel_id"] for item in first.json()["subscriptions"]], [channel_id])
+        etag = first.headers["ETag"]
+
+        self.assertEqual(
+            self.client.get("/rss/subscriptions", headers={"If-None-Match": etag}).status_code, 304
+        )
+        self.db.add_task(URL)  # writes to other tables keep the tag valid
+        self.assertEqual(
+            self.client.get("/rss/subscriptions", headers={"If-None-Match": etag}).status_code, 304
+        )
+        repository.set_enabled(first.json()["subscriptions"][0]["subscription_id"], False)
+        self.assertEqual(
+            self.client.get("/rss/subscriptions", headers={"If-None-Match": etag}).status_code, 200
+        )
+
+    def test_processing_lock_status(self):
+        headers = {"X-Maintainer-Token": "secret"}
+        with patch.dict(os.environ, {"PROCESSING_LOCK_ADMIN_TOKEN": "secret"}):
+            first = self.client.get("/processing-lock", headers=headers)
+            etag = first.headers["ETag"]
+            unchanged = self.client.get("/processing-lock", headers={**headers, "If-None-Match": etag})
+            self.assertTrue(self.db.acquire_processing_lock("worker-1"))
+            locked = self.client.get("/processing-lock", headers={**headers, "If-None-Match": etag})
+            unauthorized = self.client.get("/processing-lock", headers={"If-None-Match": etag})
+
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(locked.status_code, 200)
+        self.assertEqual(locked.json()["snapshot"]["worker_id"], "worker-1")
+        self.assertEqual(unauthorized.status_code, 401)
+
+
+if __name__ == "__main__":
+    unittest.main()
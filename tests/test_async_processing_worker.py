@@ -0,0 +1,145 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.services.pipeline.async_runner import AsyncProcessingWorker
+
+
+class _Tracker:
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    async def hold(self, seconds=0.05):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self.in_flight -= 1
+
+
+class TestAsyncProcessingWorker(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = SQLiteDB(db_path=os.path.join(self.tmpdir.name, "tasks.db"))
+        self.config = SimpleNamespace(
+            transcription_model_size="tiny",
+            transcription_concurrency=1,
+            notion_url="https://notion.example",
+            discord_webhook_url="https://discord.example/webhook",
+            data_dir=self.tmpdir.name,
+        )
+        self.downloads = _Tracker()
+        self.transcribe_threads = set()
+        self.notified = []
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _worker(self, concurrency):
+        tracker = self.downloads
+        threads = self.transcribe_threads
+
+        class _Downloader:
+            def __init__(self, url, output_path):
+                self.url = url
+
+            async def adownload(self):
+                await tracker.hold()
+                return {"path": f"/media/{self.url[-3:]}.mp3", "title": f"title {self.url[-3:]}"}
+
+        class _Transcriber:
+            last_audio_duration = 60.0
+
+            def __init__(self, model_size, **_options):
+                pass
+
+            def transcribe(self, path):
+                threads.add(threading.current_thread().name)
+                return f"transcript of {path}"
+
+        class _Summarizer:
+            last_model_label = "stub:model"
+
+            async def asummarize(self, title, text):
+                return f"summary: {text}"
+
+        class _Storage:
+            async def asave(self, *, title, text, model, url):
+                return {"page_id": f"page-{url[-3:]}"}
+
+        async def _notify(title, url, webhook, **kwargs):
+            self.notified.append((title, kwargs["notion_task_id"]))
+            return True
+
+        return AsyncProcessingWorker(
+            self.db,
+            worker_id="async-test",
+            concurrency=concurrency,
+            downloader_factory=_Downloader,
+            transcriber_factory=_Transcriber,
+            summarizer_factory=_Summarizer,
+            summary_storage_factory=_Storage,
+            file_manager_factory=lambda: MagicMock(),
+            async_notifier=_notify,
+            config_factory=lambda: self.config,
+        )
+
+    def test_runs_io_stages_concurrently_and_completes_tasks(self):
+        for index in range(6):
+            self.db.add_task(f"https://youtu.be/vid{index:03d}")
+
+        summary = self._worker(concurrency=4).run()
+
+        self.assertTrue(summary.acquired_lock)
+        self.assertEqual((summary.processed_tasks, summary.failed_tasks), (6, 0))
+        self.assertGreater(self.downloads.peak, 1)
+        self.assertEqual(len(self.transcribe_threads), 1)
+        self.assertTrue(all(name.startswith("async-test-transcribe") for name in self.transcribe_threads))
+        tasks = self.db.get_all_tasks()
+        self.assertTrue(all(task.status == "Completed" for task in tasks))
+        self.assertIn("summary: transcript of /media/002.mp3", {task.summary for task in tasks})
+        self.assertEqual(len(self.notified), 6)
+        self.assertIsNone(self.db.read_processing_lock().worker_id)
+
+    def test_media_cache_eviction_runs_off_the_event_loop(self):
+        self.db.add_task("https://youtu.be/dQw4w9WgXcQ")
+        worker = self._worker(concurrency=1)
+        evict_threads = []
+        worker.media_cache = MagicMock()
+        worker.media_cache.evict.side_effect = (
+            lambda: evict_threads.append(threading.current_thread())
+        )
+
+        summary = worker.run()
+
+        self.assertEqual(summary.processed_tasks, 1)
+        worker.media_cache.pin.assert_called_once_with("dQw4w9WgXcQ")
+        worker.media_cache.unpin.assert_called_once_with("dQw4w9WgXcQ")
+        self.assertEqual(len(evict_threads), 1)
+        self.assertIsNot(evict_threads[0], threading.main_thread())
+
+    def test_failed_task_is_marked_and_lock_released(self):
+        self.db.add_task("https://youtu.be/bad")
+        worker = self._worker(concurrency=2)
+        worker.summarizer_factory = lambda: SimpleNamespace(
+            summarize=MagicMock(side_effect=RuntimeError("llm down"))
+        )
+
+        summary = worker.run()
+
+        self.assertEqual((summary.processed_tasks, summary.failed_tasks), (0, 1))
+        task = self.db.get_all_tasks()[0]
+        self.assertEqual(task.status, "Failed")
+        self.assertIn("llm down", task.error_message)
+        self.assertIsNone(self.db.read_processing_lock().worker_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import os
+import sqlite3
+import tempfile
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.services.pipeline.processing_runner import ProcessingWorker
+
+DURATIONS = {
+    "/tmp/aaaaaaaaaaa.wav": 30.0,
+    "/tmp/bbbbbbbbbbb.wav": 90.0,
+    "/tmp/ccccccccccc.wav": 1800.0,
+    "/tmp/ddddddddddd.wav": 20.0,
+}
+
+
+class TestBatchedTranscription(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.NamedTemporaryFile(delete=False)
+        self.tmp.close()
+        self.db = SQLiteDB(db_path=self.tmp.name)
+        self.batch_calls = []
+        self.single_calls = []
+
+    def tearDown(self):
+        try:
+            os.unlink(self.tmp.name)
+        except FileNotFoundError:
+            pass
+
+    def _worker(self, batch_tasks=4, executor="inline"):
+        def downloader_factory(url, output_path):
+            video_id = url.rsplit("=", 1)[-1]
+            return MagicMock(
+                download=MagicMock(
+                    return_value={"path": f"/tmp/{video_id}.wav", "title": video_id}
+                )
+            )
+
+        def batch_transcriber_factory(options, batch_size):
+            def transcribe_many(paths):
+                self.batch_calls.append((list(paths), batch_size))
+                return [f"batched {os.path.basename(path)}" for path in paths]
+
+            return MagicMock(transcribe_many=transcribe_many)
+
+        def transcriber_factory(model_size, **options):
+            def transcribe(path):
+                self.single_calls.append(path)
+                return f"single {os.path.basename(path)}"
+
+            return MagicMock(transcribe=transcribe, last_audio_duration=None)
+
+        summarizer = MagicMock(last_model_label="mock")
+        summarizer.summarize.side_effect = lambda title, text: f"summary of {text}"
+
+        return ProcessingWorker(
+            self.db,
+            worker_id="batch-worker",
+            downloader_factory=downloader_factory,
+            transcriber_factory=transcriber_factory,
+            summarizer_factory=lambda: summarizer,
+            summary_storage_factory=lambda: MagicMock(save=MagicMock(return_value={})),
+            file_manager_factory=MagicMock,
+            notifier=MagicMock(return_value=True),
+            config_factory=lambda: types.SimpleNamespace(
+                transcription_model_size="tiny",
+                transcription_batch_tasks=batch_tasks,
+                transcription_executor=executor,
+                transcription_batch_size=16,
+                transcription_batch_max_audio_seconds=120,
+                notion_url=None,
+                discord_webhook_url=None,
+                data_dir="data",
+            ),
+            batch_transcriber_factory=batch_transcriber_factory,
+            audio_duration_probe=DURATIONS.get,
+        )
+
+    def test_short_clips_are_batched_and_results_fanned_out(self):
+        tasks = [
+            self.db.add_task(f"https://www.youtube.com/watch?v={video_id}")
+            for video_id in ("aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc", "ddddddddddd")
+        ]
+
+        summary = self._worker().run()
+
+        self.assertEqual(summary.processed_tasks, 4)
+        self.assertEqual(
+            self.batch_calls,
+            [(["/tmp/aaaaaaaaaaa.wav", "/tmp/bbbbbbbbbbb.wav", "/tmp/ddddddddddd.wav"], 16)],
+        )
+        self.assertEqual(self.single_calls, ["/tmp/ccccccccccc.wav"])
+        stored = {task.id: self.db.get_task_by_id(task.id) for task in tasks}
+        self.assertEqual(stored[tasks[1].id].summary, "summary of batched bbbbbbbbbbb.wav")
+        self.assertEqual(stored[tasks[2].id].summary, "summary of single ccccccccccc.wav")
+
+        timings = {record.task_id: record for record in self.db.list_task_stage_timings()}
+        self.assertEqual(timings[tasks[0].id].audio_duration, 30.0)
+        self.assertIn("transcription", timings[tasks[3].id].stage_durations)
+
+    def test_waiting_batch_members_keep_their_task_locks(self):
+        for video_id in ("aaaaaaaaaaa", "bbbbbbbbbbb"):
+            self.db.add_task(f"https://www.youtube.com/watch?v={video_id}")
+        worker = self._worker(batch_tasks=2)
+        download = worker.downloader_factory
+        rival_claims = []
+
+        def slow_first_download(url, output_path):
+            if not rival_claims:
+                # The first download outlasts the task lock timeout...
+                conn = sqlite3.connect(self.tmp.name)
+                conn.execute("UPDATE tasks SET locked_at = '2000-01-01 00:00:00'")
+                conn.commit()
+                conn.close()
+                # ...but the heartbeat refreshes every claimed task, not just this one.
+                worker._refresh_task_locks()
+                rival_claims.append(self.db.acquire_next_task("rival", 900))
+            return download(url, output_path)
+
+        worker.downloader_factory = slow_first_download
+        outcomes = worker.process_next_batch()
+
+        self.assertEqual(outcomes, [True, True])
+        self.assertEqual(rival_claims, [None])
+        self.assertEqual(worker._claimed_task_ids, set())
+
+    def test_batch_limit_of_one_keeps_per_task_path(self):
+        self.db.add_task("https://www.youtube.com/watch?v=aaaaaaaaaaa")
+        self.db.add_task("https://www.youtube.com/watch?v=ddddddddddd")
+
+        summary = self._worker(batch_tasks=1).run()
+
+        self.assertEqual(summary.processed_tasks, 2)
+        self.assertEqual(self.batch_calls, [])
+        self.assertEqual(len(self.single_calls), 2)
+
+    def test_test_mode_and_queue_executor_skip_the_batch_model(self):
+        for video_id in ("aaaaaaaaaaa", "ddddddddddd"):
+            self.db.add_task(f"https://www.youtube.com/watch?v={video_id}")
+
+        with patch.dict(os.environ, {"FORCE_TEST_MODE": "1"}):
+            outcomes = self._worker().process_next_batch()
+
+        self.assertEqual(outcomes, [True, True])
+        self.assertEqual(self.batch_calls, [])
+        self.assertEqual(len(self.single_calls), 2)
+        self.assertEqual(self._worker(executor="queue").batch_task_limit, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from benchmarks.pipeline_bench import compare_with_baseline
+from benchmarks.stubs.fixtures import wav_duration_seconds, write_tone_wav
+from benchmarks.stubs.servers import install_fake_yt_dlp
+
+try:  # pragma: no cover - avoid hard dependency in minimal envs
+    from src.infrastructure.media.downloader import YouTubeDownloader
+except ModuleNotFoundError:  # pragma: no cover - testing scaffold
+    YouTubeDownloader = None
+
+
+@unittest.skipIf(YouTubeDownloader is None, "downloader dependencies are not installed")
+class TestFakeYtDlp(unittest.TestCase):
+    def test_downloader_resolves_fixture_through_fake_binary(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fixture = write_tone_wav(os.path.join(tmpdir, "fixture.wav"), 1.5)
+            bin_dir = os.path.join(tmpdir, "bin")
+            install_fake_yt_dlp(bin_dir)
+            env = {
+                "PATH": bin_dir + os.pathsep + os.environ.get("PATH", ""),
+                "FAKE_YTDLP_FIXTURE": fixture,
+            }
+
+            with patch.dict(os.environ, env):
+                result = YouTubeDownloader(
+                    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                    output_path=tmpdir,
+                    backend="subprocess",
+                ).download()
+
+            self.assertEqual(
+                result["path"], os.path.join(tmpdir, "videos", "dQw4w9WgXcQ.wav")
+            )
+            self.assertEqual(result["title"], "Benchmark video dQw4w9WgXcQ")
+            self.assertAlmostEqual(wav_duration_seconds(result["path"]), 1.5)
+
+
+class TestBaselineComparison(unittest.TestCase):
+    def _scenario(self, throughput, download_p95):
+        return {
+            "queue_size": 5,
+            "workers": 2,
+            "throughput_tasks_per_min": throughput,
+            "stages": {"download": {"count": 5, "p50": 0.1, "p95": download_p95}},
+        }
+
+    def test_reports_throughput_and_stage_regressions(self):
+        baseline = {"scenarios": [self._scenario(100.0, 1.0)]}
+
+        regressions = compare_with_baseline([self._scenario(80.0, 1.5)], baseline, 10.0)
+
+        self.assertEqual(len(regressions), 2)
+        self.assertIn("throughput", regressions[0])
+        self.assertIn("download p95", regressions[1])
+
+    def test_changes_within_threshold_are_ignored(self):
+        baseline = {"scenarios": [self._scenario(100.0, 1.0)]}
+
+        self.assertEqual(
+            compare_with_baseline([self._scenario(95.0, 1.05)], baseline, 10.0), []
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+
+from src.domain.transcripts import TranscriptSegment
+from src.infrastructure.media.transcription.chunked import (
+    ChunkPlan,
+    plan_chunks,
+    stitch_segments,
+)
+from src.infrastructure.media.transcription.options import resolve_transcription_options
+
+
+class TestPlanChunks(unittest.TestCase):
+    def test_cuts_in_the_middle_of_silence(self):
+        spans = [(0.0, 250.0), (260.0, 550.0), (570.0, 900.0)]
+
+        plans = plan_chunks(
+            spans, total_duration=900.0, max_chunk_seconds=600.0, overlap_seconds=2.0
+        )
+
+        self.assertEqual(len(plans), 2)
+        self.assertEqual(plans[0].keep_until, 560.0)
+        self.assertEqual(plans[1].keep_from, 560.0)
+        self.assertEqual((plans[0].start, plans[0].end), (0.0, 552.0))
+        self.assertEqual((plans[1].start, plans[1].end), (568.0, 900.0))
+
+    def test_hard_splits_a_span_longer_than_the_limit(self):
+        plans = plan_chunks(
+            [(0.0, 1000.0)], total_duration=1000.0, max_chunk_seconds=400.0, overlap_seconds=5.0
+        )
+
+        self.assertEqual([plan.keep_from for plan in plans[1:]], [400.0, 800.0])
+        self.assertEqual((plans[1].start, plans[1].end), (395.0, 805.0))
+        for plan in plans:
+            self.assertLessEqual(plan.end - plan.start, 400.0 + 2 * 5.0)
+
+    def test_no_speech_yields_no_chunks(self):
+        self.assertEqual(plan_chunks([], total_duration=60.0, max_chunk_seconds=30.0), [])
+
+    def test_rejects_non_positive_limit(self):
+        with self.assertRaises(ValueError):
+            plan_chunks([(0.0, 1.0)], total_duration=1.0, max_chunk_seconds=0)
+
+
+class TestStitchSegments(unittest.TestCase):
+    def test_overlap_duplicates_are_removed_and_order_restored(self):
+        plans = [
+            ChunkPlan(index=0, start=0.0, end=105.0, keep_from=float("-inf"), keep_until=100.0),
+            ChunkPlan(index=1, start=95.0, end=200.0, keep_from=100.0, keep_until=float("inf")),
+        ]
+        results = {
+            1: [
+                TranscriptSegment(96.0, 99.0, " tail-dup"),
+                TranscriptSegment(99.0, 103.0, " boundary"),
+                TranscriptSegment(120.0, 130.0, " later"),
+            ],
+            0: [
+                TranscriptSegment(0.0, 10.0, " start"),
+                TranscriptSegment(96.0, 99.0, " tail"),
+                TranscriptSegment(99.5, 104.0, " boundary-dup"),
+            ],
+        }
+
+        stitched = stitch_segments(plans, results)
+
+        self.assertEqual(
+            "".join(segment.text for segment in stitched),
+            " start tail boundary later",
+        )
+
+
+class TestChunkedOptions(unittest.TestCase):
+    def test_auto_chunk_workers_share_cores_with_model_threads(self):
+        config = type(
+            "Cfg",
+            (),
+            {"transcription_chunked": True, "transcription_cpu_threads": "auto"},
+        )()
+
+        options = resolve_transcription_options(config, cpu_count=16)
+
+        self.assertEqual(options.chunk_workers, 8)
+        self.assertEqual(options.cpu_threads, 2)
+
+    def test_explicit_chunk_workers_override(self):
+        config = type("Cfg", (), {"transcription_cpu_threads": "auto"})()
+
+        options = resolve_transcription_options(
+            config, {"chunked": True, "chunk_workers": 4}, cpu_count=16
+        )
+
+        self.assertEqual(options.chunk_workers, 4)
+        self.assertEqual(options.cpu_threads, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import os
+import shutil
+import tempfile
+import types
+import unittest
+
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.services.pipeline.prefetcher import DownloadPrefetcher
+from src.services.pipeline.processing_runner import ProcessingWorker
+
+
+class _FakeDownloader:
+    calls: list[str] = []
+
+    def __init__(self, url, output_path, size=10):
+        self.url = url
+        self.output_path = output_path
+        self.size = size
+
+    def download(self):
+        _FakeDownloader.calls.append(self.url)
+        path = os.path.join(self.output_path, self.url.rsplit("/", 1)[-1] + ".mp3")
+        with open(path, "wb") as handle:
+            handle.write(b"x" * self.size)
+        return {"path": path, "title": self.url}
+
+
+class TestDownloadPrefetcher(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db = SQLiteDB(db_path=os.path.join(self.tmpdir, "tasks.db"))
+        _FakeDownloader.calls = []
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _prefetcher(self, **kwargs):
+        return DownloadPrefetcher(self.db, _FakeDownloader, self.tmpdir, **kwargs)
+
+    def test_peek_does_not_claim_tasks(self):
+        first = self.db.add_task("https://youtu.be/alpha")
+        self.db.add_task("https://youtu.be/bravo")
+
+        peeked = self.db.peek_pending_tasks(1)
+
+        self.assertEqual([task.id for task in peeked], [first.id])
+        self.assertEqual(self.db.get_task_by_id(first.id).status, "Pending")
+
+    def test_run_once_downloads_lookahead_and_take_consumes(self):
+        first = self.db.add_task("https://youtu.be/alpha")
+        self.db.add_task("https://youtu.be/bravo")
+        self.db.add_task("https://youtu.be/charlie")
+
+        prefetcher = self._prefetcher(lookahead=2)
+        self.assertEqual(prefetcher.run_once(), 2)
+        self.assertEqual(
+            _FakeDownloader.calls, ["https://youtu.be/alpha", "https://youtu.be/bravo"]
+        )
+        # Already prefetched tasks are not downloaded twice.
+        self.assertEqual(prefetcher.run_once(), 0)
+
+        result = prefetcher.take(first.id)
+        self.assertEqual(result["title"], "https://youtu.be/alpha")
+        self.assertIsNone(prefetcher.take(first.id))
+
+    def test_keeps_results_for_own_claims_and_purges_finished_or_foreign(self):
+        alpha = self.db.add_task("https://youtu.be/alpha")
+        bravo = self.db.add_task("https://youtu.be/bravo")
+        charlie = self.db.add_task("https://youtu.be/charlie")
+        prefetcher = self._prefetcher(lookahead=3, worker_id="worker-1")
+        self.assertEqual(prefetcher.run_once(), 3)
+
+        self.assertEqual(self.db.acquire_next_task("worker-1", 900).id, alpha.id)
+        self.assertEqual(self.db.acquire_next_task("worker-2", 900).id, bravo.id)
+        self.db.update_task_status(charlie.id, "Completed")
+        prefetcher.run_once()
+
+        self.assertIsNotNone(prefetcher.take(alpha.id))
+        self.assertIsNone(prefetcher.take(bravo.id))
+        self.assertIsNone(prefetcher.take(charlie.id))
+
+    def test_discard_drops_result(self):
+        task = self.db.add_task("https://youtu.be/alpha")
+        prefetcher = self._prefetcher()
+        prefetcher.run_once()
+
+        prefetcher.discard(task.id)
+
+        self.assertEqual(prefetcher.prefetched_bytes(), 0)
+        self.assertIsNone(prefetcher.take(task.id))
+
+    def test_disk_budget_limits_prefetching(self):
+        self.db.add_task("https://youtu.be/alpha")
+        self.db.add_task("https://youtu.be/bravo")
+
+        prefetcher = self._prefetcher(lookahead=2, disk_budget_bytes=5)
+
+        self.assertEqual(prefetcher.run_once(), 1)
+        self.assertEqual(prefetcher.prefetched_bytes(), 10)
+
+    def test_take_ignores_missing_files(self):
+        task = self.db.add_task("https://youtu.be/alpha")
+        prefetcher = self._prefetcher()
+        prefetcher.run_once()
+        os.remove(os.path.join(self.tmpdir, "alpha.mp3"))
+
+        self.assertIsNone(prefetcher.take(task.id))
+
+    def test_worker_uses_prefetched_media(self):
+        task = self.db.add_task("https://youtu.be/alpha")
+        prefetcher = self._prefetcher()
+        prefetcher.run_once()
+
+        def downloader_factory(url, output_path):
+            raise AssertionError("prefetched media should skip the downloader")
+
+        worker = ProcessingWorker(
+            self.db,
+            downloader_factory=downloader_factory,
+            config_factory=lambda: types.SimpleNamespace(
+                transcription_model_size="tiny",
+                notion_url=None,
+                discord_webhook_url=None,
+                data_dir=self.tmpdir,
+            ),
+        )
+        worker.prefetcher = prefetcher
+        result = worker._take_prefetched(task)
+
+        self.assertEqual(result["path"], os.path.join(self.tmpdir, "alpha.mp3"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import subprocess
+import sys
+import unittest
+
+from benchmarks.import_bench import (
+    REPO_ROOT,
+    ImportRecord,
+    check_budgets,
+    heavy_modules_in,
+    measure_target,
+    parse_importtime,
+)
+from src.infrastructure.llm import backends
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       900 |       1500 |     torch._C
+import time:      3000 |       4500 |   torch
+import time:       400 |       5020 | src.apps.api.main
+"""
+
+
+class TestImportBench(unittest.TestCase):
+    def test_parse_importtime_reads_depth_and_times(self):
+        records = parse_importtime(SAMPLE)
+
+        self.assertEqual(len(records), 4)
+        self.assertEqual(records[1], ImportRecord("torch._C", 900, 1500, 2))
+        self.assertEqual(records[-1], ImportRecord("src.apps.api.main", 400, 5020, 0))
+
+    def test_heavy_modules_and_budget_failures(self):
+        records = parse_importtime(SAMPLE)
+        self.assertEqual(heavy_modules_in(records), ["torch"])
+
+        failures = check_budgets(
+            {
+                "api": {"import_ms": 5.0, "heavy_modules": ["torch"]},
+                "cli": {"import_ms": 900.0, "heavy_modules": []},
+            },
+            {"api": 100.0, "cli": 500.0},
+        )
+
+        self.assertEqual(len(failures), 2)
+        self.assertIn("torch", failures[0])
+        self.assertIn("cli: 900 ms exceeds budget 500 ms", failures[1])
+
+    def test_api_start_up_does_not_load_sdks_or_backends(self):
+        result = measure_target("src.apps.api.main", runs=1)
+
+        self.assertEqual(result["heavy_modules"], [])
+
+    def test_worker_import_defers_backend_modules(self):
+        script = (
+            "import sys, src.services.pipeline.processing_runner\n"
+            "print(sorted(m for m in sys.modules if m.startswith("
+            "('src.infrastructure.llm.backends.', 'faster_whisper', 'whisper'))))"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        self.assertEqual(proc.stdout.strip(), "[]")
+
+
+class TestBackendRegistry(unittest.TestCase):
+    def test_unknown_backend_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            backends.load_backend("does-not-exist")
+
+    def test_missing_sdk_surfaces_as_import_error(self):
+        backends.register_backend("broken", "benchmarks.no_such_backend_module", "Backend")
+        try:
+            with self.assertRaises(ImportError) as ctx:
+                backends.load_backend("broken")
+            self.assertIn("broken backend", str(ctx.exception))
+        finally:
+            backends._REGISTRY.pop("broken", None)
+
+    def test_registered_backend_is_loaded_once(self):
+        backends.register_backend("bench", "benchmarks.import_bench", "ImportRecord")
+        try:
+            self.assertIs(backends.load_backend("bench"), ImportRecord)
+            self.assertIn("bench", backends.backend_names())
+        finally:
+            backends._REGISTRY.pop("bench", None)
+            backends._LOADED.pop("bench", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
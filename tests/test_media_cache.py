@@ -0,0 +1,153 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.infrastructure.media.downloader import YouTubeDownloader
+from src.infrastructure.media.media_cache import MediaCache
+
+
+class _Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestMediaCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.videos = os.path.join(self.tmpdir, "videos")
+        os.makedirs(self.videos)
+        self.clock = _Clock()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _write(self, video_id, size=10):
+        path = os.path.join(self.videos, f"{video_id}.mp4")
+        with open(path, "wb") as handle:
+            handle.write(b"x" * size)
+        return path
+
+    def _cache(self, **kwargs):
+        return MediaCache(self.videos, clock=self.clock, **kwargs)
+
+    def test_lru_eviction_keeps_recently_used_files(self):
+        cache = self._cache(max_bytes=25)
+        first = self._write("aaaaaaaaaaa")
+        cache.add("aaaaaaaaaaa", first)
+        self.clock.now += 1
+        second = self._write("bbbbbbbbbbb")
+        cache.add("bbbbbbbbbbb", second)
+        self.clock.now += 1
+        cache.lookup("aaaaaaaaaaa")
+        self.clock.now += 1
+        third = self._write("ccccccccccc")
+        cache.add("ccccccccccc", third)
+
+        self.assertTrue(os.path.exists(first))
+        self.assertFalse(os.path.exists(second))
+        self.assertTrue(os.path.exists(third))
+        self.assertEqual(cache.total_bytes(), 20)
+
+    def test_pinned_files_are_not_evicted(self):
+        cache = self._cache(max_bytes=15)
+        first = self._write("aaaaaaaaaaa")
+        cache.add("aaaaaaaaaaa", first)
+        self.clock.now += 1
+        with cache.pinned("aaaaaaaaaaa"):
+            second = self._write("bbbbbbbbbbb")
+            cache.add("bbbbbbbbbbb", second)
+            self.assertTrue(os.path.exists(first))
+            self.assertTrue(os.path.exists(second))
+
+        cache.evict()
+        self.assertFalse(os.path.exists(first))
+        self.assertTrue(os.path.exists(second))
+
+    def test_instances_sharing_a_directory_merge_their_entries(self):
+        first_process = self._cache()
+        second_process = self._cache()
+        first_process.lookup("nothing-yet")  # read the index before the other instance writes
+
+        first_process.add("aaaaaaaaaaa", self._write("aaaaaaaaaaa"), "First")
+        second_process.add("bbbbbbbbbbb", self._write("bbbbbbbbbbb"), "Second")
+        first_process.lookup("aaaaaaaaaaa")
+
+        reloaded = self._cache()
+        self.assertEqual(reloaded.lookup("aaaaaaaaaaa").title, "First")
+        self.assertEqual(reloaded.lookup("bbbbbbbbbbb").title, "Second")
+
+    def test_pins_of_live_processes_are_honoured_and_stale_ones_dropped(self):
+        cache = self._cache(max_age_seconds=60)
+        live = self._write("aaaaaaaaaaa")
+        stale = self._write("bbbbbbbbbbb")
+        cache.add("aaaaaaaaaaa", live)
+        cache.add("bbbbbbbbbbb", stale)
+        exited = subprocess.Popen([sys.executable, "-c", "pass"])
+        exited.wait()
+        pins = os.path.join(self.videos, ".pins")
+        os.makedirs(pins)
+        open(os.path.join(pins, f"aaaaaaaaaaa.{os.getppid()}"), "w").close()
+        open(os.path.join(pins, f"bbbbbbbbbbb.{exited.pid}"), "w").close()
+        self.clock.now += 61
+
+        self.assertEqual(cache.evict(), [stale])
+        self.assertTrue(os.path.exists(live))
+        self.assertEqual(os.listdir(pins), [f"aaaaaaaaaaa.{os.getppid()}"])
+
+    def test_pin_is_visible_to_other_instances(self):
+        owner = self._cache()
+        other = self._cache(max_age_seconds=60)
+        path = self._write("aaaaaaaaaaa")
+        owner.add("aaaaaaaaaaa", path)
+        self.clock.now += 61
+
+        with owner.pinned("aaaaaaaaaaa"):
+            self.assertEqual(other.evict(), [])
+        self.assertEqual(os.listdir(os.path.join(self.videos, ".pins")), [])
+        self.assertEqual(other.evict(), [path])
+
+    def test_age_based_eviction(self):
+        cache = self._cache(max_age_seconds=60)
+        path = self._write("aaaaaaaaaaa")
+        cache.add("aaaaaaaaaaa", path)
+        self.clock.now += 61
+
+        self.assertEqual(cache.evict(), [path])
+        self.assertIsNone(cache.lookup("aaaaaaaaaaa"))
+
+    def test_index_persists_titles_and_picks_up_existing_files(self):
+        cache = self._cache()
+        cache.add("aaaaaaaaaaa", self._write("aaaaaaaaaaa"), "First")
+        self._write("bbbbbbbbbbb")
+
+        reloaded = self._cache()
+
+        self.assertEqual(reloaded.lookup("aaaaaaaaaaa").title, "First")
+        self.assertEqual(
+            reloaded.lookup("bbbbbbbbbbb").path, os.path.join(self.videos, "bbbbbbbbbbb.mp4")
+        )
+
+    def test_downloader_cache_hit_skips_yt_dlp(self):
+        cache = self._cache()
+        path = self._write("dQw4w9WgXcQ")
+        cache.add("dQw4w9WgXcQ", path, "Cached title")
+        downloader = YouTubeDownloader(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ", self.tmpdir, media_cache=cache
+        )
+
+        with patch("src.infrastructure.media.downloader.subprocess.run") as mock_run:
+            result = downloader.download()
+
+        mock_run.assert_not_called()
+        self.assertEqual(result, {"path": path, "title": "Cached title"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import os
+import tempfile
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.core.metrics import (
+    PIPELINE_STAGE_SECONDS,
+    PIPELINE_TASKS_TOTAL,
+    REGISTRY,
+    MetricsRegistry,
+)
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.services.pipeline.processing_runner import ProcessingWorker
+
+PIPELINE_STAGES = ("download", "transcription", "summarization", "file_save", "notion_save", "notify")
+
+try:  # pragma: no cover - avoid hard dependency in minimal envs
+    from fastapi.testclient import TestClient
+    from src.apps.api.main import _load_database, app
+except ModuleNotFoundError:  # pragma: no cover - testing scaffold
+    TestClient = None
+    app = None
+    _load_database = None
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_counter_and_gauge_render_with_labels(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("demo_total", "Demo counter.", ("kind",))
+        gauge = registry.gauge("demo_depth", "Demo gauge.", ("status",))
+
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+        gauge.set(5, status='Pen"ding')
+
+        text = registry.render()
+
+        self.assertIn("# TYPE demo_total counter", text)
+        self.assertIn('demo_total{kind="a"} 3', text)
+        self.assertIn('demo_depth{status="Pen\\"ding"} 5', text)
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram(
+            "demo_seconds", "Demo histogram.", ("stage",), buckets=(1.0, 5.0)
+        )
+
+        histogram.observe(0.5, stage="x")
+        histogram.observe(3.0, stage="x")
+        histogram.observe(10.0, stage="x")
+
+        text = registry.render()
+
+        self.assertIn('demo_seconds_bucket{stage="x",le="1"} 1', text)
+        self.assertIn('demo_seconds_bucket{stage="x",le="5"} 2', text)
+        self.assertIn('demo_seconds_bucket{stage="x",le="+Inf"} 3', text)
+        self.assertIn('demo_seconds_count{stage="x"} 3', text)
+        self.assertIn('demo_seconds_sum{stage="x"} 13.5', text)
+
+    def test_unknown_label_is_rejected(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("demo_total", "Demo counter.", ("kind",))
+        with self.assertRaises(ValueError):
+            counter.inc(other="x")
+
+    def test_collectors_run_before_render(self):
+        registry = MetricsRegistry()
+        gauge = registry.gauge("demo_queue", "Demo gauge.")
+        registry.register_collector(lambda: gauge.set(7))
+
+        self.assertIn("demo_queue 7", registry.render())
+
+
+class TestPipelineStageMetrics(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.NamedTemporaryFile(delete=False)
+        self.tmp.close()
+        self.db = SQLiteDB(db_path=self.tmp.name)
+        REGISTRY.reset()
+
+    def tearDown(self):
+        REGISTRY.reset()
+        try:
+            os.unlink(self.tmp.name)
+        except FileNotFoundError:
+            pass
+
+    def test_worker_records_every_stage(self):
+        self.db.add_task("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        downloader = MagicMock()
+        downloader.download.return_value = {"path": "/tmp/audio.wav", "title": "T"}
+        summarizer = MagicMock()
+        summarizer.summarize.return_value = "summary"
+        summarizer.last_model_label = "openai:gpt-4o-mini"
+
+        worker = ProcessingWorker(
+            self.db,
+            worker_id="worker-metrics",
+            downloader_factory=lambda url, output_path: downloader,
+            transcriber_factory=lambda model_size, **options: MagicMock(
+                transcribe=MagicMock(return_value="text")
+            ),
+            summarizer_factory=lambda: summarizer,
+            summary_storage_factory=lambda: MagicMock(
+                save=MagicMock(return_value={"page_id": "page-1"})
+            ),
+            file_manager_factory=MagicMock,
+            notifier=MagicMock(return_value=True),
+            config_factory=lambda: types.SimpleNamespace(
+                transcription_model_size="tiny",
+                notion_url=None,
+                discord_webhook_url=None,
+                data_dir="data",
+            ),
+        )
+        summary = worker.run()
+
+        self.assertEqual(summary.processed_tasks, 1)
+        for stage in PIPELINE_STAGES:
+            self.assertEqual(PIPELINE_STAGE_SECONDS.count(stage=stage), 1, stage)
+        self.assertEqual(PIPELINE_TASKS_TOTAL.value(outcome="completed"), 1)
+
+        recorded = self.db.list_task_stage_timings()
+        self.assertEqual(len(recorded), 1)
+        self.assertEqual(recorded[0].outcome, "completed")
+        self.assertEqual(set(recorded[0].stage_durations), set(PIPELINE_STAGES))
+        self.assertEqual(recorded[0].transcript_chars, len("text"))
+        self.assertEqual(recorded[0].summarizer_model, "openai:gpt-4o-mini")
+
+
+@unittest.skipIf(TestClient is None, "fastapi is not installed")
+class TestMetricsEndpoint(unittest.TestCase):
+    def setUp(self):
+        _load_database.cache_clear()  # the API keeps one client per backend
+
+    def test_metrics_endpoint_reports_queue_depth(self):
+        mock_db = MagicMock()
+        mock_db.count_tasks_by_status.return_value = {"Pending": 4, "Completed": 2}
+
+        with patch("src.apps.api.main.DBFactory.get_db", return_value=mock_db) as get_db:
+            response = TestClient(app).get("/metrics")
+            TestClient(app).get("/metrics")
+
+        get_db.assert_called_once()  # scrapes reuse the API's client
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertIn('task_queue_depth{status="Pending"} 4', response.text)
+        self.assertIn('task_queue_depth{status="Completed"} 2', response.text)
+        self.assertIn("# TYPE pipeline_stage_duration_seconds histogram", response.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import os
+import tempfile
+import types
+import unittest
+from datetime import datetime
+
+from src.infrastructure.media.yt_dlp_library import MediaInfo
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.services.pipeline.probe_policy import (
+    ACCEPT,
+    DEFER,
+    REJECT,
+    ProbePolicy,
+    apply_overrides,
+)
+from src.services.pipeline.prefetcher import DownloadPrefetcher
+from src.services.pipeline.processing_runner import ProcessingWorker
+
+
+def _info(**kwargs):
+    values = {"video_id": "abc", "title": "Probed title", "duration": 600.0}
+    values.update(kwargs)
+    return MediaInfo(**values)
+
+
+class TestProbePolicy(unittest.TestCase):
+    def setUp(self):
+        self.policy = ProbePolicy(
+            max_duration_seconds=3600, defer_live_seconds=900, chunked_min_seconds=1800
+        )
+
+    def test_accepts_regular_videos(self):
+        self.assertEqual(self.policy.decide(_info()).action, ACCEPT)
+
+    def test_rejects_long_and_restricted_videos(self):
+        too_long = self.policy.decide(_info(duration=36000.0))
+        members_only = self.policy.decide(_info(availability="subscriber_only"))
+
+        self.assertEqual(too_long.action, REJECT)
+        self.assertIn("10:00:00", too_long.reason)
+        self.assertEqual(members_only.action, REJECT)
+
+    def test_defers_live_streams(self):
+        decision = self.policy.decide(_info(live_status="is_live", duration=None))
+
+        self.assertEqual(decision.action, DEFER)
+        self.assertEqual(decision.delay_seconds, 900)
+
+    def test_routes_long_videos_to_chunked_transcription(self):
+        decision = self.policy.decide(_info(duration=2400.0))
+
+        self.assertEqual(decision.transcription_overrides, {"chunked": True})
+        self.assertEqual(
+            apply_overrides({"chunked": False}, decision.transcription_overrides),
+            {"chunked": False},
+        )
+
+
+class _ProbingDownloader:
+    info = _info()
+    downloads = 0
+    probes = 0
+
+    def __init__(self, url, output_path):
+        self.url = url
+
+    def probe(self):
+        _ProbingDownloader.probes += 1
+        return _ProbingDownloader.info
+
+    def download(self):
+        _ProbingDownloader.downloads += 1
+        raise RuntimeError("stop after download")
+
+
+class TestWorkerProbeStage(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.NamedTemporaryFile(delete=False)
+        self.tmp.close()
+        self.db = SQLiteDB(db_path=self.tmp.name)
+        _ProbingDownloader.downloads = 0
+        _ProbingDownloader.probes = 0
+        self.worker = ProcessingWorker(
+            self.db,
+            downloader_factory=_ProbingDownloader,
+            config_factory=lambda: types.SimpleNamespace(
+                transcription_model_size="tiny",
+                notion_url=None,
+                discord_webhook_url=None,
+                data_dir="data",
+                probe_enabled=True,
+                probe_max_duration_seconds=3600,
+                probe_defer_live_seconds=900,
+            ),
+        )
+
+    def tearDown(self):
+        os.unlink(self.tmp.name)
+
+    def test_title_and_duration_are_stored_before_download(self):
+        _ProbingDownloader.info = _info()
+        task = self.db.add_task("https://youtu.be/alpha")
+
+        self.worker.process_next_task()
+
+        stored = self.db.get_task_by_id(task.id)
+        self.assertEqual(stored.title, "Probed title")
+        self.assertEqual(stored.duration_seconds, 600.0)
+        self.assertEqual(_ProbingDownloader.downloads, 1)
+
+    def test_rejected_task_fails_without_download(self):
+        _ProbingDownloader.info = _info(duration=7200.0)
+        task = self.db.add_task("https://youtu.be/alpha")
+
+        self.assertFalse(self.worker.process_next_task())
+
+        stored = self.db.get_task_by_id(task.id)
+        self.assertEqual(stored.status, "Failed")
+        self.assertIn("Rejected before download", stored.error_message)
+        self.assertEqual(_ProbingDownloader.downloads, 0)
+
+    def test_deferred_task_returns_to_queue_until_later(self):
+        _ProbingDownloader.info = _info(live_status="is_live", duration=None)
+        task = self.db.add_task("https://youtu.be/alpha")
+
+        self.assertTrue(self.worker.process_next_task())
+
+        stored = self.db.get_task_by_id(task.id)
+        self.assertEqual(stored.status, "Pending")
+        self.assertIsNotNone(stored.deferred_until)
+        self.assertIsNone(self.db.acquire_next_task("other-worker"))
+        self.assertEqual(self.db.peek_pending_tasks(5), [])
+        self.assertEqual(_ProbingDownloader.downloads, 0)
+
+    def test_defer_requires_the_current_claim(self):
+        task = self.db.add_task("https://youtu.be/alpha")
+        self.db.acquire_next_task("worker-a")
+        until = datetime(2030, 1, 1)
+
+        self.assertFalse(self.db.defer_task(task.id, "worker-b", until))
+        self.assertEqual(self.db.get_task_by_id(task.id).status, "Processing")
+        self.assertTrue(self.db.defer_task(task.id, "worker-a", until))
+        self.assertFalse(self.db.defer_task(task.id, "worker-a", until))
+
+    def test_prefetcher_probes_before_downloading_and_worker_reuses_it(self):
+        _ProbingDownloader.info = _info(duration=7200.0)
+        task = self.db.add_task("https://youtu.be/alpha")
+        prefetcher = DownloadPrefetcher(
+            self.db,
+            _ProbingDownloader,
+            "data",
+            worker_id=self.worker.worker_id,
+            probe_policy=self.worker.probe_policy,
+        )
+
+        prefetcher.run_once()
+        self.worker.prefetcher = prefetcher
+        self.assertFalse(self.worker.process_next_task())
+
+        self.assertEqual(self.db.get_task_by_id(task.id).status, "Failed")
+        self.assertEqual(_ProbingDownloader.probes, 1)
+        self.assertEqual(_ProbingDownloader.downloads, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
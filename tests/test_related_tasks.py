@@ -0,0 +1,152 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import types
+import unittest
+from unittest.mock import patch
+
+if "notion_client" not in sys.modules:  # pragma: no cover - testing scaffold
+    notion_stub = types.ModuleType("notion_client")
+
+    class _Client:  # minimal stub
+        def __init__(self, *_, **__):
+            pass
+
+    notion_stub.Client = _Client
+    sys.modules["notion_client"] = notion_stub
+
+try:  # pragma: no cover - avoid hard dependency in minimal envs
+    from fastapi.testclient import TestClient
+    from src.apps.api.main import _load_database, app
+except ModuleNotFoundError:  # pragma: no cover - testing scaffold
+    TestClient = None
+    app = None
+    _load_database = None
+
+from src.domain.tasks.models import Task
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.services.tasks import related_tasks
+from src.services.tasks.related_tasks import (
+    RelatedTasksIndex,
+    build_index,
+    find_related_tasks,
+    tokenize,
+)
+
+CHIPS = "台積電 先進製程 晶片 供應鏈 分析"
+CHIPS_2 = "晶片 供應鏈 與 台積電 的 先進製程"
+COOKING = "How to cook pasta al dente with tomato sauce"
+COOKING_2 = "Tomato sauce pasta recipe for busy weeknights"
+
+
+def _task(task_id, summary, status="Completed", title=""):
+    return Task(id=task_id, url=f"https://youtu.be/{task_id}", status=status, title=title, summary=summary)
+
+
+class TestRelatedTasksIndex(unittest.TestCase):
+    def test_tokenize_words_and_cjk_bigrams(self):
+        self.assertEqual(tokenize("The GPU's 晶片需求"), ["gpu's", "晶片", "片需", "需求"])
+        self.assertEqual(tokenize(None), [])
+
+    def test_related_ranks_similar_summaries_first(self):
+        index = build_index(
+            [_task("1", CHIPS), _task("2", COOKING), _task("3", CHIPS_2), _task("4", COOKING_2)]
+        )
+
+        self.assertEqual([item.task_id for item in index.related("1", limit=1)], ["3"])
+        self.assertEqual([item.task_id for item in index.related("2", limit=1)], ["4"])
+        self.assertNotIn("1", [item.task_id for item in index.related("1", limit=10)])
+        self.assertEqual(index.related("missing"), [])
+
+    def test_updates_replace_and_remove_documents(self):
+        index = build_index([_task("1", CHIPS), _task("2", CHIPS_2), _task("3", COOKING)])
+
+        index.update(_task("2", COOKING_2))
+        self.assertEqual([item.task_id for item in index.related("3", limit=1)], ["2"])
+
+        index.update(_task("2", COOKING_2, status="Failed Retry Created"))
+        self.assertEqual(len(index), 2)
+        self.assertNotIn("2", [item.task_id for item in index.related("3")])
+
+    def test_compaction_keeps_results(self):
+        with patch.object(related_tasks, "COMPACT_AFTER_REMOVALS", 2):
+            index = build_index([_task(str(i), CHIPS if i % 2 else COOKING) for i in range(6)])
+            index.update(_task("0", "", status="Failed"))
+            index.update(_task("2", "", status="Failed"))
+
+            self.assertEqual(len(index), 4)
+            # The remaining cooking summary has no neighbours left.
+            self.assertEqual(index.related("4"), [])
+            self.assertEqual(
+                sorted(item.task_id for item in index.related("1")), ["3", "5"]
+            )
+
+
+class TestRelatedTasksWithSQLite(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = SQLiteDB(db_path=os.path.join(self.tmpdir.name, "tasks.db"))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _completed(self, video_id, summary):
+        task = self.db.add_task(f"https://www.youtube.com/watch?v={video_id}")
+        self.db.update_task_status(task.id, "Completed", title=video_id, summary=summary)
+        return str(task.id)
+
+    def test_index_follows_the_change_feed(self):
+        chips = self._completed("chips", CHIPS)
+        self._completed("pasta", COOKING)
+        index = RelatedTasksIndex()
+        index.refresh(self.db)
+        self.assertEqual(index.related(chips), [])
+
+        chips_2 = self._completed("chips2", CHIPS_2)
+        self.assertGreaterEqual(index.refresh(self.db), 1)
+        self.assertEqual(index.related(chips, limit=1)[0].task_id, chips_2)
+
+        self.db.update_task_status(chips_2, "Failed")
+        index.refresh(self.db)
+        self.assertEqual(index.related(chips), [])
+
+    def test_deleted_tasks_leave_the_index(self):
+        chips = self._completed("chips", CHIPS)
+        chips_2 = self._completed("chips2", CHIPS_2)
+        index = RelatedTasksIndex()
+        index.refresh(self.db)
+        self.assertEqual(index.related(chips, limit=1)[0].task_id, chips_2)
+
+        conn = sqlite3.connect(self.db.db_path)
+        conn.execute("DELETE FROM tasks WHERE id = ?", (chips_2,))
+        conn.commit()
+        conn.close()
+        index.refresh(self.db)
+
+        self.assertEqual(index.related(chips), [])
+        self.assertEqual(len(index), 1)
+
+    @unittest.skipIf(TestClient is None, "fastapi is not installed")
+    def test_related_endpoint(self):
+        _load_database.cache_clear()  # the API keeps one client per backend
+        chips = self._completed("chips", CHIPS)
+        chips_2 = self._completed("chips2", CHIPS_2)
+        self._completed("pasta", COOKING)
+        client = TestClient(app)
+
+        with patch("src.apps.api.main.DBFactory.get_db", return_value=self.db):
+            response = client.get(f"/tasks/{chips}/related", params={"limit": 1})
+            missing = client.get("/tasks/999/related")
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload["task_id"], chips)
+        self.assertEqual([item["task_id"] for item in payload["results"]], [chips_2])
+        self.assertEqual(payload["results"][0]["title"], "chips2")
+        self.assertEqual(missing.status_code, 404)
+        self.assertEqual(find_related_tasks(self.db, "999"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@ import os
 import sqlite3
 import tempfile
 import unittest
+from unittest.mock import patch
 
 from src.infrastructure.persistence.sqlite.client import SQLiteDB
 
@@ -144,6 +145,25 @@ class TestSQLiteClient(unittest.TestCase):
         self.assertIsNone(lock_info.worker_id)
         self.assertIsNone(lock_info.locked_at)
 
+    def test_reopening_a_current_schema_skips_the_write_lock(self):
+        self.db.add_task("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        writer = sqlite3.connect(self.tmp.name)
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute("UPDATE tasks SET title = 'busy'")
+        try:
+            with patch.object(
+                SQLiteDB,
+                "_get_connection",
+                lambda db: sqlite3.connect(db.db_path, timeout=0.1),
+            ):
+                reopened = SQLiteDB(db_path=self.tmp.name)
+        finally:
+            writer.rollback()
+            writer.close()
+
+        self.assertEqual(len(reopened.get_all_tasks()), 1)
+        self.assertEqual(reopened.search_enabled, self.db.search_enabled)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,167 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from src.core.time_utils import utc_now_naive
+from src.domain.tasks.models import TaskStageTimings
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.services.tasks.stage_stats import (
+    aggregate_stage_timings,
+    load_stage_timing_summary,
+    percentile,
+)
+
+try:  # pragma: no cover - avoid hard dependency in minimal envs
+    from fastapi.testclient import TestClient
+    from src.apps.api.main import _load_database, app
+except ModuleNotFoundError:  # pragma: no cover - testing scaffold
+    TestClient = None
+    app = None
+    _load_database = None
+
+
+def _timings(task_id, recorded_at, transcription, audio=None, model="faster-whisper-tiny"):
+    return TaskStageTimings(
+        task_id=task_id,
+        outcome="completed",
+        stage_durations={"download": 1.0, "transcription": transcription},
+        total_duration=1.0 + transcription,
+        audio_duration=audio,
+        transcription_model=model,
+        recorded_at=recorded_at,
+    )
+
+
+class TestPercentile(unittest.TestCase):
+    def test_percentile_interpolates(self):
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2.5)
+        self.assertEqual(percentile([5], 95), 5.0)
+        self.assertIsNone(percentile([], 50))
+
+
+class TestAggregateStageTimings(unittest.TestCase):
+    def test_single_bucket_summarizes_stages_and_realtime_factor(self):
+        end = datetime(2026, 1, 2, 0, 0, 0)
+        records = [
+            _timings("1", end - timedelta(hours=1), 10.0, audio=100.0),
+            _timings("2", end - timedelta(hours=2), 30.0, audio=100.0),
+            _timings("3", end - timedelta(days=3), 99.0),
+        ]
+
+        buckets = aggregate_stage_timings(
+            records, window_start=end - timedelta(hours=24), window_end=end
+        )
+
+        self.assertEqual(len(buckets), 1)
+        bucket = buckets[0]
+        self.assertEqual(bucket["task_count"], 2)
+        self.assertEqual(bucket["stages"]["transcription"]["p50"], 20.0)
+        self.assertEqual(bucket["stages"]["download"]["count"], 2)
+        rtf = bucket["transcription_realtime_factor"]["faster-whisper-tiny"]
+        self.assertAlmostEqual(rtf["max"], 0.3)
+
+    def test_bucketed_window(self):
+        end = datetime(2026, 1, 2, 0, 0, 0)
+        records = [
+            _timings("1", end - timedelta(hours=1), 10.0),
+            _timings("2", end - timedelta(hours=13), 30.0),
+        ]
+
+        buckets = aggregate_stage_timings(
+            records,
+            window_start=end - timedelta(hours=24),
+            window_end=end,
+            bucket_seconds=12 * 3600,
+        )
+
+        self.assertEqual([bucket["task_count"] for bucket in buckets], [1, 1])
+        self.assertEqual(buckets[0]["stages"]["transcription"]["max"], 30.0)
+
+    def test_rejects_too_many_buckets(self):
+        end = datetime(2026, 1, 2, 0, 0, 0)
+
+        with self.assertRaises(ValueError):
+            aggregate_stage_timings(
+                [], window_start=end - timedelta(hours=24), window_end=end, bucket_seconds=60
+            )
+
+
+class TestSQLiteStageTimings(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.NamedTemporaryFile(delete=False)
+        self.tmp.close()
+        self.db = SQLiteDB(db_path=self.tmp.name)
+
+    def tearDown(self):
+        try:
+            os.unlink(self.tmp.name)
+        except FileNotFoundError:
+            pass
+
+    def test_record_and_load_summary(self):
+        task = self.db.add_task("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        self.db.record_task_stage_timings(
+            TaskStageTimings(
+                task_id=task.id,
+                outcome="completed",
+                stage_durations={"download": 2.0, "summarization": 4.0},
+                total_duration=6.0,
+                transcript_chars=1200,
+                summary_chars=300,
+                summarizer_model="openai:gpt-4o-mini",
+            )
+        )
+
+        stored = self.db.list_task_stage_timings()
+        self.assertEqual(len(stored), 1)
+        self.assertEqual(stored[0].task_id, task.id)
+        self.assertEqual(stored[0].stage_durations["summarization"], 4.0)
+        self.assertEqual(stored[0].summarizer_model, "openai:gpt-4o-mini")
+
+        summary = load_stage_timing_summary(self.db, window_hours=1)
+        self.assertEqual(summary[0]["task_count"], 1)
+        self.assertEqual(summary[0]["stages"]["download"]["p50"], 2.0)
+
+
+@unittest.skipIf(TestClient is None, "fastapi is not installed")
+class TestStageTimingEndpoint(unittest.TestCase):
+    def setUp(self):
+        _load_database.cache_clear()  # the API keeps one client per backend
+
+    def test_endpoint_returns_buckets(self):
+        now = utc_now_naive()
+        mock_db = MagicMock()
+        mock_db.list_task_stage_timings.return_value = [
+            _timings("1", now - timedelta(minutes=5), 12.0, audio=60.0)
+        ]
+
+        with patch("src.apps.api.main.DBFactory.get_db", return_value=mock_db):
+            response = TestClient(app).get(
+                "/stats/stage-timings", params={"window_hours": 2, "bucket_hours": 1}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(len(payload["buckets"]), 2)
+        self.assertEqual(payload["buckets"][-1]["stages"]["transcription"]["count"], 1)
+
+    def test_endpoint_rejects_non_positive_window(self):
+        response = TestClient(app).get("/stats/stage-timings", params={"window_hours": 0})
+        self.assertEqual(response.status_code, 422)
+
+    def test_endpoint_rejects_too_many_buckets(self):
+        mock_db = MagicMock()
+
+        with patch("src.apps.api.main.DBFactory.get_db", return_value=mock_db):
+            response = TestClient(app).get(
+                "/stats/stage-timings", params={"window_hours": 2160, "bucket_hours": 0.0003}
+            )
+
+        self.assertEqual(response.status_code, 422)
+        mock_db.list_task_stage_timings.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
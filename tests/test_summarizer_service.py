@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 import types
@@ -169,7 +170,7 @@ class TestSummarizerService(unittest.TestCase):
         fake_client.chat.return_value = fake_response
 
         with patch(
-            "src.infrastructure.llm.summarizer_service.OllamaClient",
+            "src.infrastructure.llm.backends.ollama_backend.OllamaClient",
             return_value=fake_client,
         ) as mock_client:
             result = summarizer.summarize_with_ollama(
@@ -191,6 +192,20 @@ class TestSummarizerService(unittest.TestCase):
             "kimi-k2.5:cloud",
         )
 
+    def test_asummarize_checks_api_key_before_calling_backend(self):
+        with patch.dict(os.environ, {}, clear=True):
+            summarizer = Summarizer()
+
+        with patch.object(
+            Summarizer, "_determine_backend", return_value="ollama"
+        ), patch(
+            "src.infrastructure.llm.summarizer_service.create_backend"
+        ) as mock_create:
+            with self.assertRaisesRegex(ValueError, "OLLAMA_API_KEY is not set"):
+                asyncio.run(summarizer.asummarize("title", "text"))
+
+        mock_create.assert_not_called()
+
     def test_config_validate_accepts_ollama_only(self):
         with patch.dict(
             os.environ,
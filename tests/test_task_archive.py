@@ -0,0 +1,160 @@
+import os
+import sqlite3
+import tempfile
+import types
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.infrastructure.persistence.sqlite.task_blobs import ZLIB
+from src.services.pipeline.processing_runner import ProcessingWorker
+from src.services.pipeline.task_archive import archive_old_tasks
+from src.services.tasks.task_creation import create_task_record
+
+NOW = datetime(2026, 6, 1, 12, 0, 0)
+LONG_SUMMARY = "## 摘要\n" + "封存任務的摘要內容。\n" * 200
+
+
+class TestTaskArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "tasks.db")
+        self.db = SQLiteDB(db_path=self.path, text_codec=ZLIB)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _task(self, video_id, status, days_old, summary="summary"):
+        task = self.db.add_task(f"https://www.youtube.com/watch?v={video_id}")
+        if status != "Pending":
+            self.db.update_task_status(task.id, status, title=video_id, summary=summary)
+        stamp = (NOW - timedelta(days=days_old)).strftime("%Y-%m-%d %H:%M:%S")
+        conn = sqlite3.connect(self.path)
+        conn.execute(
+            "UPDATE tasks SET created_at = ?, updated_at = ? WHERE id = ?",
+            (stamp, stamp, task.id),
+        )
+        conn.commit()
+        conn.close()
+        return str(task.id)
+
+    def test_archives_only_old_finished_tasks(self):
+        old_done = self._task("old", "Completed", 120, summary=LONG_SUMMARY)
+        old_failed = self._task("bad", "Failed", 120)
+        old_pending = self._task("queued", "Pending", 120)
+        recent = self._task("new", "Completed", 5)
+        self.db.index_task_transcript(old_done, "逐字稿 " * 400)
+
+        archived = archive_old_tasks(self.db, 90, batch_size=1, now=NOW)
+
+        self.assertEqual(archived, 2)
+        self.assertEqual(
+            sorted(task.id for task in self.db.get_all_tasks()), sorted([old_pending, recent])
+        )
+        restored = self.db.get_task_by_id(old_done)
+        self.assertEqual(restored.status, "Completed")
+        self.assertEqual(restored.summary, LONG_SUMMARY)
+        self.assertEqual(restored.title, "old")
+        self.assertEqual(self.db.get_task_transcript(old_done), "逐字稿 " * 400)
+        self.assertEqual(self.db.get_task_by_id(old_failed).status, "Failed")
+        self.assertEqual(self.db.search_tasks("封存任務").total, 0)
+
+        conn = sqlite3.connect(self.path)
+        blobs = conn.execute("SELECT COUNT(*) FROM task_blobs").fetchone()[0]
+        conn.close()
+        self.assertEqual(blobs, 0)
+
+    def test_url_dedup_falls_back_to_archived_tasks(self):
+        first = self._task("abc", "Completed", 200)
+        second = self._task("abc", "Completed", 150)
+        self._task("xyz", "Failed", 150)
+        archive_old_tasks(self.db, 90, now=NOW)
+
+        found = self.db.find_recent_task_by_url("https://www.youtube.com/watch?v=abc")
+        self.assertEqual(found.id, second)
+        self.assertNotEqual(found.id, first)
+        self.assertIsNone(self.db.find_recent_task_by_url("https://www.youtube.com/watch?v=xyz"))
+
+        result = create_task_record(
+            db=self.db,
+            url="https://www.youtube.com/watch?v=abc",
+            completed_task_policy="block_existing",
+        )
+        self.assertEqual(result.outcome, "duplicate_completed")
+        self.assertEqual(result.task.id, second)
+
+    def test_archived_dedup_matches_any_url_form(self):
+        archived = self._task("dQw4w9WgXcQ", "Completed", 200)
+        archive_old_tasks(self.db, 90, now=NOW)
+
+        found = self.db.find_recent_task_by_url("https://youtu.be/dQw4w9WgXcQ")
+
+        self.assertEqual(found.id, archived)
+
+    def test_legacy_url_index_is_migrated(self):
+        archived = self._task("dQw4w9WgXcQ", "Completed", 200)
+        archive_old_tasks(self.db, 90, now=NOW)
+        conn = sqlite3.connect(self.path)
+        conn.execute("DELETE FROM task_video_index")
+        conn.execute(
+            "CREATE TABLE task_url_index (url TEXT PRIMARY KEY, task_id INTEGER NOT NULL, "
+            "created_at TIMESTAMP) WITHOUT ROWID"
+        )
+        conn.execute(
+            "INSERT INTO task_url_index VALUES (?, ?, NULL)",
+            ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", archived),
+        )
+        conn.execute("PRAGMA user_version = 0")  # databases from before the schema marker
+        conn.commit()
+        conn.close()
+
+        reopened = SQLiteDB(db_path=self.path)
+
+        self.assertEqual(reopened.find_recent_task_by_url("https://youtu.be/dQw4w9WgXcQ").id, archived)
+        conn = sqlite3.connect(self.path)
+        legacy = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'task_url_index'"
+        ).fetchone()
+        conn.close()
+        self.assertIsNone(legacy)
+
+    def test_new_task_ids_are_not_reused(self):
+        archived_id = self._task("abc", "Completed", 200)
+        archive_old_tasks(self.db, 90, now=NOW)
+
+        new_task = self.db.add_task("https://www.youtube.com/watch?v=def")
+
+        self.assertGreater(int(new_task.id), int(archived_id))
+        self.assertEqual(self.db.get_task_by_id(archived_id).url, "https://www.youtube.com/watch?v=abc")
+
+    def test_disabled_retention_archives_nothing(self):
+        self._task("abc", "Completed", 400)
+
+        self.assertEqual(archive_old_tasks(self.db, 0, now=NOW), 0)
+        self.assertEqual(len(self.db.get_all_tasks()), 1)
+
+    def test_worker_archives_after_draining_the_queue(self):
+        archived_id = self._task("abc", "Completed", 4000)
+        worker = ProcessingWorker(
+            self.db,
+            worker_id="archiver",
+            downloader_factory=MagicMock(),
+            transcriber_factory=MagicMock(),
+            summarizer_factory=MagicMock(),
+            summary_storage_factory=MagicMock(),
+            notifier=MagicMock(),
+            config_factory=lambda: types.SimpleNamespace(
+                data_dir=self.tmpdir.name, task_archive_after_days=90
+            ),
+        )
+
+        summary = worker.run()
+
+        self.assertTrue(summary.acquired_lock)
+        self.assertEqual(self.db.get_all_tasks(), [])
+        self.assertEqual(self.db.get_task_by_id(archived_id).status, "Completed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import copy
+import os
+import pickle
+import sqlite3
+import tempfile
+import unittest
+
+from benchmarks import storage_bench
+from src.domain.tasks.models import Task
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.infrastructure.persistence.sqlite.task_blobs import (
+    NONE,
+    OFF,
+    ZLIB,
+    LazyTextTask,
+    compress_text,
+    decompress_text,
+    resolve_codec,
+)
+
+LONG_SUMMARY = "## 摘要\n" + "台積電 先進製程 與 AI 晶片 需求 持續成長。\n" * 200
+
+
+class TestTaskBlobCodecs(unittest.TestCase):
+    def test_roundtrip_and_codec_resolution(self):
+        for codec in (ZLIB, NONE):
+            self.assertEqual(decompress_text(compress_text(LONG_SUMMARY, codec), codec), LONG_SUMMARY)
+        self.assertLess(len(compress_text(LONG_SUMMARY, ZLIB)), len(LONG_SUMMARY.encode("utf-8")) // 10)
+        self.assertEqual(resolve_codec("off"), OFF)
+        self.assertEqual(resolve_codec("unknown"), ZLIB)
+
+
+class TestSQLiteTextCompression(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "tasks.db")
+        self.db = SQLiteDB(db_path=self.path, text_codec=ZLIB)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _row(self, task_id):
+        conn = sqlite3.connect(self.path)
+        try:
+            return conn.execute(
+                "SELECT summary, summary_size FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+        finally:
+            conn.close()
+
+    def test_large_summary_is_compressed_and_loaded_lazily(self):
+        task = self.db.add_task("https://www.youtube.com/watch?v=abc")
+        self.db.update_task_status(task.id, "Completed", title="Chips", summary=LONG_SUMMARY)
+
+        summary, size = self._row(task.id)
+        self.assertIsNone(summary)
+        self.assertEqual(size, len(LONG_SUMMARY.encode("utf-8")))
+
+        listed = self.db.get_all_tasks()[0]
+        self.assertIsInstance(listed, LazyTextTask)
+        self.assertFalse(listed.summary_loaded())
+        self.assertEqual(listed.summary, LONG_SUMMARY)
+        self.assertTrue(listed.summary_loaded())
+        self.assertEqual(self.db.get_task_by_id(task.id).summary, LONG_SUMMARY)
+
+    def test_lazy_tasks_pickle_as_plain_tasks(self):
+        task = self.db.add_task("https://www.youtube.com/watch?v=abc")
+        self.db.update_task_status(task.id, "Completed", title="Chips", summary=LONG_SUMMARY)
+        lazy = self.db.get_task_by_id(task.id)
+
+        restored = pickle.loads(pickle.dumps(lazy))
+
+        self.assertIs(type(restored), Task)
+        self.assertEqual((restored.id, restored.title), (lazy.id, "Chips"))
+        self.assertEqual(restored.summary, LONG_SUMMARY)
+        self.assertIs(type(copy.deepcopy(lazy)), Task)
+
+    def test_short_summary_stays_inline_and_replaces_blob(self):
+        task = self.db.add_task("https://www.youtube.com/watch?v=abc")
+        self.db.update_task_status(task.id, "Completed", summary=LONG_SUMMARY)
+        self.db.update_task_status(task.id, "Completed", summary="short")
+
+        self.assertEqual(self._row(task.id), ("short", None))
+        self.assertIsNone(self.db.load_task_text(task.id, "summary"))
+        self.assertEqual(self.db.get_task_by_id(task.id).summary, "short")
+
+    def test_search_index_keeps_compressed_summary(self):
+        task = self.db.add_task("https://www.youtube.com/watch?v=abc")
+        self.db.update_task_status(task.id, "Completed", title="Chips", summary=LONG_SUMMARY)
+        self.db.update_task_status(task.id, "Completed", title="Chips renamed")
+
+        results = self.db.search_tasks("先進製程")
+        self.assertEqual([hit.task.id for hit in results.hits], [str(task.id)])
+
+    def test_transcript_is_stored_compressed(self):
+        task = self.db.add_task("https://www.youtube.com/watch?v=abc")
+        transcript = "逐字稿內容 " * 500
+        self.db.index_task_transcript(task.id, transcript)
+
+        self.assertEqual(self.db.get_task_transcript(task.id), transcript)
+        self.assertIsNone(self.db.get_task_transcript("999"))
+
+    def test_existing_rows_are_migrated(self):
+        legacy_path = os.path.join(self.tmpdir.name, "legacy.db")
+        conn = sqlite3.connect(legacy_path)
+        conn.execute(
+            """
+            CREATE TABLE tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL,
+                status TEXT NOT NULL,
+                title TEXT,
+                summary TEXT,
+                error_message TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                processing_duration REAL
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO tasks (url, title, status, summary) VALUES (?, ?, ?, ?)",
+            ("https://youtu.be/a", "Legacy", "Completed", LONG_SUMMARY),
+        )
+        conn.execute(
+            "INSERT INTO tasks (url, title, status, summary) VALUES (?, ?, ?, ?)",
+            ("https://youtu.be/b", "Small", "Completed", "tiny"),
+        )
+        conn.commit()
+        conn.close()
+
+        db = SQLiteDB(db_path=legacy_path, text_codec=ZLIB)
+
+        conn = sqlite3.connect(legacy_path)
+        rows = conn.execute("SELECT summary, summary_size FROM tasks ORDER BY id").fetchall()
+        conn.close()
+        self.assertEqual(rows[0], (None, len(LONG_SUMMARY.encode("utf-8"))))
+        self.assertEqual(rows[1], ("tiny", None))
+        self.assertEqual([task.summary for task in db.get_all_tasks()], [LONG_SUMMARY, "tiny"])
+
+    def test_codec_off_keeps_summaries_inline(self):
+        db = SQLiteDB(db_path=os.path.join(self.tmpdir.name, "plain.db"), text_codec=OFF)
+        task = db.add_task("https://www.youtube.com/watch?v=abc")
+        db.update_task_status(task.id, "Completed", summary=LONG_SUMMARY)
+
+        self.assertEqual(db.get_task_by_id(task.id).summary, LONG_SUMMARY)
+        self.assertIsNone(db.load_task_text(task.id, "summary"))
+
+
+class TestStorageBench(unittest.TestCase):
+    def test_measure_reports_smaller_database_when_compressed(self):
+        results = [
+            storage_bench.measure(codec, tasks=20, summary_chars=3000, transcript_chars=0, runs=1, detail_samples=5)
+            for codec in (OFF, ZLIB)
+        ]
+
+        self.assertLess(results[1]["db_bytes"], results[0]["db_bytes"])
+        table = storage_bench.format_table(results)
+        self.assertIn("zlib", table)
+        self.assertIn("1.00x", table)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+from datetime import datetime, timedelta
+import sys
+import tempfile
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+if "notion_client" not in sys.modules:  # pragma: no cover - testing scaffold
+    notion_stub = types.ModuleType("notion_client")
+
+    class _Client:  # minimal stub
+        def __init__(self, *_, **__):
+            pass
+
+    notion_stub.Client = _Client
+    sys.modules["notion_client"] = notion_stub
+
+try:  # pragma: no cover - avoid hard dependency in minimal envs
+    from fastapi.testclient import TestClient
+    from src.apps.api.main import _load_database, app
+except ModuleNotFoundError:  # pragma: no cover - testing scaffold
+    TestClient = None
+    app = None
+    _load_database = None
+
+from src.domain.tasks.models import Task
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.services.tasks.dedup_cache import TaskDedupCache
+from src.services.tasks.processing_scheduler import SchedulingResult
+from src.services.tasks.task_creation import create_task_record
+
+URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+
+class TestTaskDedupCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "tasks.db")
+        self.db = SQLiteDB(db_path=self.path)
+        # A second connection object stands in for another API process or worker.
+        self.other = SQLiteDB(db_path=self.path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_follows_writes_from_other_processes(self):
+        cache = TaskDedupCache()
+        self.assertIsNone(cache.find_recent_task(self.db, URL))
+
+        task = self.other.add_task(URL)
+        self.assertEqual(cache.find_recent_task(self.db, URL).status, "Pending")
+
+        self.other.update_task_status(task.id, "Completed")
+        found = cache.find_recent_task(self.db, URL)
+        self.assertEqual((found.id, found.status), (task.id, "Completed"))
+
+        retry = self.other.add_task(URL)
+        self.other.update_task_status(retry.id, "Failed")
+        self.assertEqual(cache.find_recent_task(self.db, URL).id, task.id)
+
+        self.other.update_task_status(task.id, "Failed")
+        self.assertIsNone(cache.find_recent_task(self.db, URL))
+        self.assertEqual(len(cache), 0)
+
+    def test_archived_tasks_leave_the_cache(self):
+        cache = TaskDedupCache()
+        task = self.other.add_task(URL)
+        self.other.update_task_status(task.id, "Completed")
+        self.assertEqual(cache.find_recent_task(self.db, URL).id, task.id)
+
+        self.assertEqual(self.other.archive_tasks(datetime.utcnow() + timedelta(days=1)), 1)
+
+        self.assertIsNone(cache.find_recent_task(self.db, URL))
+        self.assertEqual(len(cache), 0)
+
+    def test_hot_path_skips_the_tasks_table(self):
+        cache = TaskDedupCache()
+        first = create_task_record(db=self.db, url=URL, dedup_cache=cache)
+        self.assertEqual(first.outcome, "created")
+
+        with patch.object(self.db, "find_recent_task_by_url") as backend_lookup, patch.object(
+            self.db, "list_tasks_changed_since", wraps=self.db.list_tasks_changed_since
+        ) as feed:
+            second = create_task_record(db=self.db, url=URL, dedup_cache=cache)
+            third = create_task_record(db=self.db, url=URL, dedup_cache=cache)
+
+        self.assertEqual(second.outcome, "duplicate_active")
+        self.assertEqual(third.task.id, first.task.id)
+        backend_lookup.assert_not_called()
+        # Only the insert recorded by the first call is read back, once.
+        self.assertEqual(feed.call_count, 1)
+
+    def test_backends_without_change_counter_use_the_backend(self):
+        db = MagicMock()
+        db.get_change_version.return_value = None
+        db.find_recent_task_by_url.return_value = Task(id="page", url=URL, status="Processing")
+
+        found = TaskDedupCache().find_recent_task(db, URL)
+
+        self.assertEqual(found.id, "page")
+        db.find_recent_task_by_url.assert_called_once_with(URL)
+        db.list_tasks_changed_since.assert_not_called()
+
+    @unittest.skipIf(TestClient is None, "fastapi is not installed")
+    def test_create_endpoint_detects_duplicates_through_the_cache(self):
+        _load_database.cache_clear()  # the API keeps one client per backend
+        client = TestClient(app)
+        scheduled = SchedulingResult(accepted=False, worker_id=None, message="Processing already running.")
+
+        with patch("src.apps.api.main.DBFactory.get_db", return_value=self.db), patch(
+            "src.apps.api.main.schedule_processing_job", return_value=scheduled
+        ):
+            created = client.post("/tasks", json={"url": "https://youtu.be/dQw4w9WgXcQ"})
+            duplicate = client.post("/tasks", json={"url": "https://youtu.be/dQw4w9WgXcQ"})
+            self.other.update_task_status(created.json()["task_id"], "Failed")
+            recreated = client.post("/tasks", json={"url": "https://youtu.be/dQw4w9WgXcQ"})
+
+        self.assertEqual(created.status_code, 201)
+        self.assertEqual(duplicate.status_code, 409)
+        self.assertEqual(recreated.status_code, 201)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest.mock import patch
+
+if "notion_client" not in sys.modules:  # pragma: no cover - testing scaffold
+    notion_stub = types.ModuleType("notion_client")
+
+    class _Client:  # minimal stub
+        def __init__(self, *_, **__):
+            pass
+
+    notion_stub.Client = _Client
+    sys.modules["notion_client"] = notion_stub
+
+try:  # pragma: no cover - avoid hard dependency in minimal envs
+    from fastapi.testclient import TestClient
+    from src.apps.api.main import _load_database, app
+except ModuleNotFoundError:  # pragma: no cover - testing scaffold
+    TestClient = None
+    app = None
+    _load_database = None
+
+from benchmarks.scheduling_bench import generate_workload, percentile, simulate, summarize
+from src.domain.tasks.scheduling import (
+    FAIR_SHARE,
+    FIFO,
+    PRIORITY_FIFO,
+    SHORTEST_JOB_FIRST,
+    default_policy,
+    normalize_policy,
+)
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+
+
+class _SQLiteTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = SQLiteDB(db_path=os.path.join(self.tmpdir.name, "tasks.db"))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _add(self, name, created_at, **kwargs):
+        duration = kwargs.pop("duration", None)
+        task = self.db.add_task(f"https://www.youtube.com/watch?v={name}", **kwargs)
+        conn = self.db._get_connection()
+        conn.execute(
+            "UPDATE tasks SET created_at = ?, duration_seconds = ? WHERE id = ?",
+            (created_at, duration, task.id),
+        )
+        conn.commit()
+        conn.close()
+        return str(task.id)
+
+    def _claim_order(self):
+        order = []
+        while (task := self.db.acquire_next_task("worker")) is not None:
+            self.db.update_task_status(task.id, "Completed")
+            order.append(task.url.rsplit("=", 1)[1])
+        return order
+
+
+class TestSchedulingPolicies(_SQLiteTestCase):
+    def test_normalize_and_default_policy(self):
+        self.assertEqual(normalize_policy(" SJF "), SHORTEST_JOB_FIRST)
+        with self.assertRaises(ValueError):
+            normalize_policy("lifo")
+        with patch.dict(os.environ, {"SCHEDULING_POLICY": "fair_share"}):
+            self.assertEqual(default_policy(), FAIR_SHARE)
+        with patch.dict(os.environ, {"SCHEDULING_POLICY": "bogus"}):
+            self.assertEqual(default_policy(), PRIORITY_FIFO)
+
+    def test_policy_is_persisted(self):
+        with patch.dict(os.environ, {"SCHEDULING_POLICY": ""}):
+            self.assertEqual(self.db.get_scheduling_policy(), PRIORITY_FIFO)
+            self.assertTrue(self.db.set_scheduling_policy("sjf"))
+            self.assertEqual(self.db.get_scheduling_policy(), SHORTEST_JOB_FIRST)
+            with self.assertRaises(ValueError):
+                self.db.set_scheduling_policy("random")
+
+    def test_fifo_ignores_priority(self):
+        self.db.set_scheduling_policy(FIFO)
+        self._add("a", "2024-01-01 00:00:00")
+        self._add("b", "2024-01-01 00:01:00", priority=5)
+        self.assertEqual(self._claim_order(), ["a", "b"])
+
+    def test_priority_fifo_orders_by_priority_then_age(self):
+        self.db.set_scheduling_policy(PRIORITY_FIFO)
+        self._add("a", "2024-01-01 00:00:00")
+        self._add("b", "2024-01-01 00:01:00", priority=5)
+        self._add("c", "2024-01-01 00:02:00", priority=5)
+        self.assertEqual(self._claim_order(), ["b", "c", "a"])
+
+    def test_sjf_prefers_short_and_estimates_unknown_duration(self):
+        self.db.set_scheduling_policy(SHORTEST_JOB_FIRST)
+        self._add("long", "2024-01-01 00:00:00", duration=3 * 3600)
+        self._add("unknown", "2024-01-01 00:01:00")
+        self._add("short", "2024-01-01 00:02:00", duration=300)
+        self.assertEqual(self._claim_order(), ["short", "unknown", "long"])
+
+    def test_fair_share_rotates_sources(self):
+        self.db.set_scheduling_policy(FAIR_SHARE)
+        for index in range(3):
+            self._add(
+                f"rss{index}",
+                f"2024-01-01 00:0{index}:00",
+                source_type="rss",
+                source_channel_id="UCbackfill",
+            )
+        self._add("manual", "2024-01-01 00:05:00")
+        conn = self.db._get_connection()
+        # The backfill channel has just been served; the manual source never was.
+        conn.execute(
+            "UPDATE tasks SET started_at = '2024-01-01 00:06:00' WHERE url LIKE '%rss0'"
+        )
+        conn.execute("UPDATE tasks SET status = 'Completed' WHERE url LIKE '%rss0'")
+        conn.commit()
+        conn.close()
+
+        first = self.db.acquire_next_task("worker")
+        self.assertTrue(first.url.endswith("manual"))
+        self.assertIsNotNone(first.started_at)
+
+    def test_set_task_priority_and_peek(self):
+        task_id = self._add("a", "2024-01-01 00:00:00")
+        self.assertTrue(self.db.set_task_priority(task_id, 7))
+        self.assertEqual(self.db.get_task_by_id(task_id).priority, 7)
+        peeked = self.db.peek_pending_tasks(5)
+        self.assertEqual([str(task.id) for task in peeked], [task_id])
+
+    def test_retry_task_keeps_priority(self):
+        task_id = self._add("a", "2024-01-01 00:00:00", priority=3)
+        source = self.db.get_task_by_id(task_id)
+        retry = self.db.create_retry_task(source, "manual")
+        self.assertEqual(retry.priority, 3)
+
+
+@unittest.skipIf(TestClient is None, "fastapi is not installed")
+class TestSchedulingEndpoints(_SQLiteTestCase):
+    def setUp(self):
+        super().setUp()
+        _load_database.cache_clear()  # the API keeps one client per backend
+        self.client = TestClient(app)
+        self.token = "lock-secret"
+        patcher = patch("src.apps.api.main.DBFactory.get_db", return_value=self.db)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_and_put_policy(self):
+        with patch.dict(
+            os.environ,
+            {"PROCESSING_LOCK_ADMIN_TOKEN": self.token, "SCHEDULING_POLICY": ""},
+        ):
+            response = self.client.get("/scheduling/policy")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["policy"], PRIORITY_FIFO)
+            self.assertIn(FAIR_SHARE, response.json()["available"])
+
+            unauthorized = self.client.put("/scheduling/policy", json={"policy": "sjf"})
+            self.assertEqual(unauthorized.status_code, 401)
+
+            invalid = self.client.put(
+                "/scheduling/policy",
+                json={"policy": "lifo"},
+                headers={"X-Maintainer-Token": self.token},
+            )
+            self.assertEqual(invalid.status_code, 422)
+
+            response = self.client.put(
+                "/scheduling/policy",
+                json={"policy": "fair_share"},
+                headers={"X-Maintainer-Token": self.token},
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["policy"], FAIR_SHARE)
+        self.assertEqual(self.db.get_scheduling_policy(), FAIR_SHARE)
+
+    def test_patch_priority(self):
+        task_id = self._add("a", "2024-01-01 00:00:00")
+
+        response = self.client.patch(f"/tasks/{task_id}/priority", json={"priority": 9})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"task_id": task_id, "priority": 9, "status": "Pending"})
+        self.assertEqual(self.db.get_task_by_id(task_id).priority, 9)
+
+        self.assertEqual(
+            self.client.patch(f"/tasks/{task_id}/priority", json={"priority": 1000}).status_code,
+            422,
+        )
+        self.assertEqual(
+            self.client.patch("/tasks/999/priority", json={"priority": 1}).status_code, 404
+        )
+        self.db.update_task_status(task_id, "Completed")
+        self.assertEqual(
+            self.client.patch(f"/tasks/{task_id}/priority", json={"priority": 1}).status_code,
+            409,
+        )
+
+
+class TestSchedulingBench(unittest.TestCase):
+    def test_percentile_nearest_rank(self):
+        self.assertEqual(percentile([], 0.95), 0.0)
+        self.assertEqual(percentile([float(v) for v in range(1, 21)], 0.95), 19.0)
+
+    def test_workload_is_reproducible(self):
+        first = generate_workload(20, seed=3, backfill=5)
+        self.assertEqual(first, generate_workload(20, seed=3, backfill=5))
+        self.assertEqual(len(first), 25)
+        self.assertEqual(sum(task.channel == "UCbackfill" for task in first), 5)
+
+    def test_sjf_lowers_mean_wait_of_short_jobs(self):
+        tasks = generate_workload(40, seed=5, backfill=10, long_share=0.2)
+        fifo = summarize(FIFO, simulate(FIFO, tasks))
+        sjf = summarize(SHORTEST_JOB_FIRST, simulate(SHORTEST_JOB_FIRST, tasks))
+
+        self.assertEqual(fifo["overall"]["count"], len(tasks))
+        self.assertLess(sjf["short"]["mean_wait_s"], fifo["short"]["mean_wait_s"])
+
+
+if __name__ == "__main__":
+    unittest.main()
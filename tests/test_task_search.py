@@ -0,0 +1,185 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import types
+import unittest
+from unittest.mock import patch
+
+if "notion_client" not in sys.modules:  # pragma: no cover - testing scaffold
+    notion_stub = types.ModuleType("notion_client")
+
+    class _Client:  # minimal stub
+        def __init__(self, *_, **__):
+            pass
+
+    notion_stub.Client = _Client
+    sys.modules["notion_client"] = notion_stub
+
+try:  # pragma: no cover - avoid hard dependency in minimal envs
+    from fastapi.testclient import TestClient
+    from src.apps.api.main import _load_database, app
+except ModuleNotFoundError:  # pragma: no cover - testing scaffold
+    TestClient = None
+    app = None
+    _load_database = None
+
+from src.apps.ui.ui_tasks import format_search_snippet
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.infrastructure.persistence.sqlite.search import highlight, match_expression, split_terms
+
+
+class _SearchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "tasks.db")
+        self.db = SQLiteDB(db_path=self.db_path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _completed(self, video_id, title, summary):
+        task = self.db.add_task(f"https://www.youtube.com/watch?v={video_id}")
+        self.db.update_task_status(task.id, "Completed", title=title, summary=summary)
+        return str(task.id)
+
+
+class TestSQLiteTaskSearch(_SearchTestCase):
+    def setUp(self):
+        super().setUp()
+        self.chip_id = self._completed(
+            "a", "台灣半導體產業分析", "本影片討論台積電的先進製程與全球供應鏈，以及 AI 晶片需求。"
+        )
+        self.pasta_id = self._completed("b", "Cooking pasta", "How to cook pasta al dente.")
+
+    def test_cjk_trigram_match_is_highlighted(self):
+        found = self.db.search_tasks("台積電 供應鏈")
+
+        self.assertEqual(found.total, 1)
+        hit = found.hits[0]
+        self.assertEqual(str(hit.task.id), self.chip_id)
+        self.assertIn("<mark>台積電</mark>", hit.snippet)
+        self.assertIn("<mark>供應鏈</mark>", hit.snippet)
+
+    def test_short_terms_fall_back_to_like(self):
+        found = self.db.search_tasks("晶片")
+        self.assertEqual([str(hit.task.id) for hit in found.hits], [self.chip_id])
+        self.assertIn("<mark>晶片</mark>", found.hits[0].snippet)
+
+        self.assertEqual(self.db.search_tasks("ai 台積電").total, 1)
+        self.assertEqual(self.db.search_tasks("100%").total, 0)
+
+    def test_urls_are_not_indexed_and_updates_are_tracked(self):
+        self.assertEqual(self.db.search_tasks("youtube").total, 0)
+
+        self.db.update_task_status(self.pasta_id, "Completed", summary="Risotto instead.")
+        self.assertEqual(self.db.search_tasks("al dente").total, 0)
+        self.assertEqual(self.db.search_tasks("risotto").total, 1)
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DELETE FROM tasks WHERE id = ?", (self.pasta_id,))
+        conn.commit()
+        conn.close()
+        self.assertEqual(self.db.search_tasks("risotto").total, 0)
+
+    def test_transcripts_are_searchable_once_indexed(self):
+        self.assertEqual(self.db.search_tasks("semiconductor").total, 0)
+        self.db.index_task_transcript(self.pasta_id, "today we also talk about semiconductors")
+
+        found = self.db.search_tasks("semiconductor")
+        self.assertEqual([str(hit.task.id) for hit in found.hits], [self.pasta_id])
+        self.assertIn("<mark>semiconductor</mark>", found.hits[0].snippet)
+
+    def test_pagination_and_ranking(self):
+        for index in range(5):
+            self._completed(f"p{index}", f"Episode {index}", "pasta night")
+
+        first = self.db.search_tasks("pasta", limit=2)
+        second = self.db.search_tasks("pasta", limit=2, offset=2)
+
+        self.assertEqual(first.total, 6)
+        self.assertEqual(len(first.hits), 2)
+        # The title match outranks summary-only matches.
+        self.assertEqual(str(first.hits[0].task.id), self.pasta_id)
+        self.assertTrue(
+            {hit.task.id for hit in first.hits}.isdisjoint({hit.task.id for hit in second.hits})
+        )
+        self.assertEqual(self.db.search_tasks("   ").total, 0)
+
+    def test_existing_tasks_are_backfilled(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DROP TABLE task_search")
+        conn.execute("DROP TRIGGER tasks_search_insert")
+        conn.commit()
+        conn.close()
+
+        reopened = SQLiteDB(db_path=self.db_path)
+        self.assertEqual(reopened.search_tasks("台積電").total, 1)
+
+    def test_like_fallback_without_fts_reads_compressed_summaries(self):
+        with patch(
+            "src.infrastructure.persistence.sqlite.client.create_search_index",
+            return_value=False,
+        ):
+            db = SQLiteDB(
+                db_path=os.path.join(self.tmpdir.name, "plain.db"),
+                text_codec="zlib",
+                compress_min_bytes=1,
+            )
+        task = db.add_task("https://www.youtube.com/watch?v=c")
+        db.update_task_status(task.id, "Completed", title="Markets", summary="利率與通膨的關係。")
+
+        found = db.search_tasks("通膨")
+
+        self.assertFalse(db.search_enabled)
+        self.assertEqual([hit.task.id for hit in found.hits], [task.id])
+        self.assertIn("<mark>通膨</mark>", found.hits[0].snippet)
+
+
+class TestSearchHelpers(unittest.TestCase):
+    def test_split_terms_and_match_expression(self):
+        self.assertEqual(split_terms(' "台積電"  AI ai  '), ["台積電", "AI"])
+        self.assertEqual(match_expression(['say "hi"', "abc"]), '"say ""hi""" "abc"')
+
+    def test_highlight_windows_long_text(self):
+        text = "x" * 200 + "needle" + "y" * 200
+        snippet = highlight([None, text], ["needle"], width=40)
+        self.assertTrue(snippet.startswith("…"))
+        self.assertTrue(snippet.endswith("…"))
+        self.assertIn("<mark>needle</mark>", snippet)
+
+    def test_format_search_snippet_for_markdown(self):
+        self.assertEqual(
+            format_search_snippet("a*b <mark>台積電</mark>\nnext"),
+            "a\\*b **台積電** next",
+        )
+        self.assertEqual(format_search_snippet(None), "")
+
+
+@unittest.skipIf(TestClient is None, "fastapi is not installed")
+class TestSearchEndpoint(_SearchTestCase):
+    def setUp(self):
+        super().setUp()
+        _load_database.cache_clear()  # the API keeps one client per backend
+
+    def test_search_endpoint_returns_ranked_page(self):
+        task_id = self._completed("a", "台灣半導體", "台積電的先進製程")
+        client = TestClient(app)
+
+        with patch("src.apps.api.main.DBFactory.get_db", return_value=self.db):
+            response = client.get("/search", params={"q": "先進製程", "limit": 5})
+            missing = client.get("/search")
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload["total"], 1)
+        self.assertEqual(payload["limit"], 5)
+        result = payload["results"][0]
+        self.assertEqual(result["task_id"], task_id)
+        self.assertEqual(result["status"], "Completed")
+        self.assertIn("<mark>先進製程</mark>", result["snippet"])
+        self.assertEqual(missing.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
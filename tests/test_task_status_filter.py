@@ -6,10 +6,8 @@ from src.apps.ui.streamlit_app import collect_task_status_options, filter_tasks_
 
 class TaskStatusFilterTests(unittest.TestCase):
     def test_collect_task_status_options_returns_fixed_list(self):
-        tasks = [SimpleNamespace(status="Archived")]
-
         self.assertEqual(
-            collect_task_status_options(tasks),
+            collect_task_status_options(),
             ["Pending", "Processing", "Completed", "Failed", "Failed Retry Created"],
         )
 
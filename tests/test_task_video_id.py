@@ -0,0 +1,111 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.domain.interfaces.database import ActiveTaskExistsError
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.services.tasks.task_creation import create_task_record
+
+WATCH_URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+SHORT_URL = "https://youtu.be/dQw4w9WgXcQ"
+
+
+class TestTaskVideoId(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "tasks.db")
+        self.db = SQLiteDB(db_path=self.path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_video_id_is_stored_and_used_for_dedup(self):
+        task = self.db.add_task(WATCH_URL)
+
+        self.assertEqual(task.video_id, "dQw4w9WgXcQ")
+        self.assertEqual(self.db.find_recent_task_by_url(SHORT_URL).id, task.id)
+        self.assertIsNone(self.db.find_recent_task_by_url("https://youtu.be/9bZkp7q19f0"))
+
+        conn = sqlite3.connect(self.path)
+        plan = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE video_id = ? "
+                "AND status NOT IN ('Failed', 'Failed Retry Created') ORDER BY created_at DESC LIMIT 1",
+                ("dQw4w9WgXcQ",),
+            )
+        )
+        conn.close()
+        self.assertIn("idx_tasks_video_id", plan)
+
+    def test_only_one_active_task_per_video(self):
+        task = self.db.add_task(WATCH_URL)
+
+        with self.assertRaises(ActiveTaskExistsError) as raised:
+            self.db.add_task(SHORT_URL)
+        self.assertEqual(raised.exception.task.id, task.id)
+
+        self.db.update_task_status(task.id, "Completed")
+        self.assertEqual(self.db.add_task(SHORT_URL).status, "Pending")
+
+    def test_concurrent_creation_yields_a_single_task(self):
+        outcomes = []
+        barrier = threading.Barrier(4)
+
+        def submit():
+            barrier.wait()
+            outcomes.append(create_task_record(db=SQLiteDB(db_path=self.path), url=WATCH_URL).outcome)
+
+        # Every request passes the lookup before any insert lands.
+        with patch.object(SQLiteDB, "find_recent_task_by_url", return_value=None):
+            threads = [threading.Thread(target=submit) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(sorted(outcomes), ["created"] + ["duplicate_active"] * 3)
+        self.assertEqual(len(self.db.get_all_tasks()), 1)
+
+    def test_legacy_rows_are_backfilled(self):
+        legacy_path = os.path.join(self.tmpdir.name, "legacy.db")
+        conn = sqlite3.connect(legacy_path)
+        conn.execute(
+            """
+            CREATE TABLE tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL,
+                status TEXT NOT NULL,
+                title TEXT,
+                summary TEXT,
+                error_message TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                processing_duration REAL
+            )
+            """
+        )
+        conn.executemany(
+            "INSERT INTO tasks (url, status) VALUES (?, ?)",
+            [(WATCH_URL, "Pending"), (SHORT_URL, "Pending"), ("https://example.com/a", "Completed")],
+        )
+        conn.commit()
+        conn.close()
+
+        db = SQLiteDB(db_path=legacy_path)
+
+        tasks = db.get_all_tasks()
+        self.assertEqual([task.video_id for task in tasks], ["dQw4w9WgXcQ", "dQw4w9WgXcQ", None])
+        self.assertEqual(db.find_recent_task_by_url("https://example.com/a").status, "Completed")
+        # Duplicate active tasks are collapsed so the unique index can be built.
+        self.assertEqual([task.status for task in tasks[:2]], ["Pending", "Failed"])
+        self.assertEqual(tasks[1].error_message, f"Duplicate of active task {tasks[0].id}")
+        with self.assertRaises(ActiveTaskExistsError):
+            db.add_task(SHORT_URL)
+
+
+if __name__ == "__main__":
+    unittest.main()
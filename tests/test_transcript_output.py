@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from src.domain.transcripts import Transcript, TranscriptSegment, TranscriptWord
+from src.infrastructure.media.transcription.options import resolve_transcription_options
+from src.infrastructure.media.transcription.transcript_io import (
+    TranscriptJsonlWriter,
+    read_transcript_jsonl,
+    segment_from_whisper,
+)
+
+
+class TestTranscriptModel(unittest.TestCase):
+    def test_text_joins_accumulated_segments(self):
+        transcript = Transcript(language="zh", duration=10.0)
+        transcript.append(TranscriptSegment(0.0, 4.0, " 你好"))
+        transcript.extend([TranscriptSegment(4.0, 9.5, " world")])
+
+        self.assertEqual(transcript.text, " 你好 world")
+        self.assertEqual(transcript.end, 9.5)
+        self.assertEqual(transcript.metadata(), {"language": "zh", "duration": 10.0})
+
+    def test_segment_dict_round_trip_keeps_words(self):
+        segment = TranscriptSegment(
+            1.0, 2.0, " hi", (TranscriptWord(1.0, 1.5, " hi", 0.9),)
+        )
+        self.assertEqual(TranscriptSegment.from_dict(segment.to_dict()), segment)
+        self.assertNotIn("words", TranscriptSegment(0.0, 1.0, " a").to_dict())
+
+
+class TestTranscriptJsonl(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "out", "dQw4w9WgXcQ.jsonl")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_segments_are_visible_before_close(self):
+        writer = TranscriptJsonlWriter(self.path, {"language": "en", "duration": 3.0})
+        writer.write(TranscriptSegment(0.0, 1.5, " first"))
+
+        with open(writer.partial_path, encoding="utf-8") as handle:
+            lines = [json.loads(line) for line in handle]
+        self.assertEqual(lines[0]["type"], "header")
+        self.assertEqual(lines[1]["text"], " first")
+        self.assertFalse(os.path.exists(self.path))
+
+        writer.write(TranscriptSegment(1.5, 3.0, " second"))
+        writer.close()
+
+        transcript = read_transcript_jsonl(self.path)
+        self.assertEqual(transcript.text, " first second")
+        self.assertEqual(transcript.language, "en")
+        self.assertEqual(transcript.duration, 3.0)
+        self.assertFalse(os.path.exists(writer.partial_path))
+
+    def test_abort_removes_partial_file(self):
+        writer = TranscriptJsonlWriter(self.path)
+        writer.write(TranscriptSegment(0.0, 1.0, " a"))
+        writer.abort()
+
+        self.assertFalse(os.path.exists(writer.partial_path))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_segment_from_whisper_applies_offset_to_words(self):
+        raw = SimpleNamespace(
+            start=1.0,
+            end=2.0,
+            text=" hey",
+            words=[SimpleNamespace(start=1.0, end=1.8, word=" hey", probability=0.7)],
+        )
+
+        segment = segment_from_whisper(raw, offset=10.0)
+
+        self.assertEqual((segment.start, segment.end), (11.0, 12.0))
+        self.assertEqual(segment.words, (TranscriptWord(11.0, 11.8, " hey", 0.7),))
+        self.assertIsNone(segment_from_whisper(SimpleNamespace(start=0, end=1, text="x")).words)
+
+
+class TestTranscriptOutputOptions(unittest.TestCase):
+    def test_output_settings_resolve_from_config(self):
+        config = SimpleNamespace(
+            transcription_word_timestamps=True,
+            transcription_output_dir="data/transcripts",
+        )
+
+        options = resolve_transcription_options(config, {"word_timestamps": False})
+
+        self.assertFalse(options.word_timestamps)
+        self.assertEqual(options.transcriber_kwargs()["transcript_dir"], "data/transcripts")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+
+from benchmarks.transcription_bench import (
+    expand_configs,
+    find_audio_files,
+    format_table,
+)
+
+
+def _result(model_size, rtf, words_per_second=None):
+    return {
+        "model_size": model_size,
+        "compute_type": "int8",
+        "beam_size": 5,
+        "cpu_threads": 0,
+        "load_seconds": 1.25,
+        "rtf": rtf,
+        "words_per_second": words_per_second,
+        "peak_rss_mb": 300.0,
+    }
+
+
+class TestTranscriptionBench(unittest.TestCase):
+    def test_expand_configs_covers_every_combination(self):
+        configs = expand_configs(["tiny", "base"], ["int8", "float32"], [1, 5], [0, 4])
+
+        self.assertEqual(len(configs), 16)
+        self.assertEqual(configs[0].label, "tiny/int8/beam=1/threads=auto")
+        self.assertEqual(configs[-1].label, "base/float32/beam=5/threads=4")
+
+    def test_find_audio_files_filters_and_limits(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("b.mp3", "a.wav", "notes.txt", "c.WEBM"):
+                open(os.path.join(tmpdir, name), "w").close()
+
+            files = find_audio_files(tmpdir)
+            limited = find_audio_files(tmpdir, limit=1)
+
+        self.assertEqual([os.path.basename(path) for path in files], ["a.wav", "b.mp3", "c.WEBM"])
+        self.assertEqual(len(limited), 1)
+
+    def test_format_table_sorts_by_realtime_factor(self):
+        table = format_table(
+            [_result("base", 0.4, 12.0), _result("tiny", 0.1, 40.0), _result("small", None)]
+        )
+        rows = table.splitlines()[2:]
+
+        self.assertTrue(rows[0].startswith("tiny"))
+        self.assertTrue(rows[1].startswith("base"))
+        self.assertTrue(rows[2].startswith("small"))
+        self.assertIn("0.100", rows[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+
+from src.infrastructure.media.transcription.checkpoint import (
+    TranscriptionCheckpoint,
+    audio_fingerprint,
+    checkpoint_key_for,
+)
+from src.domain.transcripts import TranscriptSegment
+
+
+class TestTranscriptionCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = self.tmpdir.name
+        self.fingerprint = {"size": 1234, "model_size": "tiny", "language": None}
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _checkpoint(self, fingerprint=None, interval=0.0):
+        return TranscriptionCheckpoint(
+            self.directory,
+            "dQw4w9WgXcQ",
+            fingerprint or self.fingerprint,
+            flush_interval_seconds=interval,
+        )
+
+    def test_segments_round_trip_across_instances(self):
+        writer = self._checkpoint()
+        writer.add(TranscriptSegment(0.0, 4.5, " 你好"))
+        writer.add(TranscriptSegment(4.5, 9.0, " world"))
+
+        resumed = self._checkpoint().load()
+
+        self.assertEqual([segment.text for segment in resumed], [" 你好", " world"])
+        self.assertEqual(resumed[-1].end, 9.0)
+
+    def test_buffered_segments_are_written_only_on_flush(self):
+        writer = self._checkpoint(interval=3600)
+        writer.add(TranscriptSegment(0.0, 1.0, " a"))
+        self.assertEqual(self._checkpoint().load(), [])
+
+        writer.flush()
+        self.assertEqual(len(self._checkpoint().load()), 1)
+
+    def test_torn_last_line_is_ignored(self):
+        writer = self._checkpoint()
+        writer.add(TranscriptSegment(0.0, 1.0, " a"))
+        with open(writer.path, "a", encoding="utf-8") as handle:
+            handle.write('{"start": 1.0, "end"')
+
+        self.assertEqual(len(self._checkpoint().load()), 1)
+
+    def test_repeated_crashes_keep_segments_written_after_each_resume(self):
+        writer = self._checkpoint()
+        writer.add(TranscriptSegment(0.0, 1.0, " a"))
+        for n in range(1, 3):
+            with open(writer.path, "a", encoding="utf-8") as handle:
+                handle.write('{"start": 9.0, "en')  # worker killed mid-write
+            writer = self._checkpoint()
+            resumed = writer.load()
+            self.assertEqual(len(resumed), n)
+            writer.add(TranscriptSegment(float(n), float(n + 1), f" {n}"))
+
+        resumed = self._checkpoint().load()
+
+        self.assertEqual([segment.text for segment in resumed], [" a", " 1", " 2"])
+
+    def test_checkpoint_for_different_audio_is_discarded(self):
+        writer = self._checkpoint()
+        writer.add(TranscriptSegment(0.0, 1.0, " a"))
+
+        other = self._checkpoint(fingerprint={**self.fingerprint, "size": 99})
+
+        self.assertEqual(other.load(), [])
+        self.assertFalse(os.path.exists(writer.path))
+
+    def test_clear_removes_file(self):
+        writer = self._checkpoint()
+        writer.add(TranscriptSegment(0.0, 1.0, " a"))
+        writer.clear()
+
+        self.assertFalse(os.path.exists(writer.path))
+
+    def test_key_and_fingerprint_helpers(self):
+        path = os.path.join(self.directory, "dQw4w9WgXcQ.m4a")
+        with open(path, "wb") as handle:
+            handle.write(b"\0" * 10)
+
+        self.assertEqual(checkpoint_key_for(path), "dQw4w9WgXcQ")
+        self.assertEqual(
+            audio_fingerprint(path, "base", "en"),
+            {"size": 10, "model_size": "base", "language": "en"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,198 @@
+import os
+import tempfile
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.core.config import Config
+from src.infrastructure.media.transcription.options import (
+    TranscriptionOptions,
+    auto_cpu_threads,
+    resolve_transcription_options,
+)
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.services.pipeline.processing_runner import ProcessingWorker
+
+
+def _config(**overrides):
+    values = {
+        "transcription_model_size": "small",
+        "transcription_compute_type": "int8",
+        "transcription_cpu_threads": "auto",
+        "transcription_num_workers": 1,
+        "transcription_concurrency": 2,
+        "transcription_beam_size": 5,
+        "transcription_vad_filter": False,
+        "transcription_language": None,
+    }
+    values.update(overrides)
+    return types.SimpleNamespace(**values)
+
+
+class TestAutoCpuThreads(unittest.TestCase):
+    def test_splits_cores_across_concurrent_models_and_workers(self):
+        self.assertEqual(auto_cpu_threads(1, cpu_count=16), 16)
+        self.assertEqual(auto_cpu_threads(2, cpu_count=16), 8)
+        self.assertEqual(auto_cpu_threads(2, num_workers=2, cpu_count=16), 4)
+
+    def test_never_returns_less_than_one_thread(self):
+        self.assertEqual(auto_cpu_threads(32, cpu_count=4), 1)
+
+
+class TestResolveTranscriptionOptions(unittest.TestCase):
+    def test_auto_threads_follow_configured_concurrency(self):
+        options = resolve_transcription_options(_config(), cpu_count=16)
+
+        self.assertEqual(options.model_size, "small")
+        self.assertEqual(options.cpu_threads, 8)
+
+    def test_task_overrides_take_precedence(self):
+        options = resolve_transcription_options(
+            _config(),
+            {"model_size": "base", "cpu_threads": 3, "vad_filter": True, "language": "zh"},
+            cpu_count=16,
+        )
+
+        self.assertEqual(
+            options,
+            TranscriptionOptions(
+                model_size="base",
+                compute_type="int8",
+                cpu_threads=3,
+                num_workers=1,
+                beam_size=5,
+                vad_filter=True,
+                language="zh",
+            ),
+        )
+        self.assertNotIn("model_size", options.transcriber_kwargs())
+
+    def test_unknown_overrides_are_ignored(self):
+        options = resolve_transcription_options(
+            _config(transcription_cpu_threads=0), {"temperature": 0.3}
+        )
+        self.assertEqual(options.cpu_threads, 0)
+
+    def test_invalid_model_size_override_is_ignored(self):
+        options = resolve_transcription_options(_config(), {"model_size": "gigantic"})
+        self.assertEqual(options.model_size, "small")
+
+        with tempfile.TemporaryDirectory() as model_dir:
+            options = resolve_transcription_options(_config(), {"model_size": model_dir})
+        self.assertEqual(options.model_size, model_dir)
+
+    def test_minimal_config_uses_defaults(self):
+        options = resolve_transcription_options(
+            types.SimpleNamespace(transcription_model_size="tiny")
+        )
+        self.assertEqual(options, TranscriptionOptions(model_size="tiny"))
+
+    def test_config_reads_environment(self):
+        env = {
+            "TRANSCRIPTION_MODEL_SIZE": "medium",
+            "TRANSCRIPTION_CPU_THREADS": "6",
+            "TRANSCRIPTION_BEAM_SIZE": "1",
+            "TRANSCRIPTION_VAD_FILTER": "true",
+            "TRANSCRIPTION_LANGUAGE": "en",
+        }
+        with tempfile.TemporaryDirectory() as tmpdir, patch.dict(os.environ, env):
+            cwd = os.getcwd()
+            os.chdir(tmpdir)
+            try:
+                options = resolve_transcription_options(Config())
+            finally:
+                os.chdir(cwd)
+
+        self.assertEqual(options.model_size, "medium")
+        self.assertEqual(options.cpu_threads, 6)
+        self.assertEqual(options.beam_size, 1)
+        self.assertTrue(options.vad_filter)
+        self.assertEqual(options.language, "en")
+
+    def test_defaults_leave_threads_to_library_and_disk_outputs_off(self):
+        with tempfile.TemporaryDirectory() as tmpdir, patch.dict(os.environ, {}, clear=True):
+            cwd = os.getcwd()
+            os.chdir(tmpdir)
+            try:
+                config = Config()
+            finally:
+                os.chdir(cwd)
+
+        self.assertEqual(config.transcription_cpu_threads, "0")
+        self.assertIsNone(config.transcription_checkpoint_dir)
+        self.assertIsNone(config.transcription_output_dir)
+
+
+class TestSQLiteTranscriptionOptions(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.NamedTemporaryFile(delete=False)
+        self.tmp.close()
+        self.db = SQLiteDB(db_path=self.tmp.name)
+
+    def tearDown(self):
+        try:
+            os.unlink(self.tmp.name)
+        except FileNotFoundError:
+            pass
+
+    def test_overrides_round_trip_and_carry_over_to_retries(self):
+        task = self.db.add_task(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            transcription_options={"model_size": "base", "beam_size": 1},
+        )
+
+        # Retries are created from failed tasks (one active task per video).
+        self.db.update_task_status(task.id, "Failed")
+        stored = self.db.get_task_by_id(task.id)
+        retry = self.db.create_retry_task(stored, "retry")
+
+        self.assertEqual(stored.transcription_options, {"model_size": "base", "beam_size": 1})
+        self.assertEqual(retry.transcription_options, {"model_size": "base", "beam_size": 1})
+        plain = self.db.add_task("https://www.youtube.com/watch?v=9bZkp7q19f0")
+        self.assertIsNone(plain.transcription_options)
+
+    def test_worker_builds_transcriber_with_task_overrides(self):
+        self.db.add_task(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            transcription_options={"model_size": "base", "cpu_threads": "auto"},
+        )
+        factory_calls = []
+
+        def transcriber_factory(model_size, **options):
+            factory_calls.append((model_size, options))
+            return MagicMock(transcribe=MagicMock(return_value="text"), last_audio_duration=None)
+
+        worker = ProcessingWorker(
+            self.db,
+            downloader_factory=lambda url, output_path: MagicMock(
+                download=MagicMock(return_value={"path": "/tmp/a.wav", "title": "T"})
+            ),
+            transcriber_factory=transcriber_factory,
+            summarizer_factory=lambda: MagicMock(
+                summarize=MagicMock(return_value="summary"), last_model_label="mock"
+            ),
+            summary_storage_factory=lambda: MagicMock(save=MagicMock(return_value={})),
+            file_manager_factory=MagicMock,
+            notifier=MagicMock(return_value=True),
+            config_factory=lambda: _config(
+                transcription_concurrency=4,
+                notion_url=None,
+                discord_webhook_url=None,
+                data_dir="data",
+            ),
+        )
+
+        with patch(
+            "src.infrastructure.media.transcription.options.available_cpu_count",
+            return_value=16,
+        ):
+            self.assertTrue(worker.process_next_task())
+
+        model_size, options = factory_calls[0]
+        self.assertEqual(model_size, "base")
+        self.assertEqual(options["cpu_threads"], 4)
+        self.assertEqual(self.db.list_task_stage_timings()[0].transcription_model, "faster-whisper-base")
+
+
+if __name__ == "__main__":
+    unittest.main()
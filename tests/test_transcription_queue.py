@@ -0,0 +1,151 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.domain.transcripts.jobs import JOB_COMPLETED, JOB_FAILED, JOB_RUNNING
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.infrastructure.persistence.sqlite.transcription_job_repository import (
+    SQLiteTranscriptionJobRepository,
+)
+from src.services.pipeline.processing_runner import ProcessingWorker
+from src.services.pipeline.transcription_queue import (
+    QueuedTranscriber,
+    TranscriptionJobWorker,
+    TranscriptionQueueError,
+)
+
+
+class _FakeTranscriber:
+    instances = 0
+
+    def __init__(self, model_size, **options):
+        type(self).instances += 1
+        self.model_size = model_size
+        self.options = options
+        self.last_audio_duration = 12.5
+
+    def transcribe(self, file_path):
+        if file_path.endswith("broken.mp3"):
+            raise RuntimeError("decoder exploded")
+        return f"{self.model_size}:{os.path.basename(file_path)}"
+
+
+class TestTranscriptionJobQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "tasks.db")
+        SQLiteDB(self.db_path)
+        self.repository = SQLiteTranscriptionJobRepository(self.db_path)
+        _FakeTranscriber.instances = 0
+        self.worker = TranscriptionJobWorker(
+            self.repository,
+            worker_id="t-1",
+            transcriber_factory=_FakeTranscriber,
+            heartbeat_interval_seconds=60,
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_claim_is_exclusive_until_stale(self):
+        job_id = self.repository.enqueue("/media/a.mp3", {"model_size": "tiny"})
+
+        claimed = self.repository.claim_next("t-1")
+        self.assertEqual(claimed.id, job_id)
+        self.assertEqual(claimed.status, JOB_RUNNING)
+        self.assertEqual(claimed.options, {"model_size": "tiny"})
+        self.assertIsNone(self.repository.claim_next("t-2"))
+        # A worker that stopped heart-beating loses the job.
+        self.assertEqual(self.repository.claim_next("t-2", stale_after_seconds=-1).id, job_id)
+
+    def test_reclaimed_job_ignores_the_previous_owner(self):
+        job_id = self.repository.enqueue("/media/a.mp3", {})
+        self.repository.claim_next("t-1")
+        self.repository.claim_next("t-2", stale_after_seconds=-1)
+
+        self.assertTrue(self.repository.complete(job_id, "t-2", "new owner"))
+        self.assertFalse(self.repository.fail(job_id, "t-1", "late failure"))
+        self.assertFalse(self.repository.complete(job_id, "t-2", "twice"))
+
+        job = self.repository.get_job(job_id)
+        self.assertEqual((job.status, job.transcript), (JOB_COMPLETED, "new owner"))
+        self.assertIsNone(job.error_message)
+
+    def test_worker_completes_and_reuses_transcriber(self):
+        first = self.repository.enqueue("/media/a.mp3", {"model_size": "small", "beam_size": 1})
+        second = self.repository.enqueue("/media/b.mp3", {"model_size": "small", "beam_size": 1})
+
+        handled = self.worker.run(exit_when_idle=True)
+
+        self.assertEqual(handled, 2)
+        self.assertEqual(_FakeTranscriber.instances, 1)
+        job = self.repository.get_job(first)
+        self.assertEqual(job.status, JOB_COMPLETED)
+        self.assertEqual(job.transcript, "small:a.mp3")
+        self.assertEqual(job.audio_duration, 12.5)
+        self.assertEqual(self.repository.get_job(second).transcript, "small:b.mp3")
+
+    def test_worker_records_failures(self):
+        job_id = self.repository.enqueue("/media/broken.mp3", {})
+
+        self.assertFalse(self.worker.run_once())
+
+        job = self.repository.get_job(job_id)
+        self.assertEqual(job.status, JOB_FAILED)
+        self.assertIn("decoder exploded", job.error_message)
+
+    def test_queued_transcriber_waits_for_worker_result(self):
+        transcriber = QueuedTranscriber(
+            self.repository,
+            "base",
+            beam_size=2,
+            # Each poll lets the "other process" make progress.
+            sleep=lambda _seconds: self.worker.run_once(),
+        )
+
+        text = transcriber.transcribe("clip.mp3")
+
+        self.assertEqual(text, "base:clip.mp3")
+        self.assertEqual(transcriber.last_audio_duration, 12.5)
+        self.assertEqual(self.worker._cached_options.beam_size, 2)
+        self.assertIsNone(self.repository.claim_next("t-9"))
+
+    def test_queued_transcriber_surfaces_failures_and_timeouts(self):
+        failing = QueuedTranscriber(self.repository, sleep=lambda _s: self.worker.run_once())
+        with self.assertRaises(TranscriptionQueueError):
+            failing.transcribe("broken.mp3")
+
+        ticks = iter(range(100))
+        waiting = QueuedTranscriber(
+            self.repository,
+            timeout_seconds=2,
+            sleep=lambda _s: None,
+            clock=lambda: next(ticks),
+        )
+        with self.assertRaises(TranscriptionQueueError):
+            waiting.transcribe("never.mp3")
+        self.assertIsNone(self.repository.claim_next("t-9"))
+
+    def test_processing_worker_uses_queue_executor(self):
+        config = SimpleNamespace(
+            transcription_model_size="tiny",
+            transcription_executor="queue",
+            transcription_queue_db_path=self.db_path,
+            transcription_queue_poll_seconds=0.1,
+            notion_url="",
+            discord_webhook_url="",
+            data_dir=self.tmpdir.name,
+        )
+        worker = ProcessingWorker(db=MagicMock(), config_factory=lambda: config)
+
+        transcriber = worker.transcriber_factory("tiny", beam_size=3)
+
+        self.assertIsInstance(transcriber, QueuedTranscriber)
+        self.assertEqual(transcriber.options, {"model_size": "tiny", "beam_size": 3})
+        self.assertEqual(transcriber.poll_interval_seconds, 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
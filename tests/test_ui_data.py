@@ -0,0 +1,50 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.apps.ui.ui_data import get_db, load_task_page
+from src.infrastructure.persistence.sqlite.client import SQLiteDB
+from src.infrastructure.persistence.sqlite.task_blobs import ZLIB
+
+LONG_SUMMARY = "## 摘要\n" + "快取的任務摘要。\n" * 200
+
+
+class TestUiData(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = SQLiteDB(db_path=os.path.join(self.tmpdir.name, "tasks.db"), text_codec=ZLIB)
+        self.patcher = patch("src.apps.ui.ui_data.DBFactory.get_db", return_value=self.db)
+        self.patcher.start()
+        self.ids = [
+            self.db.add_task(f"https://www.youtube.com/watch?v=video{n:06d}").id for n in range(5)
+        ]
+        self.db.update_task_status(self.ids[1], "Completed", title="done", summary=LONG_SUMMARY)
+        self.db.update_task_status(self.ids[3], "Failed", title="failed")
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.tmpdir.cleanup()
+
+    def test_pages_newest_first_with_status_filter(self):
+        page = load_task_page("SQLite", limit=2, offset=1)
+        finished = load_task_page("SQLite", statuses=["Completed", "Failed"])
+
+        self.assertEqual(page.total, 5)
+        self.assertEqual([task.id for task in page.tasks], [self.ids[3], self.ids[2]])
+        self.assertEqual([task.id for task in finished.tasks], [self.ids[3], self.ids[1]])
+        self.assertEqual(load_task_page("SQLite", statuses=[]).total, 0)
+
+    def test_snapshots_skip_summaries_and_pickle(self):
+        page = load_task_page("SQLite", statuses=["Completed"])
+
+        restored = pickle.loads(pickle.dumps(page))
+
+        self.assertEqual(restored.tasks[0].title, "done")
+        self.assertEqual(restored.tasks[0].summary, "")
+        self.assertEqual(get_db("SQLite").get_task_by_id(self.ids[1]).summary, LONG_SUMMARY)
+
+
+if __name__ == "__main__":
+    unittest.main()
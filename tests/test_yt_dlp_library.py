@@ -0,0 +1,119 @@
+import importlib.machinery
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest.mock import patch
+
+from src.infrastructure.media import yt_dlp_library
+from src.infrastructure.media.downloader import YouTubeDownloader
+
+VIDEO_URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+
+def _fake_yt_dlp_module():
+    module = types.ModuleType("yt_dlp")
+    module.__spec__ = importlib.machinery.ModuleSpec("yt_dlp", None)
+    module.instances = []
+
+    class YoutubeDL:
+        def __init__(self, params):
+            self.params = params
+            self.calls = []
+            module.instances.append(self)
+
+        def extract_info(self, url, download=True):
+            self.calls.append((url, download))
+            path = self.params["outtmpl"].replace("%(id)s", "dQw4w9WgXcQ").replace("%(ext)s", "mp4")
+            if download:
+                for hook in self.params["progress_hooks"]:
+                    hook({"status": "downloading", "downloaded_bytes": 2, "total_bytes": 4})
+                with open(path, "wb") as handle:
+                    handle.write(b"data")
+                for hook in self.params["progress_hooks"]:
+                    hook({"status": "finished", "filename": path})
+            return {
+                "id": "dQw4w9WgXcQ",
+                "title": "Never Gonna Give You Up",
+                "duration": 212,
+                "live_status": "not_live",
+                "availability": "public",
+                "formats": [{"format_id": "18", "ext": "mp4", "height": 360, "filesize": 4}],
+                "subtitles": {"en": [{"ext": "vtt"}, {"ext": "srv3"}]},
+                "automatic_captions": {"ja": [{"ext": "vtt"}]},
+                "chapters": [{"start_time": 0.0, "end_time": 212.0, "title": "Song"}],
+                "requested_downloads": [{"filepath": path}] if download else [],
+            }
+
+        def sanitize_info(self, info):
+            return info
+
+        def prepare_filename(self, info):
+            return ""
+
+    module.YoutubeDL = YoutubeDL
+    return module
+
+
+class TestYtDlpLibraryBackend(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.fake = _fake_yt_dlp_module()
+        modules = patch.dict(sys.modules, {"yt_dlp": self.fake})
+        modules.start()
+        self.addCleanup(modules.stop)
+        idle = patch.dict(yt_dlp_library._IDLE, clear=True)
+        idle.start()
+        self.addCleanup(idle.stop)
+
+    def test_single_extraction_returns_structured_info(self):
+        progress = []
+        downloader = YouTubeDownloader(
+            VIDEO_URL, self.tmpdir.name, backend="library", progress_hook=progress.append
+        )
+
+        with patch("src.infrastructure.media.downloader.subprocess.run") as mock_run:
+            result = downloader.download()
+
+        mock_run.assert_not_called()
+        expected_path = os.path.join(self.tmpdir.name, "videos", "dQw4w9WgXcQ.mp4")
+        self.assertEqual(result["path"], expected_path)
+        self.assertEqual(result["title"], "Never Gonna Give You Up")
+        self.assertEqual(result["duration"], 212.0)
+        info = downloader.last_info
+        self.assertEqual(info.captions, {"en": ["vtt", "srv3"]})
+        self.assertEqual(info.automatic_captions, {"ja": ["vtt"]})
+        self.assertEqual(info.chapters[0]["title"], "Song")
+        self.assertEqual(info.formats[0]["height"], 360)
+        self.assertEqual([item["status"] for item in progress], ["downloading", "finished"])
+
+    def test_extractor_instance_is_reused_across_tasks(self):
+        for _ in range(2):
+            YouTubeDownloader(VIDEO_URL, self.tmpdir.name, backend="library").download()
+
+        self.assertEqual(len(self.fake.instances), 1)
+        self.assertEqual(len(self.fake.instances[0].calls), 2)
+
+    def test_auto_falls_back_to_subprocess_when_library_fails(self):
+        def _broken(*_args, **_kwargs):
+            raise RuntimeError("extractor broke")
+
+        downloader = YouTubeDownloader(VIDEO_URL, self.tmpdir.name)
+        with patch.object(yt_dlp_library, "extract", side_effect=_broken), patch.object(
+            downloader, "_download_with_yt_dlp", return_value={"path": "p", "title": "t"}
+        ) as fallback:
+            result = downloader.download()
+
+        fallback.assert_called_once()
+        self.assertEqual(result, {"path": "p", "title": "t"})
+
+    def test_library_backend_requires_package(self):
+        with patch.dict(sys.modules, {"yt_dlp": None}):
+            with self.assertRaises(RuntimeError):
+                YouTubeDownloader(VIDEO_URL, self.tmpdir.name, backend="library").download()
+
+
+if __name__ == "__main__":
+    unittest.main()